@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Time each stage of the catalog extraction on the bundled gee cat page and on
+synthetic copies scaled up by repeating its cards
+
+Stages follow the split-cards pipeline (the one that stays linear on huge pages):
+container select, per-card parse, per-card extract, classification, completeness
+scoring, JSON save and thumbnail copy. Each scale runs in a fresh process so its
+peak RSS is its own. Results are printed as a table and written as JSON so two
+versions can be compared with --compare.
+"""
+
+import os
+import sys
+import glob
+import json
+import math
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the web_crawler directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'web_crawler'))
+
+from extraction_engine import (EECatalogCardParser, LocalHTMLDataExtractor, MappedHTMLFile, json_default,
+                               split_ee_catalog_cards)
+
+STAGES = ('container_select', 'parse', 'card_extract', 'classification', 'completeness', 'json_save',
+          'thumbnail_copy')
+PER_CARD_STAGES = ('parse', 'card_extract', 'completeness', 'thumbnail_copy')
+
+
+def percentile(samples, q):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def peak_rss_bytes():
+    """High-water mark of this process's resident set, or None where it cannot be read"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+    except (ImportError, AttributeError):
+        return None
+
+
+def write_scaled_page(html_file, scale, path):
+    """Write a copy of the catalog page whose card list is repeated ``scale`` times
+
+    Repeated cards get distinct dataset ids; their thumbnails still point at the
+    original page's files.
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    cards = split_ee_catalog_cards(content)
+    if not cards:
+        raise ValueError(f"No catalog cards found in {html_file}")
+    start = content.index(cards[0])
+    end = content.rindex(cards[-1]) + len(cards[-1])
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content[:start])
+        for copy in range(scale):
+            if copy == 0:
+                f.write(content[start:end])
+                continue
+            for card in cards:
+                f.write(card.replace('/catalog/', f"/catalog/X{copy}_"))
+        f.write(content[end:])
+    return path
+
+
+def run_scale(page, scale, repeat, thumbnail_root):
+    """Time every stage on one page; runs inside its own process"""
+    baseline_rss = peak_rss_bytes()
+    samples = {stage: [] for stage in STAGES}
+    datasets = []
+    work_dir = tempfile.mkdtemp(prefix='ee_benchmark_')
+    cwd = os.getcwd()
+    total_start = time.perf_counter()
+    try:
+        os.chdir(work_dir)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            extractor = LocalHTMLDataExtractor()
+            store = extractor.get_thumbnail_store()
+            for _ in range(repeat):
+                clock = time.perf_counter()
+                with MappedHTMLFile(page) as f:
+                    card_htmls = split_ee_catalog_cards(f)
+                samples['container_select'].append(time.perf_counter() - clock)
+
+                datasets = []
+                for card_html in card_htmls:
+                    clock = time.perf_counter()
+                    parser = EECatalogCardParser()
+                    parser.feed(card_html)
+                    parser.close()
+                    cards = parser.drain()
+                    samples['parse'].append(time.perf_counter() - clock)
+                    if not cards:
+                        continue
+                    clock = time.perf_counter()
+                    dataset = extractor.build_ee_dataset(cards[0])
+                    samples['card_extract'].append(time.perf_counter() - clock)
+                    if dataset:
+                        datasets.append(dataset)
+                del card_htmls
+
+                clock = time.perf_counter()
+                extractor.classify_earth_engine_datasets(datasets)
+                samples['classification'].append(time.perf_counter() - clock)
+
+                for dataset in datasets:
+                    clock = time.perf_counter()
+                    dataset['data_completeness'] = extractor.calculate_data_completeness(dataset)
+                    samples['completeness'].append(time.perf_counter() - clock)
+
+                clock = time.perf_counter()
+                catalog_data = extractor.build_earth_engine_catalog_data(datasets, page)
+                output_file = os.path.join(extractor.output_dir, 'earth_engine_catalog.json')
+                with open(output_file, 'w', encoding='utf-8') as out:
+                    json.dump(catalog_data, out, indent=2, ensure_ascii=False, default=json_default)
+                samples['json_save'].append(time.perf_counter() - clock)
+
+                for dataset in datasets:
+                    thumbnail = dataset.get('thumbnail') or ''
+                    source = os.path.join(thumbnail_root, thumbnail[2:]) if thumbnail.startswith('./') else ''
+                    if not os.path.isfile(source):
+                        continue
+                    clock = time.perf_counter()
+                    store.add_file(source, f"{dataset['dataset_id']}_{os.path.basename(source)}")
+                    samples['thumbnail_copy'].append(time.perf_counter() - clock)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    total = time.perf_counter() - total_start
+
+    cards_per_run = len(samples['parse']) // repeat
+    return {
+        'scale': scale,
+        'page_bytes': os.path.getsize(page),
+        'cards': cards_per_run,
+        'datasets': len(datasets),
+        'repeat': repeat,
+        'total_seconds': round(total, 4),
+        'cards_per_second': round(cards_per_run * repeat / total, 1) if total else None,
+        'baseline_rss_bytes': baseline_rss,
+        'peak_rss_bytes': peak_rss_bytes(),
+        'stages': {stage: summarize(samples[stage], per_card=stage in PER_CARD_STAGES) for stage in STAGES}
+    }
+
+
+def summarize(samples, per_card):
+    """Stage timings in milliseconds; percentiles are per card for per-card stages, per run otherwise"""
+    return {
+        'unit': 'card' if per_card else 'run',
+        'count': len(samples),
+        'total_ms': round(sum(samples) * 1000, 3),
+        'p50_ms': round(percentile(samples, 50) * 1000, 4),
+        'p99_ms': round(percentile(samples, 99) * 1000, 4),
+        'max_ms': round(max(samples, default=0) * 1000, 4)
+    }
+
+
+def run_benchmark(html_file, scales=(1, 10, 100), repeat=1, isolate=True):
+    """Benchmark every scale of a catalog page and return the JSON-ready results"""
+    html_file = os.path.abspath(html_file)
+    thumbnail_root = os.path.dirname(html_file)
+    results = {
+        'benchmark': 'extraction',
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'page': os.path.basename(html_file),
+        'runs': []
+    }
+
+    with tempfile.TemporaryDirectory(prefix='ee_pages_') as page_dir:
+        for scale in scales:
+            page = html_file if scale == 1 else write_scaled_page(
+                html_file, scale, os.path.join(page_dir, f"catalog_x{scale}.html"))
+            args = (page, scale, repeat, thumbnail_root)
+            if isolate:
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    run = executor.submit(run_scale, *args).result()
+            else:
+                run = run_scale(*args)
+            results['runs'].append(run)
+            print_run(run)
+            if page != html_file:
+                os.remove(page)
+    return results
+
+
+def print_run(run):
+    peak = f"{run['peak_rss_bytes'] / 2**20:.0f} MB" if run['peak_rss_bytes'] else 'n/a'
+    print(f"\nx{run['scale']}: {run['page_bytes']:,} bytes, {run['cards']:,} cards, {run['datasets']:,} datasets, "
+          f"{run['total_seconds']:.2f} s total, {run['cards_per_second']:,.0f} cards/s, peak RSS {peak}")
+    print(f"  {'stage':<17} {'unit':>5} {'total':>10} {'p50':>10} {'p99':>10}")
+    for stage, timing in run['stages'].items():
+        print(f"  {stage:<17} {timing['unit']:>5} {timing['total_ms']:>7.0f} ms "
+              f"{timing['p50_ms']:>7.3f} ms {timing['p99_ms']:>7.3f} ms")
+
+
+def compare_results(old, new):
+    """Print the p50 and total time of every stage in ``new`` relative to ``old``"""
+    old_runs = {run['scale']: run for run in old.get('runs', [])}
+    for run in new['runs']:
+        previous = old_runs.get(run['scale'])
+        if not previous:
+            continue
+        print(f"\nx{run['scale']} vs {old.get('timestamp', 'baseline')}")
+        for stage, timing in run['stages'].items():
+            before = previous['stages'].get(stage)
+            if not before:
+                continue
+            ratios = [f"{timing[key] / before[key]:.2f}x" if before[key] else '-' for key in ('p50_ms', 'total_ms')]
+            print(f"  {stage:<17} p50 {ratios[0]:>7}  total {ratios[1]:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the catalog extraction stages")
+    parser.add_argument('html_file', nargs='?', help="catalog page (default: first file in ./gee cat)")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="card-count multipliers for the synthetic pages")
+    parser.add_argument('--repeat', type=int, default=1, help="passes over each page")
+    parser.add_argument('--output', help="results JSON (default: collected_data/benchmarks/extraction_<time>.json)")
+    parser.add_argument('--compare', help="earlier results JSON to compare against")
+    parser.add_argument('--in-process', action='store_true', help="run every scale in this process")
+    args = parser.parse_args()
+
+    html_file = args.html_file or next(iter(sorted(glob.glob('./gee cat/*.html'))), None)
+    if not html_file:
+        print("No HTML files found in gee cat folder")
+        sys.exit(1)
+
+    results = run_benchmark(html_file, args.scales, max(1, args.repeat), not args.in_process)
+    output_file = args.output or os.path.join(
+        'collected_data', 'benchmarks', f"extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"\nResults saved to: {output_file}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), results)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compare the HTML parser backends on the bundled gee cat catalog page
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+# Add the web_crawler directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
+
+from extraction_engine import (PARSER_BACKENDS, TREE_BACKENDS, EECatalogCardParser, find_links, make_soup,
+                               parser_backend_available, pick_parser_backend, tokenize_html)
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def stream_cards(content, backend):
+    parser = EECatalogCardParser()
+    cards = []
+    for _ in tokenize_html(parser, content, backend):
+        cards.extend(parser.drain())
+    return cards
+
+
+def benchmark_parsers(html_file, repeat=3):
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    print(f"Page: {os.path.basename(html_file)} ({len(content):,} characters), best of {repeat}")
+    print(f"Auto-picked: tree={pick_parser_backend(tree=True)} links={pick_parser_backend()}")
+    print(f"\n{'backend':<12} {'full tree':>10} {'card stream':>12} {'img links':>10} {'links found':>12}")
+
+    results = {}
+    for backend in PARSER_BACKENDS:
+        if not parser_backend_available(backend):
+            print(f"{backend:<12} {'not installed':>47}")
+            continue
+        tree_time = stream_time = None
+        if backend in TREE_BACKENDS:
+            tree_time, _ = best_of(lambda: make_soup(content, backend), repeat)
+            stream_time, _ = best_of(lambda: stream_cards(content, backend), repeat)
+        links_time, links = best_of(lambda: find_links(content, backend, with_img=True), repeat)
+        results[backend] = {'tree': tree_time, 'stream': stream_time, 'links': links_time, 'count': len(links)}
+        tree_col = f"{tree_time * 1000:.0f} ms" if tree_time is not None else '-'
+        stream_col = f"{stream_time * 1000:.0f} ms" if stream_time is not None else '-'
+        print(f"{backend:<12} {tree_col:>10} {stream_col:>12} {links_time * 1000:>7.0f} ms {len(links):>12}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parser backends")
+    parser.add_argument('html_file', nargs='?', help="page to parse (default: first file in ./gee cat)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    html_file = args.html_file or next(iter(sorted(glob.glob('./gee cat/*.html'))), None)
+    if not html_file:
+        print("No HTML files found in gee cat folder")
+        sys.exit(1)
+    benchmark_parsers(html_file, args.repeat)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Compact the append-only satellite catalog into a single snapshot and refresh satellite_catalog.json
+"""
+
+import os
+import sys
+
+# Add the web_crawler directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
+
+from lightweight_crawler import LocalHTMLDataExtractor
+
+def compact_satellite_catalog():
+    print("=== SATELLITE CATALOG COMPACTION ===")
+
+    extractor = LocalHTMLDataExtractor()
+    store = extractor.get_satellite_catalog_store()
+    print(f"Catalog directory: {os.path.abspath(store.directory)}")
+
+    catalog = extractor.compact_satellite_catalog()
+    print(f"Snapshot: {store.snapshot_path}")
+    print(f"Export: {store.export_path}")
+    return bool(catalog)
+
+if __name__ == "__main__":
+    if compact_satellite_catalog():
+        print("\nCompaction completed successfully!")
+    else:
+        print("\nSatellite catalog is empty - nothing to compact")
@@ -7,15 +7,15 @@ import os
 import sys
 import glob
 import json
+import argparse
 from datetime import datetime
 
 # Add the web_crawler directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
 
-from lightweight_crawler import LocalHTMLDataExtractor
-from bs4 import BeautifulSoup
+from extraction_engine import LocalHTMLDataExtractor, MappedHTMLFile, json_default, setup_logging
 
-def extract_ee_catalog():
+def extract_ee_catalog(workers=1, incremental=False, index=False, profile=False):
     print("=== EARTH ENGINE CATALOG EXTRACTION ===")
 
     # Find the HTML file
@@ -30,51 +30,32 @@ def extract_ee_catalog():
 
     # Initialize extractor
     extractor = LocalHTMLDataExtractor()
+    extractor.config['profile']['enabled'] = profile
 
-    # Parse HTML
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
-    print("HTML parsed successfully")
-
-    # Extract Earth Engine catalog data
+    # Parse and extract Earth Engine catalog data in a single streaming pass over
+    # the memory-mapped page, or shard the cards across worker processes
     print("Extracting Earth Engine catalog datasets...")
-    datasets = extractor.extract_earth_engine_catalog(soup)
+    change_report = None
+    with MappedHTMLFile(html_file) as f:
+        if incremental:
+            datasets, change_report = extractor.refresh_earth_engine_catalog(f, workers=workers)
+        elif workers > 1:
+            datasets = extractor.extract_earth_engine_catalog_parallel(f, workers=workers)
+        else:
+            datasets = extractor.extract_earth_engine_catalog_streaming(f)
 
     if not datasets:
         print("No datasets extracted")
         return False
 
+    # Pre-scale gallery thumbnails once, off the UI thread
+    extractor.prescale_thumbnails(datasets)
+
     # Classify datasets
     classifications = extractor.classify_earth_engine_datasets(datasets)
 
     # Create comprehensive data structure
-    catalog_data = {
-        'extraction_info': {
-            'timestamp': datetime.now().isoformat(),
-            'source_file': html_file,
-            'extractor_version': 'enhanced_v3.0',
-            'total_datasets': len(datasets)
-        },
-        'datasets': datasets,
-        'classifications': classifications,
-        'statistics': {
-            'by_category': {k: len(v) for k, v in classifications.items() if v},
-            'quality_distribution': {
-                'high_quality': len([d for d in datasets if d.get('confidence_score', 0) >= 70]),
-                'medium_quality': len([d for d in datasets if 50 <= d.get('confidence_score', 0) < 70]),
-                'low_quality': len([d for d in datasets if d.get('confidence_score', 0) < 50])
-            },
-            'completeness': {
-                'with_titles': len([d for d in datasets if d.get('title')]),
-                'with_descriptions': len([d for d in datasets if d.get('description')]),
-                'with_tags': len([d for d in datasets if d.get('tags')]),
-                'with_urls': len([d for d in datasets if d.get('url')]),
-                'with_thumbnails': len([d for d in datasets if d.get('thumbnail')])
-            }
-        }
-    }
+    catalog_data = extractor.build_earth_engine_catalog_data(datasets, html_file, classifications)
 
     print(f"\n=== EXTRACTION RESULTS ===")
     print(f"Total datasets: {len(datasets)}")
@@ -97,15 +78,36 @@ def extract_ee_catalog():
     print(f"  With URLs: {stats['completeness']['with_urls']}")
     print(f"  With thumbnails: {stats['completeness']['with_thumbnails']}")
 
+    unmatched = extractor.get_unmatched_patterns()
+    print(f"\nPATTERNS WITHOUT HITS: {len(unmatched)}")
+    for group, pattern in unmatched:
+        print(f"  {group}: {pattern}")
+
+    if change_report:
+        report_file = os.path.join(extractor.output_dir, 'earth_engine_catalog_changes.json')
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(change_report, f, indent=2, ensure_ascii=False)
+        print(f"\nINCREMENTAL REFRESH:")
+        print(f"  Reused: {change_report['reused']} | Re-extracted: {change_report['extracted']}")
+        print(f"  Added: {len(change_report['added'])} | Removed: {len(change_report['removed'])} | Changed: {len(change_report['changed'])}")
+        print(f"  Change report: {report_file}")
+
     # Save to JSON
     output_file = os.path.join(extractor.output_dir, 'earth_engine_catalog.json')
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(catalog_data, f, indent=2, ensure_ascii=False)
+        json.dump(catalog_data, f, indent=2, ensure_ascii=False, default=json_default)
+    # The next incremental run diffs against this catalog only once it is saved
+    extractor.commit_manifest()
 
     print(f"\nData saved to: {output_file}")
 
+    if index:
+        extractor.config['index']['enabled'] = True
+        indexed = extractor.index_datasets(datasets, source=html_file)
+        print(f"Indexed {indexed} datasets in: {extractor.get_dataset_index().path}")
+
     # Show sample datasets
     print(f"\nSAMPLE DATASETS:")
     for i, dataset in enumerate(datasets[:10]):
@@ -121,11 +123,27 @@ def extract_ee_catalog():
     if len(datasets) > 10:
         print(f"... and {len(datasets) - 10} more datasets")
 
+    for run in extractor.profile_runs:
+        print(f"Profile saved to: {run['pstats']} (report: {run['report']})")
+
     print(f"\n=== SUCCESS: {len(datasets)} datasets extracted! ===")
     return True
 
 if __name__ == "__main__":
-    success = extract_ee_catalog()
+    parser = argparse.ArgumentParser(description="Extract the Earth Engine catalog from the local gee cat page")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for card extraction (0 = one per CPU core)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only re-extract cards that changed since the last run and write a change report")
+    parser.add_argument('--index', action='store_true',
+                        help="also write the datasets to the SQLite index (collected_data/catalog_index.sqlite)")
+    parser.add_argument('--profile', action='store_true',
+                        help="profile the extraction with cProfile and tracemalloc into collected_data/profiles")
+    args = parser.parse_args()
+
+    setup_logging()
+    success = extract_ee_catalog(workers=args.workers or os.cpu_count() or 1,
+                                 incremental=args.incremental, index=args.index, profile=args.profile)
     if success:
         print("\nExtraction completed successfully!")
         print("You can now view the data in earth_engine_catalog.json")
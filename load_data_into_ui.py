@@ -5,12 +5,14 @@ Load the extracted Earth Engine data into the UI for viewing
 
 import os
 import sys
+import glob
 import json
-import shutil
 
 # Add the web_crawler directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
 
+from lightweight_crawler import ThumbnailStore, generate_thumbnail_variants
+
 def create_ui_compatible_data():
     """Convert the extracted Earth Engine data to UI-compatible format"""
 
@@ -48,31 +50,36 @@ def create_ui_compatible_data():
 
     print(f"UI data saved to: {ui_file}")
 
-    # Create sample thumbnails for datasets that have thumbnail URLs
+    # Link each dataset to its own thumbnail from the gee cat folder. Images are
+    # stored once by content hash, so reruns only check existing links.
     thumbnails_dir = 'web_crawler/collected_data/thumbnails'
-    os.makedirs(thumbnails_dir, exist_ok=True)
+    store = ThumbnailStore(thumbnails_dir)
 
-    # Copy some sample thumbnails from the gee cat folder if they exist
-    gee_files_dir = 'gee cat/Earth Engine Data Catalog  _  Google for Developers_files'
-    if os.path.exists(gee_files_dir):
+    gee_files_dirs = [d for d in glob.glob('gee cat/*_files') if os.path.isdir(d)]
+    if gee_files_dirs:
+        gee_files_dir = gee_files_dirs[0]
         thumbnail_count = 0
-        for filename in os.listdir(gee_files_dir):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')) and thumbnail_count < 50:
-                src = os.path.join(gee_files_dir, filename)
-                # Find a matching dataset
-                for dataset in datasets[:50]:  # Process first 50 datasets
-                    dataset_id = dataset.get('dataset_id', 'unknown')
-                    if dataset_id != 'unknown':
-                        dest = os.path.join(thumbnails_dir, f"{dataset_id}_thumbnail.png")
-                        try:
-                            shutil.copy2(src, dest)
-                            dataset['thumbnail_local_path'] = dest
-                            thumbnail_count += 1
-                            break
-                        except Exception:
-                            continue
-
-        print(f"Created {thumbnail_count} sample thumbnails")
+        for dataset in datasets:
+            dataset_id = dataset.get('dataset_id', '')
+            thumbnail = dataset.get('thumbnail', '')
+            if not dataset_id or not thumbnail:
+                continue
+            src = os.path.join(gee_files_dir, os.path.basename(thumbnail))
+            if not os.path.exists(src):
+                continue
+            try:
+                ext = os.path.splitext(src)[1] or '.png'
+                dataset['thumbnail_local_path'] = store.add_file(src, f"{dataset_id}_thumbnail{ext}")
+                thumbnail_count += 1
+            except Exception as e:
+                print(f"Failed to store thumbnail for {dataset_id}: {e}")
+
+        print(f"Linked {thumbnail_count} dataset thumbnails")
+
+        # Pre-scale the gallery-size variants so the UI never decodes full images
+        written = generate_thumbnail_variants(
+            [d['thumbnail_local_path'] for d in datasets if d.get('thumbnail_local_path')])
+        print(f"Pre-scaled {written} gallery thumbnail variants")
 
     # Update the UI data with thumbnail paths
     with open(ui_file, 'w', encoding='utf-8') as f:
@@ -7,14 +7,14 @@ import os
 import sys
 import glob
 import json
+import argparse
 
 # Add the web_crawler directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
 
-from lightweight_crawler import LocalHTMLDataExtractor
-from bs4 import BeautifulSoup
+from extraction_engine import LocalHTMLDataExtractor, MappedHTMLFile, setup_logging
 
-def run_full_extraction():
+def run_full_extraction(profile=False):
     print("=== FLUTTER EARTH - ENHANCED EXTRACTION ===")
     print("Running full extraction on Earth Engine catalog...")
 
@@ -30,12 +30,11 @@ def run_full_extraction():
 
     # Initialize extractor
     extractor = LocalHTMLDataExtractor()
+    extractor.config['profile']['enabled'] = profile
 
-    # Parse HTML
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+    # Parse HTML from the memory-mapped page; the decoded text is dropped once the tree is built
+    with MappedHTMLFile(html_file) as f:
+        soup = extractor.make_soup(f.read())
     print("HTML parsed successfully")
 
     # Progress callback
@@ -118,6 +117,8 @@ def run_full_extraction():
         print(f"Total datasets extracted: {len(datasets)}")
         print(f"Output directory: {extractor.output_dir}")
         print(f"Thumbnails directory: {extractor.thumbnails_dir}")
+        for run in extractor.profile_runs:
+            print(f"Profile saved to: {run['pstats']} (report: {run['report']})")
 
         return True
 
@@ -126,7 +127,13 @@ def run_full_extraction():
         return False
 
 if __name__ == "__main__":
-    success = run_full_extraction()
+    parser = argparse.ArgumentParser(description="Run the full extraction on the local gee cat page")
+    parser.add_argument('--profile', action='store_true',
+                        help="profile extract_all_data with cProfile and tracemalloc into collected_data/profiles")
+    args = parser.parse_args()
+
+    setup_logging()
+    success = run_full_extraction(profile=args.profile)
     if success:
         print("\nFull extraction completed successfully!")
         print("You can now run the UI to view the extracted data with thumbnails.")
@@ -10,8 +10,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'web_crawler'))
 
 try:
-    from lightweight_crawler import LocalHTMLDataExtractor
-    from bs4 import BeautifulSoup
+    from extraction_engine import LocalHTMLDataExtractor, MappedHTMLFile, setup_logging
 
     def simple_test():
         print("Starting Earth Engine extraction test...")
@@ -30,11 +29,9 @@ try:
         print(f"Processing: {os.path.basename(html_file)}")
         print(f"Size: {os.path.getsize(html_file):,} bytes")
 
-        # Read and parse HTML
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        soup = BeautifulSoup(content, 'html.parser')
+        # Parse HTML from the memory-mapped page; the decoded text is dropped once the tree is built
+        with MappedHTMLFile(html_file) as f:
+            soup = extractor.make_soup(f.read())
         print("HTML parsed successfully")
 
         # Test Earth Engine specific extraction
@@ -66,6 +63,7 @@ try:
                 return False
 
     if __name__ == "__main__":
+        setup_logging()
         success = simple_test()
         if success:
             print("\nTest completed successfully!")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test the extraction benchmark harness on a small synthetic catalog page
+"""
+
+import json
+
+from benchmark_extraction import STAGES, percentile, run_benchmark
+
+CARD = """
+<li class="ee-sample-image ee-cards devsite-landing-row-item-description">
+  <a href="https://developers.google.com/earth-engine/datasets/catalog/LANDSAT_LC0{n}">
+    <h3 data-text="Landsat {n} Surface Reflectance">Landsat {n}</h3>
+    <figure><img src="./files/landsat_{n}.png"></figure>
+  </a>
+  <table><tr><td class="ee-dataset-description-snippet">Landsat {n} OLI/TIRS, 30m, 2013-04-11 to 2024-01-01.</td></tr></table>
+  <a class="ee-chip ee-tag" href="#">landsat</a>
+</li>
+"""
+
+
+def test_stage_timings_scale_with_the_card_count(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'files').mkdir()
+    for n in range(4):
+        (tmp_path / 'files' / f"landsat_{n}.png").write_bytes(b'\x89PNG' + bytes([n]) * 32)
+    page = tmp_path / 'catalog.html'
+    page.write_text("<html><body><ul>" + "".join(CARD.format(n=n) for n in range(4)) + "</ul></body></html>",
+                    encoding='utf-8')
+
+    results = run_benchmark(str(page), scales=(1, 3), repeat=2, isolate=False)
+    json.loads(json.dumps(results))
+
+    small, large = results['runs']
+    assert (small['cards'], large['cards']) == (4, 12)
+    assert large['datasets'] == 12 and large['peak_rss_bytes'] > 0
+    for run in results['runs']:
+        assert set(run['stages']) == set(STAGES)
+        assert run['stages']['parse']['count'] == run['cards'] * 2
+        assert run['stages']['json_save']['count'] == 2
+        assert run['stages']['thumbnail_copy']['count'] == run['datasets'] * 2
+        assert run['stages']['card_extract']['p50_ms'] <= run['stages']['card_extract']['p99_ms']
+
+    assert percentile([5, 1, 4, 2, 3], 50) == 3 and percentile(list(range(1, 101)), 99) == 99
+    assert percentile([], 99) == 0.0
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test the headless browser pool against local HTML fixtures
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from web_crawler.lightweight_crawler import HeadlessBrowserPool, LocalHTMLDataExtractor
+
+PAGE = """<html><head>
+<style>@font-face { font-family: Catalog; src: url(/font.woff2); } body { font-family: Catalog; }</style>
+<script src="https://www.google-analytics.com/analytics.js"></script>
+</head><body>
+<h1>Sentinel-2 Surface Reflectance</h1><img src="/thumb.png">
+<script>
+  setTimeout(function () {
+    var ld = document.createElement('script');
+    ld.type = 'application/ld+json';
+    ld.text = '{"name": "Sentinel-2 {path}"}';
+    document.head.appendChild(ld);
+  }, 300);
+</script>
+</body></html>"""
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    requested = []
+
+    def do_GET(self):
+        type(self).requested.append(self.path)
+        if self.path.startswith('/catalog/'):
+            body, content_type = PAGE.replace('{path}', self.path).encode(), 'text/html'
+        else:
+            body, content_type = b'\0' * 64, 'application/octet-stream'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    _FixtureHandler.requested = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_pool_renders_on_selector_and_blocks_heavy_requests(fixture_server):
+    pool = HeadlessBrowserPool(size=2, wait_selector='script[type="application/ld+json"]', timeout=10)
+    try:
+        pool.start()
+    except Exception as e:
+        pytest.skip(f"headless Chromium unavailable: {str(e).strip().splitlines()[0]}")
+
+    with pool:
+        start = time.monotonic()
+        html_content = pool.render(f"{fixture_server}/catalog/S2_SR")
+        assert time.monotonic() - start < 2
+        assert '"Sentinel-2 /catalog/S2_SR"' in html_content
+
+        # Renders from several threads share the two pages
+        urls = [f"{fixture_server}/catalog/{n}" for n in range(6)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pages = list(executor.map(pool.render, urls))
+        assert all(f'"Sentinel-2 /catalog/{n}"' in page for n, page in enumerate(pages))
+
+    assert _FixtureHandler.requested and all(path.startswith('/catalog/') for path in _FixtureHandler.requested)
+    assert not pool.running
+    assert not any(thread.name == 'browser-pool' for thread in threading.enumerate())
+
+
+def test_closed_pool_is_not_restarted():
+    pool = HeadlessBrowserPool()
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.render('http://127.0.0.1/catalog/S2_SR')
+    assert not pool.running
+
+
+def test_extractor_starts_the_pool_once(tmp_path, monkeypatch, fixture_server):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    extractor.config['browser']['timeout'] = 10
+    url = f"{fixture_server}/catalog/COPERNICUS_S2"
+
+    pool = extractor.get_browser_pool()
+    try:
+        if pool is None:
+            # No browser: reported once and the fallback quietly gives up
+            assert extractor.get_browser_pool() is None
+            assert extractor.extract_with_headless_browser(url) is None
+            assert not any(thread.name == 'browser-pool' for thread in threading.enumerate())
+        else:
+            assert extractor.get_browser_pool() is pool
+            soup = extractor.extract_with_headless_browser(url)
+            assert soup.find('script', type='application/ld+json') is not None
+    finally:
+        extractor.close_browser_pool()
+
+    extractor.config['browser']['enabled'] = False
+    assert extractor.get_browser_pool() is None
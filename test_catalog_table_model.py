@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test the satellite catalog table model and its filter proxy
+"""
+
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+from web_crawler.lightweight_crawler import CatalogFilterProxyModel, CatalogTableModel
+
+app = QApplication.instance() or QApplication([])
+
+
+def _record(name, provider, citations=0, doi=''):
+    return {'title': name, 'satellite_catalog': {
+        'layer_name': name, 'dataset_provider': provider, 'doi': doi,
+        'citations': ['c'] * citations, 'description': 'Land &amp; sea'}}
+
+
+def test_sync_inserts_only_new_rows():
+    model = CatalogTableModel()
+    inserted, resets = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    extracted = [_record('A', 'USGS'), {'title': 'plain page'}]
+    model.sync(extracted)
+    extracted.append(_record('B', 'NASA'))
+    model.sync(extracted)
+    model.sync(extracted)
+
+    assert model.rowCount() == 2
+    assert inserted == [(1, 1)] and len(resets) == 1
+    assert model.index(0, 11).data() == 'Land & sea'
+    assert model.record(1)['title'] == 'B'
+
+    # Replacing the list (e.g. clearing extracted data) rebuilds the rows
+    model.sync([])
+    assert model.rowCount() == 0 and len(resets) == 2
+
+
+def test_proxy_sorts_counts_numerically_and_filters():
+    model = CatalogTableModel()
+    model.sync([_record('A', 'USGS', 10), _record('B', 'NASA', 9, doi='10.1/x'), _record('C', 'usgs', 2)])
+    proxy = CatalogFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    proxy.sort(12, Qt.SortOrder.AscendingOrder)
+    assert [proxy.index(r, 0).data() for r in range(3)] == ['C', 'B', 'A']
+
+    proxy.set_filters({'provider': 'usgs'})
+    assert sorted(proxy.index(r, 0).data() for r in range(proxy.rowCount())) == ['A', 'C']
+    proxy.set_filters({'has_doi': True})
+    assert proxy.rowCount() == 1
+    assert proxy.data(proxy.index(0, 0), CatalogTableModel.RecordRole)['title'] == 'B'
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test the headless engine import and the python -m web_crawler command line
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from test_streaming_catalog import CATALOG_HTML
+from web_crawler.__main__ import main
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_engine_import_has_no_qt_or_side_effects():
+    probe = (
+        "import sys, faulthandler, logging\n"
+        "import web_crawler.extraction_engine\n"
+        "assert not [m for m in sys.modules if m.split('.')[0] in ('PySide6', 'psutil')]\n"
+        "assert not faulthandler.is_enabled() and sys.excepthook is sys.__excepthook__\n"
+        "assert not logging.getLogger('lightweight').handlers\n"
+    )
+    subprocess.run([sys.executable, '-c', probe], cwd=REPO_DIR, check=True)
+
+
+def test_extract_and_export_commands(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page = tmp_path / 'catalog.html'
+    page.write_text(CATALOG_HTML, encoding='utf-8')
+
+    assert main(['extract', str(page), '--no-thumbnails']) == 0
+    with open(tmp_path / 'collected_data' / 'earth_engine_catalog.json', encoding='utf-8') as f:
+        catalog = json.load(f)
+    assert catalog['extraction_info']['total_datasets'] == 2
+    assert catalog['statistics']['by_category'] == {'landsat': 1, 'vegetation': 1}
+
+    assert main(['export', '--format', 'jsonl', '--category', 'landsat', '--output', 'landsat.jsonl']) == 0
+    lines = (tmp_path / 'landsat.jsonl').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['dataset_id'] for line in lines] == ['LANDSAT_LC08_C02_T1_L2']
+
+    assert main(['export']) == 0
+    assert len(list((tmp_path / 'collected_data' / 'exports').glob('*.csv'))) == 1
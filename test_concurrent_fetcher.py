@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent detail-page fetcher against a local HTTP server
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from web_crawler.lightweight_crawler import ConcurrentFetcher, HostRateLimiter, LocalHTMLDataExtractor
+
+
+class _SlowPageHandler(BaseHTTPRequestHandler):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(0.05)
+            if self.path.startswith('/missing'):
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = f"<html><head><title>{self.path}</title></head><body>Provider: USGS.</body></html>".encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_iter_fetch_keeps_order_and_caps_concurrency():
+    server, base = _serve()
+    try:
+        _SlowPageHandler.peak = 0
+        fetcher = ConcurrentFetcher(requests.Session(), max_concurrency=4, host_rate=0)
+        urls = [f"{base}/page{i}" for i in range(12)] + [f"{base}/missing"]
+
+        results = list(fetcher.iter_fetch(urls, timeout=5))
+
+        assert [r['url'] for r in results] == urls
+        assert all(r['error'] is None for r in results[:-1])
+        assert results[0]['response'].text.startswith('<html><head><title>/page0</title>')
+        assert results[-1]['response'] is None and results[-1]['error'] is not None
+        assert 1 < _SlowPageHandler.peak <= 4
+    finally:
+        server.shutdown()
+
+
+def test_iter_fetch_bounds_requests_ahead_of_consumer():
+    fetcher = ConcurrentFetcher(requests.Session(), max_concurrency=2, host_rate=0)
+    started = []
+    fetcher.fetch = lambda url, retries=None, **kwargs: started.append(url) or {'url': url, 'response': None, 'error': None}
+    urls = [f"http://example.org/page{i}" for i in range(20)]
+
+    results = fetcher.iter_fetch(urls)
+    assert next(results)['url'] == urls[0]
+    time.sleep(0.1)
+
+    # Two requests per worker in flight, plus the one submitted as the first result was taken
+    assert len(started) == 5
+    assert [r['url'] for r in results] == urls[1:]
+
+def test_host_rate_limiter_spaces_requests_after_burst():
+    limiter = HostRateLimiter(rate=20, burst=2)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire('http://example.org/a')
+    limiter.acquire('http://other.example.org/b')
+
+    # 2 burst tokens, then 4 more at 20/s => ~0.2s; the other host is not delayed
+    assert 0.15 <= time.monotonic() - start < 1.0
+
+
+def test_extract_from_dataset_link_uses_prefetched_page(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server, base = _serve()
+    try:
+        extractor = LocalHTMLDataExtractor()
+        link = {'href': f"{base}/catalog/USGS_SRTMGL1_003", 'text': 'USGS SRTM'}
+        prefetched = extractor.get_fetcher().fetch(link['href'], timeout=5)
+
+        detailed = extractor.extract_from_dataset_link(link, None, prefetched)
+
+        assert detailed['layer_name'] == 'USGS SRTM'
+        assert detailed['dataset_provider'] == 'USGS'
+    finally:
+        server.shutdown()
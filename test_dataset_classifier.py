@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test the batch dataset classifier and the categories it caches on records
+"""
+
+from web_crawler.lightweight_crawler import DATASET_CATEGORIES, LocalHTMLDataExtractor, classify_dataset_text
+
+
+def test_first_matching_category_wins_with_its_terms():
+    assert classify_dataset_text('landsat 8 sea surface temperature') == ('landsat', ['landsat'])
+    assert classify_dataset_text('sea surface temperature') == ('climate', ['temperature'])
+    assert classify_dataset_text('ocean sst and marine heatwaves') == ('ocean', ['ocean', 'marine', 'sst'])
+    assert classify_dataset_text('global roads') == ('other', [])
+
+    for category, terms in DATASET_CATEGORIES:
+        assert classify_dataset_text(f"xx {terms[0]} xx")[0] == category
+
+
+def test_batch_classification_is_cached_on_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    datasets = [
+        {'title': 'MOD13Q1: Terra Vegetation Indices', 'description': 'NDVI and EVI', 'tags': ['MODIS']},
+        {'title': 'Copernicus DEM', 'description': None, 'tags': ['elevation'], 'keywords': ['Topography']},
+        {'title': 'Roads', 'description': ''},
+    ]
+
+    assert extractor.classify_datasets(datasets) == ['modis', 'terrain', 'other']
+    assert datasets[0]['category_terms'] == ['modis', 'terra']
+    assert datasets[1]['category_terms'] == ['dem', 'elevation', 'topography']
+
+    # Cached records are not scanned again, even if their text changes later
+    datasets[2]['title'] = 'Urban areas'
+    assert extractor.classify_single_dataset(datasets[2]) == 'other'
+    classifications = extractor.classify_earth_engine_datasets(datasets)
+    assert classifications['modis'] == [datasets[0]] and classifications['other'] == [datasets[2]]
+
+    # A record loaded from an older catalog has a category but no terms yet
+    stale = {'title': 'Sentinel-2 MSI', 'category': 'landsat'}
+    assert extractor.classify_single_dataset(stale) == 'sentinel'
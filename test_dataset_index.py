@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test the optional SQLite dataset index
+"""
+
+import json
+from web_crawler.lightweight_crawler import LocalHTMLDataExtractor
+from test_streaming_catalog import CATALOG_HTML
+
+
+def test_index_earth_engine_datasets_and_query(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    extractor.config['index']['enabled'] = True
+    datasets = extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML)
+
+    assert extractor.index_datasets(datasets, source='gee cat') == 2
+    index = extractor.get_dataset_index()
+
+    assert index.count() == 2
+    assert index.get('LANDSAT_LC08_C02_T1_L2')['title'] == 'Landsat 8 Level 2, Collection 2, Tier 1'
+    assert [d['dataset_id'] for d in extractor.query_datasets(tag='USGS')] == ['LANDSAT_LC08_C02_T1_L2']
+    assert [d['dataset_id'] for d in extractor.query_datasets(provider='USGS', category='landsat')] == ['LANDSAT_LC08_C02_T1_L2']
+    assert [d['dataset_id'] for d in extractor.query_datasets(start_from='2013-01-01')] == ['LANDSAT_LC08_C02_T1_L2']
+    assert extractor.query_datasets(category='urban') == []
+
+    # Re-indexing replaces rows instead of duplicating them
+    extractor.index_datasets(datasets)
+    assert index.count() == 2
+
+
+def test_save_data_to_json_writes_index_when_enabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    url = 'https://developers.google.com/earth-engine/datasets/catalog/NASA_GPM_L3_IMERG_V07'
+    data = {
+        'file_path': url,
+        'satellite_catalog': {
+            'layer_name': 'GPM: Global Precipitation Measurement',
+            'dataset_provider': 'NASA GES DISC',
+            'date_range': {'start': '2000-06-01', 'end': '2024-01-01'},
+            'pixel_size': '11132 meters',
+            'category_tags': ['precipitation', 'nasa']
+        }
+    }
+
+    extractor.save_data_to_json(data, url)
+    assert not (tmp_path / 'collected_data' / 'catalog_index.sqlite').exists()
+
+    extractor.config['index']['enabled'] = True
+    json_file = extractor.save_data_to_json(data, url)
+
+    record = extractor.get_dataset_index().get('NASA_GPM_L3_IMERG_V07')
+    assert record == json.load(open(json_file, encoding='utf-8'))['satellite_catalog']
+    assert [d['layer_name'] for d in extractor.query_datasets(category='climate', tag='nasa')] == [record['layer_name']]
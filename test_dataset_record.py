@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the slotted dataset record that catalog extraction builds
+"""
+
+import json
+import pickle
+import sys
+
+from test_streaming_catalog import CATALOG_HTML
+from web_crawler.lightweight_crawler import (DatasetRecord, LocalHTMLDataExtractor, SlottedRecord, SpatialInfo,
+                                             json_default)
+
+
+def _container_size(value):
+    """Bytes held by a record's containers, leaving out the strings both layouts share"""
+    if isinstance(value, (dict, SlottedRecord)):
+        return sys.getsizeof(value) + sum(_container_size(item) for item in value.values())
+    return 0 if isinstance(value, str) else sys.getsizeof(value)
+
+
+def test_record_reads_and_writes_like_a_dict():
+    record = DatasetRecord(title='Landsat 8', tags=['landsat'])
+    record['temporal_coverage']['start_date'] = '2013-04-11'
+    record['source_page'] = 'catalog.html'
+
+    assert not hasattr(record, '__dict__')
+    assert record['title'] == 'Landsat 8' and record.get('provider') == '' and record.get('missing', 1) == 1
+    assert record.get('keywords') == () and 'category' not in record
+    assert list(record)[:3] == ['dataset_id', 'title', 'description'] and list(record)[-1] == 'source_page'
+
+    plain = record.to_dict()
+    assert plain['keywords'] == [] and plain['temporal_coverage']['start_date'] == '2013-04-11'
+    assert record == plain and json.loads(json.dumps(record, default=json_default)) == plain
+    assert pickle.loads(pickle.dumps(record)) == record
+
+    assert record.pop('source_page') == 'catalog.html' and 'source_page' not in record
+    del record['extraction_timestamp']
+    assert 'extraction_timestamp' not in record.to_dict() and len(record) == len(plain) - 2
+
+    loaded = DatasetRecord.from_dict({'title': 'DEM', 'spatial_info': {'resolution': '30m'}})
+    assert isinstance(loaded['spatial_info'], SpatialInfo) and loaded.to_dict() == {
+        'title': 'DEM', 'spatial_info': {'resolution': '30m'}}
+
+    # Tags and providers built separately end up sharing one string
+    first, second = DatasetRecord(), DatasetRecord()
+    first['provider'], second['provider'] = ''.join(['US', 'GS']), ''.join(['U', 'SGS'])
+    first['tags'], second['tags'] = [''.join(['land', 'sat'])], [''.join(['lan', 'dsat'])]
+    assert first['provider'] is second['provider'] and first['tags'][0] is second['tags'][0]
+
+
+def test_extraction_builds_compact_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    datasets = extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML)
+    as_dicts = [dataset.to_dict() for dataset in datasets]
+
+    assert all(isinstance(dataset, DatasetRecord) for dataset in datasets)
+    assert datasets[0]['tags'] == ['landsat', 'usgs'] and datasets[0]['provider'] == 'USGS'
+    assert datasets[0]['temporal_coverage']['start_date'] == '2013-04-11'
+    assert _container_size(datasets[0]) * 2 < _container_size(as_dicts[0])
+
+    # Records reused from the incremental manifest come back as records too
+    manifest = str(tmp_path / 'manifest.json')
+    extractor.refresh_earth_engine_catalog(CATALOG_HTML, manifest)
+    extractor.commit_manifest()
+    reused, report = extractor.refresh_earth_engine_catalog(CATALOG_HTML, manifest)
+    assert report['reused'] == 2 and all(isinstance(dataset, DatasetRecord) for dataset in reused)
+    assert [dataset['dataset_id'] for dataset in reused] == [dataset['dataset_id'] for dataset in as_dicts]
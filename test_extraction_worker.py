@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test that UI extraction runs on the worker pool and reports back in batches
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QElapsedTimer, QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+from web_crawler.lightweight_crawler import ExtractionWorker, LocalHTMLDataExtractorUI
+
+app = QApplication.instance() or QApplication([])
+
+
+class _DetailPageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f"<html><head><title>{self.path}</title></head><body><h1>Landsat 8</h1></body></html>".encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _wait_for(signal, timeout_ms=20000):
+    loop = QEventLoop()
+    signal.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+
+
+def test_worker_results_arrive_in_coalesced_batches(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ui = LocalHTMLDataExtractorUI()
+    updates = []
+    ui.data_updated.connect(lambda: updates.append(len(ui.extracted_data)))
+
+    def job():
+        for i in range(200):
+            ui.post_result({'title': f"record {i}", 'satellite_catalog': {'layer_name': f"L{i}"}})
+        ui.extraction_done.emit()
+
+    ui.worker_pool.start(ExtractionWorker(job))
+    ui.worker_pool.waitForDone()
+    app.processEvents()
+
+    assert len(ui.extracted_data) == 200
+    assert ui.catalog_model.rowCount() == 200
+    assert len(updates) < 200
+
+
+def test_start_stays_disabled_until_a_stopped_run_finishes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ui = LocalHTMLDataExtractorUI()
+    release = threading.Event()
+
+    def job():
+        release.wait(10)
+        ui.extraction_done.emit()
+
+    ui.start_btn.setEnabled(False)
+    ui.worker_pool.start(ExtractionWorker(job))
+    ui.stop_extraction()
+    app.processEvents()
+    assert not ui.start_btn.isEnabled()
+
+    release.set()
+    ui.worker_pool.waitForDone()
+    app.processEvents()
+    assert ui.start_btn.isEnabled()
+    assert ui.extraction_status_label.text() == "Stopped"
+
+
+def test_start_extraction_keeps_event_loop_running(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _DetailPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        page = tmp_path / 'catalog.html'
+        page.write_text('<html><body>' + ''.join(
+            f'<a href="{base}/d{i}"><img src="t.png"></a>' for i in range(12)) + '</body></html>')
+
+        ui = LocalHTMLDataExtractorUI()
+        ui.extractor.config['performance']['host_rate'] = 0
+        ui.file_list.addItem(str(page))
+
+        gaps = []
+        clock = QElapsedTimer()
+        clock.start()
+        ticker = QTimer()
+        ticker.timeout.connect(lambda: gaps.append(clock.restart()))
+        ticker.start(16)
+
+        ui.start_extraction()
+        assert not ui.start_btn.isEnabled()
+        _wait_for(ui.extraction_done)
+        ticker.stop()
+
+        assert ui.start_btn.isEnabled()
+        assert len(list((tmp_path / 'collected_data').rglob('*.json'))) >= 12
+        assert gaps and max(gaps) < 250
+    finally:
+        server.shutdown()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test the model/delegate dataset gallery
+"""
+
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QListView
+from web_crawler.lightweight_crawler import DatasetGalleryDelegate, DatasetGalleryModel
+
+app = QApplication.instance() or QApplication([])
+
+
+def _datasets(count):
+    names = ['landsat', 'modis', 'sentinel']
+    return [{'title': f"{names[i % 3]} {i}", 'category': names[i % 3],
+             'thumbnail_local_path': f"thumb_{i}.png"} for i in range(count)]
+
+
+def test_model_classifies_once_and_filters_rows():
+    classified = []
+    model = DatasetGalleryModel(lambda d: classified.append(d) or d['category'])
+    model.set_datasets(_datasets(9))
+
+    model.set_category_filter('modis')
+    assert model.rowCount() == 3
+    assert model.index(0).data(DatasetGalleryModel.DatasetRole)['title'] == 'modis 1'
+
+    # Appended rows outside the filter stay hidden until the filter changes
+    model.append_datasets(_datasets(12)[9:])
+    assert model.rowCount() == 4
+    model.set_category_filter(None)
+    assert model.rowCount() == 12
+    assert len(classified) == 12
+
+
+def test_delegate_only_loads_visible_thumbnails():
+    loaded = []
+    model = DatasetGalleryModel(lambda d: d['category'])
+    model.set_datasets(_datasets(5000))
+
+    view = QListView()
+    view.setViewMode(QListView.ViewMode.IconMode)
+    view.setUniformItemSizes(True)
+    view.setItemDelegate(DatasetGalleryDelegate(lambda path: loaded.append(path), lambda c: '#7f8c8d', view))
+    view.setModel(model)
+    view.resize(900, 600)
+    view.grab()
+
+    assert 0 < len(loaded) < 50
+    # Missing images are remembered instead of being retried on every paint
+    view.grab()
+    assert len(loaded) == len(set(loaded))
+
+
+def test_delegate_retries_missing_thumbnails_after_a_reset():
+    loaded = []
+    delegate = DatasetGalleryDelegate(lambda path: loaded.append(path), lambda c: '#7f8c8d')
+    model = DatasetGalleryModel(lambda d: d['category'])
+    model.modelReset.connect(delegate.forget_missing)
+
+    assert delegate.pixmap_for('thumb_0.png') is None and delegate.pixmap_for('thumb_0.png') is None
+    model.set_datasets(_datasets(1))
+    delegate.pixmap_for('thumb_0.png')
+    assert loaded == ['thumb_0.png', 'thumb_0.png']
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test the on-disk HTTP response cache against a local HTTP server
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from web_crawler.lightweight_crawler import ConcurrentFetcher, HTTPResponseCache, LocalHTMLDataExtractor
+
+
+class _VersionedPageHandler(BaseHTTPRequestHandler):
+    version = 'v1'
+    full_responses = 0
+    not_modified = 0
+
+    def do_GET(self):
+        cls = type(self)
+        etag = f'"{cls.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            cls.not_modified += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        cls.full_responses += 1
+        body = f"<html><body>{self.path} {cls.version}</body></html>".encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', 'Mon, 01 Jan 2024 00:00:00 GMT')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    _VersionedPageHandler.version = 'v1'
+    _VersionedPageHandler.full_responses = 0
+    _VersionedPageHandler.not_modified = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _VersionedPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_fresh_entries_skip_the_network(tmp_path):
+    server, base = _serve()
+    try:
+        cache = HTTPResponseCache(str(tmp_path), ttl=3600)
+        fetcher = ConcurrentFetcher(requests.Session(), host_rate=0, cache=cache)
+
+        first = fetcher.fetch(f"{base}/a", timeout=5)
+        second = fetcher.fetch(f"{base}/a", timeout=5)
+
+        assert _VersionedPageHandler.full_responses == 1
+        assert second['response'].text == first['response'].text
+        assert second['response'].from_cache
+        assert cache.stats['hits'] == 1
+    finally:
+        server.shutdown()
+
+
+def test_stale_entries_revalidate_and_pick_up_changes(tmp_path):
+    server, base = _serve()
+    try:
+        fetcher = ConcurrentFetcher(requests.Session(), host_rate=0, cache=HTTPResponseCache(str(tmp_path), ttl=0))
+        fetcher.fetch(f"{base}/a", timeout=5)
+
+        # A new cache instance reads the entries back from disk
+        fetcher.cache = HTTPResponseCache(str(tmp_path), ttl=0)
+        unchanged = fetcher.fetch(f"{base}/a", timeout=5)
+        assert _VersionedPageHandler.not_modified == 1
+        assert unchanged['response'].text.endswith('/a v1</body></html>')
+
+        _VersionedPageHandler.version = 'v2'
+        changed = fetcher.fetch(f"{base}/a", timeout=5)
+        assert _VersionedPageHandler.full_responses == 2
+        assert changed['response'].text.endswith('/a v2</body></html>')
+    finally:
+        server.shutdown()
+
+
+def test_lru_eviction_bounds_cache_size(tmp_path):
+    server, base = _serve()
+    try:
+        cache = HTTPResponseCache(str(tmp_path), ttl=3600, max_bytes=70)
+        fetcher = ConcurrentFetcher(requests.Session(), host_rate=0, cache=cache)
+
+        for name in ('a', 'b', 'c'):
+            fetcher.fetch(f"{base}/{name}", timeout=5)
+
+        assert cache.lookup(f"{base}/a") is None
+        assert cache.lookup(f"{base}/c") is not None
+        assert cache.stats['evicted'] >= 1
+        assert len(list(tmp_path.glob('*.body'))) == len(cache._index)
+    finally:
+        server.shutdown()
+
+
+def test_missing_body_is_a_cache_miss(tmp_path):
+    server, base = _serve()
+    try:
+        for ttl in (3600, 0):
+            cache = HTTPResponseCache(str(tmp_path / str(ttl)), ttl=ttl)
+            fetcher = ConcurrentFetcher(requests.Session(), host_rate=0, retry_delay=30, cache=cache)
+            fetcher.fetch(f"{base}/a", timeout=5)
+
+            # Another thread evicts the body between lookup() and the read
+            def lookup_then_evict(url, lookup=cache.lookup, directory=tmp_path / str(ttl)):
+                meta = lookup(url)
+                for body in directory.glob('*.body'):
+                    body.unlink()
+                return meta
+            cache.lookup = lookup_then_evict
+            refetched = fetcher.fetch(f"{base}/a", timeout=5)
+
+            assert refetched['error'] is None and not getattr(refetched['response'], 'from_cache', False)
+            assert cache.stats['hits'] == cache.stats['revalidated'] == 0 and cache.stats['misses'] == 2
+        assert _VersionedPageHandler.full_responses == 4 and _VersionedPageHandler.not_modified == 1
+    finally:
+        server.shutdown()
+
+def test_extractor_cache_lives_under_collected_data(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+
+    assert extractor.get_fetcher().cache is extractor.get_http_cache()
+    assert (tmp_path / 'collected_data' / 'http_cache').is_dir()
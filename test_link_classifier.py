@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test the combined keyword matcher behind the link classification checks
+"""
+
+import random
+
+from web_crawler.lightweight_crawler import LINK_KEYWORDS, KeywordMatcher, LocalHTMLDataExtractor, classify_link
+
+
+def test_matcher_agrees_with_substring_tests():
+    keywords = sorted({keyword for keywords in LINK_KEYWORDS.values() for keyword in keywords})
+    matcher = KeywordMatcher(keywords)
+    rng = random.Random(7)
+
+    # Overlapping and prefix keywords: 'ad' inside 'download', 'ad' + 'advertisement', 'x.com' in 'box.com'
+    samples = ['download an advertisement from box.com', '', 'HOME']
+    samples += [''.join(rng.choice(keywords + ['/', ' ', 'q', '.']) for _ in range(rng.randint(1, 6)))
+                for _ in range(500)]
+    for text in samples:
+        hits = matcher.scan(text)
+        assert [k for k in keywords if hits & matcher.bits[k]] == [k for k in keywords if k in text]
+
+
+def test_classify_link_matches_the_individual_checks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    dataset = {'href': 'https://developers.google.com/earth-engine/datasets/catalog/LANDSAT_LC08_C02_T1_L2',
+               'text': 'USGS Landsat 8 Level 2, Collection 2, Tier 1'}
+    social = {'href': 'https://twitter.com/googleearth', 'text': 'Follow us'}
+    external = {'href': 'https://example.org/noaa/sst', 'text': 'NOAA satellite dataset'}
+    weak_external = {'href': 'https://example.org/page', 'text': 'Landsat'}
+
+    flags = classify_link(dataset['href'], dataset['text'])
+    assert flags['looks_like_dataset'] and flags['earth_engine'] and flags['catalog_link']
+    assert not flags['junk']
+    assert classify_link(social['href'], social['text'])['junk']
+    assert extractor.is_social_media_link(social['href'], social['text'])
+    assert extractor.is_external_junk_domain(social['href'])
+    assert extractor.has_strong_dataset_indicators(external['href'], external['text'])
+
+    links = [dataset, social, external, weak_external, {'href': '#', 'text': 'Top'}]
+    assert extractor.validate_catalog_links(links) == [dataset, external]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the memory-mapped HTML reader against the in-memory extraction paths
+"""
+
+import threading
+
+from web_crawler.lightweight_crawler import (TREE_BACKENDS, LinkCollector, LocalHTMLDataExtractor, MappedHTMLFile,
+                                             find_links, parser_backend_available, split_ee_catalog_cards,
+                                             tokenize_html)
+
+CARD = """
+<li class="ee-sample-image ee-cards devsite-landing-row-item-description">
+  <a href="https://developers.google.com/earth-engine/datasets/catalog/COPERNICUS_S2_SR_{n}">
+    <h3 data-text="Sentinel-2 Surface Reflectance {n}">Sentinel-2 – Réflectance {n}</h3>
+    <figure><img src="./files/s2_{n}.png"><figcaption><!-- provider: ESA 🛰 --></figcaption></figure>
+  </a>
+  <table><tr><td class="ee-dataset-description-snippet">Niveau-2A, 10m résolution, 2017-03-28 à 2024-01-01.</td></tr></table>
+  <a class="ee-chip ee-tag" href="#">sentinel</a>
+</li>
+"""
+CATALOG_HTML = "<html><body><ul>" + "".join(CARD.format(n=n) for n in range(5)) + "</ul></body></html>"
+
+
+def _write(tmp_path, text):
+    path = tmp_path / 'catalog.html'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_small_reads_decode_across_multibyte_boundaries(tmp_path):
+    path = _write(tmp_path, CATALOG_HTML)
+
+    for size in (1, 3, 7, 4096):
+        with MappedHTMLFile(path) as f:
+            assert ''.join(iter(lambda: f.read(size), '')) == CATALOG_HTML
+
+    empty = _write(tmp_path, '')
+    with MappedHTMLFile(empty) as f:
+        assert len(f) == 0 and f.read() == ''
+        assert find_links(f) == []
+
+
+def test_mapped_file_matches_text_extraction(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = _write(tmp_path, CATALOG_HTML)
+    extractor = LocalHTMLDataExtractor()
+
+    with MappedHTMLFile(path) as f:
+        assert split_ee_catalog_cards(f) == split_ee_catalog_cards(CATALOG_HTML)
+
+    for backend in TREE_BACKENDS:
+        if not parser_backend_available(backend):
+            continue
+        extractor.config['parser']['backend'] = backend
+        expected = [d['dataset_id'] for d in extractor.iter_earth_engine_catalog(CATALOG_HTML)]
+        with MappedHTMLFile(path) as f:
+            mapped = [d['dataset_id'] for d in extractor.iter_earth_engine_catalog(f, chunk_size=5)]
+        assert len(expected) == 5 and mapped == expected
+        with MappedHTMLFile(path) as f:
+            assert extractor.find_links(f, with_img=True) == extractor.find_links(CATALOG_HTML, with_img=True)
+
+
+def test_abandoned_tokenizer_releases_its_thread():
+    for backend in TREE_BACKENDS:
+        if not parser_backend_available(backend):
+            continue
+        steps = tokenize_html(LinkCollector(), CATALOG_HTML, backend, chunk_size=10)
+        next(steps)
+        next(steps)
+        steps.close()
+
+    assert not any(thread.name == 'html-tokenizer' for thread in threading.enumerate())
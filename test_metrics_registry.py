@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the metrics registry, its Prometheus endpoint and the stage timings the CLI records
+"""
+
+import json
+import urllib.request
+
+import pytest
+from test_streaming_catalog import CATALOG_HTML
+from web_crawler.__main__ import main
+from web_crawler.lightweight_crawler import METRICS, MetricsRegistry
+
+
+def test_registry_series_snapshot_and_prometheus_text():
+    registry = MetricsRegistry(namespace='test', buckets=(0.01, 0.1, 1.0))
+    registry.inc('fetch_total', result='ok')
+    registry.inc('fetch_total', 2, result='ok')
+    registry.inc('fetch_total', result='error')
+    registry.set_gauge('process_rss_bytes', 1024)
+    for value in [0.005] * 50 + [0.05] * 49 + [5.0]:
+        registry.observe('stage_seconds', value, stage='parse')
+    with pytest.raises(ValueError):
+        with registry.stage('save', kind='page'):
+            raise ValueError('disk full')
+
+    snapshot = json.loads(json.dumps(registry.snapshot()))
+    counters = {(c['name'], tuple(c['labels'].items())): c['value'] for c in snapshot['counters']}
+    assert counters[('fetch_total', (('result', 'ok'),))] == 3
+    assert counters[('stage_errors_total', (('kind', 'page'), ('stage', 'save')))] == 1
+    parse = next(h for h in snapshot['histograms'] if h['labels'] == {'stage': 'parse'})
+    assert parse['count'] == 100 and parse['max'] == 5.0
+    assert parse['buckets'] == {'0.01': 50, '0.1': 99, '1.0': 99, '+Inf': 100}
+    assert parse['p50'] <= 0.01 and 0.01 < parse['p90'] <= 0.1 and parse['p99'] <= 0.1
+
+    # Estimates stay inside the observed range, even for a single observation
+    registry.observe('stage_seconds', 0.0778, stage='render')
+    render = next(h for h in registry.snapshot()['histograms'] if h['labels'] == {'stage': 'render'})
+    assert render['min'] == render['p50'] == render['p99'] == 0.0778
+
+    text = registry.prometheus_text()
+    assert '# TYPE test_fetch_total counter' in text
+    assert 'test_fetch_total{result="ok"} 3' in text
+    assert 'test_process_rss_bytes 1024' in text
+    assert 'test_stage_seconds_bucket{stage="parse",le="+Inf"} 100' in text
+    assert 'test_stage_seconds_count{kind="page",stage="save"} 1' in text
+    assert text.count('# TYPE test_stage_seconds histogram') == 1
+
+    server = registry.serve()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert response.headers['Content-Type'].startswith('text/plain')
+            assert response.read().decode('utf-8') == registry.prometheus_text()
+        with urllib.request.urlopen(f"{base}/metrics.json", timeout=5) as response:
+            assert json.load(response)['gauges'][0]['value'] == 1024
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cli_writes_stage_timings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page = tmp_path / 'catalog.html'
+    page.write_text(CATALOG_HTML, encoding='utf-8')
+    METRICS.reset()
+
+    assert main(['--metrics-port', '0', 'extract', str(page), '--no-thumbnails']) == 0
+
+    with open(tmp_path / 'collected_data' / 'metrics.json', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    stages = {(h['labels']['stage'], h['labels'].get('kind')): h['count'] for h in snapshot['histograms']}
+    assert stages[('extract', 'card')] == 2
+    assert stages[('parse', 'stream')] >= 1
+    assert stages[('save', 'catalog')] == 1
+    counters = {(c['name'], c['labels'].get('result')): c['value'] for c in snapshot['counters']}
+    assert counters[('catalog_cards_total', 'dataset')] == 2
+    assert {g['name']: g['value'] for g in snapshot['gauges']}['catalog_datasets'] == 2
+
+
+def test_cli_merges_worker_metrics(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page = tmp_path / 'catalog.html'
+    page.write_text(CATALOG_HTML, encoding='utf-8')
+    METRICS.reset()
+
+    assert main(['extract', str(page), '--no-thumbnails', '--workers', '2']) == 0
+
+    with open(tmp_path / 'collected_data' / 'metrics.json', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    stages = {(h['labels']['stage'], h['labels'].get('kind')): h['count'] for h in snapshot['histograms']}
+    assert stages[('extract', 'card')] == 2
+    counters = {(c['name'], c['labels'].get('result')): c['value'] for c in snapshot['counters']}
+    assert counters[('catalog_cards_total', 'dataset')] == 2
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test that the HTML parser backends agree on link discovery
+"""
+
+from bs4 import BeautifulSoup
+from web_crawler.lightweight_crawler import (PARSER_BACKENDS, TREE_BACKENDS, LinkCollector, LocalHTMLDataExtractor,
+                                             find_links, parser_backend_available, pick_parser_backend, tokenize_html)
+
+PAGE_HTML = """
+<html><body>
+<a href="https://developers.google.com/earth-engine/datasets/catalog/LANDSAT_LC08_C02_T1_L2">
+  <img src="landsat.png"> Landsat 8 <!-- provider: USGS --><script>var x = 1;</script> <b>Level 2</b></a>
+<a href="/earth-engine/datasets/tags/landsat">landsat</a>
+<a name="anchor-without-href">skip</a>
+<a href="https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MOD13Q1"><figure><img src="m.png"></figure></a>
+</body></html>
+"""
+
+
+def test_backends_find_the_same_links():
+    installed = [backend for backend in PARSER_BACKENDS if parser_backend_available(backend)]
+    expected = find_links(PAGE_HTML, 'html.parser')
+
+    assert [link['text'] for link in expected] == ['Landsat 8 Level 2', 'landsat', '']
+    for backend in installed:
+        assert find_links(PAGE_HTML, backend) == expected
+        with_img = find_links(PAGE_HTML, backend, with_img=True)
+        assert [link['href'].rsplit('/', 1)[1] for link in with_img] == ['LANDSAT_LC08_C02_T1_L2', 'MODIS_061_MOD13Q1']
+
+
+def test_streamed_links_match_soup_text_across_chunk_boundaries():
+    expected = [{'href': a['href'], 'text': a.get_text(" ", strip=True)}
+                for a in BeautifulSoup(PAGE_HTML, 'html.parser').find_all('a', href=True)]
+
+    for backend in TREE_BACKENDS:
+        if not parser_backend_available(backend):
+            continue
+        collector = LinkCollector()
+        for _ in tokenize_html(collector, PAGE_HTML, backend, chunk_size=5):
+            pass
+        assert collector.links() == expected
+    assert find_links('') == []
+
+
+def test_auto_pick_prefers_installed_backends():
+    assert pick_parser_backend('html.parser') == 'html.parser'
+    assert pick_parser_backend('no-such-parser') == next(b for b in PARSER_BACKENDS if parser_backend_available(b))
+    assert pick_parser_backend('selectolax', tree=True) in TREE_BACKENDS
+
+    extractor = LocalHTMLDataExtractor()
+    extractor.config['parser']['backend'] = 'html.parser'
+    assert extractor.make_soup(PAGE_HTML).builder.NAME == 'html.parser'
+    assert len(extractor.find_dataset_page_links(PAGE_HTML)) == 2
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the precompiled metadata pattern registry and its hit counters
+"""
+
+from bs4 import BeautifulSoup
+from test_streaming_catalog import CATALOG_HTML
+from web_crawler.lightweight_crawler import PATTERNS, PatternRegistry, LocalHTMLDataExtractor
+
+
+def test_registry_counts_checks_and_hits():
+    registry = PatternRegistry()
+    registry.register('year', [r'since\s+(\d{4})', r'(\d{4})'])
+
+    assert registry.findall('year', 'available since 1999') == ['1999']
+    assert registry.findall('year', 'no dates') == []
+
+    stats = registry.statistics()['year']
+    assert [entry['checks'] for entry in stats] == [2, 1]
+    assert [entry['hits'] for entry in stats] == [1, 0]
+    assert registry.unmatched() == [('year', r'(\d{4})')]
+
+
+def test_extractors_use_shared_registry():
+    PATTERNS.reset()
+    extractor = LocalHTMLDataExtractor()
+    dataset = {'temporal_coverage': {}, 'spatial_info': {}}
+
+    extractor.extract_temporal_metadata('Data from 2000-02-24 to 2023-01-01, daily', dataset)
+    extractor.extract_access_metadata('Licensed CC BY 4.0, doi:10.5067/MODIS/MOD13Q1.061', dataset)
+
+    assert dataset['temporal_coverage'] == {
+        'start_date': '2000-02-24', 'end_date': '2023-01-01', 'update_frequency': 'daily'
+    }
+    assert dataset['license'] == 'CC BY'
+    assert dataset['doi'] == '10.5067/MODIS/MOD13Q1.061'
+
+    stats = extractor.get_pattern_statistics()
+    assert stats['temporal.date_range'][0]['hits'] == 1
+    assert stats['temporal.date_range'][1]['checks'] == 0
+
+
+def test_parallel_extraction_merges_worker_counters():
+    extractor = LocalHTMLDataExtractor()
+    PATTERNS.reset()
+    extractor.extract_earth_engine_catalog_parallel(CATALOG_HTML, workers=1)
+    expected = PATTERNS.statistics()
+
+    PATTERNS.reset()
+    extractor.extract_earth_engine_catalog_parallel(CATALOG_HTML, workers=2)
+
+    assert PATTERNS.statistics() == expected and expected['ee_card.provider'][0]['hits'] == 1
+
+
+def test_citation_extraction_with_compiled_patterns():
+    extractor = LocalHTMLDataExtractor()
+    soup = BeautifulSoup(
+        '<div><span>Citations:</span> Didan, K. (2021). MODIS Vegetation Index, doi:10.5067/MODIS</div>'
+        '<div><span>Terms of Use</span> Free to use without restriction.</div>',
+        'html.parser'
+    )
+    satellite_data = {'citations': [], 'doi': '', 'terms_of_use': '', 'description': ''}
+
+    extractor.extract_citation_data(soup, satellite_data)
+
+    assert satellite_data['doi']
+    assert satellite_data['citations'][0].startswith('Didan, K. (2021)')
+    assert satellite_data['terms_of_use'] == 'Free to use without restriction.'
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test the opt-in cProfile/tracemalloc capture around extraction runs
+"""
+
+import os
+import pstats
+import tracemalloc
+
+from test_streaming_catalog import CATALOG_HTML
+from web_crawler.__main__ import main
+from web_crawler.lightweight_crawler import LocalHTMLDataExtractor, profile_run
+
+
+def _allocate_blocks():
+    return [bytearray(4096) for _ in range(256)]
+
+
+def test_profile_run_writes_stats_and_allocation_report(tmp_path):
+    with profile_run('outer', str(tmp_path)) as run:
+        with profile_run('inner', str(tmp_path)) as inner:
+            blocks = _allocate_blocks()
+
+    assert inner['pstats'] is None and not tracemalloc.is_tracing()
+    assert sorted(tmp_path.iterdir()) == sorted([tmp_path / os.path.basename(run['pstats']),
+                                                 tmp_path / os.path.basename(run['report'])])
+    functions = {name for _, _, name in pstats.Stats(run['pstats']).stats}
+    assert '_allocate_blocks' in functions
+
+    with open(run['report'], encoding='utf-8') as f:
+        report = f.read()
+    assert 'Profile: outer' in report and 'Traced memory: peak' in report
+    assert 'return [bytearray(4096) for _ in range(256)]' in report
+    assert 'functions by cumulative time' in report
+    del blocks
+
+
+def test_extractor_profiles_only_when_enabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    extractor = LocalHTMLDataExtractor()
+    assert len(extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML)) == 2
+    assert extractor.profile_runs == [] and not (tmp_path / 'collected_data' / 'profiles').exists()
+
+    extractor.config['profile']['enabled'] = True
+    extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML)
+    [run] = extractor.profile_runs
+    assert run['label'] == 'extract_earth_engine_catalog_streaming'
+    assert pstats.Stats(run['pstats']).total_calls > 0
+
+
+def test_cli_profile_flag(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    page = tmp_path / 'catalog.html'
+    page.write_text(CATALOG_HTML, encoding='utf-8')
+
+    assert main(['--profile', 'extract', str(page), '--no-thumbnails']) == 0
+
+    profiles = tmp_path / 'collected_data' / 'profiles'
+    [stats_file] = profiles.glob('*_extract.pstats')
+    [report_file] = profiles.glob('*_extract.txt')
+    functions = {name for _, _, name in pstats.Stats(str(stats_file)).stats}
+    assert {'cmd_extract', 'extract_earth_engine_catalog_streaming'} <= functions
+    assert 'allocation sites' in report_file.read_text(encoding='utf-8')
+    assert f"Profile saved to: {os.path.join('collected_data', 'profiles', stats_file.name)}" in capsys.readouterr().out
+
+    # With a worker pool requested, the cards are still extracted where the profiler can see them
+    assert main(['--profile', 'extract', str(page), '--no-thumbnails', '--workers', '2']) == 0
+    assert 'extracting cards in this process instead of 2 workers' in capsys.readouterr().out
+    [stats_file] = set(profiles.glob('*_extract.pstats')) - {stats_file}
+    assert 'build_ee_dataset' in {name for _, _, name in pstats.Stats(str(stats_file)).stats}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the append-only satellite catalog store
+"""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+from web_crawler.lightweight_crawler import SatelliteCatalogStore
+
+
+def test_append_read_and_compact(tmp_path):
+    store = SatelliteCatalogStore(str(tmp_path))
+    store.append('Landsat 8', {'layer_name': 'LC08 C02 T1'})
+    store.append('Sentinel-2', {'layer_name': 'S2 SR'})
+    store.append('Landsat 8', {'layer_name': 'LC08 C02 T2'})
+
+    expected = {
+        'Landsat 8': [{'layer_name': 'LC08 C02 T1'}, {'layer_name': 'LC08 C02 T2'}],
+        'Sentinel-2': [{'layer_name': 'S2 SR'}]
+    }
+    assert store.read() == expected
+
+    assert store.compact() == expected
+    assert json.loads((tmp_path / 'satellite_catalog.json').read_text(encoding='utf-8')) == expected
+    assert not list(tmp_path.glob('*.jsonl'))
+
+    # Appends after compaction land in a new segment; a reopened store sees everything
+    store.append('MODIS', {'layer_name': 'MOD13Q1'})
+    reopened = SatelliteCatalogStore(str(tmp_path))
+    assert reopened.read() == {**expected, 'MODIS': [{'layer_name': 'MOD13Q1'}]}
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    store = SatelliteCatalogStore(str(tmp_path))
+    store.append('Landsat 8', {'layer_name': 'LC08'})
+    with open(store.path, 'a', encoding='utf-8') as f:
+        f.write('{"satellite": "Sentinel-2", "rec')
+
+    assert store.read() == {'Landsat 8': [{'layer_name': 'LC08'}]}
+
+    # The next append terminates the torn line instead of gluing onto it
+    store.append('MODIS', {'layer_name': 'MOD13Q1'})
+    assert SatelliteCatalogStore(str(tmp_path)).read() == {'Landsat 8': [{'layer_name': 'LC08'}],
+                                                           'MODIS': [{'layer_name': 'MOD13Q1'}]}
+
+
+def test_compaction_by_another_store_keeps_its_appends(tmp_path):
+    writer, compactor = SatelliteCatalogStore(str(tmp_path)), SatelliteCatalogStore(str(tmp_path))
+    writer.append('Landsat 8', {'layer_name': 'LC08'})
+    compactor.compact()
+    writer.append('Landsat 8', {'layer_name': 'LC09'})
+    compactor.append('MODIS', {'layer_name': 'MOD13Q1'})
+
+    expected = {'Landsat 8': [{'layer_name': 'LC08'}, {'layer_name': 'LC09'}], 'MODIS': [{'layer_name': 'MOD13Q1'}]}
+    assert writer.read() == expected and compactor.compact() == expected
+
+
+def test_opening_the_store_reads_only_the_snapshot_segment_number(tmp_path, monkeypatch):
+    store = SatelliteCatalogStore(str(tmp_path))
+    store.append('Landsat 8', {'layer_name': 'LC08'})
+    store.compact()
+    assert (tmp_path / 'satellite_catalog.snapshot.segment').read_text(encoding='ascii') == '1'
+
+    monkeypatch.setattr(SatelliteCatalogStore, '_load_snapshot', lambda self: pytest.fail("parsed the snapshot"))
+    reopened = SatelliteCatalogStore(str(tmp_path))
+    reopened.append('MODIS', {'layer_name': 'MOD13Q1'})
+    assert reopened.path.endswith('satellite_catalog.2.jsonl')
+
+
+def test_legacy_catalog_file_is_imported(tmp_path):
+    (tmp_path / 'satellite_catalog.json').write_text(json.dumps({'GOES': [{'layer_name': 'GOES-16'}]}), encoding='utf-8')
+    store = SatelliteCatalogStore(str(tmp_path))
+    store.append('GOES', {'layer_name': 'GOES-18'})
+
+    assert store.read() == {'GOES': [{'layer_name': 'GOES-16'}, {'layer_name': 'GOES-18'}]}
+    store.compact()
+    assert SatelliteCatalogStore(str(tmp_path)).read() == {'GOES': [{'layer_name': 'GOES-16'}, {'layer_name': 'GOES-18'}]}
+
+
+def _hold_store_lock(directory, held, seconds):
+    with SatelliteCatalogStore(directory)._locked():
+        held.set()
+        time.sleep(seconds)
+
+
+def test_lock_is_held_across_processes(tmp_path):
+    held = multiprocessing.Event()
+    holder = multiprocessing.Process(target=_hold_store_lock, args=(str(tmp_path), held, 0.5))
+    holder.start()
+    try:
+        assert held.wait(10)
+        start = time.monotonic()
+        SatelliteCatalogStore(str(tmp_path)).append('Landsat 8', {'layer_name': 'LC08'})
+        assert time.monotonic() - start >= 0.3
+    finally:
+        holder.join()
+    assert holder.exitcode == 0
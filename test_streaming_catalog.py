@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test that the streaming catalog parser matches the BeautifulSoup extraction
+"""
+
+from bs4 import BeautifulSoup
+from web_crawler.lightweight_crawler import (TREE_BACKENDS, LocalHTMLDataExtractor, parser_backend_available,
+                                             split_ee_catalog_cards)
+
+CATALOG_HTML = """
+<html><body><ul>
+<li class="ee-sample-image ee-cards devsite-landing-row-item-description">
+  <a href="https://developers.google.com/earth-engine/datasets/catalog/LANDSAT_LC08_C02_T1_L2">
+    <h3 class="no-link" data-text="Landsat 8 Level 2, Collection 2, Tier 1">Landsat 8</h3>
+    <figure><img src="./files/LANDSAT_LC08_C02_T1_L2_sample.png"><figcaption><!-- provider: USGS --></figcaption></figure>
+  </a>
+  <table><tr><td class="ee-dataset-description-snippet">Surface reflectance from 2013-04-11 to 2024-01-01 at 30m resolution.</td></tr></table>
+  <a class="ee-chip ee-tag" href="#">landsat</a>
+  <a class="ee-chip ee-tag" href="#">usgs</a>
+</li>
+<li class="ee-sample-image ee-cards devsite-landing-row-item-description">
+  <a href="https://developers.google.com/earth-engine/datasets/catalog/MODIS_061_MOD13Q1?hl=en">
+    <h3 data-text="MOD13Q1.061 Vegetation Indices 16-Day Global 250m">MOD13Q1</h3>
+  </a>
+  <table><tr><td class="ee-dataset-description-snippet">NDVI and EVI<br>vegetation indices.</td></tr></table>
+  <script>var ignored = "<li>";</script>
+</li>
+<li class="other-card"><h3 data-text="Not a dataset">Other</h3></li>
+</ul></body></html>
+"""
+
+TRICKY_CARD = """<li class="ee-sample-image ee-cards">
+  <a href="https://developers.google.com/earth-engine/datasets/catalog/{0}"><h3 data-text="{0}">{0}</h3></a>
+  {1}
+</li>"""
+
+
+def _normalize(datasets):
+    for dataset in datasets:
+        dataset.pop('extraction_timestamp')
+        dataset['bands'] = sorted(dataset['bands'])
+    return datasets
+
+
+def test_streaming_matches_soup_extraction():
+    extractor = LocalHTMLDataExtractor()
+
+    soup_datasets = extractor.extract_earth_engine_catalog(BeautifulSoup(CATALOG_HTML, 'html.parser'))
+    streamed = extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML)
+
+    assert len(streamed) == 2
+    assert _normalize(streamed) == _normalize(soup_datasets)
+
+
+def test_streaming_handles_small_chunks():
+    extractor = LocalHTMLDataExtractor()
+
+    datasets = list(extractor.iter_earth_engine_catalog(CATALOG_HTML, chunk_size=7))
+
+    assert [d['dataset_id'] for d in datasets] == ['LANDSAT_LC08_C02_T1_L2', 'MODIS_061_MOD13Q1']
+    assert datasets[0]['provider'] == 'USGS'
+    assert datasets[0]['tags'] == ['landsat', 'usgs']
+
+
+def test_streaming_tokenizers_agree():
+    extractor = LocalHTMLDataExtractor()
+    extractor.config['parser']['backend'] = 'html.parser'
+    expected = _normalize(extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML))
+
+    for backend in TREE_BACKENDS:
+        if parser_backend_available(backend):
+            extractor.config['parser']['backend'] = backend
+            assert _normalize(list(extractor.iter_earth_engine_catalog(CATALOG_HTML, chunk_size=7))) == expected
+
+
+def test_parallel_extraction_keeps_page_order():
+    extractor = LocalHTMLDataExtractor()
+
+    expected = _normalize(extractor.extract_earth_engine_catalog_streaming(CATALOG_HTML))
+    from_text = extractor.extract_earth_engine_catalog_parallel(CATALOG_HTML, workers=2)
+    from_soup = extractor.extract_earth_engine_catalog_parallel(BeautifulSoup(CATALOG_HTML, 'html.parser'), workers=1)
+
+    assert _normalize(from_text) == expected
+    assert _normalize(from_soup) == expected
+
+
+def test_incremental_refresh_reports_changes(tmp_path):
+    extractor = LocalHTMLDataExtractor()
+    manifest = str(tmp_path / 'manifest.json')
+
+    datasets, report = extractor.refresh_earth_engine_catalog(CATALOG_HTML, manifest)
+    assert report['added'] == ['LANDSAT_LC08_C02_T1_L2', 'MODIS_061_MOD13Q1']
+    assert report['extracted'] == 2 and len(datasets) == 2
+
+    # Until the caller commits the manifest, a rerun still sees every card as new
+    datasets, report = extractor.refresh_earth_engine_catalog(CATALOG_HTML, manifest)
+    assert report['extracted'] == 2 and not (tmp_path / 'manifest.json').exists()
+    assert extractor.commit_manifest() == manifest and extractor.commit_manifest() is None
+
+    # Reformatting whitespace alone does not count as a change
+    reformatted = CATALOG_HTML.replace('\n  <a class', '\n\n      <a class')
+    datasets, report = extractor.refresh_earth_engine_catalog(reformatted, manifest)
+    assert report['reused'] == 2 and report['extracted'] == 0
+    assert not (report['added'] or report['removed'] or report['changed'])
+    extractor.commit_manifest()
+
+    edited = CATALOG_HTML.replace('NDVI and EVI', 'NDVI, EVI').replace(
+        'LANDSAT_LC08_C02_T1_L2"', 'LANDSAT_LC09_C02_T1_L2"')
+    datasets, report = extractor.refresh_earth_engine_catalog(edited, manifest)
+    assert report['changed'] == ['MODIS_061_MOD13Q1']
+    assert report['added'] == ['LANDSAT_LC09_C02_T1_L2']
+    assert report['removed'] == ['LANDSAT_LC08_C02_T1_L2']
+    assert [d['description'] for d in datasets][1] == 'NDVI, EVIvegetation indices.'
+
+
+def test_card_boundaries_ignore_li_markup_outside_tags():
+    page = '<html><body><ul>{}{}{}</ul></body></html>'.format(
+        TRICKY_CARD.format('A', '<script>var s="<li>";</script><!-- <li> --><span title="</li><li>">x</span>'),
+        # An omitted </li> is implied by the next <li>
+        TRICKY_CARD.format('B', '<ul><li>nested</li></ul>')[:-len('</li>')],
+        TRICKY_CARD.format('C', ''))
+    extractor = LocalHTMLDataExtractor()
+
+    cards = split_ee_catalog_cards(page)
+    assert len(cards) == 3 and '<!-- <li> -->' in cards[0] and cards[1].endswith('</ul>\n')
+    assert split_ee_catalog_cards(page.encode('utf-8'), chunk_size=5) == cards
+
+    expected = ['A', 'B', 'C']
+    assert [d['dataset_id'] for d in extractor.extract_earth_engine_catalog_streaming(page)] == expected
+    assert [d['dataset_id'] for d in extractor.extract_earth_engine_catalog_parallel(page, workers=2)] == expected
+    for backend in TREE_BACKENDS:
+        if parser_backend_available(backend):
+            extractor.config['parser']['backend'] = backend
+            assert [d['dataset_id'] for d in extractor.iter_earth_engine_catalog(page)] == expected
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test the background structured log writer
+"""
+
+import json
+import os
+import queue
+from web_crawler.lightweight_crawler import _StructuredLogWriter
+
+
+def test_writer_batches_in_order_and_flushes(tmp_path):
+    path = tmp_path / 'structured.log'
+    writer = _StructuredLogWriter(path, batch_size=16)
+
+    for i in range(500):
+        writer.write(json.dumps({'event': 'card', 'index': i}))
+    writer.flush()
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['index'] for line in lines] == list(range(500))
+
+    writer.write(json.dumps({'event': 'last'}))
+    writer.close()
+    assert json.loads(path.read_text(encoding='utf-8').splitlines()[-1]) == {'event': 'last'}
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = _StructuredLogWriter(tmp_path / 'structured.log', max_queue=1)
+    # Stand in for a stalled writer thread: a full queue nobody drains
+    writer._pid = os.getpid()
+    writer._queue = queue.Queue(maxsize=1)
+
+    writer.write(json.dumps({'event': 'queued'}))
+    writer.write(json.dumps({'event': 'overflow'}))
+
+    assert writer.dropped == 1
+    assert writer._queue.qsize() == 1
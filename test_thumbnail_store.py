@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed thumbnail store
+"""
+
+import os
+from web_crawler.lightweight_crawler import ThumbnailStore
+
+
+def test_identical_images_are_stored_once(tmp_path):
+    src_dir = tmp_path / 'src'
+    src_dir.mkdir()
+    (src_dir / 'a_sample.png').write_bytes(b'\x89PNG same pixels')
+    (src_dir / 'b_sample.png').write_bytes(b'\x89PNG same pixels')
+    store = ThumbnailStore(str(tmp_path / 'thumbnails'))
+
+    first = store.add_file(str(src_dir / 'a_sample.png'), 'A_thumbnail.png')
+    second = store.add_file(str(src_dir / 'b_sample.png'), 'B_thumbnail.png')
+
+    objects = [p for p in (tmp_path / 'thumbnails' / 'objects').rglob('*') if p.is_file()]
+    assert len(objects) == 1
+    assert os.path.samefile(first, second)
+    assert open(second, 'rb').read() == b'\x89PNG same pixels'
+
+
+def test_rerun_skips_unchanged_sources(tmp_path):
+    src = tmp_path / 'c_sample.png'
+    src.write_bytes(b'\x89PNG v1')
+    thumbnails = tmp_path / 'thumbnails'
+    ThumbnailStore(str(thumbnails)).add_file(str(src), 'C_thumbnail.png')
+    index_size = (thumbnails / 'index.jsonl').stat().st_size
+
+    # A fresh store (next run) reuses the indexed object without re-reading the source
+    ThumbnailStore(str(thumbnails)).add_file(str(src), 'C_thumbnail.png')
+    assert (thumbnails / 'index.jsonl').stat().st_size == index_size
+
+    src.write_bytes(b'\x89PNG v2 changed')
+    path = ThumbnailStore(str(thumbnails)).add_file(str(src), 'C_thumbnail.png')
+    assert open(path, 'rb').read() == b'\x89PNG v2 changed'
+
+
+def test_known_urls_are_not_downloaded_again(tmp_path):
+    store = ThumbnailStore(str(tmp_path))
+    url = 'https://example.org/thumbs/X_sample.png'
+    assert store.lookup_url(url) is None
+
+    store.add_url_content(url, b'\x89PNG remote', '.png', 'X_thumbnail.png')
+
+    assert ThumbnailStore(str(tmp_path)).lookup_url(url).endswith('.png')
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test the pre-scaled gallery thumbnail variants
+"""
+
+import builtins
+import os
+
+import pytest
+import PySide6.QtGui
+from PySide6.QtGui import QColor, QImage
+from web_crawler import extraction_engine as engine
+from web_crawler.lightweight_crawler import generate_thumbnail_variants, thumbnail_variant_path
+
+
+def _write_png(path, width=256, height=256, color='teal'):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    assert image.save(str(path), 'PNG')
+    return str(path)
+
+
+def test_variants_are_scaled_beside_the_original(tmp_path):
+    original = _write_png(tmp_path / 'AAFC_ACI_thumbnail.png')
+
+    assert generate_thumbnail_variants([original], workers=2) == 2
+
+    small = thumbnail_variant_path(original, 1)
+    large = thumbnail_variant_path(original, 2)
+    assert small.endswith('AAFC_ACI_thumbnail@180x140.png')
+    assert QImage(small).size().toTuple() == (140, 140)
+    assert QImage(large).size().toTuple() == (280, 280)
+
+    # Up-to-date variants are not regenerated
+    assert generate_thumbnail_variants([original]) == 0
+    os.utime(original, (os.path.getmtime(small) + 10,) * 2)
+    assert generate_thumbnail_variants([original]) == 2
+
+
+def test_hardlinked_originals_share_one_scaled_pair(tmp_path):
+    original = _write_png(tmp_path / 'a_thumbnail.png')
+    twin = str(tmp_path / 'b_thumbnail.png')
+    os.link(original, twin)
+
+    generate_thumbnail_variants([original, twin, str(tmp_path / 'missing.png')])
+
+    for scale in (1, 2):
+        assert os.path.samefile(thumbnail_variant_path(original, scale), thumbnail_variant_path(twin, scale))
+
+
+def test_relinking_to_an_older_object_rescales(tmp_path):
+    original = _write_png(tmp_path / 'a_thumbnail.png')
+    older = _write_png(tmp_path / 'older_object.png', 256, 128, 'navy')
+    os.utime(older, (os.path.getmtime(original) - 3600,) * 2)
+    generate_thumbnail_variants([original])
+
+    # The dataset name now points at a different, older image
+    os.remove(original)
+    os.link(older, original)
+
+    assert generate_thumbnail_variants([original]) == 2
+    assert QImage(thumbnail_variant_path(original, 1)).size().toTuple() == (180, 90)
+    assert generate_thumbnail_variants([original]) == 0
+
+
+def test_unchanged_originals_are_not_read_again(tmp_path, monkeypatch):
+    originals = [_write_png(tmp_path / f"{name}_thumbnail.png") for name in ('a', 'b')]
+    assert generate_thumbnail_variants(originals) == 4
+
+    opened = []
+    real_open = builtins.open
+    monkeypatch.setattr(builtins, 'open', lambda file, *args, **kwargs: opened.append(str(file)) or real_open(
+        file, *args, **kwargs))
+    monkeypatch.setattr(engine, '_file_digest', lambda path: pytest.fail(f"hashed {path}"))
+    monkeypatch.setattr(PySide6.QtGui, 'QImage', lambda path: pytest.fail(f"decoded {path}"))
+
+    assert generate_thumbnail_variants(originals) == 0
+    assert opened and all(path.endswith('.png.source') for path in opened)
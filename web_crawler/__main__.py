@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Headless command line for the extraction engine (no Qt required)
+
+    python -m web_crawler extract [SOURCE] [--workers N] [--incremental] [--index]
+    python -m web_crawler follow-links [SOURCE] [--limit N]
+    python -m web_crawler export [--format csv|json|jsonl] [--output PATH] [--category C]
+
+Every command writes its stage timings and counters to collected_data/metrics.json;
+--metrics-port also serves them in Prometheus text format while the command runs.
+--profile runs the command under cProfile and tracemalloc and writes a .pstats file
+and an allocation report to collected_data/profiles.
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+import contextlib
+from datetime import datetime
+
+if __package__:
+    from .extraction_engine import (METRICS, PARSER_BACKENDS, DatasetRecord, LocalHTMLDataExtractor, MappedHTMLFile,
+                                    json_default, profile_run, setup_logging)
+else:
+    from extraction_engine import (METRICS, PARSER_BACKENDS, DatasetRecord, LocalHTMLDataExtractor, MappedHTMLFile,
+                                   json_default, profile_run, setup_logging)
+
+
+def find_catalog_page(source):
+    """The catalog page given on the command line, or the first page in ./gee cat"""
+    if source:
+        return source
+    html_files = sorted(glob.glob('./gee cat/*.html'))
+    return html_files[0] if html_files else None
+
+
+def make_extractor(args):
+    extractor = LocalHTMLDataExtractor()
+    extractor.config['parser']['backend'] = args.parser
+    if args.metrics_port is not None:
+        port = extractor.start_metrics_server(args.metrics_port)
+        print(f"Metrics: http://127.0.0.1:{port}/metrics")
+    # main() writes the metrics snapshot once the command is done
+    args.extractor = extractor
+    return extractor
+
+
+def cmd_extract(args):
+    html_file = find_catalog_page(args.source)
+    if not html_file or not os.path.exists(html_file):
+        print("No catalog HTML file found")
+        return 1
+
+    print(f"Processing: {os.path.basename(html_file)} ({os.path.getsize(html_file):,} bytes)")
+    extractor = make_extractor(args)
+    workers = args.workers or os.cpu_count() or 1
+
+    change_report = None
+    with MappedHTMLFile(html_file) as f:
+        if args.incremental:
+            datasets, change_report = extractor.refresh_earth_engine_catalog(f, workers=workers)
+        elif workers > 1:
+            datasets = extractor.extract_earth_engine_catalog_parallel(f, workers=workers)
+        else:
+            datasets = extractor.extract_earth_engine_catalog_streaming(f)
+
+    if not datasets:
+        print("No datasets extracted")
+        return 1
+
+    if not args.no_thumbnails:
+        extractor.prescale_thumbnails(datasets)
+
+    catalog_data = extractor.build_earth_engine_catalog_data(datasets, html_file)
+    output_file = os.path.join(extractor.output_dir, 'earth_engine_catalog.json')
+    with METRICS.stage('save', kind='catalog'), open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(catalog_data, f, indent=2, ensure_ascii=False, default=json_default)
+    # The next incremental run diffs against this catalog only once it is saved
+    extractor.commit_manifest()
+
+    print(f"Datasets: {len(datasets)}")
+    for category, count in sorted(catalog_data['statistics']['by_category'].items()):
+        print(f"  {category.title()}: {count}")
+
+    if change_report:
+        report_file = os.path.join(extractor.output_dir, 'earth_engine_catalog_changes.json')
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(change_report, f, indent=2, ensure_ascii=False)
+        print(f"Reused: {change_report['reused']} | Re-extracted: {change_report['extracted']} | "
+              f"Added: {len(change_report['added'])} | Removed: {len(change_report['removed'])} | "
+              f"Changed: {len(change_report['changed'])}")
+
+    if args.index:
+        extractor.config['index']['enabled'] = True
+        indexed = extractor.index_datasets(datasets, source=html_file)
+        print(f"Indexed {indexed} datasets in: {extractor.get_dataset_index().path}")
+
+    print(f"Data saved to: {output_file}")
+    return 0
+
+
+def cmd_follow_links(args):
+    html_file = find_catalog_page(args.source)
+    if not html_file or not os.path.exists(html_file):
+        print("No catalog HTML file found")
+        return 1
+
+    extractor = make_extractor(args)
+    with MappedHTMLFile(html_file) as f:
+        links = extractor.find_dataset_page_links(f)
+    if args.limit:
+        links = links[:args.limit]
+    print(f"Following {len(links)} dataset links from {os.path.basename(html_file)}")
+    if not links:
+        return 1
+
+    summary = extractor.follow_dataset_links(links, verify=not args.insecure)
+    print(f"Saved: {summary['saved']} | Failed: {summary['failed']} | Output: {extractor.output_dir}")
+    return 0 if summary['saved'] else 1
+
+
+def cmd_export(args):
+    input_file = args.input or os.path.join('collected_data', 'earth_engine_catalog.json')
+    if not os.path.exists(input_file):
+        print(f"Catalog not found: {input_file} (run the extract command first)")
+        return 1
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        datasets = [DatasetRecord.from_dict(dataset) for dataset in json.load(f).get('datasets', [])]
+
+    extractor = make_extractor(args)
+    if args.category:
+        datasets = [d for d in datasets if extractor.classify_single_dataset(d) == args.category.lower()]
+    if args.provider:
+        datasets = [d for d in datasets if args.provider.lower() in d.get('provider', '').lower()]
+
+    output_file = args.output or os.path.join(
+        extractor.output_dir, 'exports',
+        f"earth_engine_catalog_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{args.format}")
+    count = extractor.export_datasets(datasets, output_file, args.format)
+    print(f"Exported {count} datasets to: {output_file}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m web_crawler',
+                                     description="Headless Earth Engine catalog extraction")
+    parser.add_argument('--verbose', action='store_true', help="also print log records to the console")
+    parser.add_argument('--parser', choices=('auto',) + PARSER_BACKENDS, default='auto',
+                        help="HTML parser backend (auto = fastest installed)")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="serve Prometheus metrics on this localhost port while running (0 = any free port)")
+    parser.add_argument('--profile', action='store_true',
+                        help="profile the command with cProfile and tracemalloc into collected_data/profiles")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    extract = subparsers.add_parser('extract', help="extract the catalog page into earth_engine_catalog.json")
+    extract.add_argument('source', nargs='?', help="catalog HTML file (default: first file in ./gee cat)")
+    extract.add_argument('--workers', type=int, default=1,
+                         help="worker processes for card extraction (0 = one per CPU core)")
+    extract.add_argument('--incremental', action='store_true',
+                         help="only re-extract cards that changed since the last run and write a change report")
+    extract.add_argument('--index', action='store_true', help="also write the datasets to the SQLite index")
+    extract.add_argument('--no-thumbnails', action='store_true', help="skip pre-scaling gallery thumbnails")
+    extract.set_defaults(func=cmd_extract)
+
+    follow = subparsers.add_parser('follow-links', help="fetch and extract every dataset page linked from the catalog")
+    follow.add_argument('source', nargs='?', help="catalog HTML file (default: first file in ./gee cat)")
+    follow.add_argument('--limit', type=int, default=0, help="follow at most this many links")
+    follow.add_argument('--insecure', action='store_true', help="do not verify TLS certificates")
+    follow.set_defaults(func=cmd_follow_links)
+
+    export = subparsers.add_parser('export', help="export extracted datasets to csv, json or jsonl")
+    export.add_argument('--input', help="catalog JSON (default: collected_data/earth_engine_catalog.json)")
+    export.add_argument('--format', choices=['csv', 'json', 'jsonl'], default='csv')
+    export.add_argument('--output', help="output file (default: collected_data/exports/...)")
+    export.add_argument('--category', help="only datasets in this category (e.g. landsat)")
+    export.add_argument('--provider', help="only datasets whose provider contains this text")
+    export.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logging(console=args.verbose)
+    # One profile for the whole command; the extractor's own profiling hooks are no-ops inside it
+    profiling = (profile_run(args.command, os.path.join('collected_data', 'profiles')) if args.profile
+                 else contextlib.nullcontext())
+    run = None
+    try:
+        with profiling as run:
+            return args.func(args)
+    finally:
+        extractor = getattr(args, 'extractor', None)
+        if extractor is not None:
+            extractor.write_metrics_snapshot()
+            extractor.stop_metrics_server()
+        if run and run['pstats']:
+            print(f"Profile saved to: {run['pstats']} (report: {run['report']})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
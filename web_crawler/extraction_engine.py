@@ -0,0 +1,5885 @@
+#!/usr/bin/env python3
+"""
+Extraction engine - everything LocalHTMLDataExtractor needs without Qt
+
+Importing this module has no side effects: logging handlers, the crash log and
+the exception hook are installed by setup_logging(). The PySide6 UI lives in
+lightweight_crawler.py and the headless CLI in __main__.py.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import warnings
+import re
+import gc
+import queue
+import atexit
+import asyncio
+from datetime import datetime
+from collections import deque
+from collections.abc import Mapping, MutableMapping
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import html
+import faulthandler
+import logging
+from logging.handlers import RotatingFileHandler
+import pathlib
+import hashlib
+import sqlite3
+import mmap
+import codecs
+import functools
+import operator
+import bisect
+import itertools
+import contextlib
+import cProfile
+import pstats
+import tracemalloc
+import linecache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+__all__ = [
+    'PatternRegistry', 'PATTERNS', 'MetricsRegistry', 'METRICS', 'profile_run', 'KeywordMatcher', 'LINK_KEYWORDS',
+    'classify_link', 'DATASET_CATEGORIES', 'classify_dataset_text', 'SlottedRecord', 'TemporalCoverage', 'SpatialInfo',
+    'DatasetRecord', 'json_default', 'StreamingHTMLHandler', 'EECatalogCardParser', 'MappedHTMLFile',
+    'split_ee_catalog_cards',
+    'HostRateLimiter', 'HTTPResponseCache', 'ConcurrentFetcher', 'HeadlessBrowserPool', 'SatelliteCatalogStore',
+    'DatasetIndex', 'ThumbnailStore', 'PARSER_BACKENDS', 'TREE_BACKENDS', 'parser_backend_available',
+    'pick_parser_backend', 'make_soup', 'tokenize_html', 'LinkCollector', 'find_links', 'GALLERY_THUMBNAIL_SIZE', 'THUMBNAIL_SCALES',
+    'thumbnail_variant_path', 'generate_thumbnail_variants', 'LocalHTMLDataExtractor',
+    'setup_logging',
+]
+
+_logs_dir = pathlib.Path(os.path.join(os.path.dirname(__file__), 'logs'))
+_logger = logging.getLogger('lightweight')
+
+
+# Global exception hook to log uncaught exceptions
+def _log_excepthook(exctype, value, tb):
+    try:
+        with open(os.path.join(os.path.dirname(__file__), 'lightweight_errors.log'), 'a', encoding='utf-8') as ef:
+            ef.write(f"[{datetime.now().isoformat()}] Uncaught: {exctype.__name__}: {value}\n")
+    except Exception:
+        pass
+    sys.__excepthook__(exctype, value, tb)
+
+
+def setup_logging(console=True):
+    """Install the crash log, exception hook and log handlers (once per process)"""
+    # Enable fault handler to capture hard crashes
+    if not faulthandler.is_enabled():
+        try:
+            crash_log_path = os.path.join(os.path.dirname(__file__), 'lightweight_crash.log')
+            setup_logging._crash_log = open(crash_log_path, 'w', buffering=1, encoding='utf-8')
+            faulthandler.enable(file=setup_logging._crash_log)
+        except Exception:
+            pass
+
+    sys.excepthook = _log_excepthook
+
+    # Configure comprehensive logging
+    if not _logger.handlers:
+        _logs_dir.mkdir(parents=True, exist_ok=True)
+        _logger.setLevel(logging.INFO)
+        fmt = logging.Formatter('%(asctime)s | %(levelname)s | %(threadName)s | %(name)s | %(message)s')
+        file_handler = RotatingFileHandler(_logs_dir / 'app.log', maxBytes=2_000_000, backupCount=5, encoding='utf-8')
+        file_handler.setFormatter(fmt)
+        _logger.addHandler(file_handler)
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(fmt)
+            _logger.addHandler(console_handler)
+
+class _StructuredLogWriter:
+    """Background writer for structured.log: one thread, batched writes, bounded queue
+
+    Callers only enqueue a serialized line. When the queue is full new lines are
+    dropped (and counted) instead of blocking the crawl or growing memory.
+    """
+
+    def __init__(self, path, max_queue=10000, batch_size=256, flush_interval=0.5):
+        self.path = path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+    def _ensure_started(self):
+        # Also restarts in forked worker processes, where the thread does not exist
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._thread = threading.Thread(target=self._run, name='structured-log', daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def write(self, line):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        log_queue = self._queue
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as jf:
+            while True:
+                try:
+                    batch = [log_queue.get(timeout=self.flush_interval)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = None in batch
+                lines = [line for line in batch if line is not None]
+                if self.dropped:
+                    dropped, self.dropped = self.dropped, 0
+                    lines.append(json.dumps({'ts': datetime.now().isoformat(), 'event': 'log_dropped', 'count': dropped}))
+                try:
+                    if lines:
+                        jf.write('\n'.join(lines) + '\n')
+                        jf.flush()
+                except Exception:
+                    pass
+                for _ in batch:
+                    log_queue.task_done()
+                if stop:
+                    return
+
+    def flush(self):
+        """Block until every queued line has been written"""
+        if self._pid == os.getpid():
+            self._queue.join()
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        if self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        self._pid = None
+
+
+_structured_log = _StructuredLogWriter(_logs_dir / 'structured.log')
+atexit.register(_structured_log.close)
+
+def _log_json(event_type: str, **kwargs):
+    try:
+        record = {
+            'ts': datetime.now().isoformat(),
+            'event': event_type,
+            **kwargs
+        }
+        _structured_log.write(json.dumps(record, ensure_ascii=False))
+    except Exception:
+        pass
+
+# Suppress warnings
+warnings.filterwarnings('ignore')
+
+class PatternRegistry:
+    """Precompiled regex patterns grouped per metadata field, with hit counters"""
+
+    def __init__(self):
+        self._groups = {}
+        self._checks = {}
+        self._hits = {}
+
+    def register(self, group, patterns, flags=0):
+        """Compile and register an ordered list of patterns under a field name"""
+        compiled = tuple(re.compile(pattern, flags) for pattern in patterns)
+        self._groups[group] = compiled
+        self._checks[group] = [0] * len(compiled)
+        self._hits[group] = [0] * len(compiled)
+        return compiled
+
+    def pattern(self, group, index=0):
+        """Return a single compiled pattern, e.g. for BeautifulSoup string matchers"""
+        return self._groups[group][index]
+
+    def iter_findall(self, group, text):
+        """Yield the non-empty findall results of each pattern in order
+
+        Patterns are only evaluated as the caller consumes the generator, so a
+        ``break`` after the first result skips the remaining patterns.
+        """
+        checks = self._checks[group]
+        hits = self._hits[group]
+        for index, pattern in enumerate(self._groups[group]):
+            checks[index] += 1
+            matches = pattern.findall(text)
+            if matches:
+                hits[index] += 1
+                yield matches
+
+    def findall(self, group, text):
+        """Return the findall result of the first pattern that matches, or []"""
+        for matches in self.iter_findall(group, text):
+            return matches
+        return []
+
+    def search(self, group, text):
+        """Return the first ``re.Match`` found by the group's patterns, or None"""
+        checks = self._checks[group]
+        hits = self._hits[group]
+        for index, pattern in enumerate(self._groups[group]):
+            checks[index] += 1
+            match = pattern.search(text)
+            if match:
+                hits[index] += 1
+                return match
+        return None
+
+    def statistics(self):
+        """Per-group list of {pattern, checks, hits} entries"""
+        return {
+            group: [
+                {'pattern': pattern.pattern, 'checks': self._checks[group][i], 'hits': self._hits[group][i]}
+                for i, pattern in enumerate(patterns)
+            ]
+            for group, patterns in self._groups.items()
+        }
+
+    def unmatched(self):
+        """Patterns that were evaluated at least once but never matched"""
+        return [
+            (group, entry['pattern'])
+            for group, entries in self.statistics().items()
+            for entry in entries
+            if entry['checks'] and not entry['hits']
+        ]
+
+    def counters(self):
+        """Copy of the check and hit counters, to pass to counter_delta() later"""
+        return {group: (list(self._checks[group]), list(self._hits[group])) for group in self._groups}
+
+    def counter_delta(self, since):
+        """Checks and hits added since a counters() copy, for merge_counters() in another process"""
+        delta = {}
+        for group, (checks, hits) in since.items():
+            added = ([now - before for now, before in zip(self._checks[group], checks)],
+                     [now - before for now, before in zip(self._hits[group], hits)])
+            if any(added[0]):
+                delta[group] = added
+        return delta
+
+    def merge_counters(self, delta):
+        """Add a counter_delta() taken in a worker process to this registry's counters"""
+        for group, (checks, hits) in delta.items():
+            if group in self._groups:
+                self._checks[group] = [a + b for a, b in zip(self._checks[group], checks)]
+                self._hits[group] = [a + b for a, b in zip(self._hits[group], hits)]
+
+    def reset(self):
+        """Zero all counters"""
+        for group, patterns in self._groups.items():
+            self._checks[group] = [0] * len(patterns)
+            self._hits[group] = [0] * len(patterns)
+
+
+PATTERNS = PatternRegistry()
+
+# Earth Engine catalog card comments
+PATTERNS.register('ee_card.provider', [r'<!--.*?provider[:\s]+([^-]+?)-->'], re.IGNORECASE | re.DOTALL)
+PATTERNS.register('ee_card.keywords', [r'<!--.*?keywords?[:\s]+([^-]+?)-->'], re.IGNORECASE | re.DOTALL)
+PATTERNS.register('ee_card.collection_type', [r'<!--.*?collection[_\s]type[:\s]+([^-]+?)-->'], re.IGNORECASE | re.DOTALL)
+
+# Temporal metadata
+PATTERNS.register('temporal.date_range', [
+    r'(\d{4}-\d{2}-\d{2}).*?to.*?(\d{4}-\d{2}-\d{2})',
+    r'(\d{4}).*?to.*?(\d{4})',
+    r'since\s+(\d{4})',
+    r'from\s+(\d{4})'
+], re.IGNORECASE)
+PATTERNS.register('temporal.update_frequency', [
+    r'(daily|weekly|monthly|yearly|annual)',
+    r'every\s+(\d+\s+days?)',
+    r'(\d+)\s*day\s*repeat',
+    r'revisit.*?(\d+).*?days?'
+], re.IGNORECASE)
+
+# Spatial metadata
+PATTERNS.register('spatial.resolution', [
+    r'(\d+(?:\.\d+)?)\s*(?:meter|m)\s*resolution',
+    r'(\d+)\s*m\s*pixel',
+    r'(\d+(?:\.\d+)?)\s*km\s*resolution',
+    r'resolution.*?(\d+(?:\.\d+)?)\s*(?:meter|m|km)'
+], re.IGNORECASE)
+PATTERNS.register('spatial.geographic_extent', [
+    r'global(?:\s+coverage)?',
+    r'worldwide',
+    r'continental',
+    r'regional',
+    r'([-+]?\d*\.?\d+)°?[NS],?\s*([-+]?\d*\.?\d+)°?[EW]'
+], re.IGNORECASE)
+
+# Technical metadata
+PATTERNS.register('technical.bands', [
+    r'(\d+)\s*(?:spectral\s+)?bands?',
+    r'bands?.*?(\d+)',
+    r'(red|green|blue|nir|swir|thermal|panchromatic)',
+    r'(\d+(?:\.\d+)?)\s*(?:μm|um|nm|µm)'
+], re.IGNORECASE)
+PATTERNS.register('technical.processing_level', [
+    r'level\s*(\d+[a-zA-Z]*)',
+    r'L(\d+[a-zA-Z]*)',
+    r'(raw|processed|calibrated|atmospherically\s+corrected)'
+], re.IGNORECASE)
+PATTERNS.register('technical.file_format', [
+    r'(GeoTIFF|NetCDF|HDF|CSV|JSON)',
+    r'\.(tif|nc|hdf|csv|json)\s',
+    r'format.*?(GeoTIFF|NetCDF|HDF|CSV|JSON)'
+], re.IGNORECASE)
+
+# Access metadata
+PATTERNS.register('access.license', [
+    r'(CC\s*BY[^,\s]*)',
+    r'(Creative\s+Commons[^,\s]*)',
+    r'(public\s+domain)',
+    r'(open\s+(?:access|data))',
+    r'license.*?(free|commercial|restricted)'
+], re.IGNORECASE)
+PATTERNS.register('access.doi', [
+    r'doi:\s*(10\.\d+/[^\s]+)',
+    r'(10\.\d+/[^\s,]+)',
+    r'DOI[:\s]+(10\.\d+/[^\s]+)'
+], re.IGNORECASE)
+
+# Earth Engine dataset pages
+PATTERNS.register('ee_page.date_range', [
+    r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}Z\s*-\s*(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}Z',
+    r'(\d{4}-\d{2}-\d{2})\s*to\s*(\d{4}-\d{2}-\d{2})',
+    r'(\d{4}-\d{2}-\d{2})\s*-\s*(\d{4}-\d{2}-\d{2})'
+])
+PATTERNS.register('ee_page.provider', [
+    r'provider[:\s]+([^.\n]+)',
+    r'managed by[:\s]+([^.\n]+)',
+    r'hosted by[:\s]+([^.\n]+)',
+    r'produced by[:\s]+([^.\n]+)',
+    r'developed by[:\s]+([^.\n]+)'
+], re.IGNORECASE)
+PATTERNS.register('ee_page.provider_name', [r'([A-Z][a-zA-Z\s&]+)'])
+PATTERNS.register('ee_page.resolution', [
+    r'pixel size[:\s]+([^.\n]+)',
+    r'resolution[:\s]+([^.\n]+)',
+    r'spatial resolution[:\s]+([^.\n]+)'
+], re.IGNORECASE)
+PATTERNS.register('ee_page.availability_label', [r'Dataset Availability'], re.I)
+PATTERNS.register('ee_page.provider_label', [r'Dataset Provider'], re.I)
+PATTERNS.register('ee_page.snippet_label', [r'Earth Engine Snippet'], re.I)
+PATTERNS.register('ee_page.tags_label', [r'Tags?'], re.I)
+
+# Citations, terms and descriptions
+PATTERNS.register('citation.doi', [
+    r'doi[:\s]+([^.\n]+)',
+    r'10\.\d{4,}/[^\s\n]+',
+    r'digital object identifier[:\s]+([^.\n]+)',
+    r'doi\.org/([^\s\n]+)'
+], re.IGNORECASE)
+PATTERNS.register('citation.element_class', [r'citation|reference|cite'])
+PATTERNS.register('citation.label', [r'Citations?'], re.I)
+PATTERNS.register('citation.content', [r'Citations?[:\s]*(.+)'], re.I | re.DOTALL)
+PATTERNS.register('citation.section_doi', [r'doi[:\s]*([^.\s]+)'], re.I)
+PATTERNS.register('citation.terms_label', [r'Terms of Use'], re.I)
+PATTERNS.register('citation.terms', [r'Terms of Use[:\s]*(.+)'], re.I | re.DOTALL)
+PATTERNS.register('citation.description_label', [r'Description'], re.I)
+PATTERNS.register('citation.description', [r'Description[:\s]*(.+)'], re.I | re.DOTALL)
+PATTERNS.register('citation.text', [
+    r'([A-Z][a-zA-Z\s&]+)\s*\(\d{4}\)[:\s]+([^.\n]+)',
+    r'([A-Z][a-zA-Z\s&]+)\s*Climate\s+Change\s+Service[^.\n]*',
+    r'([A-Z][a-zA-Z\s&]+)\s*Climate\s+Data\s+Store[^.\n]*'
+])
+
+# Generic satellite page patterns
+PATTERNS.register('regex.satellites', [
+    r'satellite[:\s]+([^.\n]+)',
+    r'sensor[:\s]+([^.\n]+)',
+    r'instrument[:\s]+([^.\n]+)',
+    r'platform[:\s]+([^.\n]+)'
+], re.IGNORECASE)
+PATTERNS.register('regex.category_tags', [
+    r'category[:\s]+([^.\n]+)',
+    r'tag[s]?[:\s]+([^.\n]+)',
+    r'type[:\s]+([^.\n]+)',
+    r'classification[:\s]+([^.\n]+)'
+], re.IGNORECASE)
+PATTERNS.register('regex.terms', [
+    r'terms[:\s]+([^.\n]+)',
+    r'license[:\s]+([^.\n]+)',
+    r'usage[:\s]+([^.\n]+)',
+    r'conditions[:\s]+([^.\n]+)'
+], re.IGNORECASE)
+
+PATTERNS.register('ee_catalog.whitespace', [r'\s+'])
+
+# Loose hints that link text names a dataset (a year, an acronym)
+PATTERNS.register('link.dataset_hints', [r'\d{4}', r'[A-Z]{2,}'])
+
+
+class MetricsRegistry:
+    """Thread-safe in-process counters, gauges and histograms
+
+    A series is a metric name plus keyword labels. stage() times a block into the
+    ``stage_seconds`` histogram (labelled by stage) and counts the exceptions that
+    leave it. snapshot() is JSON-ready; prometheus_text() renders the Prometheus
+    text format that serve() exposes on localhost. Worker processes keep their own
+    registry; series_delta() and merge_series() carry their counters and
+    histograms back to the parent (gauges stay per process).
+    """
+
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, namespace='web_crawler', buckets=DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        """Add to a counter"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        """Set a gauge to its current value"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        """Record one value (seconds, bytes, ...) in a histogram"""
+        key = self._key(name, labels)
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'counts': [0] * (len(self.buckets) + 1),
+                                                     'sum': 0.0, 'count': 0, 'min': value, 'max': value}
+            histogram['counts'][bucket] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+            histogram['min'] = min(histogram['min'], value)
+            histogram['max'] = max(histogram['max'], value)
+
+    @contextlib.contextmanager
+    def stage(self, stage, **labels):
+        """Time a block into ``stage_seconds{stage=...}``"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc('stage_errors_total', stage=stage, **labels)
+            raise
+        finally:
+            self.observe('stage_seconds', time.perf_counter() - start, stage=stage, **labels)
+
+    def timed(self, stage, **labels):
+        """Decorator form of stage() for plain (non-generator) functions"""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage, **labels):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def series(self):
+        """Copy of every counter and histogram, to pass to series_delta() later"""
+        with self._lock:
+            return {'counters': dict(self._counters),
+                    'histograms': {key: dict(value, counts=list(value['counts']))
+                                   for key, value in self._histograms.items()}}
+
+    def series_delta(self, since):
+        """Counts and observations added since a series() copy, for merge_series() in another process"""
+        with self._lock:
+            counters = {key: value - since['counters'].get(key, 0) for key, value in self._counters.items()
+                        if value != since['counters'].get(key, 0)}
+            histograms = {}
+            for key, histogram in self._histograms.items():
+                before = since['histograms'].get(key)
+                if before is None:
+                    histograms[key] = dict(histogram, counts=list(histogram['counts']))
+                elif histogram['count'] != before['count']:
+                    # min/max cover earlier observations too, which the parent already holds
+                    histograms[key] = {
+                        'counts': [now - then for now, then in zip(histogram['counts'], before['counts'])],
+                        'sum': histogram['sum'] - before['sum'],
+                        'count': histogram['count'] - before['count'],
+                        'min': histogram['min'],
+                        'max': histogram['max']
+                    }
+        return {'counters': counters, 'histograms': histograms}
+
+    def merge_series(self, delta):
+        """Add a series_delta() taken in a worker process to this registry"""
+        with self._lock:
+            for key, value in delta['counters'].items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, added in delta['histograms'].items():
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    self._histograms[key] = dict(added, counts=list(added['counts']))
+                    continue
+                histogram['counts'] = [a + b for a, b in zip(histogram['counts'], added['counts'])]
+                histogram['sum'] += added['sum']
+                histogram['count'] += added['count']
+                histogram['min'] = min(histogram['min'], added['min'])
+                histogram['max'] = max(histogram['max'], added['max'])
+
+    def _quantile(self, histogram, q):
+        # Linear interpolation inside the bucket holding the rank, as histogram_quantile does,
+        # kept within the observed min/max so sparse buckets do not stretch the estimate
+        rank = q * histogram['count']
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets + (histogram['max'],), histogram['counts']):
+            upper = min(bound, histogram['max'])
+            if count and seen + count >= rank:
+                lower = max(lower, histogram['min'])
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return histogram['max']
+
+    def snapshot(self):
+        """Every series as JSON-ready dicts, histograms with estimated p50/p90/p99"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            histograms = sorted((key, dict(value, counts=list(value['counts'])))
+                                for key, value in self._histograms.items())
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'uptime_seconds': round(time.time() - self._started, 3),
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in counters],
+            'gauges': [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in gauges],
+            'histograms': [{
+                'name': name,
+                'labels': dict(labels),
+                'count': histogram['count'],
+                'sum': round(histogram['sum'], 6),
+                'min': round(histogram['min'], 6),
+                'max': round(histogram['max'], 6),
+                'p50': round(self._quantile(histogram, 0.5), 6),
+                'p90': round(self._quantile(histogram, 0.9), 6),
+                'p99': round(self._quantile(histogram, 0.99), 6),
+                'buckets': dict(zip([str(bound) for bound in self.buckets] + ['+Inf'],
+                                    itertools.accumulate(histogram['counts'])))
+            } for (name, labels), histogram in histograms]
+        }
+
+    def write_snapshot(self, path):
+        """Write snapshot() to a JSON file (atomically replaced)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def prometheus_text(self):
+        """All series in the Prometheus text exposition format (0.0.4)"""
+        def series(name, labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return name
+            escaped = (str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+                       for _, value in pairs)
+            return name + '{' + ','.join(f'{label}="{value}"' for (label, _), value in zip(pairs, escaped)) + '}'
+
+        snapshot = self.snapshot()
+        lines = []
+        typed = set()
+
+        def declare(name, kind):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+
+        for kind in ('counters', 'gauges'):
+            for entry in snapshot[kind]:
+                name = f"{self.namespace}_{entry['name']}"
+                declare(name, kind[:-1])
+                lines.append(f"{series(name, entry['labels'].items())} {entry['value']}")
+        for entry in snapshot['histograms']:
+            name = f"{self.namespace}_{entry['name']}"
+            declare(name, 'histogram')
+            labels = entry['labels'].items()
+            for bound, count in entry['buckets'].items():
+                lines.append(f"{series(name + '_bucket', labels, [('le', bound)])} {count}")
+            lines.append(f"{series(name + '_sum', labels)} {entry['sum']}")
+            lines.append(f"{series(name + '_count', labels)} {entry['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port=0, host='127.0.0.1'):
+        """Serve /metrics (Prometheus text) and /metrics.json on a daemon thread
+
+        Returns the HTTP server; ``server.server_address[1]`` is the bound port and
+        ``server.shutdown()`` stops it.
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                if path in ('/', '/metrics'):
+                    body = registry.prometheus_text().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif path == '/metrics.json':
+                    body = json.dumps(registry.snapshot()).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+        _log_json('metrics_server_started', host=host, port=server.server_address[1])
+        return server
+
+    def reset(self):
+        """Drop every series"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._started = time.time()
+
+
+METRICS = MetricsRegistry()
+
+
+_profile_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def profile_run(label, directory, top=25):
+    """Profile a block with cProfile and tracemalloc, writing the results to ``directory``
+
+    Writes ``<time>_<label>.pstats`` and a ``<time>_<label>.txt`` report with the
+    traced memory peak, the largest allocation sites still live when the block
+    ends and the functions with the most cumulative time. cProfile only sees the
+    calling thread, so card extraction skips its process pool while a run is
+    active. One run profiles at a time: a nested or concurrent call runs
+    its block unprofiled. Yields a dict that holds both paths once the block ends.
+    """
+    run = {'label': label, 'pstats': None, 'report': None}
+    if not _profile_lock.acquire(blocking=False):
+        yield run
+        return
+    try:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield run
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                tracemalloc.Filter(False, '<unknown>'),
+            ))
+            if not was_tracing:
+                tracemalloc.stop()
+            try:
+                _write_profile(run, directory, profiler, snapshot, elapsed, current, peak, top)
+            except Exception as e:
+                print(f"Failed to write profile for {label}: {e}")
+    finally:
+        _profile_lock.release()
+
+
+def _write_profile(run, directory, profiler, snapshot, elapsed, current, peak, top):
+    os.makedirs(directory, exist_ok=True)
+    label = re.sub(r'[^\w.-]+', '_', run['label'])
+    stem = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{label}")
+    profiler.dump_stats(stem + '.pstats')
+
+    with open(stem + '.txt', 'w', encoding='utf-8') as f:
+        f.write(f"Profile: {run['label']}\n")
+        f.write(f"Wall time: {elapsed:.3f} s\n")
+        f.write(f"Traced memory: peak {peak / 2**20:.1f} MB, still allocated at the end {current / 2**20:.1f} MB\n")
+        f.write(f"\nTop {top} allocation sites still live at the end of the run:\n")
+        for rank, stat in enumerate(snapshot.statistics('lineno')[:top], start=1):
+            frame = stat.traceback[0]
+            f.write(f"{rank:>4}. {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+            line = linecache.getline(frame.filename, frame.lineno).strip()
+            if line:
+                f.write(f"        {line}\n")
+        f.write(f"\nTop {top} functions by cumulative time:\n")
+        pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(top)
+
+    run['pstats'] = stem + '.pstats'
+    run['report'] = stem + '.txt'
+    _log_json('profile_written', label=run['label'], pstats=run['pstats'], seconds=round(elapsed, 3),
+              peak_traced_bytes=peak)
+
+
+def _profiled(method):
+    """Run an extractor method under self.profiling(), a no-op unless config['profile'] enables it"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.profiling(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class KeywordMatcher:
+    """Substring tests for many keywords with a single regex scan
+
+    ``scan(text)`` returns an int with bit ``i`` set when ``keywords[i] in text``.
+    The keywords are compiled into one prefix-tree alternation inside a
+    lookahead, so overlapping occurrences are all seen. At each position the
+    regex reports the longest keyword, which implies every keyword that is a
+    prefix of it.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.bits = {keyword: 1 << i for i, keyword in enumerate(self.keywords)}
+        self._implied = {
+            keyword: self.mask(prefix for prefix in self.keywords if keyword.startswith(prefix))
+            for keyword in self.keywords
+        }
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        self._pattern = re.compile('(?=(%s))' % self._trie_pattern(trie))
+
+    @classmethod
+    def _trie_pattern(cls, node):
+        branches = [re.escape(char) + cls._trie_pattern(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+        # Greedy optional group: prefer the longer keyword, fall back to the one ending here
+        return '(?:%s)?' % pattern if '' in node else pattern
+
+    def mask(self, keywords):
+        """Bit mask of a group of keywords, to test scan() results against"""
+        mask = 0
+        for keyword in keywords:
+            mask |= self.bits[keyword]
+        return mask
+
+    def scan(self, text):
+        found = 0
+        for keyword in set(self._pattern.findall(text)):
+            found |= self._implied[keyword]
+        return found
+
+
+# Keyword tables behind the link checks (is_navigation_link and friends). Each
+# check is a substring test against the lowercased href or link text.
+LINK_KEYWORDS = {
+    'navigation': [
+        'home', 'about', 'contact', 'help', 'support', 'login', 'signup',
+        'documentation', 'api', 'tutorial', 'forum', 'blog', 'news',
+        'privacy', 'terms', 'cookies', 'feedback', 'report'
+    ],
+    'social_domains': [
+        'facebook.com', 'twitter.com', 'x.com', 'instagram.com', 'linkedin.com',
+        'youtube.com', 'reddit.com', 'github.com', 'stackoverflow.com',
+        'medium.com', 'dev.to', 'hashnode.dev', 'substack.com',
+        'discord.com', 'slack.com', 'telegram.org', 'whatsapp.com',
+        'tiktok.com', 'snapchat.com', 'pinterest.com', 'tumblr.com'
+    ],
+    'social_text': [
+        'follow us', 'like us', 'share', 'tweet', 'post', 'comment',
+        'social', 'community', 'connect', 'join us', 'subscribe'
+    ],
+    'utility_protocols': [
+        'javascript:', 'mailto:', 'tel:', 'sms:', 'ftp://',
+        'chrome://', 'about:', 'data:', 'file://', 'view-source:'
+    ],
+    'utility_text': [
+        'print', 'download', 'export', 'save', 'bookmark', 'favorite',
+        'share', 'email', 'copy link', 'permalink', 'qr code',
+        'accessibility', 'language', 'translate', 'search', 'filter',
+        'sort', 'refresh', 'reload', 'back', 'forward', 'close'
+    ],
+    'dataset': [
+        'dataset', 'catalog', 'satellite', 'collection', 'product', 'layer',
+        'imagery', 'data', 'coverage', 'temporal', 'spatial'
+    ],
+    'advertisement': [
+        'ad', 'advertisement', 'sponsor', 'sponsored', 'promotion',
+        'banner', 'click', 'offer', 'deal', 'discount', 'sale',
+        'affiliate', 'referral', 'tracking', 'analytics'
+    ],
+    'tracking': [
+        'utm_', 'gclid', 'fbclid', 'msclkid', 'ref_',
+        'source=', 'medium=', 'campaign=', 'term=', 'content=',
+        'tracking', 'analytics', 'pixel', 'beacon', 'tag'
+    ],
+    'broken': [
+        'javascript:void(0)', 'javascript:;', '#', 'javascript:',
+        'mailto:', 'tel:', 'sms:', 'ftp://', 'chrome://',
+        'about:', 'data:', 'file://', 'view-source:'
+    ],
+    'earth_engine': [
+        '/datasets/', '/collections/', 'earth-engine', 'earthengine',
+        'google.com/earthengine', 'developers.google.com/earth-engine'
+    ],
+    'earth_engine_specific': [
+        '/datasets/', '/collections/', '/products/', '/layers/',
+        'earth-engine', 'earthengine', 'google.com/earthengine',
+        'developers.google.com/earth-engine', 'code.earthengine.google.com',
+        'explorer.earthengine.google.com', 'signup.earthengine.google.com'
+    ],
+    'earth_engine_text': [
+        'earth engine', 'earthengine', 'gee', 'google earth engine',
+        'dataset', 'collection', 'satellite', 'imagery', 'remote sensing'
+    ],
+    'dataset_indicators': [
+        'dataset', 'collection', 'product', 'layer', 'imagery',
+        'satellite', 'sensor', 'coverage', 'temporal', 'spatial',
+        'earth engine', 'earthengine', 'gee', 'landsat', 'sentinel',
+        'modis', 'copernicus', 'nasa', 'esa', 'usgs', 'noaa'
+    ],
+    'not_dataset': [
+        'login', 'signup', 'register', 'account', 'profile',
+        'settings', 'preferences', 'admin', 'dashboard',
+        'cart', 'checkout', 'payment', 'billing',
+        'support', 'help', 'faq', 'contact', 'about',
+        'privacy', 'terms', 'legal', 'cookies',
+        'news', 'blog', 'article', 'press', 'media',
+        'careers', 'jobs', 'team', 'company', 'organization',
+        'events', 'conferences', 'webinars', 'workshops'
+    ],
+    'junk_domains': [
+        'facebook.com', 'twitter.com', 'x.com', 'instagram.com',
+        'linkedin.com', 'youtube.com', 'reddit.com', 'github.com',
+        'stackoverflow.com', 'medium.com', 'dev.to', 'hashnode.dev',
+        'discord.com', 'slack.com', 'telegram.org', 'whatsapp.com',
+        'tiktok.com', 'snapchat.com', 'pinterest.com', 'tumblr.com',
+        'amazon.com', 'ebay.com', 'etsy.com', 'shopify.com',
+        'booking.com', 'airbnb.com', 'tripadvisor.com', 'yelp.com',
+        'wikipedia.org', 'wikimedia.org', 'quora.com', 'yahoo.com',
+        'bing.com', 'duckduckgo.com', 'baidu.com', 'yandex.com'
+    ],
+    'strong_indicators': [
+        'satellite', 'sensor', 'imagery', 'remote sensing', 'earth observation',
+        'landsat', 'sentinel', 'modis', 'copernicus', 'nasa', 'esa', 'usgs', 'noaa',
+        'dataset', 'collection', 'product', 'layer', 'coverage', 'temporal', 'spatial'
+    ],
+}
+_LINK_MATCHER = KeywordMatcher(keyword for keywords in LINK_KEYWORDS.values() for keyword in keywords)
+_LINK_MASKS = {name: _LINK_MATCHER.mask(keywords) for name, keywords in LINK_KEYWORDS.items()}
+LINK_FLAGS = (
+    'navigation', 'social_media', 'utility', 'external_junk', 'clearly_not_dataset', 'looks_like_dataset',
+    'dataset', 'earth_engine', 'earth_engine_specific', 'advertisement', 'tracking', 'broken',
+    'strong_dataset_indicators', 'junk', 'catalog_link'
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _link_flags(href, text):
+    href_hits = _LINK_MATCHER.scan(href.lower())
+    text_hits = _LINK_MATCHER.scan(text.lower()) if text else 0
+    masks = _LINK_MASKS
+
+    social_media = bool(href_hits & masks['social_domains'] or text_hits & masks['social_text'])
+    utility = bool(href_hits & masks['utility_protocols'] or text_hits & masks['utility_text'])
+    navigation = bool(href_hits & masks['navigation'] or text_hits & masks['navigation']
+                      or href.startswith('#') or href in ('/', '') or social_media or utility)
+    external_junk = href.startswith('http') and bool(href_hits & masks['junk_domains'])
+    clearly_not_dataset = bool(href_hits & masks['not_dataset'] or text_hits & masks['not_dataset'] or external_junk)
+    earth_engine = bool(href_hits & masks['earth_engine'])
+    earth_engine_specific = bool(href_hits & masks['earth_engine_specific']
+                                 or text_hits & masks['earth_engine_text'])
+    looks_like_dataset = not clearly_not_dataset and bool(
+        href_hits & masks['dataset_indicators'] or text_hits & masks['dataset_indicators']
+        or PATTERNS.search('link.dataset_hints', text) or earth_engine_specific)
+    dataset = bool(href_hits & masks['dataset'] or text_hits & masks['dataset']
+                   or '/datasets/' in href or '/collections/' in href)
+    advertisement = bool(href_hits & masks['advertisement'] or text_hits & masks['advertisement'])
+    tracking = bool(href_hits & masks['tracking'])
+    broken = bool(href_hits & masks['broken']) or href.strip() in ('', '#')
+    strong = masks['strong_indicators']
+    strong_dataset_indicators = bin(href_hits & strong).count('1') * 2 + bin(text_hits & strong).count('1') >= 3
+
+    # Same order of checks as is_junk_link always used: anything clearly not a
+    # dataset that got past the hard filters is kept
+    if navigation or social_media or utility or (external_junk and not looks_like_dataset):
+        junk = True
+    elif clearly_not_dataset:
+        junk = False
+    else:
+        junk = ((advertisement or tracking) and not looks_like_dataset) or broken
+
+    catalog_link = not (href in ('', '#') or navigation or external_junk or utility or social_media
+                        or clearly_not_dataset)
+    if catalog_link and href.startswith('http') and not earth_engine:
+        # External links need very strong dataset indicators
+        catalog_link = strong_dataset_indicators
+
+    return (navigation, social_media, utility, external_junk, clearly_not_dataset, looks_like_dataset,
+            dataset, earth_engine, earth_engine_specific, advertisement, tracking, broken,
+            strong_dataset_indicators, junk, catalog_link)
+
+
+def classify_link(href, text):
+    """Every junk/dataset flag of a link from one keyword scan of its href and one of its text
+
+    Returns a dict keyed by LINK_FLAGS. ``junk`` is the is_junk_link verdict and
+    ``catalog_link`` the validate_catalog_links one. Results are cached per
+    (href, text), so the per-check methods can share one classification.
+    """
+    return dict(zip(LINK_FLAGS, _link_flags(href or '', text or '')))
+
+
+# Dataset categories in priority order: a dataset gets the first category with
+# a term in its title, description, tags or keywords, else 'other'
+DATASET_CATEGORIES = (
+    ('landsat', ['landsat', 'oli', 'tirs']),
+    ('modis', ['modis', 'aqua', 'terra']),
+    ('sentinel', ['sentinel', 'esa', 'msi', 'olci']),
+    ('climate', ['temperature', 'precipitation', 'climate']),
+    ('atmospheric', ['atmospheric', 'aerosol', 'ozone', 'air']),
+    ('ocean', ['ocean', 'sea', 'marine', 'sst']),
+    ('terrain', ['dem', 'elevation', 'topography', 'terrain']),
+    ('weather', ['weather', 'goes', 'himawari', 'meteorological']),
+    ('vegetation', ['vegetation', 'ndvi', 'evi', 'lai', 'biomass']),
+    ('urban', ['urban', 'built', 'population', 'lights']),
+)
+_DATASET_CATEGORY_NAMES = frozenset([category for category, _ in DATASET_CATEGORIES] + ['other'])
+
+
+def classify_dataset_text(text):
+    """``(category, matched terms)`` for lowercased dataset text
+
+    Plain substring tests in priority order: on texts this short they beat a
+    combined regex scan, and most texts stop at the first category.
+    """
+    for category, terms in DATASET_CATEGORIES:
+        for term in terms:
+            if term in text:
+                return category, [term for term in terms if term in text]
+    return 'other', []
+
+
+class SlottedRecord(MutableMapping):
+    """Dict-compatible record whose fixed fields live in ``__slots__``
+
+    Subclasses list their keys in FIELDS (in to_dict() order) and their defaults
+    in DEFAULTS; a callable default builds a fresh value per record. A field
+    can be unset (``del record[key]``, pop()) and is then missing like a dict
+    key. Keys outside FIELDS go to a small overflow dict created on first use.
+    Strings stored in INTERNED fields, alone or in a list, are interned so
+    records share one copy of each tag, provider or band name. Empty list
+    fields default to a shared ``()`` rather than a list per record.
+    """
+
+    __slots__ = ('_extra',)
+
+    FIELDS = ()
+    DEFAULTS = {}
+    INTERNED = frozenset()
+    NESTED = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+        cls._read_fields = operator.attrgetter(*cls.FIELDS)
+        cls._list_fields = tuple(key for key, default in cls.DEFAULTS.items() if default == ())
+
+    def __init__(self, data=None, **fields):
+        self._extra = None
+        for key, default in self.DEFAULTS.items():
+            setattr(self, key, default() if callable(default) else default)
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Record holding exactly the keys of ``data`` (nested dicts become records)"""
+        record = cls.__new__(cls)
+        record._extra = None
+        for key, value in data.items():
+            record[key] = value
+        return record
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            return getattr(self, key, default)
+        return default if self._extra is None else self._extra.get(key, default)
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            if key in self.INTERNED:
+                if type(value) is str:
+                    value = sys.intern(value)
+                elif type(value) is list:
+                    value[:] = [sys.intern(item) if type(item) is str else item for item in value]
+            elif key in self.NESTED and type(value) is dict:
+                value = self.NESTED[key].from_dict(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, SlottedRecord):
+            other = other.to_dict()
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == dict(other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return type(self).from_dict, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def copy(self):
+        return type(self).from_dict(self.to_dict())
+
+    def to_dict(self):
+        """Plain dict copy for serialization; nested records become dicts and ``()`` an empty list"""
+        try:
+            data = dict(zip(self.FIELDS, self._read_fields(self)))
+        except AttributeError:
+            # Some fields are unset
+            data = {key: getattr(self, key) for key in self.FIELDS if hasattr(self, key)}
+        for key in self.NESTED:
+            if isinstance(data.get(key), SlottedRecord):
+                data[key] = data[key].to_dict()
+        for key in self._list_fields:
+            if data.get(key) == ():
+                data[key] = []
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+
+class TemporalCoverage(SlottedRecord):
+    """``temporal_coverage`` of a catalog dataset"""
+
+    __slots__ = ('start_date', 'end_date', 'update_frequency', 'revisit_time')
+    FIELDS = __slots__
+    DEFAULTS = dict.fromkeys(FIELDS, '')
+    INTERNED = frozenset(FIELDS)
+
+
+class SpatialInfo(SlottedRecord):
+    """``spatial_info`` of a catalog dataset"""
+
+    __slots__ = ('resolution', 'pixel_size', 'projection', 'geographic_extent')
+    FIELDS = __slots__
+    DEFAULTS = dict.fromkeys(FIELDS, '')
+    INTERNED = frozenset(FIELDS)
+
+
+class DatasetRecord(SlottedRecord):
+    """One Earth Engine catalog dataset, as built by build_ee_dataset()
+
+    Reads and writes like the dict it replaces (``record['title']``,
+    ``record.get('tags')``, ``record['temporal_coverage']['start_date'] = ...``)
+    at a fraction of the memory, so catalogs of 100k datasets stay small.
+    ``category`` and ``category_terms`` stay unset until classify_datasets()
+    fills them. Serialize with to_dict() or ``json.dump(..., default=json_default)``.
+    """
+
+    __slots__ = (
+        # Core Information
+        'dataset_id', 'title', 'description', 'url', 'thumbnail', 'thumbnail_local_path',
+        # Classification & Metadata
+        'tags', 'provider', 'keywords', 'collection_type',
+        # Temporal and Spatial Information
+        'temporal_coverage', 'spatial_info',
+        # Spectral & Technical
+        'bands', 'spectral_info', 'processing_level', 'file_format', 'data_volume',
+        # Access & Legal
+        'license', 'doi', 'citations', 'terms_of_use', 'access_method',
+        # Quality Metrics
+        'confidence_score', 'extraction_timestamp', 'data_completeness',
+        # Filled by classify_datasets()
+        'category', 'category_terms'
+    )
+    FIELDS = __slots__
+    DEFAULTS = {
+        **dict.fromkeys(FIELDS[:-2], ''),
+        'tags': (), 'keywords': (), 'bands': (), 'citations': (),
+        'temporal_coverage': TemporalCoverage, 'spatial_info': SpatialInfo,
+        'confidence_score': 0, 'data_completeness': 0
+    }
+    INTERNED = frozenset(['tags', 'provider', 'keywords', 'collection_type', 'bands', 'processing_level',
+                          'file_format', 'license', 'category', 'category_terms'])
+    NESTED = {'temporal_coverage': TemporalCoverage, 'spatial_info': SpatialInfo}
+
+
+def json_default(value):
+    """``default=`` hook for json.dump/json.dumps that serializes records lazily"""
+    if isinstance(value, SlottedRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StreamingHTMLHandler(HTMLParser):
+    """HTMLParser whose handle_* callbacks can also be driven by libxml2
+
+    The start/end/data/comment methods are lxml's parser-target interface, so
+    tokenize_html() can feed the same handler from lxml's C tokenizer instead
+    of html.parser. libxml2 may split one text run across several data calls.
+    """
+
+    def start(self, tag, attrib):
+        self.handle_starttag(tag, list(attrib.items()))
+
+    def end(self, tag):
+        self.handle_endtag(tag)
+
+    def data(self, data):
+        self.handle_data(data)
+
+    def comment(self, text):
+        self.handle_comment(text)
+
+
+class EECatalogCardParser(StreamingHTMLHandler):
+    """Single-pass tokenizer that reduces Earth Engine catalog cards to raw fields.
+
+    Visits every tag of the page exactly once without building a DOM. Each
+    ``li.ee-sample-image`` card is turned into the field dict consumed by
+    ``LocalHTMLDataExtractor.build_ee_dataset`` and queued as soon as its
+    closing tag is seen, so callers can drain finished cards between feeds.
+    Like the HTML tree builders, an ``<li>`` or the end of the enclosing list
+    closes a card item whose ``</li>`` was left out, and the end of the input
+    closes the last card.
+
+    With ``spans=True`` and the text fed through feed() (html.parser), each card
+    also gets ``span``: its ``(start, end)`` character offsets in the input.
+    """
+
+    VOID_TAGS = frozenset([
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+        'link', 'meta', 'param', 'source', 'track', 'wbr'
+    ])
+    NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+    LIST_TAGS = frozenset(['ul', 'ol', 'menu'])
+
+    def __init__(self, spans=False):
+        super().__init__(convert_charrefs=True)
+        self.spans = spans
+        self.cards = []
+        self._card = None
+        self._stack = []   # (tag, sink) for every open element inside the current card
+        self._sinks = []   # text buffers currently collecting (description / tag chips)
+        self._skip_text = 0
+        self._fed = 0           # input offset of html.parser's unparsed buffer
+        self._tag_start = 0     # input offset of the tag being handled
+        self._card_start = None
+
+    def drain(self):
+        """Return and forget the cards completed so far"""
+        cards, self.cards = self.cards, []
+        return cards
+
+    def retained_offset(self):
+        """Input offset from which text may still be needed for a card span"""
+        return self._card_start if self._card is not None else self._fed
+
+    def feed(self, data):
+        pending = len(self.rawdata) + len(data)
+        super().feed(data)
+        self._fed += pending - len(self.rawdata)
+
+    def close(self):
+        pending = len(self.rawdata)
+        super().close()
+        self._fed += pending - len(self.rawdata)
+        if self._card is not None:
+            self._finish_card(self._fed)
+
+    def parse_starttag(self, i):
+        self._tag_start = self._fed + i
+        return super().parse_starttag(i)
+
+    def parse_endtag(self, i):
+        self._tag_start = self._fed + i
+        j = super().parse_endtag(i)
+        if self.spans and j >= 0 and self.cards and self.cards[-1]['span'][1] is None:
+            self.cards[-1]['span'] = (self.cards[-1]['span'][0], self._fed + j)
+        return j
+
+    def _closes_card_item(self):
+        # An <li> outside any list nested in the card is a sibling of the card item
+        return self._stack[0][0] == 'li' and not any(open_tag in self.LIST_TAGS for open_tag, _ in self._stack)
+
+    def handle_starttag(self, tag, attrs):
+        if self._card is not None and tag == 'li' and self._closes_card_item():
+            self._finish_card(self._tag_start)
+
+        attrs = {name: (value if value is not None else '') for name, value in attrs}
+        classes = attrs.get('class', '').split()
+
+        if self._card is None:
+            # Same containers the select() fallbacks accept: li.ee-sample-image or .ee-sample-image.ee-cards
+            if 'ee-sample-image' in classes and (tag == 'li' or 'ee-cards' in classes):
+                self._card = {
+                    'title': None,
+                    'href': None,
+                    'description': None,
+                    'tags': [],
+                    'thumbnail': None,
+                    'text': [],
+                    'comments': []
+                }
+                self._stack = [(tag, None)]
+                self._sinks = []
+                self._skip_text = 0
+                self._card_start = self._tag_start
+            return
+
+        card = self._card
+        if tag == 'h3' and card['title'] is None and 'data-text' in attrs:
+            card['title'] = attrs['data-text']
+        elif tag == 'a' and card['href'] is None and 'href' in attrs:
+            card['href'] = attrs['href']
+        elif tag == 'img' and card['thumbnail'] is None and any(open_tag == 'figure' for open_tag, _ in self._stack):
+            card['thumbnail'] = attrs.get('src', '')
+
+        if tag in self.VOID_TAGS:
+            return
+
+        sink = None
+        if 'ee-dataset-description-snippet' in classes and card['description'] is None:
+            sink = card['description'] = []
+        elif 'ee-chip' in classes and 'ee-tag' in classes:
+            sink = []
+            card['tags'].append(sink)
+        if sink is not None:
+            self._sinks.append(sink)
+        if tag in self.NON_TEXT_TAGS:
+            self._skip_text += 1
+        self._stack.append((tag, sink))
+
+    def handle_endtag(self, tag):
+        if self._card is None:
+            return
+
+        # Pop back to the matching open tag, ignoring stray end tags like html.parser does
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            if tag in self.LIST_TAGS and self._closes_card_item():
+                # The list holding the card item ends, and the item with it
+                self._finish_card(self._tag_start)
+            return
+
+        for open_tag, sink in self._stack[index:]:
+            if sink is not None:
+                self._sinks.remove(sink)
+            if open_tag in self.NON_TEXT_TAGS:
+                self._skip_text -= 1
+        del self._stack[index:]
+
+        if not self._stack:
+            self._finish_card()
+
+    def handle_data(self, data):
+        if self._card is None or self._skip_text:
+            return
+        self._card['text'].append(data)
+        for sink in self._sinks:
+            sink.append(data)
+
+    def handle_comment(self, data):
+        if self._card is not None:
+            self._card['comments'].append(f"<!--{data}-->")
+
+    def _finish_card(self, end=None):
+        # end is None when the card's own end tag closes it; parse_endtag() fills it in
+        card = self._card
+        self._card = None
+        self._stack = []
+        self._sinks = []
+        self._skip_text = 0
+        fields = {
+            'title': card['title'],
+            'href': card['href'],
+            'description': ''.join(card['description']) if card['description'] is not None else None,
+            'tags': [''.join(parts) for parts in card['tags']],
+            'thumbnail': card['thumbnail'],
+            'text': ''.join(card['text']),
+            'markup': ''.join(card['comments'])
+        }
+        if self.spans:
+            fields['span'] = (self._card_start, end)
+        self.cards.append(fields)
+
+class MappedHTMLFile:
+    """Memory-mapped saved page that reads like a text-mode file, one chunk at a time
+
+    The streaming extraction paths accept it wherever they accept an open file.
+    ``read(size)`` counts ``size`` in bytes of the file and decodes only that
+    slice, so the page never exists as one Python string. Mapped pages behind
+    the read position are handed back to the kernel as soon as they are decoded.
+    ``mapping`` exposes the raw bytes for byte-level scans.
+    """
+
+    def __init__(self, path, encoding='utf-8', errors='strict'):
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self.mapping = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self.mapping.madvise(mmap.MADV_SEQUENTIAL)
+        else:
+            self.mapping = b''  # empty files cannot be mapped
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self._position = 0
+        self._released = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def read(self, size=-1):
+        """Decode the next ``size`` bytes (all remaining bytes if negative); '' at the end"""
+        length = len(self.mapping)
+        text = ''
+        # A chunk can end inside a multi-byte character; keep going until it decodes to something
+        while not text and self._position < length:
+            end = length if size is None or size < 0 else min(length, self._position + max(size, 1))
+            text = self._decoder.decode(self.mapping[self._position:end], final=end == length)
+            self._position = end
+        self._release_consumed()
+        return text
+
+    def _release_consumed(self):
+        # The mapping is read-only and file-backed, so dropped pages are simply re-read if needed
+        if not hasattr(mmap, 'MADV_DONTNEED') or not isinstance(self.mapping, mmap.mmap):
+            return
+        consumed = self._position - self._position % mmap.PAGESIZE
+        if consumed > self._released:
+            self.mapping.madvise(mmap.MADV_DONTNEED, self._released, consumed - self._released)
+            self._released = consumed
+
+    def close(self):
+        if isinstance(self.mapping, mmap.mmap):
+            self.mapping.close()
+        self._file.close()
+
+
+@METRICS.timed('parse', kind='split')
+def split_ee_catalog_cards(source, encoding='utf-8', errors='strict', chunk_size=65536):
+    """Cut the raw HTML of each ``li.ee-sample-image`` card out of the catalog page
+
+    ``source`` is the page text, a file object opened in text mode, raw page
+    bytes or a MappedHTMLFile. Card boundaries come from EECatalogCardParser on
+    html.parser, so ``<li>`` in scripts, comments or attribute values and
+    omitted ``</li>`` tags split the page the way the extraction paths read it.
+    The page is decoded a chunk at a time and only the text of the card being
+    read is kept.
+    """
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        length = len(source)
+        chunks = (decoder.decode(source[i:i + chunk_size], final=i + chunk_size >= length)
+                  for i in range(0, length, chunk_size))
+    elif hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), '')
+    else:
+        chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+
+    parser = EECatalogCardParser(spans=True)
+    cards = []
+    window, window_start = '', 0
+
+    def collect():
+        nonlocal window, window_start
+        for card in parser.drain():
+            start, end = card['span']
+            cards.append(window[start - window_start:end - window_start])
+        keep = parser.retained_offset()
+        window, window_start = window[keep - window_start:], keep
+
+    for chunk in chunks:
+        window += chunk
+        parser.feed(chunk)
+        collect()
+    parser.close()
+    collect()
+    return cards
+
+
+_card_worker_extractor = None
+
+
+def _init_card_worker():
+    """Create the per-process extractor used by _extract_card_batch"""
+    global _card_worker_extractor
+    _card_worker_extractor = LocalHTMLDataExtractor()
+
+
+def _extract_card_batch(cards):
+    """Extract a batch of cards, keeping their order (None for rejected cards)
+
+    Each card is either its raw HTML or the field dict EECatalogCardParser made of it.
+    Returns the datasets and the pattern counters and metrics the batch added,
+    which a worker process has to hand back for the parent to merge.
+    """
+    extractor = _card_worker_extractor or LocalHTMLDataExtractor()
+    patterns = PATTERNS.counters()
+    metrics = METRICS.series()
+    results = []
+    for card in cards:
+        if isinstance(card, str):
+            parser = EECatalogCardParser()
+            parser.feed(card)
+            parser.close()
+            parsed = parser.drain()
+            card = parsed[0] if parsed else None
+        results.append(extractor.build_ee_dataset(card) if card else None)
+    return {'datasets': results, 'patterns': PATTERNS.counter_delta(patterns),
+            'metrics': METRICS.series_delta(metrics)}
+
+
+# HTML parser backends, fastest first. 'auto' picks the first one installed;
+# only the BeautifulSoup tree builders can back full-page extraction.
+PARSER_BACKENDS = ('selectolax', 'lxml', 'html.parser')
+TREE_BACKENDS = ('lxml', 'html.parser')
+_parser_availability = {}
+
+
+def parser_backend_available(name):
+    """Whether a parser backend can be imported here"""
+    if name not in _parser_availability:
+        if name == 'html.parser':
+            available = True
+        else:
+            try:
+                __import__('selectolax.parser' if name == 'selectolax' else 'lxml.html')
+                available = True
+            except ImportError:
+                available = False
+        _parser_availability[name] = available
+    return _parser_availability[name]
+
+
+def pick_parser_backend(preferred='auto', tree=False):
+    """Resolve a backend name; falls back to the fastest installed one
+
+    With tree=True the result is always a BeautifulSoup tree builder.
+    """
+    candidates = TREE_BACKENDS if tree else PARSER_BACKENDS
+    if preferred in candidates and parser_backend_available(preferred):
+        return preferred
+    return next(name for name in candidates if parser_backend_available(name))
+
+
+@METRICS.timed('parse', kind='tree')
+def make_soup(markup, backend='auto'):
+    """BeautifulSoup tree built with the chosen (or fastest installed) tree builder"""
+    return BeautifulSoup(markup, pick_parser_backend(backend, tree=True))
+
+
+def tokenize_html(handler, source, backend='auto', chunk_size=65536):
+    """Feed HTML text, a text-mode file object or a MappedHTMLFile to a StreamingHTMLHandler
+
+    Yields after every chunk and once more after the end of the input, so the
+    caller can drain what the handler collected so far. No tree is built: lxml's
+    tokenizer drives the handler when lxml is the chosen backend, otherwise the
+    handler tokenizes with html.parser itself.
+    """
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), '')
+    else:
+        chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+
+    if pick_parser_backend(backend, tree=True) == 'lxml':
+        yield from _tokenize_with_libxml2(handler, chunks)
+        return
+
+    for chunk in chunks:
+        handler.feed(chunk)
+        yield
+    handler.close()
+    yield
+
+
+def _tokenize_with_libxml2(handler, chunks):
+    # libxml2's push parser (feed) keeps every byte it was given until close, which
+    # costs the size of the page again. In pull mode it reads through a file-like
+    # object and discards consumed input, so the parse runs on a helper thread that
+    # asks for one chunk at a time, in lockstep with this generator.
+    import lxml.etree
+
+    paused = threading.Semaphore(0)   # parser thread waits for the next chunk, or finished
+    resume = threading.Semaphore(0)   # caller drained the handler, parse on
+    state = {'fed': False, 'stop': False, 'finished': False, 'error': None}
+
+    class ChunkReader:
+        def read(self, size):
+            paused.release()
+            resume.acquire()
+            if state['stop']:
+                return ''
+            chunk = next(chunks, '')
+            state['fed'] = state['fed'] or bool(chunk)
+            return chunk
+
+    def parse():
+        try:
+            lxml.etree.parse(ChunkReader(), lxml.etree.HTMLParser(target=handler))
+        except lxml.etree.XMLSyntaxError as e:
+            if state['fed']:  # libxml2 rejects a document it was never fed
+                state['error'] = e
+        except Exception as e:
+            state['error'] = e
+        finally:
+            state['finished'] = True
+            paused.release()
+
+    thread = threading.Thread(target=parse, name='html-tokenizer', daemon=True)
+    thread.start()
+    try:
+        while True:
+            paused.acquire()
+            if state['finished']:
+                break
+            yield
+            resume.release()
+    finally:
+        if not state['finished']:
+            # Abandoned by the caller: end the document so the thread can exit
+            state['stop'] = True
+            resume.release()
+        thread.join()
+    if state['error'] is not None:
+        raise state['error']
+    yield
+
+
+class LinkCollector(StreamingHTMLHandler):
+    """Single-pass collector of <a href> targets and their text, without a DOM
+
+    Link text matches Tag.get_text(" ", strip=True): text runs stripped and joined
+    by spaces, leaving out comments, scripts, styles and templates. With
+    with_img=True only anchors wrapping an <img> are kept.
+    """
+
+    NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+    def __init__(self, with_img=False):
+        super().__init__(convert_charrefs=True)
+        self.with_img = with_img
+        self._anchors = []   # every anchor in document order: [href, text runs, has_img]
+        self._open = []      # anchors not closed yet
+        self._run = []       # pieces of the current text run
+        self._skip_text = 0
+
+    def links(self):
+        self._flush_text()
+        return [{'href': href, 'text': ' '.join(texts)}
+                for href, texts, has_img in self._anchors
+                if href is not None and (has_img or not self.with_img)]
+
+    def _flush_text(self):
+        if self._run:
+            text = ''.join(self._run).strip()
+            self._run = []
+            if text:
+                for anchor in self._open:
+                    anchor[1].append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag == 'a':
+            anchor = [dict(attrs).get('href'), [], False]
+            self._anchors.append(anchor)
+            self._open.append(anchor)
+        elif tag == 'img':
+            for anchor in self._open:
+                anchor[2] = True
+        elif tag in self.NON_TEXT_TAGS:
+            self._skip_text += 1
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag == 'a':
+            if self._open:
+                anchor = self._open.pop()
+                # Forget anchors that can never be reported (usually the newest one)
+                if (anchor[0] is None or (self.with_img and not anchor[2])) and self._anchors[-1] is anchor:
+                    self._anchors.pop()
+        elif tag in self.NON_TEXT_TAGS and self._skip_text:
+            self._skip_text -= 1
+
+    def handle_data(self, data):
+        if self._open and not self._skip_text:
+            self._run.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+
+@METRICS.timed('parse', kind='links')
+def find_links(markup, backend='auto', with_img=False):
+    """All <a href> targets in a page as {'href', 'text'} dicts, in document order
+
+    Link discovery only needs the anchors, so no BeautifulSoup tree is built:
+    selectolax parses natively, lxml and html.parser stream through LinkCollector.
+    markup is the page text or a file object opened in text mode.
+    with_img keeps anchors wrapping an <img>.
+    """
+    backend = pick_parser_backend(backend)
+    if backend == 'selectolax':
+        from selectolax.parser import HTMLParser as SelectolaxParser
+        if hasattr(markup, 'read'):
+            markup = markup.read()
+        links = []
+        for node in SelectolaxParser(markup).css('a[href]'):
+            if with_img and node.css_first('img') is None:
+                continue
+            links.append({'href': node.attributes.get('href') or '',
+                          'text': node.text(separator=' ', strip=True)})
+        return links
+
+    collector = LinkCollector(with_img)
+    for _ in tokenize_html(collector, markup, backend):
+        pass
+    return collector.links()
+
+
+class HostRateLimiter:
+    """Token bucket per host: ``rate`` requests per second with bursts of up to ``burst``"""
+
+    def __init__(self, rate=4.0, burst=8):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """Block until the URL's host has a token available"""
+        if not self.rate or self.rate <= 0:
+            return
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+class HTTPResponseCache:
+    """Persistent URL-keyed response cache with ETag/Last-Modified revalidation and LRU eviction
+
+    Each entry is a ``<sha256>.body`` file plus a ``<sha256>.json`` metadata file.
+    Entries younger than ``ttl`` seconds are served without a request; older ones
+    are revalidated with a conditional GET. The body file's mtime is the LRU clock.
+    """
+
+    CACHED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+    def __init__(self, cache_dir, ttl=3600, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._index = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _paths(self, key):
+        return (os.path.join(self.cache_dir, key + '.body'),
+                os.path.join(self.cache_dir, key + '.json'))
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _load_index(self):
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            key = name[:-5]
+            body_path, meta_path = self._paths(key)
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                meta['size'] = os.path.getsize(body_path)
+                meta['last_access'] = os.path.getmtime(body_path)
+            except Exception:
+                continue
+            self._index[key] = meta
+            self._total_bytes += meta['size']
+
+    def _write_meta(self, key, meta):
+        _, meta_path = self._paths(key)
+        tmp_path = meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({k: v for k, v in meta.items() if k not in ('size', 'last_access')}, f)
+        os.replace(tmp_path, meta_path)
+
+    def lookup(self, url):
+        """Return a copy of the entry metadata for a URL, or None"""
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            return dict(meta) if meta else None
+
+    def is_fresh(self, meta):
+        return time.time() - meta.get('fetched_at', 0) < self.ttl
+
+    def conditional_headers(self, meta):
+        """If-None-Match / If-Modified-Since headers for revalidating an entry"""
+        headers = {}
+        if meta['headers'].get('etag'):
+            headers['If-None-Match'] = meta['headers']['etag']
+        if meta['headers'].get('last-modified'):
+            headers['If-Modified-Since'] = meta['headers']['last-modified']
+        return headers
+
+    def load_response(self, url, meta):
+        """Rebuild a requests.Response from a cached entry and mark it recently used
+
+        Returns None when the body is gone, e.g. evicted by another thread since lookup().
+        """
+        key = self._key(url)
+        body_path, _ = self._paths(key)
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                entry = self._index.pop(key, None)
+                if entry:
+                    self._total_bytes -= entry['size']
+            return None
+        now = time.time()
+        try:
+            os.utime(body_path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._index:
+                self._index[key]['last_access'] = now
+
+        response = requests.Response()
+        response._content = content
+        response.status_code = 200
+        response.url = meta.get('final_url', url)
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = meta.get('encoding')
+        response.from_cache = True
+        return response
+
+    def hit(self, url, meta):
+        """Serve a fresh entry without touching the network; None if its body is gone"""
+        response = self.load_response(url, meta)
+        if response is not None:
+            with self._lock:
+                self.stats['hits'] += 1
+        return response
+
+    def revalidate(self, url, meta, not_modified):
+        """Refresh an entry after a 304 and return the cached response; None if its body is gone"""
+        key = self._key(url)
+        for header in ('etag', 'last-modified'):
+            if not_modified.headers.get(header):
+                meta['headers'][header] = not_modified.headers[header]
+        meta['fetched_at'] = time.time()
+        response = self.load_response(url, meta)
+        if response is None:
+            return None
+        with self._lock:
+            self.stats['revalidated'] += 1
+            if key in self._index:
+                self._index[key].update(headers=meta['headers'], fetched_at=meta['fetched_at'])
+        self._write_meta(key, meta)
+        return response
+
+    def store(self, url, response):
+        """Store a 200 response unless the server forbids it"""
+        with self._lock:
+            self.stats['misses'] += 1
+        if response.status_code != 200 or 'no-store' in response.headers.get('Cache-Control', '').lower():
+            return
+        key = self._key(url)
+        body_path, _ = self._paths(key)
+        content = response.content
+        meta = {
+            'url': url,
+            'final_url': response.url,
+            'fetched_at': time.time(),
+            'encoding': response.encoding,
+            'headers': {h: response.headers[h] for h in self.CACHED_HEADERS if response.headers.get(h)}
+        }
+        try:
+            tmp_path = body_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, body_path)
+            self._write_meta(key, meta)
+        except Exception as e:
+            _log_json('http_cache_write_error', url=url, error=str(e))
+            return
+
+        meta['size'] = len(content)
+        meta['last_access'] = time.time()
+        with self._lock:
+            previous = self._index.get(key)
+            if previous:
+                self._total_bytes -= previous['size']
+            self._index[key] = meta
+            self._total_bytes += meta['size']
+            self.stats['stored'] += 1
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            for key, meta in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self._total_bytes -= meta['size']
+                del self._index[key]
+                self.stats['evicted'] += 1
+
+
+class ConcurrentFetcher:
+    """Fetch pages on a thread pool over one pooled session, rate limited per host"""
+
+    def __init__(self, session, max_concurrency=8, host_rate=4.0, host_burst=8, retries=0, retry_delay=2, cache=None):
+        self.session = session
+        self.max_concurrency = max(1, max_concurrency)
+        self.limiter = HostRateLimiter(host_rate, host_burst)
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.cache = cache
+
+        # Size the connection pool so every worker can keep its connection alive
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @METRICS.timed('fetch', kind='http')
+    def fetch(self, url, retries=None, **request_kwargs):
+        """Fetch one URL; returns {'url', 'response', 'error'} and never raises"""
+        retries = self.retries if retries is None else retries
+        delay = self.retry_delay
+
+        plain_kwargs = request_kwargs
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached:
+            try:
+                if self.cache.is_fresh(cached):
+                    response = self.cache.hit(url, cached)
+                    if response is not None:
+                        METRICS.inc('fetch_total', result='cache_hit')
+                        return {'url': url, 'response': response, 'error': None}
+                    # Evicted since lookup(): fetch it like any other miss
+                    cached = None
+                else:
+                    headers = dict(request_kwargs.get('headers') or {})
+                    headers.update(self.cache.conditional_headers(cached))
+                    request_kwargs = {**request_kwargs, 'headers': headers}
+            except Exception as e:
+                _log_json('http_cache_read_error', url=url, error=str(e))
+                cached = None
+                request_kwargs = plain_kwargs
+
+        for attempt in range(retries + 1):
+            self.limiter.acquire(url)
+            try:
+                response = self.session.get(url, **request_kwargs)
+                if cached and response.status_code == 304:
+                    revalidated = self.cache.revalidate(url, cached, response)
+                    if revalidated is not None:
+                        METRICS.inc('fetch_total', result='revalidated')
+                        return {'url': url, 'response': revalidated, 'error': None}
+                    # The body was evicted while revalidating: fetch it again without conditions
+                    cached, request_kwargs = None, plain_kwargs
+                    self.limiter.acquire(url)
+                    response = self.session.get(url, **request_kwargs)
+                response.raise_for_status()
+                if self.cache:
+                    self.cache.store(url, response)
+                METRICS.inc('fetch_total', result='ok')
+                return {'url': url, 'response': response, 'error': None}
+            except Exception as e:
+                if attempt >= retries:
+                    METRICS.inc('fetch_total', result='error')
+                    return {'url': url, 'response': None, 'error': e}
+                METRICS.inc('fetch_retries_total')
+                _log_json('fetch_retry', url=url, attempt=attempt + 1, error=str(e))
+                time.sleep(delay)
+                delay *= 2
+
+    def iter_fetch(self, urls, retries=None, **request_kwargs):
+        """Fetch URLs concurrently, yielding results in the order the URLs were given
+
+        At most twice as many requests as workers are in flight or waiting to be
+        consumed, so response bodies do not pile up ahead of a slow consumer.
+        Closing the generator early (e.g. ``break`` on a stop request) cancels the
+        requests that have not started yet.
+        """
+        urls = list(urls)
+        if not urls:
+            return
+        workers = min(self.max_concurrency, len(urls))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch')
+        remaining = iter(urls)
+        futures = deque(executor.submit(self.fetch, url, retries, **request_kwargs)
+                        for url in itertools.islice(remaining, workers * 2))
+        try:
+            while futures:
+                result = futures.popleft().result()
+                for url in itertools.islice(remaining, 1):
+                    futures.append(executor.submit(self.fetch, url, retries, **request_kwargs))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+class HeadlessBrowserPool:
+    """Long-lived headless Chromium with ``size`` reusable pages
+
+    Playwright runs on its own event-loop thread, so render() can be called from
+    any thread and up to ``size`` pages render at once. Images, media, fonts and
+    analytics requests are aborted, and a render waits for ``wait_selector`` to be
+    attached instead of network idle plus a fixed sleep. A closed pool stays
+    closed: start() and render() raise RuntimeError.
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font'])
+    BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+                     'analytics.google.com', 'googleadservices.com', 'facebook.net', 'hotjar.com', 'segment.io')
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    def __init__(self, size=2, wait_selector=None, timeout=15, block_resources=True):
+        self.size = max(1, size)
+        self.wait_selector = wait_selector
+        self.timeout = timeout
+        self.block_resources = block_resources
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._pages = None
+        self._closed = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def start(self):
+        """Launch the browser and open the pages; raises ImportError or Playwright's Error on failure"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("browser pool is closed")
+            if self._loop is not None:
+                return self
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='browser-pool', daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), loop).result()
+            except BaseException:
+                self._stop_loop(loop, thread)
+                raise
+            self._loop, self._thread = loop, thread
+        atexit.register(self.close)
+        _log_json('browser_pool_started', pages=self.size)
+        return self
+
+    def render(self, url, wait_selector=None, timeout=None):
+        """Rendered HTML of a URL, from the first free page of the pool"""
+        self.start()
+        timeout_ms = (timeout or self.timeout) * 1000
+        rendering = self._render(url, wait_selector or self.wait_selector, timeout_ms)
+        return asyncio.run_coroutine_threadsafe(rendering, self._loop).result()
+
+    def close(self):
+        """Close the browser and stop the event-loop thread (safe to call twice)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._closed = True
+        if loop is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+        except Exception as e:
+            _log_json('browser_pool_close_error', error=str(e))
+        self._stop_loop(loop, thread)
+
+    @staticmethod
+    def _stop_loop(loop, thread):
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def _launch(self):
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._context = await self._browser.new_context(user_agent=self.USER_AGENT,
+                                                            viewport={'width': 1280, 'height': 720})
+            if self.block_resources:
+                await self._context.route('**/*', self._route)
+            self._pages = asyncio.Queue()
+            for _ in range(self.size):
+                self._pages.put_nowait(await self._context.new_page())
+        except BaseException:
+            await self._shutdown()
+            raise
+
+    async def _shutdown(self):
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        finally:
+            if self._playwright is not None:
+                await self._playwright.stop()
+            self._playwright = self._browser = self._context = self._pages = None
+
+    async def _route(self, route):
+        request = route.request
+        host = urlparse(request.url).hostname or ''
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(
+                host == blocked or host.endswith('.' + blocked) for blocked in self.BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _render(self, url, wait_selector, timeout_ms):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        page = await self._pages.get()
+        rendered = False
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+            if wait_selector:
+                try:
+                    await page.wait_for_selector(wait_selector, state='attached', timeout=timeout_ms)
+                except PlaywrightTimeoutError:
+                    _log_json('browser_wait_timeout', url=url, selector=wait_selector)
+            html_content = await page.content()
+            rendered = True
+            return html_content
+        finally:
+            if not rendered:
+                # A page left mid-navigation (or crashed) is swapped for a fresh one
+                page = await self._replace_page(page)
+            self._pages.put_nowait(page)
+
+    async def _replace_page(self, page):
+        try:
+            await page.close()
+            return await self._context.new_page()
+        except Exception as e:
+            _log_json('browser_page_replace_error', error=str(e))
+            return page
+
+
+# Advisory whole-file locks across processes; the OS drops them when the holder exits
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK gives up after about 10 seconds; keep waiting
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class SatelliteCatalogStore:
+    """Append-only, satellite-keyed catalog store
+
+    Each save appends one JSON line to the newest ``satellite_catalog.<n>.jsonl``
+    segment, so the cost per record stays constant. ``compact()`` folds older
+    segments into ``satellite_catalog.snapshot.json`` (which records the last
+    segment it contains) and refreshes the ``satellite_catalog.json`` export.
+    That segment number is also kept in ``satellite_catalog.snapshot.segment``,
+    so opening the store does not parse the snapshot. Appends, reads and
+    compaction hold an OS lock on ``satellite_catalog.lock``, so several
+    processes can share one store.
+    """
+
+    def __init__(self, directory, name='satellite_catalog'):
+        self.directory = directory
+        self.name = name
+        self.snapshot_path = os.path.join(directory, f"{name}.snapshot.json")
+        self.export_path = os.path.join(directory, f"{name}.json")
+        self.snapshot_segment_path = os.path.join(directory, f"{name}.snapshot.segment")
+        self.lock_path = os.path.join(directory, f"{name}.lock")
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._segment = self._newest_segment()
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"{self.name}.{number}.jsonl")
+
+    def _segments(self):
+        prefix, suffix = f"{self.name}.", '.jsonl'
+        numbers = []
+        for filename in os.listdir(self.directory):
+            middle = filename[len(prefix):-len(suffix)]
+            if filename.startswith(prefix) and filename.endswith(suffix) and middle.isdigit():
+                numbers.append(int(middle))
+        return sorted(numbers)
+
+    def _load_snapshot(self):
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        # First use after the read-modify-write format: start from the old file
+        if os.path.exists(self.export_path):
+            try:
+                with open(self.export_path, 'r', encoding='utf-8') as f:
+                    return {'segment': 0, 'catalog': json.load(f)}
+            except Exception:
+                pass
+        return {'segment': 0, 'catalog': {}}
+
+    def _snapshot_segment(self):
+        try:
+            with open(self.snapshot_segment_path, 'r', encoding='ascii') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            pass
+        if not os.path.exists(self.snapshot_path):
+            return 0  # nothing compacted yet (a legacy export is imported as segment 0)
+        # Snapshot written before the segment file existed
+        try:
+            return self._load_snapshot().get('segment', 0)
+        except Exception:
+            return 0
+
+    def _newest_segment(self):
+        segments = self._segments()
+        return max(segments[-1] if segments else 0, self._snapshot_segment() + 1)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the store lock for this process's threads and, via the lock file, for other processes"""
+        with self._lock, open(self.lock_path, 'a+b') as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
+
+    @property
+    def path(self):
+        """Segment file currently receiving appends"""
+        return self._segment_path(self._segment)
+
+    def append(self, satellite_name, record):
+        """Append one record for a satellite"""
+        line = json.dumps({'satellite': satellite_name, 'record': record}, ensure_ascii=False,
+                          default=json_default) + '\n'
+        with self._locked():
+            # A missing segment was either never written or folded in by another process's compact()
+            if not os.path.exists(self.path):
+                self._segment = self._newest_segment()
+            with open(self.path, 'ab') as f:
+                if f.tell() and not self._ends_with_newline():
+                    # Terminate a torn line left by an interrupted write so this record stays readable
+                    line = '\n' + line
+                f.write(line.encode('utf-8'))
+            return self.path
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _replay(self, catalog, number):
+        try:
+            with open(self._segment_path(number), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write
+                        continue
+                    catalog.setdefault(entry['satellite'], []).append(entry['record'])
+        except FileNotFoundError:
+            pass
+
+    def read(self):
+        """Return the current {satellite_name: [records]} view"""
+        with self._locked():
+            snapshot = self._load_snapshot()
+            catalog = snapshot.get('catalog', {})
+            for number in self._segments():
+                if number > snapshot.get('segment', 0):
+                    self._replay(catalog, number)
+            return catalog
+
+    def compact(self):
+        """Fold all closed segments into the snapshot and rewrite the JSON export"""
+        with self._locked():
+            # New appends, from this or any other process, go to a fresh segment
+            last_segment = max([self._segment] + self._segments())
+            self._segment = last_segment + 1
+            snapshot = self._load_snapshot()
+            catalog = snapshot.get('catalog', {})
+            folded = [n for n in self._segments() if snapshot.get('segment', 0) < n <= last_segment]
+            for number in folded:
+                self._replay(catalog, number)
+
+            # The segment number goes first: ahead of the snapshot it only makes appends
+            # skip a number, whereas behind it appends could land in a folded segment
+            tmp_path = self.snapshot_segment_path + '.tmp'
+            with open(tmp_path, 'w', encoding='ascii') as f:
+                f.write(str(last_segment))
+            os.replace(tmp_path, self.snapshot_segment_path)
+
+            for path, payload, indent in ((self.snapshot_path, {'segment': last_segment, 'catalog': catalog}, None),
+                                          (self.export_path, catalog, 2)):
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, indent=indent, ensure_ascii=False)
+                os.replace(tmp_path, path)
+
+            for number in self._segments():
+                if number <= last_segment:
+                    os.remove(self._segment_path(number))
+            return catalog
+
+
+class DatasetIndex:
+    """SQLite index of extracted dataset records with indexed filter columns
+
+    The full record is kept as JSON next to the indexed columns, so filtered
+    lookups return the same dicts the JSON files hold without scanning them.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS datasets (
+            dataset_id TEXT PRIMARY KEY,
+            title TEXT,
+            provider TEXT,
+            category TEXT,
+            start_date TEXT,
+            end_date TEXT,
+            resolution TEXT,
+            source TEXT,
+            updated_at TEXT,
+            record TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS dataset_tags (
+            dataset_id TEXT NOT NULL REFERENCES datasets(dataset_id) ON DELETE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (dataset_id, tag)
+        );
+        CREATE INDEX IF NOT EXISTS idx_datasets_provider ON datasets(provider);
+        CREATE INDEX IF NOT EXISTS idx_datasets_category ON datasets(category);
+        CREATE INDEX IF NOT EXISTS idx_datasets_start_date ON datasets(start_date);
+        CREATE INDEX IF NOT EXISTS idx_datasets_end_date ON datasets(end_date);
+        CREATE INDEX IF NOT EXISTS idx_datasets_resolution ON datasets(resolution);
+        CREATE INDEX IF NOT EXISTS idx_dataset_tags_tag ON dataset_tags(tag);
+    """
+
+    COLUMNS = ('dataset_id', 'title', 'provider', 'category', 'start_date', 'end_date', 'resolution', 'source')
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    def upsert(self, rows):
+        """Insert or replace index rows in one transaction; returns the number written"""
+        now = datetime.now().isoformat()
+        written = 0
+        with self._lock, self._conn:
+            for row in rows:
+                if not row.get('dataset_id'):
+                    continue
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO datasets (dataset_id, title, provider, category, start_date, end_date, '
+                    'resolution, source, updated_at, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [row.get(column) or '' for column in self.COLUMNS] +
+                    [now, json.dumps(row['record'], ensure_ascii=False, default=json_default)]
+                )
+                self._conn.execute('DELETE FROM dataset_tags WHERE dataset_id = ?', (row['dataset_id'],))
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO dataset_tags (dataset_id, tag) VALUES (?, ?)',
+                    [(row['dataset_id'], tag.lower()) for tag in row.get('tags', []) if tag]
+                )
+                written += 1
+        return written
+
+    def get(self, dataset_id):
+        """Return the stored record for a dataset id, or None"""
+        with self._lock:
+            found = self._conn.execute('SELECT record FROM datasets WHERE dataset_id = ?', (dataset_id,)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def query(self, provider=None, category=None, tag=None, start_from=None, end_until=None, resolution=None, limit=None):
+        """Return records matching all given filters, ordered by dataset id"""
+        clauses, params = [], []
+        if provider:
+            clauses.append('provider = ?')
+            params.append(provider)
+        if category:
+            clauses.append('category = ?')
+            params.append(category)
+        if tag:
+            clauses.append('dataset_id IN (SELECT dataset_id FROM dataset_tags WHERE tag = ?)')
+            params.append(tag.lower())
+        if start_from:
+            clauses.append("start_date != '' AND start_date >= ?")
+            params.append(start_from)
+        if end_until:
+            clauses.append("end_date != '' AND end_date <= ?")
+            params.append(end_until)
+        if resolution:
+            clauses.append('resolution = ?')
+            params.append(resolution)
+
+        sql = 'SELECT record FROM datasets'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY dataset_id'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+        with self._lock:
+            return [json.loads(record) for (record,) in self._conn.execute(sql, params)]
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM datasets').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ThumbnailStore:
+    """Content-addressed thumbnail store with per-dataset hardlinks
+
+    Image bytes are stored once as ``objects/<sha256[:2]>/<sha256><ext>``; each
+    dataset name in the thumbnails directory is a hardlink to its object (or a
+    copy where links are unsupported). ``index.jsonl`` remembers which source
+    (local file path + size + mtime, or URL) produced which object, so unchanged
+    sources are neither re-read nor re-downloaded.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        self._sources = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._sources[entry['source']] = entry
+                except (ValueError, KeyError):
+                    continue
+
+    def _remember(self, source, object_path, **extra):
+        entry = {'source': source, 'object': os.path.relpath(object_path, self.directory), **extra}
+        with self._lock:
+            self._sources[source] = entry
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def _known_object(self, source, **expected):
+        entry = self._sources.get(source)
+        if not entry or any(entry.get(key) != value for key, value in expected.items()):
+            return None
+        object_path = os.path.join(self.directory, entry['object'])
+        return object_path if os.path.exists(object_path) else None
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.objects_dir, digest[:2], digest + ext.lower())
+
+    def put_bytes(self, content, ext):
+        """Store image bytes (skipped when the object already exists) and return the object path"""
+        object_path = self._object_path(hashlib.sha256(content).hexdigest(), ext)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f"{object_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, object_path)
+        return object_path
+
+    def link(self, object_path, name):
+        """Expose an object under a dataset file name; no I/O if the link is already in place"""
+        dest_path = os.path.join(self.directory, name)
+        if os.path.exists(dest_path):
+            try:
+                if os.path.samefile(dest_path, object_path):
+                    return dest_path
+            except OSError:
+                pass
+            os.remove(dest_path)
+        try:
+            os.link(object_path, dest_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            import shutil
+            shutil.copyfile(object_path, dest_path)
+        return dest_path
+
+    def add_file(self, src_path, name):
+        """Store a local image file under a dataset name"""
+        stat = os.stat(src_path)
+        source = os.path.abspath(src_path)
+        object_path = self._known_object(source, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        if object_path is None:
+            with open(src_path, 'rb') as f:
+                object_path = self.put_bytes(f.read(), os.path.splitext(src_path)[1] or '.png')
+            self._remember(source, object_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        return self.link(object_path, name)
+
+    def lookup_url(self, url):
+        """Object path previously downloaded from a URL, or None"""
+        return self._known_object(url)
+
+    def add_url_content(self, url, content, ext, name):
+        """Store downloaded image bytes under a dataset name and remember their URL"""
+        object_path = self.put_bytes(content, ext)
+        self._remember(url, object_path)
+        return self.link(object_path, name)
+
+
+# Gallery card image size; variants are pre-scaled at 1x and 2x (HiDPI)
+GALLERY_THUMBNAIL_SIZE = (180, 140)
+THUMBNAIL_SCALES = (1, 2)
+
+
+def thumbnail_variant_path(path, scale=1):
+    """Path of the pre-scaled gallery variant stored beside an original thumbnail"""
+    width, height = GALLERY_THUMBNAIL_SIZE
+    stem, ext = os.path.splitext(path)
+    return f"{stem}@{width * scale}x{height * scale}{ext or '.png'}"
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_variant_source(target):
+    try:
+        with open(target + '.source', 'r', encoding='ascii') as f:
+            source = json.load(f)
+        return source if isinstance(source, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_variant_source(target, source):
+    tmp_path = f"{target}.source.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='ascii') as f:
+        json.dump(source, f)
+    os.replace(tmp_path, target + '.source')
+
+
+def _scale_thumbnail(path):
+    """Write the missing or stale gallery variants of one image; returns how many were written
+
+    The ``.source`` file beside each variant records the original it was scaled
+    from: its (st_dev, st_ino, size, mtime_ns) and sha256. A matching stat means
+    the variant is current without reading the original. Otherwise a newer
+    original is rescaled, and an older one (a dataset name relinked to another
+    object) is only rescaled when its sha256 differs.
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage
+
+    width, height = GALLERY_THUMBNAIL_SIZE
+    stat = os.stat(path)
+    signature = [stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns]
+    source_digest = None
+    image = None
+    written = 0
+    for scale in THUMBNAIL_SCALES:
+        target = thumbnail_variant_path(path, scale)
+        recorded = _read_variant_source(target) if os.path.exists(target) else None
+        if recorded is not None:
+            if recorded.get('stat') == signature:
+                continue
+            if os.path.getmtime(target) >= stat.st_mtime:
+                if source_digest is None:
+                    source_digest = _file_digest(path)
+                if recorded.get('sha256') == source_digest:
+                    _write_variant_source(target, {'stat': signature, 'sha256': source_digest})
+                    continue
+        if image is None:
+            image = QImage(path)
+            if image.isNull():
+                return written
+        scaled = image.scaled(width * scale, height * scale,
+                              Qt.AspectRatioMode.KeepAspectRatio,
+                              Qt.TransformationMode.SmoothTransformation)
+        tmp_path = f"{target}.{threading.get_ident()}.tmp"
+        if scaled.save(tmp_path, os.path.splitext(target)[1][1:].upper() or 'PNG'):
+            os.replace(tmp_path, target)
+            if source_digest is None:
+                source_digest = _file_digest(path)
+            _write_variant_source(target, {'stat': signature, 'sha256': source_digest})
+            written += 1
+    return written
+
+
+def generate_thumbnail_variants(paths, workers=4):
+    """Pre-scale gallery variants for many thumbnails on a thread pool
+
+    Originals that are hardlinks of the same file (see ThumbnailStore) are scaled
+    once and their variants (with their ``.source`` records) hardlinked. Returns
+    the number of variant files written.
+    """
+    groups = {}
+    for path in dict.fromkeys(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        groups.setdefault((stat.st_dev, stat.st_ino), []).append(path)
+    if not groups:
+        return 0
+    try:
+        import PySide6.QtGui  # noqa: F401
+    except ImportError:
+        print("     PySide6 is not installed; skipping thumbnail pre-scaling")
+        return 0
+
+    primaries = [group[0] for group in groups.values()]
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='thumbnail') as executor:
+        written = sum(executor.map(_scale_thumbnail, primaries))
+
+    for group in groups.values():
+        for scale in THUMBNAIL_SCALES:
+            source = thumbnail_variant_path(group[0], scale)
+            if not os.path.exists(source):
+                continue
+            for path in group[1:]:
+                target = thumbnail_variant_path(path, scale)
+                written += _link_variant(source, target)
+                if os.path.exists(source + '.source'):
+                    _link_variant(source + '.source', target + '.source')
+    return written
+
+
+def _link_variant(source, target):
+    """Hardlink (or copy) a variant file onto another name; False when it already is that file"""
+    try:
+        if os.path.exists(target):
+            if os.path.samefile(source, target):
+                return False
+            os.remove(target)
+        os.link(source, target)
+    except OSError:
+        import shutil
+        shutil.copyfile(source, target)
+    return True
+
+
+class LocalHTMLDataExtractor:
+    """Extracts ALL data from local HTML files without external requests"""
+    
+    def __init__(self):
+        # Create output directory for JSON files
+        self.output_dir = "collected_data"
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+
+        # Create thumbnails directory
+        self.thumbnails_dir = os.path.join(self.output_dir, "thumbnails")
+        if not os.path.exists(self.thumbnails_dir):
+            os.makedirs(self.thumbnails_dir)
+
+        # Smart crawling controls
+        self.processed_urls = set()
+        self.crawl_depth_limit = 3
+        self.max_datasets_per_run = 1000
+        self.crawl_delay = 1.0  # seconds between requests
+        self.dataset_counter = 0
+        
+        # Network session and defaults for link-following
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        # Log all HTTP responses
+        def _resp_hook(resp, *args, **kwargs):
+            try:
+                _logger.info(f"HTTP {resp.status_code} {resp.request.method} {resp.url} ({resp.elapsed.total_seconds():.3f}s)")
+                _log_json('http_response', status=resp.status_code, method=resp.request.method, url=resp.url, elapsed_ms=int(resp.elapsed.total_seconds()*1000))
+            except Exception:
+                pass
+            return resp
+        self.session.hooks['response'] = [ _resp_hook ]
+        self.config = {
+            'performance': {'timeout': 15, 'request_delay': 0.5, 'max_concurrency': 8, 'host_rate': 4.0, 'host_burst': 8},
+            'processing': {'batch_size': 10, 'extraction_workers': os.cpu_count() or 1, 'thumbnail_workers': 4},
+            'cache': {'enabled': True, 'ttl': 3600, 'max_bytes': 256 * 1024 * 1024},
+            'index': {'enabled': False, 'path': None},
+            'parser': {'backend': 'auto'},
+            'browser': {'enabled': True, 'pool_size': 2, 'timeout': 15,
+                        # Only client-side rendering adds the JSON-LD; the article body is server-rendered
+                        'wait_selector': 'script[type="application/ld+json"]'},
+            'metrics': {'snapshot_path': None, 'port': None},
+            'profile': {'enabled': False, 'top': 25}
+        }
+        self._fetcher = None
+        self._browser_pool = None
+        self._browser_error = None
+        self._metrics_server = None
+        self.profile_runs = []
+        self._pending_manifest = None
+        self._http_cache = None
+        self._satellite_catalog_store = None
+        self._dataset_index = None
+        self._thumbnail_store = None
+
+    def make_soup(self, markup):
+        """Parse a page with the configured parser backend"""
+        return make_soup(markup, self.config.get('parser', {}).get('backend', 'auto'))
+
+    def find_links(self, markup, with_img=False):
+        """Anchors of a page via the configured backend, without building a full tree"""
+        return find_links(markup, self.config.get('parser', {}).get('backend', 'auto'), with_img)
+
+    def get_thumbnail_store(self):
+        """Return the content-addressed thumbnail store for the thumbnails directory"""
+        if self._thumbnail_store is None:
+            self._thumbnail_store = ThumbnailStore(self.thumbnails_dir)
+        return self._thumbnail_store
+
+    def get_dataset_index(self):
+        """Return the SQLite dataset index, or None unless config['index'] enables it"""
+        index_config = self.config.get('index', {})
+        if not index_config.get('enabled', False):
+            return None
+        if self._dataset_index is None:
+            path = index_config.get('path') or os.path.join(self.output_dir, 'catalog_index.sqlite')
+            self._dataset_index = DatasetIndex(path)
+        return self._dataset_index
+
+    def index_datasets(self, records, source=''):
+        """Write Earth Engine datasets or satellite catalog records to the SQLite index"""
+        index = self.get_dataset_index()
+        if index is None:
+            return 0
+        return index.upsert(self.dataset_index_row(record, source) for record in records)
+
+    def dataset_index_row(self, record, source=''):
+        """Map an Earth Engine dataset or a satellite catalog record to index columns"""
+        if 'layer_name' in record:
+            # satellite_catalog record from a followed detail page
+            url = record.get('url') or source
+            dataset_id = url.split('/catalog/')[-1].split('?')[0].split('#')[0] if '/catalog/' in url else url
+            classify_view = {
+                'title': record.get('layer_name', ''),
+                'description': record.get('description', ''),
+                'tags': record.get('category_tags', [])
+            }
+            return {
+                'dataset_id': dataset_id or record.get('layer_name'),
+                'title': record.get('layer_name', ''),
+                'provider': record.get('dataset_provider', ''),
+                'category': self.classify_single_dataset(classify_view),
+                'tags': record.get('category_tags', []),
+                'start_date': record.get('date_range', {}).get('start', ''),
+                'end_date': record.get('date_range', {}).get('end', ''),
+                'resolution': record.get('pixel_size', ''),
+                'source': source,
+                'record': record
+            }
+        return {
+            'dataset_id': self.ee_dataset_key(record),
+            'title': record.get('title', ''),
+            'provider': record.get('provider', ''),
+            'category': self.classify_single_dataset(record),
+            'tags': record.get('tags', []),
+            'start_date': record.get('temporal_coverage', {}).get('start_date', ''),
+            'end_date': record.get('temporal_coverage', {}).get('end_date', ''),
+            'resolution': record.get('spatial_info', {}).get('resolution', ''),
+            'source': source,
+            'record': record
+        }
+
+    def query_datasets(self, **filters):
+        """Filter indexed datasets (provider, category, tag, start_from, end_until, resolution, limit)"""
+        index = self.get_dataset_index()
+        return index.query(**filters) if index is not None else []
+
+    def get_satellite_catalog_store(self):
+        """Return the append-only satellite catalog store under the output directory"""
+        if self._satellite_catalog_store is None:
+            self._satellite_catalog_store = SatelliteCatalogStore(self.output_dir)
+        return self._satellite_catalog_store
+
+    def get_http_cache(self):
+        """Return the on-disk HTTP response cache, or None when caching is disabled"""
+        cache_config = self.config.get('cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        if self._http_cache is None:
+            self._http_cache = HTTPResponseCache(
+                os.path.join(self.output_dir, 'http_cache'),
+                ttl=cache_config.get('ttl', 3600),
+                max_bytes=cache_config.get('max_bytes', 256 * 1024 * 1024)
+            )
+        return self._http_cache
+
+    def get_fetcher(self):
+        """Return the shared concurrent fetcher, created from the performance config on first use"""
+        if self._fetcher is None:
+            perf = self.config.get('performance', {})
+            self._fetcher = ConcurrentFetcher(
+                self.session,
+                max_concurrency=perf.get('max_concurrency', 8),
+                host_rate=perf.get('host_rate', 4.0),
+                host_burst=perf.get('host_burst', 8),
+                retries=perf.get('retries', 0),
+                cache=self.get_http_cache()
+            )
+        return self._fetcher
+
+    def get_browser_pool(self):
+        """Return the shared headless browser pool, or None when disabled or Chromium cannot start"""
+        browser_config = self.config.get('browser', {})
+        if not browser_config.get('enabled', False) or self._browser_error is not None:
+            return None
+        if self._browser_pool is None:
+            pool = HeadlessBrowserPool(
+                size=browser_config.get('pool_size', 2),
+                wait_selector=browser_config.get('wait_selector'),
+                timeout=browser_config.get('timeout', 15)
+            )
+            try:
+                pool.start()
+            except ImportError as e:
+                self._browser_error = e
+                print("          Playwright not installed. Install with: pip install playwright")
+                return None
+            except Exception as e:
+                # Remembered so a missing browser is reported once, not once per link
+                self._browser_error = e
+                print(f"          Headless browser unavailable: {str(e).strip().splitlines()[0]}")
+                return None
+            self._browser_pool = pool
+        return self._browser_pool
+
+    def close_browser_pool(self):
+        """Shut down the headless browser pool if one was started"""
+        if self._browser_pool is not None:
+            self._browser_pool.close()
+            self._browser_pool = None
+
+    def write_metrics_snapshot(self, path=None):
+        """Write the stage timings and counters to collected_data/metrics.json (or config['metrics'])"""
+        path = path or self.config.get('metrics', {}).get('snapshot_path') or os.path.join(
+            self.output_dir, 'metrics.json')
+        try:
+            return METRICS.write_snapshot(path)
+        except Exception as e:
+            print(f"Failed to write metrics snapshot: {e}")
+            return None
+
+    def start_metrics_server(self, port=None):
+        """Serve the metrics in Prometheus text format on localhost; returns the bound port"""
+        if self._metrics_server is None:
+            if port is None:
+                port = self.config.get('metrics', {}).get('port') or 0
+            self._metrics_server = METRICS.serve(port)
+        return self._metrics_server.server_address[1]
+
+    def stop_metrics_server(self):
+        """Stop the metrics endpoint if one was started"""
+        if self._metrics_server is not None:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+
+    def profiling(self, label):
+        """Profile a block into collected_data/profiles when config['profile'] enables it
+
+        Yields the run dict from profile_run(); finished runs are kept in self.profile_runs.
+        """
+        profile_config = self.config.get('profile', {})
+        if not profile_config.get('enabled', False):
+            return contextlib.nullcontext({'label': label, 'pstats': None, 'report': None})
+        return self._profiling(label, profile_config.get('top', 25))
+
+    @contextlib.contextmanager
+    def _profiling(self, label, top):
+        run = None
+        try:
+            with profile_run(label, os.path.join(self.output_dir, 'profiles'), top) as run:
+                yield run
+        finally:
+            if run and run['pstats']:
+                self.profile_runs.append(run)
+    
+    @_profiled
+    @METRICS.timed('extract', kind='page')
+    def extract_all_data(self, soup, file_path, progress_callback=None, log_callback=None):
+        """Extract satellite catalog data from HTML file"""
+        print(f"Starting satellite catalog extraction from: {os.path.basename(file_path)}")
+        _logger.info(f"extract_all_data:start file={file_path}")
+        
+        try:
+            data = {
+                'file_path': file_path,
+                'timestamp': datetime.now().isoformat(),
+                'title': '',
+                'satellite_catalog': {},
+                'catalog_links': [],
+                'thumbnails': [],
+                'extraction_metadata': {}
+            }
+            
+            print(" Extracting satellite catalog data...")
+            
+            # Extract title
+            title_tag = soup.find('title')
+            if title_tag:
+                data['title'] = title_tag.get_text().strip()
+                print(f"    Title: {data['title'][:50]}...")
+                _logger.info(f"title: {data['title']}")
+            
+            # Extract catalog links (thumbnails with satellite data)
+            print(" Extracting satellite catalog links with smart classification...")
+            catalog_links = []
+            
+            try:
+                # Look for catalog grid containers first
+                catalog_containers = soup.find_all(['div', 'section', 'article'], class_=re.compile(r'catalog|grid|item|dataset|collection'))
+                
+                if catalog_containers:
+                    print(f"      Found {len(catalog_containers)} catalog containers")
+                    for container in catalog_containers:
+                        self.extract_links_from_container(container, catalog_links)
+                else:
+                    # Fallback to general link extraction
+                    print("     No catalog containers found, using general link extraction")
+                    self.extract_links_generally(soup, catalog_links)
+            except re.error as e:
+                print(f"      Regex error in catalog container search: {e}")
+                # Fallback to general link extraction
+                print("     Using fallback link extraction due to regex error")
+                self.extract_links_generally(soup, catalog_links)
+            
+            data['catalog_links'] = catalog_links
+            print(f"    Found {len(catalog_links)} catalog links")
+            _log_json('catalog_links', file=file_path, count=len(catalog_links))
+            
+            # Classify catalog links by type
+            try:
+                self.classify_catalog_links(catalog_links)
+            except Exception as e:
+                print(f"      Error in link classification: {e}")
+                _logger.exception("link_classification_error")
+            
+            # Extract satellite catalog data using smart extraction
+            print(" Starting smart satellite catalog data extraction...")
+            try:
+                data['satellite_catalog'] = self.extract_satellite_data(soup, data)
+                print(" Smart satellite catalog data extraction completed")
+                _log_json('satellite_data_extracted', completeness=len(data['satellite_catalog']))
+            except Exception as e:
+                print(f"      Error in satellite data extraction: {e}")
+                data['satellite_catalog'] = {}
+                _logger.exception("satellite_data_extraction_error")
+            
+            # Now follow individual dataset links to extract detailed information
+            if catalog_links:
+                try:
+                    # Keep only dataset detail links
+                    detail_links = [l for l in catalog_links if l.get('link_type') == 'dataset_detail']
+                    print(f" Following {len(detail_links)} dataset detail links to extract detailed information...")
+                    _log_json('detail_links', file=file_path, count=len(detail_links))
+                    detailed_extractions = 0
+                    
+                    # Fetch detail pages concurrently; results come back in link order
+                    http_links = [l.get('href', '') for l in detail_links if l.get('href', '').startswith('http')]
+                    fetched = self.get_fetcher().iter_fetch(
+                        http_links, timeout=self.config['performance']['timeout'], verify=False, allow_redirects=True
+                    )
+                    
+                    # Process ALL detail links - no artificial limits
+                    try:
+                        for i, link in enumerate(detail_links):
+                            if progress_callback:
+                                # Update progress: 50% for initial extraction, 50% for dataset processing
+                                progress = 50 + (i / len(detail_links)) * 50
+                                progress_callback(progress)
+                            if log_callback:
+                                log_callback(f"Processing dataset {i+1}/{len(detail_links)}: {link['text'][:80]}")
+                        
+                            print(f"     Processing dataset {i+1}/{len(detail_links)}: {link['text'][:50]}...")
+                        
+                            try:
+                                # Extract detailed data from this dataset link
+                                prefetched = next(fetched) if link.get('href', '').startswith('http') else None
+                                detailed_data = self.extract_from_dataset_link(link, soup, prefetched)
+                                if detailed_data:
+                                    # Add to satellite catalog
+                                    if 'satellite_catalog' not in data:
+                                        data['satellite_catalog'] = {}
+                                
+                                    # Merge detailed data
+                                    for key, value in detailed_data.items():
+                                        if value and value != 'Unknown':
+                                            data['satellite_catalog'][key] = value
+                                
+                                    detailed_extractions += 1
+                                    print(f"        Extracted detailed data for: {link['text'][:30]}...")
+                                    _log_json('detail_extracted', href=link.get('href', ''), text=link.get('text', '')[:120])
+                                else:
+                                    print(f"        No detailed data found for: {link['text'][:30]}...")
+                            except Exception as e:
+                                print(f"        Error processing dataset link: {e}")
+                                continue
+                    
+                    finally:
+                        fetched.close()
+                    print(f" Completed detailed extraction of {detailed_extractions} datasets")
+                    if progress_callback:
+                        progress_callback(100)
+                except Exception as e:
+                    print(f"      Error in dataset link processing: {e}")
+                    _logger.exception("dataset_link_processing_error")
+            
+            # Generate extraction summary
+            if catalog_links:
+                try:
+                    summary = self.generate_extraction_summary(catalog_links, data['satellite_catalog'])
+                    data['extraction_summary'] = summary
+                    print(f"    Smart Extraction Summary:")
+                    print(f"      • Total links discovered: {summary['total_links_discovered']}")
+                    print(f"      • Junk links filtered: {summary['junk_links_filtered']}")
+                    print(f"      • Clean catalog links: {summary['total_links']}")
+                    print(f"      • Links by type: {', '.join([f'{k}: {v}' for k, v in summary['links_by_type'].items()])}")
+                    print(f"      • Confidence: {summary['extraction_confidence']}")
+                    print(f"      • Completeness: {summary['data_completeness']:.1f}%")
+                    print(f"      • Quality: {summary['extraction_quality']}")
+                    if summary['junk_examples']:
+                        print(f"      • Junk examples: {', '.join(summary['junk_examples'][:3])}")
+                    if summary['recommendations']:
+                        print(f"      • Recommendations: {', '.join(summary['recommendations'][:2])}")
+                    _log_json('extraction_summary', **summary)
+                except Exception as e:
+                    print(f"      Error generating extraction summary: {e}")
+                    data['extraction_summary'] = {}
+                    _logger.exception("summary_error")
+            
+            return data
+            
+        except Exception as e:
+            print(f" Critical error in extract_all_data: {e}")
+            _logger.exception("extract_all_data_critical_error")
+            # Return minimal data structure
+            return {
+                'file_path': file_path,
+                'timestamp': datetime.now().isoformat(),
+                'title': 'Extraction Failed',
+                'satellite_catalog': {},
+                'catalog_links': [],
+                'thumbnails': [],
+                'extraction_metadata': {'error': str(e)}
+            }
+    
+    def extract_links_from_container(self, container, catalog_links):
+        """Extract links from a catalog container with smart classification"""
+        # Look for links within the container
+        links = container.find_all('a', href=True)
+        
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            
+            # Skip navigation and utility links
+            if self.is_navigation_link(href, text):
+                continue
+            
+            # Check if this is a dataset link
+            if self.is_dataset_link(href, text):
+                # Find associated thumbnail
+                thumbnail = self.find_thumbnail_for_link(link, container)
+                
+                catalog_link = {
+                    'text': text,
+                    'href': href,
+                    'title': link.get('title', ''),
+                    'thumbnail': thumbnail,
+                    'is_catalog_item': True,
+                    'link_type': self.classify_link_type(href, text),
+                    'extraction_priority': self.calculate_link_priority(href, text)
+                }
+                catalog_links.append(catalog_link)
+    
+    def extract_links_generally(self, soup, catalog_links):
+        """Extract links using general patterns when no containers found"""
+        links = soup.find_all('a', href=True)
+        
+        for link in links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            
+            # Look for satellite/dataset links
+            if any(keyword in href.lower() for keyword in ['dataset', 'catalog', 'satellite', 'collection', 'product']):
+                # Find associated thumbnail
+                thumbnail = self.find_thumbnail_for_link(link, soup)
+                
+                catalog_link = {
+                    'text': text,
+                    'href': href,
+                    'title': link.get('title', ''),
+                    'thumbnail': thumbnail,
+                    'is_catalog_item': True,
+                    'link_type': self.classify_link_type(href, text),
+                    'extraction_priority': self.calculate_link_priority(href, text)
+                }
+                catalog_links.append(catalog_link)
+    
+    def is_navigation_link(self, href, text):
+        """Check if a link is navigation/utility rather than dataset content"""
+        return classify_link(href, text)['navigation']
+    
+    def is_social_media_link(self, href, text):
+        """Check if a link is social media or external junk"""
+        return classify_link(href, text)['social_media']
+    
+    def is_utility_link(self, href, text):
+        """Check if a link is utility/non-content"""
+        return classify_link(href, text)['utility']
+    
+    def is_dataset_link(self, href, text):
+        """Check if a link points to a dataset/satellite page"""
+        return classify_link(href, text)['dataset']
+    
+    def find_thumbnail_for_link(self, link, container):
+        """Find thumbnail image associated with a link"""
+        thumbnail = None
+        
+        # Look for thumbnail in the link itself
+        thumbnail = link.find('img')
+        if thumbnail:
+            return {
+                'src': thumbnail.get('src', ''),
+                'alt': thumbnail.get('alt', ''),
+                'title': thumbnail.get('title', ''),
+                'width': thumbnail.get('width', ''),
+                'height': thumbnail.get('height', '')
+            }
+        
+        # Look for thumbnail in parent container
+        parent = link.parent
+        if parent:
+            thumbnail = parent.find('img')
+            if thumbnail:
+                return {
+                    'src': thumbnail.get('src', ''),
+                    'alt': thumbnail.get('alt', ''),
+                    'title': thumbnail.get('title', ''),
+                    'width': thumbnail.get('width', ''),
+                    'height': thumbnail.get('height', '')
+                }
+        
+        # Look for thumbnail in sibling elements
+        siblings = link.find_next_siblings()
+        for sibling in siblings:
+            if sibling.name == 'img':
+                return {
+                    'src': sibling.get('src', ''),
+                    'alt': sibling.get('alt', ''),
+                    'title': sibling.get('title', ''),
+                    'width': sibling.get('width', ''),
+                    'height': sibling.get('height', '')
+                }
+        
+        return None
+    
+    def classify_link_type(self, href, text):
+        """Classify the type of catalog link"""
+        href_lower = href.lower()
+        text_lower = text.lower()
+        
+        # Satellite/Platform links
+        if any(word in href_lower for word in ['satellite', 'platform', 'sensor', 'instrument']):
+            return 'satellite_info'
+        
+        # Dataset/Collection links (prefer catalog pages, exclude tag/tag-like pages)
+        if ('/datasets/catalog/' in href_lower) or any(word in href_lower for word in ['dataset', 'collection', 'product']):
+            if '/datasets/tags/' in href_lower or '/tags/' in href_lower:
+                return 'tag_page'
+            return 'dataset_detail'
+        
+        # Imagery/Data links
+        if any(word in href_lower for word in ['imagery', 'data', 'coverage']):
+            return 'data_coverage'
+        
+        # Documentation links
+        if any(word in href_lower for word in ['docs', 'documentation', 'guide', 'tutorial']):
+            return 'documentation'
+        
+        # API/Technical links
+        if any(word in href_lower for word in ['api', 'code', 'example', 'snippet']):
+            return 'technical'
+        
+        return 'general'
+    
+    def calculate_link_priority(self, href, text):
+        """Calculate extraction priority for a link"""
+        priority = 0
+        
+        # High priority for dataset/collection links
+        if any(word in href.lower() for word in ['dataset', 'collection', 'product']):
+            priority += 10
+        
+        # High priority for satellite/sensor links
+        if any(word in href.lower() for word in ['satellite', 'sensor', 'instrument']):
+            priority += 8
+        
+        # Medium priority for imagery/data links
+        if any(word in href.lower() for word in ['imagery', 'data', 'coverage']):
+            priority += 6
+        
+        # Lower priority for documentation
+        if any(word in href.lower() for word in ['docs', 'documentation', 'guide']):
+            priority += 3
+        
+        # Bonus for Earth Engine specific URLs
+        if '/datasets/' in href or '/collections/' in href:
+            priority += 5
+        
+        return priority
+    
+    def classify_catalog_links(self, catalog_links):
+        """Classify and organize catalog links by type and priority - Enhanced junk filtering"""
+        if not catalog_links:
+            return
+        
+        # Filter out junk links before classification
+        print("      Filtering out junk links...")
+        junk_links = []
+        clean_links = []
+        
+        for link in catalog_links:
+            if classify_link(link.get('href', ''), link.get('text', ''))['junk']:
+                junk_links.append(link)
+            else:
+                clean_links.append(link)
+        
+        # Report junk filtering results
+        print(f"      Filtered out {len(junk_links)} junk links")
+        print(f"     ✨ Kept {len(clean_links)} clean catalog links")
+        
+        if junk_links:
+            print("      Junk link examples:")
+            for junk in junk_links[:5]:  # Show first 5 junk examples
+                print(f"        • {junk['text'][:50]}... ({junk['href'][:50]}...)")
+        
+        # Sort clean links by priority
+        clean_links.sort(key=lambda x: x.get('extraction_priority', 0), reverse=True)
+        
+        # Group by type
+        link_types = {}
+        for link in clean_links:
+            link_type = link.get('link_type', 'general')
+            if link_type not in link_types:
+                link_types[link_type] = []
+            link_types[link_type].append(link)
+        
+        # Print classification summary
+        print("      Clean catalog link classification:")
+        for link_type, links in link_types.items():
+            print(f"       • {link_type.title()}: {len(links)} links")
+        
+        # Print high-priority links
+        high_priority = [link for link in clean_links if link.get('extraction_priority', 0) >= 8]
+        if high_priority:
+            print(f"      High-priority clean links ({len(high_priority)}):")
+            for link in high_priority[:5]:  # Show first 5
+                print(f"       • {link['text'][:50]}... (Priority: {link['extraction_priority']})")
+        
+        # Update the catalog_links list to only contain clean links
+        catalog_links.clear()
+        catalog_links.extend(clean_links)
+    
+    def is_junk_link(self, href, text):
+        """Comprehensive junk link detection - Less aggressive to capture all datasets"""
+        return classify_link(href, text)['junk']
+    
+    def is_advertisement_link(self, href, text):
+        """Check if a link is an advertisement"""
+        return classify_link(href, text)['advertisement']
+    
+    def is_tracking_link(self, href, text):
+        """Check if a link is a tracking/analytics link"""
+        return classify_link(href, text)['tracking']
+    
+    def is_broken_link(self, href, text):
+        """Check if a link appears to be broken"""
+        return classify_link(href, text)['broken']
+    
+    def save_local_image_reference(self, img_src, base_file_path):
+        """Save reference to local image (don't download external ones)"""
+        try:
+            # Only process local image references
+            if img_src.startswith('http'):
+                return None
+            
+            # Generate filename for reference
+            filename = f"local_img_{int(time.time() * 1000)}_{hash(img_src) % 10000}.txt"
+            filepath = os.path.join(self.thumbnails_dir, filename)
+            
+            # Save image reference info
+            img_info = {
+                'original_src': img_src,
+                'base_file': base_file_path,
+                'timestamp': datetime.now().isoformat(),
+                'note': 'Local image reference - not downloaded'
+            }
+            
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(img_info, f, indent=2, ensure_ascii=False)
+            
+            return filepath
+            
+        except Exception as e:
+            print(f"Failed to save local image reference {img_src}: {e}")
+            return None
+    
+    @METRICS.timed('save', kind='page')
+    def save_data_to_json(self, data, file_path):
+        """Save extracted data to individual JSON file"""
+        try:
+            # Create safe filename from file path
+            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', os.path.basename(file_path))
+            safe_filename = safe_filename[:200]  # Limit length
+            
+            # Add timestamp to ensure uniqueness
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"{timestamp}_{safe_filename}.json"
+            filepath = os.path.join(self.output_dir, filename)
+            
+            _logger.info(f"save_json:start path={filepath}")
+            _log_json('save_json_start', file=file_path, out=filepath)
+            
+            # Save to JSON
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=json_default)
+            
+            _logger.info(f"save_json:done path={filepath}")
+            _log_json('save_json_done', out=filepath, size_bytes=os.path.getsize(filepath))
+            
+            # Mirror the records into the optional SQLite index
+            if self.get_dataset_index() is not None:
+                try:
+                    catalog = data.get('satellite_catalog') or {}
+                    records = catalog.get('datasets') or ([catalog] if catalog.get('layer_name') else [])
+                    indexed = self.index_datasets(records, data.get('file_path') or file_path)
+                    _log_json('index_updated', out=filepath, records=indexed)
+                except Exception as e:
+                    print(f"Failed to index data for {file_path}: {e}")
+            return filepath
+            
+        except Exception as e:
+            print(f"Failed to save data for {file_path}: {e}")
+            try:
+                _logger.exception("save_json_error")
+                _log_json('save_json_error', file=file_path, error=str(e))
+            except Exception:
+                pass
+            return None
+
+    @METRICS.timed('save', kind='satellite')
+    def save_satellite_catalog_data(self, satellite_data, satellite_name):
+        """Save satellite catalog data organized by satellite"""
+        try:
+            # Add timestamp to the data
+            satellite_data['extraction_timestamp'] = datetime.now().isoformat()
+            
+            # Append one record; the satellite-keyed view is rebuilt on read
+            catalog_file = self.get_satellite_catalog_store().append(satellite_name, satellite_data)
+            
+            print(f" Saved satellite data for {satellite_name} to catalog")
+            return catalog_file
+            
+        except Exception as e:
+            print(f"Failed to save satellite catalog data for {satellite_name}: {e}")
+            return None
+
+    def load_satellite_catalog(self):
+        """Return the satellite catalog as {satellite_name: [records]}"""
+        return self.get_satellite_catalog_store().read()
+
+    def compact_satellite_catalog(self):
+        """Compact the satellite catalog segments and refresh satellite_catalog.json"""
+        catalog = self.get_satellite_catalog_store().compact()
+        print(f" Compacted satellite catalog: {len(catalog)} satellites, "
+              f"{sum(len(records) for records in catalog.values())} records")
+        return catalog
+
+    def categorize_content(self, soup, data):
+        """Categorize content into meaningful groups"""
+        print("    Categorizing content into groups...")
+        
+        categories = {
+            'navigation': [],
+            'main_content': [],
+            'sidebar': [],
+            'footer': [],
+            'header': [],
+            'metadata': [],
+            'interactive_elements': [],
+            'media_content': [],
+            'data_tables': [],
+            'forms_and_inputs': []
+        }
+        
+        # Categorize links by purpose
+        print("      Categorizing links...")
+        for link in data['links']:
+            link_text = link.get('text', '').lower()
+            href = link.get('href', '').lower()
+            
+            if any(word in link_text for word in ['home', 'main', 'index', 'start']):
+                categories['navigation'].append(link)
+            elif any(word in href for word in ['nav', 'menu', 'navigation']):
+                categories['navigation'].append(link)
+            elif any(word in link_text for word in ['contact', 'about', 'help', 'support']):
+                categories['footer'].append(link)
+            elif any(word in link_text for word in ['login', 'sign', 'register', 'submit']):
+                categories['interactive_elements'].append(link)
+            else:
+                categories['main_content'].append(link)
+        
+        print(f"        Navigation: {len(categories['navigation'])} links")
+        print(f"        Main content: {len(categories['main_content'])} links")
+        print(f"        Footer: {len(categories['footer'])} links")
+        print(f"        Interactive: {len(categories['interactive_elements'])} links")
+        
+        # Categorize images by type
+        print("      Categorizing images...")
+        for img in data['images']:
+            img_src = img.get('src', '').lower()
+            alt_text = img.get('alt', '').lower()
+            
+            if any(word in alt_text for word in ['logo', 'brand', 'header']):
+                categories['header'].append(img)
+            elif any(word in alt_text for word in ['icon', 'button', 'arrow']):
+                categories['navigation'].append(img)
+            elif any(word in img_src for word in ['chart', 'graph', 'diagram']):
+                categories['data_tables'].append(img)
+            else:
+                categories['media_content'].append(img)
+        
+        print(f"        Header images: {len(categories['header'])}")
+        print(f"        Navigation images: {len(categories['navigation'])}")
+        print(f"        Data images: {len(categories['data_tables'])}")
+        print(f"        Media images: {len(categories['media_content'])}")
+        
+        # Categorize forms
+        categories['forms_and_inputs'] = data['forms']
+        print(f"      Forms: {len(categories['forms_and_inputs'])}")
+        
+        # Categorize tables
+        categories['data_tables'] = data['tables']
+        print(f"      Tables: {len(categories['data_tables'])}")
+        
+        # Categorize headings by hierarchy
+        print("      Categorizing headings...")
+        for heading in data['headings']:
+            if heading.get('level') in ['h1', 'h2']:
+                categories['header'].append(heading)
+            elif heading.get('level') in ['h3', 'h4']:
+                categories['main_content'].append(heading)
+            else:
+                categories['sidebar'].append(heading)
+        
+        print(f"        Header headings: {len([h for h in categories['header'] if isinstance(h, dict) and h.get('level') in ['h1', 'h2']])}")
+        print(f"        Main headings: {len([h for h in categories['main_content'] if isinstance(h, dict) and h.get('level') in ['h3', 'h4']])}")
+        print(f"        Sidebar headings: {len([h for h in categories['sidebar'] if isinstance(h, dict) and h.get('level') not in ['h1', 'h2', 'h3', 'h4']])}")
+        
+        print("    Content categorization completed")
+        return categories
+    
+    def analyze_semantics(self, soup, data):
+        """Analyze semantic meaning of content"""
+        semantics = {
+            'topics': [],
+            'keywords': [],
+            'entities': [],
+            'sentiment': 'neutral',
+            'language': 'en',
+            'content_type': 'unknown',
+            'subject_matter': 'general'
+        }
+        
+        # Extract keywords from text
+        text = data['raw_text'].lower()
+        words = re.findall(r'\b\w+\b', text)
+        word_freq = {}
+        
+        for word in words:
+            if len(word) > 3:  # Skip short words
+                word_freq[word] = word_freq.get(word, 0) + 1
+        
+        # Get top keywords
+        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        semantics['keywords'] = [word for word, freq in sorted_words[:20]]
+        
+        # Detect content type
+        if any(word in text for word in ['dataset', 'catalog', 'earth engine', 'satellite']):
+            semantics['content_type'] = 'earth_engine_data'
+            semantics['subject_matter'] = 'geospatial_data'
+        elif any(word in text for word in ['tutorial', 'guide', 'help', 'documentation']):
+            semantics['content_type'] = 'documentation'
+            semantics['subject_matter'] = 'educational'
+        elif any(word in text for word in ['api', 'reference', 'endpoint', 'parameter']):
+            semantics['content_type'] = 'api_reference'
+            semantics['subject_matter'] = 'technical'
+        
+        # Detect language (simple detection)
+        if any(word in text for word in ['the', 'and', 'for', 'with']):
+            semantics['language'] = 'en'
+        
+        return semantics
+    
+    # Old analyze_structure method removed - no longer needed for satellite catalog extraction
+    
+    def generate_content_summary(self, data):
+        """Generate comprehensive content summary"""
+        summary = {
+            'total_elements': 0,
+            'content_distribution': {},
+            'richness_score': 0,
+            'interactivity_level': 'low',
+            'media_richness': 'low',
+            'data_density': 'low',
+            'overall_complexity': 'simple'
+        }
+        
+        # Calculate total elements
+        summary['total_elements'] = (
+            len(data['links']) + 
+            len(data['images']) + 
+            len(data['forms']) + 
+            len(data['tables']) + 
+            len(data['lists']) + 
+            len(data['headings']) + 
+            len(data['paragraphs'])
+        )
+        
+        # Content distribution
+        summary['content_distribution'] = {
+            'text_content': len(data['paragraphs']) + len(data['headings']),
+            'interactive_elements': len(data['forms']) + len(data['links']),
+            'media_elements': len(data['images']),
+            'data_structures': len(data['tables']) + len(data['lists'])
+        }
+        
+        # Calculate richness scores
+        if summary['total_elements'] > 100:
+            summary['overall_complexity'] = 'very_complex'
+        elif summary['total_elements'] > 50:
+            summary['overall_complexity'] = 'complex'
+        elif summary['total_elements'] > 20:
+            summary['overall_complexity'] = 'moderate'
+        else:
+            summary['overall_complexity'] = 'simple'
+        
+        # Media richness
+        if len(data['images']) > 20:
+            summary['media_richness'] = 'very_high'
+        elif len(data['images']) > 10:
+            summary['media_richness'] = 'high'
+        elif len(data['images']) > 5:
+            summary['media_richness'] = 'moderate'
+        else:
+            summary['media_richness'] = 'low'
+        
+        # Interactivity level
+        if len(data['forms']) > 5 or len(data['links']) > 50:
+            summary['interactivity_level'] = 'very_high'
+        elif len(data['forms']) > 2 or len(data['links']) > 25:
+            summary['interactivity_level'] = 'high'
+        elif len(data['forms']) > 0 or len(data['links']) > 10:
+            summary['interactivity_level'] = 'moderate'
+        else:
+            summary['interactivity_level'] = 'low'
+        
+        # Data density
+        if len(data['tables']) > 5 or len(data['lists']) > 20:
+            summary['data_density'] = 'very_high'
+        elif len(data['tables']) > 2 or len(data['lists']) > 10:
+            summary['data_density'] = 'high'
+        elif len(data['tables']) > 0 or len(data['lists']) > 5:
+            summary['data_density'] = 'moderate'
+        else:
+            summary['data_density'] = 'low'
+        
+        return summary
+
+    def extract_satellite_data(self, soup, data):
+        """Extract satellite catalog data with smart classification based on Earth Engine catalog structure"""
+        print("    Starting smart satellite catalog data extraction...")
+        
+        satellite_data = {
+            'layer_name': '',
+            'date_range': {'start': '', 'end': ''},
+            'satellites_used': [],
+            'location': '',
+            'gee_code_snippet': '',
+            'thumbnails': [],
+            'band_information': [],
+            'category_tags': [],
+            'dataset_provider': '',
+            'pixel_size': '',
+            'citations': [],
+            'description': '',
+            'terms_of_use': '',
+            'doi': '',
+            'extraction_confidence': 'low',
+            'detected_page_type': 'unknown'
+        }
+        
+        # Smart page type detection
+        page_type = self.detect_page_type(soup)
+        satellite_data['detected_page_type'] = page_type
+        print(f"      Detected page type: {page_type}")
+        
+        # Extract based on page type
+        if page_type == 'catalog_main':
+            self.extract_from_catalog_main(soup, satellite_data)
+        elif page_type == 'dataset_detail':
+            self.extract_from_dataset_detail(soup, satellite_data)
+        elif page_type == 'satellite_info':
+            self.extract_from_satellite_info(soup, satellite_data)
+        else:
+            self.extract_generic_data(soup, satellite_data)
+        
+        # Calculate extraction confidence
+        satellite_data['extraction_confidence'] = self.calculate_extraction_confidence(satellite_data)
+        
+        return satellite_data
+    
+    def detect_page_type(self, soup):
+        """Detect the type of Earth Engine page based on content and structure"""
+        text_content = soup.get_text().lower()
+
+        # Prefer canonical URL hints first
+        canonical = soup.find('link', rel='canonical')
+        if canonical:
+            href = canonical.get('href', '')
+            if '/earth-engine/datasets/catalog/' in href:
+                return 'dataset_detail'
+            if '/earth-engine/datasets' in href and href.rstrip('/').endswith('datasets'):
+                return 'catalog_main'
+
+        # Dataset detail: look for strong EE detail markers
+        dataset_detail_markers = [
+            'earth engine snippet',
+            'dataset availability',
+            'dataset provider',
+            'citations',
+            'doi',
+            'tags',
+            'bands',
+            'pixel size',
+            'resolution',
+            'explore with earth engine',
+            'open in code editor'
+        ]
+        if any(marker in text_content for marker in dataset_detail_markers):
+            return 'dataset_detail'
+
+        # Dataset detail: presence of ee.* code blocks
+        code_blocks = soup.find_all(['pre', 'code'])
+        for cb in code_blocks:
+            if 'ee.' in cb.get_text():
+                return 'dataset_detail'
+
+        # Main catalog indicators (checked after dataset detail to avoid false positives)
+        if any(phrase in text_content for phrase in [
+            'earth engine data catalog',
+            'dataset catalog',
+            'satellite catalog',
+            'collection catalog'
+        ]):
+            return 'catalog_main'
+
+        # Satellite information page
+        if any(phrase in text_content for phrase in [
+            'satellite information',
+            'sensor details',
+            'instrument details',
+            'platform information'
+        ]):
+            return 'satellite_info'
+
+        return 'unknown'
+    
+    def extract_from_catalog_main(self, soup, satellite_data):
+        """Extract data from main catalog page with thumbnail grid - Enhanced for Earth Engine"""
+        print("      Extracting from main catalog page with Earth Engine intelligence...")
+
+        # First try Earth Engine specific extraction
+        ee_datasets = self.extract_earth_engine_catalog(soup)
+        if ee_datasets:
+            print(f"      Found {len(ee_datasets)} Earth Engine datasets using intelligent extraction")
+
+            # Classify the datasets intelligently
+            classifications = self.classify_earth_engine_datasets(ee_datasets)
+
+            satellite_data['datasets'] = ee_datasets
+            satellite_data['classifications'] = classifications
+            satellite_data['extraction_method'] = 'earth_engine_intelligent'
+            satellite_data['extraction_confidence'] = 'high'
+
+            # Log classification summary
+            for category, items in classifications.items():
+                if items:
+                    print(f"        {category.title()}: {len(items)} datasets")
+
+            return
+
+        # Fallback to generic extraction if Earth Engine patterns not found
+        print("      Earth Engine patterns not detected, using generic extraction...")
+        catalog_items = soup.find_all(['div', 'article', 'section'], class_=re.compile(r'catalog|item|dataset|collection'))
+        
+        for item in catalog_items:
+            # Extract thumbnail and link
+            thumbnail = item.find('img')
+            if thumbnail:
+                thumbnail_data = {
+                    'src': thumbnail.get('src', ''),
+                    'alt': thumbnail.get('alt', ''),
+                    'title': thumbnail.get('title', ''),
+                    'width': thumbnail.get('width', ''),
+                    'height': thumbnail.get('height', '')
+                }
+                satellite_data['thumbnails'].append(thumbnail_data)
+            
+            # Extract dataset name from heading or link
+            heading = item.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+            if heading:
+                satellite_data['layer_name'] = heading.get_text().strip()
+                break
+            
+            # Extract from link text
+            link = item.find('a')
+            if link and not satellite_data['layer_name']:
+                satellite_data['layer_name'] = link.get_text().strip()
+        
+        # Extract provider from page metadata
+        provider_meta = soup.find('meta', attrs={'name': re.compile(r'provider|organization|institution', re.I)})
+        if provider_meta:
+            satellite_data['dataset_provider'] = provider_meta.get('content', '')
+        
+        # Extract description from meta description
+        desc_meta = soup.find('meta', attrs={'name': 'description'})
+        if desc_meta:
+            satellite_data['description'] = desc_meta.get('content', '')
+    
+    def extract_from_dataset_detail(self, soup, satellite_data):
+        """Extract data from detailed dataset page - Enhanced for Earth Engine structure"""
+        print("      Extracting from dataset detail page...")
+        
+        # Extract dataset name from main heading
+        main_heading = soup.find(['h1', 'h2'], class_=re.compile(r'main|title|dataset'))
+        if main_heading:
+            satellite_data['layer_name'] = main_heading.get_text().strip()
+        
+        # Look for Earth Engine specific data structure
+        self.extract_earth_engine_metadata(soup, satellite_data)
+        
+        # Look for structured data sections
+        sections = soup.find_all(['section', 'div'], class_=re.compile(r'section|info|details'))
+        
+        for section in sections:
+            section_text = section.get_text().lower()
+            section_title = section.find(['h2', 'h3', 'h4'])
+            title_text = section_title.get_text().lower() if section_title else ''
+            
+            # Temporal coverage section
+            if any(word in title_text for word in ['temporal', 'time', 'date', 'coverage', 'availability']):
+                self.extract_temporal_data(section, satellite_data)
+            
+            # Spatial coverage section
+            elif any(word in title_text for word in ['spatial', 'coverage', 'extent', 'boundary']):
+                self.extract_spatial_data(section, satellite_data)
+            
+            # Technical specifications section
+            elif any(word in title_text for word in ['technical', 'specifications', 'bands', 'resolution']):
+                self.extract_technical_data(section, satellite_data)
+            
+            # Provider information section
+            elif any(word in title_text for word in ['provider', 'source', 'organization']):
+                self.extract_provider_data(section, satellite_data)
+        
+        # Extract GEE code examples
+        code_blocks = soup.find_all(['code', 'pre'], class_=re.compile(r'example|code|snippet'))
+        for code in code_blocks:
+            code_text = code.get_text()
+            if any(word in code_text.lower() for word in ['ee.', 'earth engine', 'dataset', 'collection']):
+                satellite_data['gee_code_snippet'] = code_text.strip()
+                break
+        
+        # Extract DOI and citations
+        self.extract_citation_data(soup, satellite_data)
+    
+    def extract_earth_engine_metadata(self, soup, satellite_data):
+        """Extract Earth Engine specific metadata structure - Enhanced based on actual HTML structure"""
+        print("      Extracting Earth Engine metadata...")
+        
+        try:
+            # Method 1: Look for specific text patterns in the entire page
+            page_text = soup.get_text()
+            
+            # Extract dataset availability (date range) - Look for ISO date format
+            matches = PATTERNS.findall('ee_page.date_range', page_text)
+            if matches:
+                satellite_data['date_range']['start'] = matches[0][0]
+                satellite_data['date_range']['end'] = matches[0][1]
+                print(f"        Found date range: {matches[0][0]} to {matches[0][1]}")
+            
+            # Extract dataset provider - Look for common providers
+            for matches in PATTERNS.iter_findall('ee_page.provider', page_text):
+                provider = matches[0].strip()
+                if len(provider) > 2 and provider.lower() not in ['unknown', 'n/a', 'none']:
+                    satellite_data['dataset_provider'] = provider
+                    print(f"       🏢 Found provider: {provider}")
+                    break
+            
+            # Method 2: Look for specific HTML structures
+            # Look for dataset availability label
+            availability_elements = soup.find_all(string=PATTERNS.pattern('ee_page.availability_label'))
+            for element in availability_elements:
+                parent = element.parent
+                if parent:
+                    # Look for the next sibling or parent that contains the date
+                    date_container = parent.find_next_sibling() or parent.parent
+                    if date_container:
+                        date_text = date_container.get_text()
+                        for matches in PATTERNS.iter_findall('ee_page.date_range', date_text):
+                            if not satellite_data['date_range']['start']:
+                                satellite_data['date_range']['start'] = matches[0][0]
+                                satellite_data['date_range']['end'] = matches[0][1]
+                                print(f"        Found date range from structure: {matches[0][0]} to {matches[0][1]}")
+                                break
+            
+            # Look for dataset provider label
+            provider_elements = soup.find_all(string=PATTERNS.pattern('ee_page.provider_label'))
+            for element in provider_elements:
+                parent = element.parent
+                if parent:
+                    # Look for provider name in nearby elements
+                    provider_container = parent.find_next_sibling() or parent.parent
+                    if provider_container:
+                        provider_text = provider_container.get_text()
+                        provider_match = PATTERNS.search('ee_page.provider_name', provider_text)
+                        if provider_match:
+                            provider = provider_match.group(1).strip()
+                            if len(provider) > 2 and provider.lower() not in ['unknown', 'n/a', 'none']:
+                                satellite_data['dataset_provider'] = provider
+                                print(f"       🏢 Found provider from structure: {provider}")
+                                break
+            
+            # Look for Earth Engine snippet
+            snippet_elements = soup.find_all(string=PATTERNS.pattern('ee_page.snippet_label'))
+            for element in snippet_elements:
+                parent = element.parent
+                if parent:
+                    # Look for code in the same container
+                    code_element = parent.find(['code', 'pre'])
+                    if code_element:
+                        snippet = code_element.get_text().strip()
+                        if 'ee.' in snippet or 'ImageCollection' in snippet:
+                            satellite_data['gee_code_snippet'] = snippet
+                            print(f"       💻 Found GEE snippet: {snippet[:50]}...")
+                            break
+            
+            # Method 3: Look for common Earth Engine patterns
+            # Look for any code blocks that contain Earth Engine code
+            code_blocks = soup.find_all(['code', 'pre'])
+            for code in code_blocks:
+                code_text = code.get_text()
+                if ('ee.' in code_text or 'ImageCollection' in code_text) and not satellite_data.get('gee_code_snippet'):
+                    satellite_data['gee_code_snippet'] = code_text.strip()
+                    print(f"       💻 Found GEE code block: {code_text[:50]}...")
+                    break
+            
+            # Look for tags/categories
+            tag_elements = soup.find_all(string=PATTERNS.pattern('ee_page.tags_label'))
+            for element in tag_elements:
+                parent = element.parent
+                if parent:
+                    # Look for tag elements in the same container
+                    tag_links = parent.find_all('a')
+                    if tag_links:
+                        tags = [tag.get_text().strip() for tag in tag_links if tag.get_text().strip()]
+                        if tags:
+                            satellite_data['category_tags'].extend(tags)
+                            print(f"        Found tags: {', '.join(tags)}")
+                            break
+            
+            # Look for pixel size/resolution
+            matches = PATTERNS.findall('ee_page.resolution', page_text)
+            if matches:
+                satellite_data['pixel_size'] = matches[0].strip()
+                print(f"        Found pixel size: {matches[0].strip()}")
+                    
+        except Exception as e:
+            print(f"        Error in Earth Engine metadata extraction: {e}")
+            # Continue with basic extraction
+
+    @_profiled
+    def extract_earth_engine_catalog(self, soup):
+        """Intelligent extraction specifically designed for Earth Engine catalog structure"""
+        print("     Using Earth Engine intelligent extraction...")
+        datasets = []
+
+        # Target the specific Earth Engine dataset containers
+        ee_containers = soup.select('li.ee-sample-image.ee-cards.devsite-landing-row-item-description')
+
+        if not ee_containers:
+            # Try alternative selector patterns
+            ee_containers = soup.select('.ee-sample-image.ee-cards')
+            if not ee_containers:
+                ee_containers = soup.select('li.ee-sample-image')
+
+        if not ee_containers:
+            print("     No Earth Engine dataset containers found")
+            return None
+
+        print(f"     Found {len(ee_containers)} Earth Engine dataset containers")
+
+        for container in ee_containers:
+            dataset = self.extract_single_ee_dataset(container)
+            if dataset:
+                datasets.append(dataset)
+
+        return datasets if datasets else None
+
+    @_profiled
+    def extract_earth_engine_catalog_streaming(self, source):
+        """Single-pass Earth Engine catalog extraction straight from HTML text or an open file"""
+        print("     Using Earth Engine streaming extraction...")
+        datasets = list(self.iter_earth_engine_catalog(source))
+
+        if not datasets:
+            print("     No Earth Engine dataset containers found")
+            return None
+
+        print(f"     Extracted {len(datasets)} Earth Engine datasets in a single pass")
+        return datasets
+
+    @_profiled
+    def extract_earth_engine_catalog_parallel(self, source, workers=None):
+        """Extract catalog cards across a process pool, merging results in page order
+
+        ``source`` is the page HTML, an open or mapped file or a parsed soup. The page is
+        tokenized once here, exactly as the streaming path does, and workers receive the
+        card fields (or the raw HTML of soup cards) only; ``workers`` defaults to
+        ``config['processing']['extraction_workers']``.
+        """
+        if workers is None:
+            workers = self.config['processing'].get('extraction_workers', 1)
+        workers = self._card_workers(workers)
+
+        if isinstance(source, BeautifulSoup):
+            containers = source.select('li.ee-sample-image.ee-cards.devsite-landing-row-item-description')
+            if not containers:
+                containers = source.select('.ee-sample-image.ee-cards') or source.select('li.ee-sample-image')
+            cards = [str(container) for container in containers]
+        else:
+            parser = EECatalogCardParser()
+            backend = self.config.get('parser', {}).get('backend', 'auto')
+            cards = []
+            with METRICS.stage('parse', kind='stream'):
+                for _ in tokenize_html(parser, source, backend):
+                    cards.extend(parser.drain())
+                cards.extend(parser.drain())
+
+        if not cards:
+            print("     No Earth Engine dataset containers found")
+            return None
+
+        print(f"     Found {len(cards)} Earth Engine dataset containers, extracting with {workers} worker(s)")
+
+        datasets = [dataset for dataset in self.extract_ee_cards(cards, workers) if dataset]
+        return datasets if datasets else None
+
+    def _card_workers(self, workers):
+        """Number of card worker processes to use: ``workers``, or 1 while a profile is running"""
+        workers = max(1, int(workers))
+        if workers > 1 and _profile_lock.locked():
+            # cProfile only sees this process, where a pool would leave just the wait for results
+            print(f"     Profiling is on: extracting cards in this process instead of {workers} workers")
+            return 1
+        return workers
+
+    def extract_ee_cards(self, cards, workers=1):
+        """Extract cards (raw HTML or parsed card fields), returning one dataset (or None) per card in order"""
+        if not cards:
+            return []
+        workers = self._card_workers(workers)
+
+        # A few batches per worker keeps the pool busy without per-card IPC overhead
+        batch_size = max(1, -(-len(cards) // (workers * 4)))
+        batches = [cards[i:i + batch_size] for i in range(0, len(cards), batch_size)]
+
+        results = []
+        if workers == 1:
+            for batch in map(_extract_card_batch, batches):
+                results.extend(batch['datasets'])
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_card_worker) as executor:
+                for batch in executor.map(_extract_card_batch, batches):
+                    results.extend(batch['datasets'])
+                    # Workers count pattern use and metrics in their own copies of the registries
+                    PATTERNS.merge_counters(batch['patterns'])
+                    METRICS.merge_series(batch['metrics'])
+        return results
+
+    def fingerprint_ee_card(self, card_html):
+        """Hash of a card's whitespace-normalized HTML"""
+        normalized = PATTERNS.pattern('ee_catalog.whitespace').sub(' ', card_html).strip()
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def ee_dataset_key(self, dataset):
+        """Stable identity of a catalog dataset across runs"""
+        return dataset.get('dataset_id') or dataset.get('url') or dataset.get('title')
+
+    @_profiled
+    def refresh_earth_engine_catalog(self, source, manifest_path=None, workers=1):
+        """Incrementally refresh the catalog, re-extracting only cards whose fingerprint changed
+
+        Returns ``(datasets, report)``. The manifest of the previous run maps card
+        fingerprints to their extracted datasets; the report lists added, removed
+        and changed dataset keys. The new manifest is only written by
+        commit_manifest(), which callers run once the catalog itself is saved.
+        """
+        manifest_path = manifest_path or os.path.join(self.output_dir, 'earth_engine_catalog_manifest.json')
+        previous_cards = {}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    previous_cards = json.load(f).get('cards', {})
+            except Exception as e:
+                print(f"     Could not read catalog manifest, doing a full refresh: {e}")
+
+        card_htmls = split_ee_catalog_cards(source)
+        fingerprints = [self.fingerprint_ee_card(card_html) for card_html in card_htmls]
+
+        pending = [i for i, fingerprint in enumerate(fingerprints) if fingerprint not in previous_cards]
+        print(f"     {len(card_htmls)} cards, {len(card_htmls) - len(pending)} unchanged, re-extracting {len(pending)}")
+        extracted = dict(zip(pending, self.extract_ee_cards([card_htmls[i] for i in pending], workers)))
+
+        cards = {}
+        datasets = []
+        for i, fingerprint in enumerate(fingerprints):
+            if i in extracted:
+                dataset = extracted[i]
+            else:
+                previous = previous_cards[fingerprint]['dataset']
+                dataset = DatasetRecord.from_dict(previous) if previous else None
+            cards[fingerprint] = {'key': self.ee_dataset_key(dataset) if dataset else None, 'dataset': dataset}
+            if dataset:
+                datasets.append(dataset)
+
+        previous_keys = {entry['key']: fingerprint for fingerprint, entry in previous_cards.items() if entry['key']}
+        current_keys = {entry['key']: fingerprint for fingerprint, entry in cards.items() if entry['key']}
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'total_cards': len(card_htmls),
+            'reused': len(card_htmls) - len(pending),
+            'extracted': len(pending),
+            'added': sorted(key for key in current_keys if key not in previous_keys),
+            'removed': sorted(key for key in previous_keys if key not in current_keys),
+            'changed': sorted(key for key in current_keys
+                              if key in previous_keys and current_keys[key] != previous_keys[key])
+        }
+
+        self._pending_manifest = (manifest_path, {'generated': report['timestamp'], 'cards': cards})
+        return datasets, report
+
+    def commit_manifest(self):
+        """Write the manifest of the last refresh_earth_engine_catalog() run
+
+        Until then the previous manifest stays in place, so a save that fails or
+        never happens makes the next refresh report the same changes again.
+        Returns the manifest path, or None when there is nothing to commit.
+        """
+        if self._pending_manifest is None:
+            return None
+        manifest_path, manifest = self._pending_manifest
+        os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, default=json_default)
+        os.replace(tmp_path, manifest_path)
+        self._pending_manifest = None
+        return manifest_path
+
+    def iter_earth_engine_catalog(self, source, chunk_size=65536):
+        """Yield Earth Engine datasets card by card while the page is tokenized
+
+        ``source`` is the HTML text, a file object opened in text mode or a
+        MappedHTMLFile. No DOM is built, so the cost grows linearly with the page size.
+        """
+        parser = EECatalogCardParser()
+        backend = self.config.get('parser', {}).get('backend', 'auto')
+
+        steps = tokenize_html(parser, source, backend, chunk_size)
+        done = False
+        try:
+            while not done:
+                # Only the tokenizer's own work is timed, not the caller's between datasets
+                with METRICS.stage('parse', kind='stream'):
+                    done = next(steps, StopIteration) is StopIteration
+                for card in parser.drain():
+                    dataset = self.build_ee_dataset(card)
+                    if dataset:
+                        yield dataset
+        finally:
+            steps.close()
+
+    def extract_single_ee_dataset(self, container):
+        """Extract data from a single Earth Engine dataset container with enhanced data points"""
+        try:
+            title_element = container.select_one('h3[data-text]')
+            link = container.select_one('a[href]')
+            desc_element = container.select_one('.ee-dataset-description-snippet')
+            img_element = container.select_one('figure img')
+
+            card = {
+                'title': title_element.get('data-text', '') if title_element else None,
+                'href': link.get('href', '') if link else None,
+                'description': desc_element.get_text() if desc_element else None,
+                'tags': [tag_elem.get_text() for tag_elem in container.select('.ee-chip.ee-tag')],
+                'thumbnail': img_element.get('src', '') if img_element else None,
+                'text': container.get_text(),
+                'markup': str(container)
+            }
+        except Exception as e:
+            print(f"     Error extracting single EE dataset: {e}")
+            return None
+
+        return self.build_ee_dataset(card)
+
+    @METRICS.timed('extract', kind='card')
+    def build_ee_dataset(self, card):
+        """Build a DatasetRecord from the raw fields of one catalog card
+
+        ``card`` holds the title (``h3[data-text]``), first link href, description
+        snippet, tag chip texts, ``figure img`` src, the card text and the card
+        markup used for comment metadata. Missing elements are ``None``.
+        """
+        dataset = DatasetRecord(extraction_timestamp=datetime.now().isoformat())
+
+        try:
+            # Extract title from h3[data-text] attribute (most reliable)
+            if card['title'] is not None:
+                dataset['title'] = card['title'].strip()
+                dataset['confidence_score'] += 25
+
+                # Extract dataset ID from URL if available
+                if card['href'] is not None:
+                    href = card['href']
+                    dataset['url'] = href
+                    dataset['confidence_score'] += 20
+
+                    # Extract dataset ID from URL pattern
+                    if '/catalog/' in href:
+                        dataset_id = href.split('/catalog/')[-1].split('?')[0].split('#')[0]
+                        dataset['dataset_id'] = dataset_id
+                        dataset['confidence_score'] += 20
+
+            # Extract description from specific class
+            if card['description'] is not None:
+                dataset['description'] = card['description'].strip()
+                dataset['confidence_score'] += 15
+
+            # Extract tags from ee-chip ee-tag elements
+            tags = [tag_text.strip() for tag_text in card['tags'] if tag_text.strip()]
+            if tags:
+                dataset['tags'] = tags
+                dataset['confidence_score'] += 10
+
+            # Extract thumbnail image and download it locally
+            if card['thumbnail'] is not None:
+                thumbnail_url = card['thumbnail']
+                dataset['thumbnail'] = thumbnail_url
+
+                # Download thumbnail locally for real-time viewing
+                local_path = self.download_thumbnail(thumbnail_url, dataset.get('dataset_id', 'unknown'))
+                if local_path:
+                    dataset['thumbnail_local_path'] = local_path
+                    dataset['confidence_score'] += 10
+
+            # Extract enhanced metadata
+            self.extract_ee_enhanced_metadata_from_text(card['text'], dataset)
+            self.extract_ee_metadata_from_markup(card['markup'], dataset)
+
+            # Calculate data completeness score
+            dataset['data_completeness'] = self.calculate_data_completeness(dataset)
+
+            # Only return dataset if we have minimum viable data
+            if dataset['title'] and dataset['confidence_score'] >= 30:
+                METRICS.inc('catalog_cards_total', result='dataset')
+                return dataset
+
+        except Exception as e:
+            print(f"     Error extracting single EE dataset: {e}")
+
+        METRICS.inc('catalog_cards_total', result='rejected')
+        return None
+
+    def extract_ee_metadata_from_comments(self, container, dataset):
+        """Extract metadata from HTML comments in Earth Engine dataset"""
+        try:
+            self.extract_ee_metadata_from_markup(str(container), dataset)
+        except Exception as e:
+            print(f"     Error extracting metadata from comments: {e}")
+
+    def extract_ee_metadata_from_markup(self, html_str, dataset):
+        """Extract metadata from the HTML comments found in a card's markup"""
+        try:
+            # Extract provider from comments
+            provider_match = PATTERNS.search('ee_card.provider', html_str)
+            if provider_match:
+                dataset['provider'] = provider_match.group(1).strip()
+                dataset['confidence_score'] += 15
+
+            # Extract keywords from comments
+            keywords_match = PATTERNS.search('ee_card.keywords', html_str)
+            if keywords_match:
+                keywords_text = keywords_match.group(1).strip()
+                dataset['keywords'] = [kw.strip() for kw in keywords_text.split() if kw.strip()]
+                dataset['confidence_score'] += 10
+
+            # Extract collection type
+            collection_match = PATTERNS.search('ee_card.collection_type', html_str)
+            if collection_match:
+                dataset['collection_type'] = collection_match.group(1).strip()
+                dataset['confidence_score'] += 10
+
+        except Exception as e:
+            print(f"     Error extracting metadata from comments: {e}")
+
+    def extract_ee_enhanced_metadata(self, container, dataset):
+        """Extract enhanced metadata from Earth Engine dataset container"""
+        try:
+            self.extract_ee_enhanced_metadata_from_text(container.get_text(), dataset)
+        except Exception as e:
+            print(f"     Error extracting enhanced metadata: {e}")
+
+    def extract_ee_enhanced_metadata_from_text(self, text_content, dataset):
+        """Extract enhanced metadata from the text content of a dataset card"""
+        try:
+            # Extract temporal information
+            self.extract_temporal_metadata(text_content, dataset)
+
+            # Extract spatial information
+            self.extract_spatial_metadata(text_content, dataset)
+
+            # Extract technical information
+            self.extract_technical_metadata(text_content, dataset)
+
+            # Extract access information
+            self.extract_access_metadata(text_content, dataset)
+
+        except Exception as e:
+            print(f"     Error extracting enhanced metadata: {e}")
+
+    def extract_temporal_metadata(self, text, dataset):
+        """Extract temporal coverage information"""
+        # Date range patterns
+        matches = PATTERNS.findall('temporal.date_range', text)
+        if matches:
+            if len(matches[0]) == 2:
+                dataset['temporal_coverage']['start_date'] = matches[0][0]
+                dataset['temporal_coverage']['end_date'] = matches[0][1]
+            else:
+                dataset['temporal_coverage']['start_date'] = matches[0]
+
+        # Update frequency patterns
+        matches = PATTERNS.findall('temporal.update_frequency', text)
+        if matches:
+            dataset['temporal_coverage']['update_frequency'] = matches[0]
+
+    def extract_spatial_metadata(self, text, dataset):
+        """Extract spatial resolution and coverage information"""
+        # Resolution patterns
+        matches = PATTERNS.findall('spatial.resolution', text)
+        if matches:
+            dataset['spatial_info']['resolution'] = f"{matches[0]}m"
+            dataset['spatial_info']['pixel_size'] = matches[0]
+
+        # Geographic extent patterns
+        matches = PATTERNS.findall('spatial.geographic_extent', text)
+        if matches:
+            dataset['spatial_info']['geographic_extent'] = matches[0] if isinstance(matches[0], str) else str(matches[0])
+
+    def extract_technical_metadata(self, text, dataset):
+        """Extract technical specifications"""
+        # Band information patterns
+        bands_found = []
+        for matches in PATTERNS.iter_findall('technical.bands', text):
+            bands_found.extend(matches)
+
+        if bands_found:
+            dataset['bands'] = list(set(bands_found))
+            dataset['spectral_info'] = ', '.join(bands_found)
+
+        # Processing level patterns
+        matches = PATTERNS.findall('technical.processing_level', text)
+        if matches:
+            dataset['processing_level'] = matches[0]
+
+        # File format patterns
+        matches = PATTERNS.findall('technical.file_format', text)
+        if matches:
+            dataset['file_format'] = matches[0]
+
+    def extract_access_metadata(self, text, dataset):
+        """Extract access and licensing information"""
+        # License patterns
+        matches = PATTERNS.findall('access.license', text)
+        if matches:
+            dataset['license'] = matches[0]
+
+        # DOI patterns
+        matches = PATTERNS.findall('access.doi', text)
+        if matches:
+            dataset['doi'] = matches[0]
+
+    @METRICS.timed('thumbnail', kind='download')
+    def download_thumbnail(self, thumbnail_url, dataset_id):
+        """Download thumbnail image locally for real-time viewing"""
+        try:
+            if not thumbnail_url or not thumbnail_url.startswith(('http', './')):
+                return None
+
+            # Handle relative URLs
+            if thumbnail_url.startswith('./'):
+                # This is a local file reference
+                base_path = os.path.dirname(os.path.dirname(__file__))
+                local_path = os.path.join(base_path, thumbnail_url.replace('./', ''))
+                if os.path.exists(local_path):
+                    # Store once by content, link under the dataset name
+                    filename = f"{dataset_id}_{os.path.basename(local_path)}"
+                    return self.get_thumbnail_store().add_file(local_path, filename)
+
+            # For HTTP URLs, download the image
+            if thumbnail_url.startswith('http'):
+                store = self.get_thumbnail_store()
+                known_object = store.lookup_url(thumbnail_url)
+                if known_object:
+                    ext = os.path.splitext(known_object)[1]
+                    return store.link(known_object, f"{dataset_id}_thumbnail{ext}")
+
+                response = self.session.get(thumbnail_url, timeout=10)
+                if response.status_code == 200:
+                    # Determine file extension
+                    content_type = response.headers.get('content-type', '')
+                    if 'image/png' in content_type:
+                        ext = '.png'
+                    elif 'image/jpeg' in content_type or 'image/jpg' in content_type:
+                        ext = '.jpg'
+                    elif 'image/webp' in content_type:
+                        ext = '.webp'
+                    else:
+                        ext = '.png'  # default
+
+                    filename = f"{dataset_id}_thumbnail{ext}"
+                    return store.add_url_content(thumbnail_url, response.content, ext, filename)
+
+        except Exception as e:
+            print(f"     Error downloading thumbnail: {e}")
+
+        return None
+
+    @METRICS.timed('thumbnail', kind='prescale')
+    def prescale_thumbnails(self, datasets, workers=None):
+        """Generate the gallery-size thumbnail variants for datasets with a local thumbnail"""
+        if workers is None:
+            workers = self.config['processing'].get('thumbnail_workers', 4)
+        paths = [d['thumbnail_local_path'] for d in datasets
+                 if d.get('thumbnail_local_path') and os.path.exists(d['thumbnail_local_path'])]
+        written = generate_thumbnail_variants(paths, workers)
+        print(f"     Pre-scaled thumbnails: {written} variant files written for {len(paths)} images")
+        return written
+
+    def calculate_data_completeness(self, dataset):
+        """Calculate completeness score for the dataset"""
+        total_fields = 25  # Total number of fields we check
+        filled_fields = 0
+
+        # Check core fields
+        if dataset.get('title'): filled_fields += 1
+        if dataset.get('description'): filled_fields += 1
+        if dataset.get('dataset_id'): filled_fields += 1
+        if dataset.get('url'): filled_fields += 1
+        if dataset.get('thumbnail'): filled_fields += 1
+
+        # Check metadata fields
+        if dataset.get('provider'): filled_fields += 1
+        if dataset.get('tags'): filled_fields += 1
+        if dataset.get('keywords'): filled_fields += 1
+        if dataset.get('collection_type'): filled_fields += 1
+
+        # Check temporal fields
+        temporal = dataset.get('temporal_coverage', {})
+        if temporal.get('start_date'): filled_fields += 1
+        if temporal.get('end_date'): filled_fields += 1
+        if temporal.get('update_frequency'): filled_fields += 1
+
+        # Check spatial fields
+        spatial = dataset.get('spatial_info', {})
+        if spatial.get('resolution'): filled_fields += 1
+        if spatial.get('pixel_size'): filled_fields += 1
+        if spatial.get('geographic_extent'): filled_fields += 1
+
+        # Check technical fields
+        if dataset.get('bands'): filled_fields += 1
+        if dataset.get('processing_level'): filled_fields += 1
+        if dataset.get('file_format'): filled_fields += 1
+
+        # Check access fields
+        if dataset.get('license'): filled_fields += 1
+        if dataset.get('doi'): filled_fields += 1
+        if dataset.get('citations'): filled_fields += 1
+        if dataset.get('terms_of_use'): filled_fields += 1
+
+        # Check quality fields
+        if dataset.get('confidence_score', 0) > 0: filled_fields += 1
+        if dataset.get('thumbnail_local_path'): filled_fields += 1
+        if dataset.get('data_volume'): filled_fields += 1
+
+        return round((filled_fields / total_fields) * 100, 1)
+
+    def classify_earth_engine_datasets(self, datasets):
+        """Intelligent classification of Earth Engine datasets"""
+        print(f"      Classifying {len(datasets)} datasets using intelligent algorithms...")
+
+        classifications = {
+            'climate': [],
+            'landsat': [],
+            'modis': [],
+            'sentinel': [],
+            'atmospheric': [],
+            'ocean': [],
+            'terrain': [],
+            'weather': [],
+            'vegetation': [],
+            'urban': [],
+            'other': []
+        }
+
+        for dataset, category in zip(datasets, self.classify_datasets(datasets)):
+            classifications[category].append(dataset)
+
+        return classifications
+
+    def classify_single_dataset(self, dataset):
+        """Classify a single dataset based on its metadata (cached on the record)"""
+        return self.classify_datasets([dataset])[0]
+
+    def classify_datasets(self, datasets):
+        """Categorize datasets in one pass and cache the result on each record
+
+        Each record gains ``category`` and ``category_terms`` (the terms of its
+        category found in the title, description, tags and keywords). Records
+        that already carry both are not classified again. Returns the categories
+        in order.
+        """
+        categories = []
+        for dataset in datasets:
+            if 'category_terms' not in dataset or dataset.get('category') not in _DATASET_CATEGORY_NAMES:
+                title = (dataset.get('title') or '').lower()
+                description = (dataset.get('description') or '').lower()
+                tags = ' '.join(dataset.get('tags') or []).lower()
+                keywords = ' '.join(dataset.get('keywords') or []).lower()
+                dataset['category'], dataset['category_terms'] = classify_dataset_text(
+                    f"{title} {description} {tags} {keywords}")
+            categories.append(dataset['category'])
+        return categories
+
+    def build_earth_engine_catalog_data(self, datasets, source_file, classifications=None):
+        """Document written to earth_engine_catalog.json: datasets, classifications and statistics"""
+        if classifications is None:
+            classifications = self.classify_earth_engine_datasets(datasets)
+        METRICS.set_gauge('catalog_datasets', len(datasets))
+        return {
+            'extraction_info': {
+                'timestamp': datetime.now().isoformat(),
+                'source_file': source_file,
+                'extractor_version': 'enhanced_v3.0',
+                'total_datasets': len(datasets)
+            },
+            'datasets': datasets,
+            'classifications': classifications,
+            'statistics': {
+                'by_category': {k: len(v) for k, v in classifications.items() if v},
+                'quality_distribution': {
+                    'high_quality': len([d for d in datasets if d.get('confidence_score', 0) >= 70]),
+                    'medium_quality': len([d for d in datasets if 50 <= d.get('confidence_score', 0) < 70]),
+                    'low_quality': len([d for d in datasets if d.get('confidence_score', 0) < 50])
+                },
+                'completeness': {
+                    'with_titles': len([d for d in datasets if d.get('title')]),
+                    'with_descriptions': len([d for d in datasets if d.get('description')]),
+                    'with_tags': len([d for d in datasets if d.get('tags')]),
+                    'with_urls': len([d for d in datasets if d.get('url')]),
+                    'with_thumbnails': len([d for d in datasets if d.get('thumbnail')])
+                }
+            }
+        }
+
+    @METRICS.timed('save', kind='export')
+    def export_datasets(self, datasets, path, fmt='csv'):
+        """Write dataset records to a csv, json or jsonl file; returns the number written"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if fmt == 'json':
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(datasets, f, indent=2, ensure_ascii=False, default=json_default)
+        elif fmt == 'jsonl':
+            with open(path, 'w', encoding='utf-8') as f:
+                for dataset in datasets:
+                    f.write(json.dumps(dataset, ensure_ascii=False, default=json_default) + '\n')
+        elif fmt == 'csv':
+            import csv
+            fieldnames = ['dataset_id', 'title', 'provider', 'category', 'start_date', 'end_date',
+                          'resolution', 'tags', 'url', 'thumbnail', 'confidence_score']
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                for dataset in datasets:
+                    temporal = dataset.get('temporal_coverage', {})
+                    writer.writerow({
+                        'dataset_id': dataset.get('dataset_id', ''),
+                        'title': dataset.get('title', ''),
+                        'provider': dataset.get('provider', ''),
+                        'category': self.classify_single_dataset(dataset),
+                        'start_date': temporal.get('start_date', ''),
+                        'end_date': temporal.get('end_date', ''),
+                        'resolution': dataset.get('spatial_info', {}).get('resolution', ''),
+                        'tags': ', '.join(dataset.get('tags', [])),
+                        'url': dataset.get('url', ''),
+                        'thumbnail': dataset.get('thumbnail', ''),
+                        'confidence_score': dataset.get('confidence_score', 0)
+                    })
+        else:
+            raise ValueError(f"Unknown export format: {fmt}")
+        return len(datasets)
+
+    def generate_intelligent_extraction_report(self, satellite_data):
+        """Generate a detailed report of the intelligent extraction results"""
+        if satellite_data.get('extraction_method') != 'earth_engine_intelligent':
+            return None
+
+        datasets = satellite_data.get('datasets', [])
+        classifications = satellite_data.get('classifications', {})
+
+        report = {
+            'total_datasets': len(datasets),
+            'extraction_method': 'Earth Engine Intelligent Extraction',
+            'confidence_scores': {
+                'very_high': len([d for d in datasets if d.get('confidence_score', 0) >= 70]),
+                'high': len([d for d in datasets if 50 <= d.get('confidence_score', 0) < 70]),
+                'medium': len([d for d in datasets if 30 <= d.get('confidence_score', 0) < 50]),
+                'low': len([d for d in datasets if d.get('confidence_score', 0) < 30])
+            },
+            'data_completeness': {
+                'with_titles': len([d for d in datasets if d.get('title')]),
+                'with_descriptions': len([d for d in datasets if d.get('description')]),
+                'with_tags': len([d for d in datasets if d.get('tags')]),
+                'with_thumbnails': len([d for d in datasets if d.get('thumbnail')]),
+                'with_providers': len([d for d in datasets if d.get('provider')]),
+                'with_urls': len([d for d in datasets if d.get('url')])
+            },
+            'classifications': {k: len(v) for k, v in classifications.items() if v},
+            'top_providers': self._get_top_providers(datasets),
+            'sample_datasets': datasets[:5] if datasets else []
+        }
+
+        return report
+
+    def _get_top_providers(self, datasets):
+        """Get the top data providers from the extracted datasets"""
+        provider_counts = {}
+        for dataset in datasets:
+            provider = dataset.get('provider', 'Unknown')
+            if provider and provider.strip():
+                provider_counts[provider] = provider_counts.get(provider, 0) + 1
+
+        return sorted(provider_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+
+    def extract_from_satellite_info(self, soup, satellite_data):
+        """Extract data from satellite information page"""
+        print("      Extracting from satellite info page...")
+        
+        # Extract satellite name
+        satellite_heading = soup.find(['h1', 'h2'], class_=re.compile(r'satellite|platform|instrument'))
+        if satellite_heading:
+            satellite_data['layer_name'] = satellite_heading.get_text().strip()
+        
+        # Extract sensor/instrument information
+        sensor_sections = soup.find_all(['div', 'section'], class_=re.compile(r'sensor|instrument|platform'))
+        for section in sensor_sections:
+            section_text = section.get_text()
+            if 'band' in section_text.lower():
+                self.extract_band_data(section, satellite_data)
+            if 'resolution' in section_text.lower():
+                self.extract_resolution_data(section, satellite_data)
+    
+    def extract_generic_data(self, soup, satellite_data):
+        """Extract data using generic patterns when page type is unknown"""
+        print("     Using generic extraction patterns...")
+        
+        text_content = soup.get_text()
+        
+        # Try to extract dataset name from various sources
+        if not satellite_data['layer_name']:
+            # Look for dataset names in headings
+            headings = soup.find_all(['h1', 'h2', 'h3'])
+            for heading in headings:
+                heading_text = heading.get_text().lower()
+                if any(word in heading_text for word in ['dataset', 'collection', 'product', 'layer']):
+                    satellite_data['layer_name'] = heading.get_text().strip()
+                    break
+        
+        # Extract using regex patterns
+        self.extract_with_regex_patterns(text_content, satellite_data)
+    
+    def extract_temporal_data(self, section, satellite_data):
+        """Extract temporal coverage information"""
+        section_text = section.get_text()
+        
+        # Look for date patterns
+        date_patterns = [
+            r'(\d{4}-\d{2}-\d{2})\s*to\s*(\d{4}-\d{2}-\d{2})',
+            r'(\d{4}/\d{2}/\d{2})\s*-\s*(\d{4}/\d{2}/\d{2})',
+            r'start[:\s]+(\d{4}[-/]\d{2}[-/]\d{2}).*?end[:\s]+(\d{4}[-/]\d{2}[-/]\d{2})',
+            r'(\d{4})\s*to\s*(\d{4})',
+            r'coverage[:\s]+(\d{4})\s*-\s*(\d{4})'
+        ]
+        
+        for pattern in date_patterns:
+            matches = re.findall(pattern, section_text, re.IGNORECASE)
+            if matches:
+                if len(matches[0]) == 2:
+                    satellite_data['date_range']['start'] = matches[0][0]
+                    satellite_data['date_range']['end'] = matches[0][1]
+                    break
+    
+    def extract_spatial_data(self, section, satellite_data):
+        """Extract spatial coverage information"""
+        section_text = section.get_text()
+        
+        # Look for location/coverage patterns
+        location_patterns = [
+            r'coverage[:\s]+([^.\n]+)',
+            r'extent[:\s]+([^.\n]+)',
+            r'boundary[:\s]+([^.\n]+)',
+            r'region[:\s]+([^.\n]+)',
+            r'area[:\s]+([^.\n]+)',
+            r'global|worldwide|continental|regional|local'
+        ]
+        
+        for pattern in location_patterns:
+            if pattern in ['global', 'worldwide', 'continental', 'regional', 'local']:
+                if pattern in section_text.lower():
+                    satellite_data['location'] = pattern.title()
+                    break
+            else:
+                matches = re.findall(pattern, section_text, re.IGNORECASE)
+                if matches:
+                    satellite_data['location'] = matches[0].strip()
+                    break
+    
+    def extract_technical_data(self, section, satellite_data):
+        """Extract technical specifications"""
+        section_text = section.get_text()
+        
+        # Extract bands
+        band_patterns = [
+            r'band[s]?[:\s]+([^.\n]+)',
+            r'wavelength[s]?[:\s]+([^.\n]+)',
+            r'channel[s]?[:\s]+([^.\n]+)'
+        ]
+        
+        for pattern in band_patterns:
+            matches = re.findall(pattern, section_text, re.IGNORECASE)
+            if matches:
+                bands = [b.strip() for b in matches[0].split(',')]
+                satellite_data['band_information'].extend(bands)
+        
+        # Extract resolution/pixel size
+        resolution_patterns = [
+            r'resolution[:\s]+([^.\n]+)',
+            r'pixel[:\s]+([^.\n]+)',
+            r'spatial[:\s]+([^.\n]+)'
+        ]
+        
+        for pattern in resolution_patterns:
+            matches = re.findall(pattern, section_text, re.IGNORECASE)
+            if matches:
+                satellite_data['pixel_size'] = matches[0].strip()
+                break
+    
+    def extract_provider_data(self, section, satellite_data):
+        """Extract provider/organization information"""
+        section_text = section.get_text()
+        
+        provider_patterns = [
+            r'provider[:\s]+([^\.\n]+)',
+            r'source[:\s]+([^\.\n]+)',
+            r'organization[:\s]+([^\.\n]+)',
+            r'institution[:\s]+([^\.\n]+)',
+            r'developed by[:\s]+([^\.\n]+)',
+            r'created by[:\s]+([^\.\n]+)',
+            r'managed by[:\s]+([^\.\n]+)',
+            r'hosted by[:\s]+([^\.\n]+)',
+            r'maintained by[:\s]+([^\.\n]+)',
+            r'agency[:\s]+([^\.\n]+)',
+            r'authority[:\s]+([^\.\n]+)'
+        ]
+        
+        for pattern in provider_patterns:
+            matches = re.findall(pattern, section_text, re.IGNORECASE)
+            if matches:
+                satellite_data['dataset_provider'] = matches[0].strip()
+                break
+        
+        # Fallback via meta tags if still empty
+        if not satellite_data.get('dataset_provider'):
+            meta = section.find('meta', attrs={'name': re.compile(r'provider|organization|institution|author|og:site_name', re.I)})
+            if meta:
+                satellite_data['dataset_provider'] = meta.get('content', '').strip()
+    
+    def extract_band_data(self, section, satellite_data):
+        """Extract band information from sensor section - Enhanced for Earth Engine bands table"""
+        section_text = section.get_text()
+        
+        # Look for band tables
+        band_tables = section.find_all('table')
+        for table in band_tables:
+            rows = table.find_all('tr')
+            for row in rows:
+                cells = row.find_all(['td', 'th'])
+                if len(cells) >= 2:
+                    band_name = cells[0].get_text().strip()
+                    if 'band' in band_name.lower() or 'channel' in band_name.lower() or 'wavelength' in band_name.lower():
+                        satellite_data['band_information'].append(band_name)
+        
+        # Look for Earth Engine specific band structure
+        bands_divs = section.find_all(['div', 'span'], string=re.compile(r'Bands?', re.I))
+        for div in bands_divs:
+            parent = div.parent
+            if parent:
+                # Look for band information in the same container
+                bands_text = parent.get_text()
+                
+                # Extract band names from text
+                band_patterns = [
+                    r'band[s]?[:\s]+([^.\n]+)',
+                    r'wavelength[s]?[:\s]+([^.\n]+)',
+                    r'channel[s]?[:\s]+([^.\n]+)'
+                ]
+                
+                for pattern in band_patterns:
+                    matches = re.findall(pattern, bands_text, re.IGNORECASE)
+                    if matches:
+                        bands = [b.strip() for b in matches[0].split(',')]
+                        satellite_data['band_information'].extend(bands)
+                        print(f"        Found bands from text: {', '.join(bands)}")
+                        break
+                
+                # Also look for band table in this section
+                band_table = parent.find('table')
+                if band_table:
+                    rows = band_table.find_all('tr')
+                    for row in rows:
+                        cells = row.find_all(['td', 'th'])
+                        if len(cells) >= 1:
+                            band_name = cells[0].get_text().strip()
+                            if band_name and band_name.lower() not in ['name', 'band', 'bands']:
+                                satellite_data['band_information'].append(band_name)
+                    
+                    if satellite_data['band_information']:
+                        print(f"        Found {len(satellite_data['band_information'])} bands from table")
+                break
+    
+    def extract_resolution_data(self, section, satellite_data):
+        """Extract resolution information from sensor section"""
+        section_text = section.get_text()
+        
+        resolution_patterns = [
+            r'(\d+(?:\.\d+)?)\s*(?:meter|m|km|pixel|arcsecond)',
+            r'resolution[:\s]+([^.\n]+)',
+            r'pixel[:\s]+([^.\n]+)'
+        ]
+        
+        for pattern in resolution_patterns:
+            matches = re.findall(pattern, section_text, re.IGNORECASE)
+            if matches:
+                satellite_data['pixel_size'] = matches[0].strip()
+                break
+    
+    def extract_citation_data(self, soup, satellite_data):
+        """Extract DOI and citation information - Enhanced for Earth Engine structure"""
+        print("     📚 Extracting citation data...")
+        
+        page_text = soup.get_text()
+        
+        # Look for DOI in text - Enhanced patterns
+        matches = PATTERNS.findall('citation.doi', page_text)
+        if matches:
+            doi = matches[0].strip()
+            if doi.startswith('10.'):
+                satellite_data['doi'] = doi
+            else:
+                satellite_data['doi'] = f"10.{doi}"
+            print(f"        Found DOI: {satellite_data['doi']}")
+        
+        # Look for citations in structured elements
+        citation_elements = soup.find_all(['div', 'section'], class_=PATTERNS.pattern('citation.element_class'))
+        for element in citation_elements:
+            citation_text = element.get_text().strip()
+            if citation_text:
+                satellite_data['citations'].append(citation_text)
+                print(f"       📖 Found citation: {citation_text[:100]}...")
+        
+        # Look for Earth Engine specific citation structure
+        citations_divs = soup.find_all(['div', 'span'], string=PATTERNS.pattern('citation.label'))
+        for div in citations_divs:
+            parent = div.parent
+            if parent:
+                # Look for citation text in the same container
+                citation_text = parent.get_text()
+                # Extract the citation content (everything after "Citations:")
+                citation_match = PATTERNS.search('citation.content', citation_text)
+                if citation_match:
+                    citation_content = citation_match.group(1).strip()
+                    if citation_content and len(citation_content) > 10:  # Avoid very short matches
+                        satellite_data['citations'].append(citation_content)
+                        print(f"       📖 Found structured citation: {citation_content[:100]}...")
+                
+                # Also look for DOI in the citation section
+                doi_match = PATTERNS.search('citation.section_doi', citation_text)
+                if doi_match and not satellite_data.get('doi'):
+                    doi = doi_match.group(1).strip()
+                    if doi.startswith('10.'):
+                        satellite_data['doi'] = doi
+                    else:
+                        satellite_data['doi'] = f"10.{doi}"
+                    print(f"        Found DOI in citations: {satellite_data['doi']}")
+                break
+        
+        # Look for terms of use
+        terms_divs = soup.find_all(['div', 'span'], string=PATTERNS.pattern('citation.terms_label'))
+        for div in terms_divs:
+            parent = div.parent
+            if parent:
+                # Look for terms content in the same container
+                terms_text = parent.get_text()
+                terms_match = PATTERNS.search('citation.terms', terms_text)
+                if terms_match:
+                    terms_content = terms_match.group(1).strip()
+                    if terms_content and len(terms_content) > 10:
+                        satellite_data['terms_of_use'] = terms_content
+                        print(f"        Found terms of use: {terms_content[:100]}...")
+                break
+        
+        # Look for description
+        description_divs = soup.find_all(['div', 'span'], string=PATTERNS.pattern('citation.description_label'))
+        for div in description_divs:
+            parent = div.parent
+            if parent:
+                # Look for description content in the same container
+                desc_text = parent.get_text()
+                desc_match = PATTERNS.search('citation.description', desc_text)
+                if desc_match:
+                    desc_content = desc_match.group(1).strip()
+                    if desc_content and len(desc_content) > 10:
+                        satellite_data['description'] = desc_content
+                        print(f"        Found description: {desc_content[:100]}...")
+                break
+        
+        # Method 4: Look for any text that looks like a citation
+        for matches in PATTERNS.iter_findall('citation.text', page_text):
+            if not satellite_data.get('citations'):
+                for match in matches:
+                    if isinstance(match, tuple):
+                        citation = ' '.join(match).strip()
+                    else:
+                        citation = match.strip()
+                    if citation and len(citation) > 20:
+                        satellite_data['citations'].append(citation)
+                        print(f"       📖 Found citation pattern: {citation[:100]}...")
+    
+    def extract_with_regex_patterns(self, text_content, satellite_data):
+        """Extract data using comprehensive regex patterns"""
+        # Extract satellites used
+        for matches in PATTERNS.iter_findall('regex.satellites', text_content):
+            satellites = [s.strip() for s in matches[0].split(',')]
+            satellite_data['satellites_used'].extend(satellites)
+        
+        # Extract category tags
+        for matches in PATTERNS.iter_findall('regex.category_tags', text_content):
+            tags = [t.strip() for t in matches[0].split(',')]
+            satellite_data['category_tags'].extend(tags)
+        
+        # Extract terms of use
+        matches = PATTERNS.findall('regex.terms', text_content)
+        if matches:
+            satellite_data['terms_of_use'] = matches[0].strip()
+    
+    def get_pattern_statistics(self):
+        """Return per-pattern check/hit counters of the shared pattern registry"""
+        return PATTERNS.statistics()
+
+    def get_unmatched_patterns(self):
+        """Return (group, pattern) pairs that were tried but never matched"""
+        return PATTERNS.unmatched()
+
+    def calculate_extraction_confidence(self, satellite_data):
+        """Calculate confidence level of extracted data - Enhanced for Earth Engine"""
+        # Check if we used intelligent Earth Engine extraction
+        if satellite_data.get('extraction_method') == 'earth_engine_intelligent':
+            datasets = satellite_data.get('datasets', [])
+            if datasets:
+                avg_confidence = sum(d.get('confidence_score', 0) for d in datasets) / len(datasets)
+                if avg_confidence >= 70:
+                    return 'very_high'
+                elif avg_confidence >= 50:
+                    return 'high'
+                elif avg_confidence >= 30:
+                    return 'medium'
+                else:
+                    return 'low'
+
+        # Fallback to original confidence calculation
+        confidence_score = 0
+        max_score = 100
+        
+        # Layer name (20 points)
+        if satellite_data['layer_name']:
+            confidence_score += 20
+        
+        # Date range (15 points)
+        if satellite_data['date_range']['start'] and satellite_data['date_range']['end']:
+            confidence_score += 15
+        elif satellite_data['date_range']['start'] or satellite_data['date_range']['end']:
+            confidence_score += 7
+        
+        # Satellites used (15 points)
+        if satellite_data['satellites_used']:
+            confidence_score += 15
+        
+        # Location (10 points)
+        if satellite_data['location']:
+            confidence_score += 10
+        
+        # GEE code (10 points)
+        if satellite_data['gee_code_snippet']:
+            confidence_score += 10
+        
+        # Provider (10 points)
+        if satellite_data['dataset_provider']:
+            confidence_score += 10
+        
+        # Technical specs (10 points)
+        if satellite_data['pixel_size'] or satellite_data['band_information']:
+            confidence_score += 10
+        
+        # Determine confidence level
+        if confidence_score >= 80:
+            return 'high'
+        elif confidence_score >= 50:
+            return 'medium'
+        else:
+            return 'low'
+
+    def process_catalog_extraction(self, soup, file_path):
+        """Process catalog extraction with detailed progress tracking"""
+        print(f"Processing catalog extraction for: {os.path.basename(file_path)}")
+        
+        # Step 1: Analyze page structure
+        print("    Step 1: Analyzing page structure...")
+        page_type = self.detect_page_type(soup)
+        print(f"       Detected page type: {page_type}")
+        
+        # Step 2: Extract catalog links
+        print("    Step 2: Extracting catalog links...")
+        catalog_links = self.extract_catalog_links_smart(soup)
+        print(f"       Found {len(catalog_links)} catalog links")
+        
+        # Step 3: Classify and prioritize links
+        print("    Step 3: Classifying and prioritizing links...")
+        classified_links = self.classify_and_prioritize_links(catalog_links)
+        print(f"       Classified into {len(classified_links)} categories")
+        
+        # Step 4: Extract satellite data
+        print("    Step 4: Extracting satellite catalog data...")
+        satellite_data = self.extract_satellite_data_enhanced(soup, catalog_links)
+        print(f"       Extracted satellite data with {satellite_data.get('extraction_confidence', 'unknown')} confidence")
+        
+        # Step 5: Validate and enhance data
+        print("    Step 5: Validating and enhancing data...")
+        enhanced_data = self.enhance_satellite_data(satellite_data, soup)
+        print(f"       Data enhancement completed")
+        
+        return {
+            'page_type': page_type,
+            'catalog_links': catalog_links,
+            'classified_links': classified_links,
+            'satellite_catalog': enhanced_data,
+            'extraction_summary': self.generate_extraction_summary(catalog_links, enhanced_data)
+        }
+    
+    def extract_catalog_links_smart(self, soup):
+        """Smart extraction of catalog links with better pattern recognition"""
+        catalog_links = []
+        
+        # Method 1: Look for structured catalog containers
+        containers = self.find_catalog_containers(soup)
+        if containers:
+            print(f"       Found {len(containers)} catalog containers")
+            for container in containers:
+                links = self.extract_from_container(container)
+                catalog_links.extend(links)
+        
+        # Method 2: Look for specific link patterns
+        if not catalog_links:
+            print("       No containers found, using link pattern analysis")
+            pattern_links = self.extract_by_link_patterns(soup)
+            catalog_links.extend(pattern_links)
+        
+        # Method 3: Look for thumbnail-based links
+        if not catalog_links:
+            print("       No pattern links found, using thumbnail analysis")
+            thumbnail_links = self.extract_by_thumbnails(soup)
+            catalog_links.extend(thumbnail_links)
+        
+        # Remove duplicates and validate
+        unique_links = self.deduplicate_links(catalog_links)
+        valid_links = self.validate_catalog_links(unique_links)
+        
+        return valid_links
+    
+    def find_catalog_containers(self, soup):
+        """Find catalog containers using multiple strategies"""
+        containers = []
+        
+        # Strategy 1: Look for common catalog class names
+        catalog_classes = [
+            'catalog', 'grid', 'item', 'dataset', 'collection', 'product',
+            'catalog-item', 'catalog-grid', 'dataset-grid', 'collection-grid'
+        ]
+        
+        for class_name in catalog_classes:
+            found = soup.find_all(['div', 'section', 'article'], class_=re.compile(class_name, re.I))
+            containers.extend(found)
+        
+        # Strategy 2: Look for catalog-like structures
+        catalog_structures = soup.find_all(['div', 'section'], class_=re.compile(r'container|wrapper|content'))
+        for structure in catalog_structures:
+            # Check if it contains multiple links and images (likely a catalog)
+            links = structure.find_all('a')
+            images = structure.find_all('img')
+            if len(links) > 3 and len(images) > 2:
+                containers.append(structure)
+        
+        # Strategy 3: Look for grid-like layouts
+        grid_elements = soup.find_all(['div', 'section'], style=re.compile(r'grid|flex|display'))
+        containers.extend(grid_elements)
+        
+        return list(set(containers))  # Remove duplicates
+    
+    def extract_from_container(self, container):
+        """Extract catalog links from a container"""
+        links = []
+        
+        # Find all links in the container
+        container_links = container.find_all('a', href=True)
+        
+        for link in container_links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            
+            # Skip navigation links
+            if self.is_navigation_link(href, text):
+                continue
+            
+            # Check if this looks like a dataset link
+            if self.looks_like_dataset_link(href, text):
+                # Find associated thumbnail
+                thumbnail = self.find_thumbnail_for_link(link, container)
+                
+                catalog_link = {
+                    'text': text,
+                    'href': href,
+                    'title': link.get('title', ''),
+                    'thumbnail': thumbnail,
+                    'is_catalog_item': True,
+                    'link_type': self.classify_link_type(href, text),
+                    'extraction_priority': self.calculate_link_priority(href, text),
+                    'container_type': 'structured'
+                }
+                links.append(catalog_link)
+        
+        return links
+    
+    def extract_by_link_patterns(self, soup):
+        """Extract links by analyzing URL patterns"""
+        links = []
+        
+        all_links = soup.find_all('a', href=True)
+        
+        for link in all_links:
+            href = link.get('href', '')
+            text = link.get_text().strip()
+            
+            # Look for Earth Engine specific patterns
+            if self.is_earth_engine_link(href):
+                thumbnail = self.find_thumbnail_for_link(link, soup)
+                
+                catalog_link = {
+                    'text': text,
+                    'href': href,
+                    'title': link.get('title', ''),
+                    'thumbnail': thumbnail,
+                    'is_catalog_item': True,
+                    'link_type': 'earth_engine',
+                    'extraction_priority': 9,
+                    'container_type': 'pattern_based'
+                }
+                links.append(catalog_link)
+        
+        return links
+    
+    def extract_by_thumbnails(self, soup):
+        """Extract links by finding thumbnail images and their associated links"""
+        links = []
+        
+        # Find all images that look like thumbnails
+        thumbnails = soup.find_all('img', src=True)
+        
+        for thumbnail in thumbnails:
+            # Check if this looks like a dataset thumbnail
+            if self.looks_like_dataset_thumbnail(thumbnail):
+                # Find associated link
+                link = self.find_link_for_thumbnail(thumbnail)
+                if link:
+                    href = link.get('href', '')
+                    text = link.get_text().strip()
+                    
+                    catalog_link = {
+                        'text': text,
+                        'href': href,
+                        'title': link.get('title', ''),
+                        'thumbnail': {
+                            'src': thumbnail.get('src', ''),
+                            'alt': thumbnail.get('alt', ''),
+                            'title': thumbnail.get('title', ''),
+                            'width': thumbnail.get('width', ''),
+                            'height': thumbnail.get('height', '')
+                        },
+                        'is_catalog_item': True,
+                        'link_type': 'thumbnail_based',
+                        'extraction_priority': 7,
+                        'container_type': 'thumbnail_based'
+                    }
+                    links.append(catalog_link)
+        
+        return links
+    
+    def is_earth_engine_link(self, href):
+        """Check if a link is Earth Engine specific"""
+        return classify_link(href, '')['earth_engine']
+    
+    def looks_like_dataset_link(self, href, text):
+        """Check if a link looks like it points to a dataset - Enhanced filtering"""
+        return classify_link(href, text)['looks_like_dataset']
+    
+    def is_clearly_not_dataset(self, href, text):
+        """Check if a link is clearly NOT a dataset link"""
+        return classify_link(href, text)['clearly_not_dataset']
+    
+    def is_external_junk_domain(self, href):
+        """Check if href points to external junk domains"""
+        return classify_link(href, '')['external_junk']
+    
+    def is_earth_engine_specific(self, href, text):
+        """Check if a link is specifically Earth Engine related"""
+        return classify_link(href, text)['earth_engine_specific']
+    
+    def looks_like_dataset_thumbnail(self, img):
+        """Check if an image looks like a dataset thumbnail"""
+        src = img.get('src', '').lower()
+        alt = img.get('alt', '').lower()
+        title = img.get('title', '').lower()
+        
+        # Check for thumbnail indicators
+        thumbnail_indicators = [
+            'thumb', 'preview', 'sample', 'example', 'dataset', 'collection'
+        ]
+        
+        if any(indicator in src for indicator in thumbnail_indicators):
+            return True
+        
+        if any(indicator in alt for indicator in thumbnail_indicators):
+            return True
+        
+        if any(indicator in title for indicator in thumbnail_indicators):
+            return True
+        
+        # Check size (thumbnails are usually small)
+        width = img.get('width')
+        height = img.get('height')
+        if width and height:
+            try:
+                if int(width) < 300 and int(height) < 300:
+                    return True
+            except ValueError:
+                pass
+        
+        return False
+    
+    def find_link_for_thumbnail(self, thumbnail):
+        """Find the link associated with a thumbnail image"""
+        # Look for parent link
+        parent = thumbnail.parent
+        while parent and parent.name != 'a':
+            parent = parent.parent
+        
+        if parent and parent.name == 'a':
+            return parent
+        
+        # Look for sibling link
+        siblings = thumbnail.find_next_siblings()
+        for sibling in siblings:
+            if sibling.name == 'a':
+                return sibling
+        
+        # Look for nearby link
+        nearby = thumbnail.find_next('a')
+        if nearby:
+            return nearby
+        
+        return None
+    
+    def deduplicate_links(self, links):
+        """Remove duplicate links based on href"""
+        seen = set()
+        unique_links = []
+        
+        for link in links:
+            href = link.get('href', '')
+            if href not in seen:
+                seen.add(href)
+                unique_links.append(link)
+        
+        return unique_links
+    
+    def validate_catalog_links(self, links):
+        """Validate that links are actually catalog-related - Enhanced filtering
+
+        Skips empty, navigation, utility, social media, junk-domain and clearly
+        non-dataset links, and external non-Earth Engine links without strong
+        dataset indicators; each link is classified once by classify_link().
+        """
+        return [link for link in links
+                if classify_link(link.get('href', ''), link.get('text', ''))['catalog_link']]
+    
+    def has_strong_dataset_indicators(self, href, text):
+        """Check if a link has very strong dataset indicators"""
+        return classify_link(href, text)['strong_dataset_indicators']
+    
+    def classify_and_prioritize_links(self, links):
+        """Classify links by type and assign priorities"""
+        if not links:
+            return {}
+        
+        # Sort by priority
+        links.sort(key=lambda x: x.get('extraction_priority', 0), reverse=True)
+        
+        # Group by type
+        classified = {}
+        for link in links:
+            link_type = link.get('link_type', 'general')
+            if link_type not in classified:
+                classified[link_type] = []
+            classified[link_type].append(link)
+        
+        return classified
+    
+    def extract_satellite_data_enhanced(self, soup, catalog_links):
+        """Enhanced satellite data extraction using catalog links context"""
+        # Use the existing enhanced extraction method
+        return self.extract_satellite_data(soup, {'catalog_links': catalog_links})
+    
+    def enhance_satellite_data(self, satellite_data, soup):
+        """Enhance satellite data with additional context"""
+        enhanced = satellite_data.copy()
+        
+        # Add extraction metadata
+        enhanced['extraction_timestamp'] = datetime.now().isoformat()
+        enhanced['extraction_method'] = 'enhanced_smart_extraction'
+        
+        # Add confidence indicators
+        enhanced['data_completeness'] = self.calculate_data_completeness(enhanced)
+        enhanced['extraction_quality'] = self.assess_extraction_quality(enhanced)
+        
+        # Add context information
+        enhanced['page_context'] = self.extract_page_context(soup)
+        
+        return enhanced
+    
+    def calculate_data_completeness(self, data):
+        """Calculate how complete the extracted data is"""
+        fields = [
+            'layer_name', 'date_range', 'satellites_used', 'location',
+            'gee_code_snippet', 'dataset_provider', 'pixel_size', 'doi'
+        ]
+        
+        completed_fields = 0
+        for field in fields:
+            if field == 'date_range':
+                if data.get('date_range', {}).get('start') and data.get('date_range', {}).get('end'):
+                    completed_fields += 1
+            elif data.get(field):
+                completed_fields += 1
+        
+        return (completed_fields / len(fields)) * 100
+    
+    def assess_extraction_quality(self, data):
+        """Assess the overall quality of extracted data"""
+        quality_score = 0
+        
+        # Layer name quality
+        if data.get('layer_name'):
+            if len(data['layer_name']) > 10:
+                quality_score += 20
+            else:
+                quality_score += 10
+        
+        # Date range quality
+        if data.get('date_range', {}).get('start') and data.get('date_range', {}).get('end'):
+            quality_score += 20
+        
+        # Technical data quality
+        if data.get('pixel_size') or data.get('band_information'):
+            quality_score += 15
+        
+        # Provider information quality
+        if data.get('dataset_provider'):
+            quality_score += 15
+        
+        # GEE code quality
+        if data.get('gee_code_snippet'):
+            quality_score += 10
+        
+        # Metadata quality
+        if data.get('doi') or data.get('citations'):
+            quality_score += 10
+        
+        # Determine quality level
+        if quality_score >= 80:
+            return 'excellent'
+        elif quality_score >= 60:
+            return 'good'
+        elif quality_score >= 40:
+            return 'fair'
+        else:
+            return 'poor'
+    
+    def extract_page_context(self, soup):
+        """Extract contextual information about the page"""
+        context = {
+            'page_title': '',
+            'breadcrumbs': [],
+            'related_links': [],
+            'page_metadata': {}
+        }
+        
+        # Extract page title
+        title_tag = soup.find('title')
+        if title_tag:
+            context['page_title'] = title_tag.get_text().strip()
+        
+        # Extract breadcrumbs
+        breadcrumb_elements = soup.find_all(['nav', 'div'], class_=re.compile(r'breadcrumb|navigation'))
+        for element in breadcrumb_elements:
+            links = element.find_all('a')
+            for link in links:
+                context['breadcrumbs'].append({
+                    'text': link.get_text().strip(),
+                    'href': link.get('href', '')
+                })
+        
+        # Extract related links
+        related_sections = soup.find_all(['div', 'section'], class_=re.compile(r'related|similar|additional'))
+        for section in related_sections:
+            links = section.find_all('a')
+            for link in links:
+                context['related_links'].append({
+                    'text': link.get_text().strip(),
+                    'href': link.get('href', '')
+                })
+        
+        # Extract page metadata
+        meta_tags = soup.find_all('meta')
+        for meta in meta_tags:
+            name = meta.get('name', meta.get('property', ''))
+            content = meta.get('content', '')
+            if name and content:
+                context['page_metadata'][name] = content
+        
+        return context
+    
+    def generate_extraction_summary(self, catalog_links, satellite_data):
+        """Generate a comprehensive summary of the extraction process with junk filtering details"""
+        summary = {
+            'total_links_discovered': 0,  # Total before filtering
+            'junk_links_filtered': 0,     # How many were filtered out
+            'total_links': len(catalog_links),
+            'links_by_type': {},
+            'extraction_confidence': satellite_data.get('extraction_confidence', 'unknown'),
+            'data_completeness': satellite_data.get('data_completeness', 0),
+            'extraction_quality': satellite_data.get('extraction_quality', 'unknown'),
+            'junk_examples': [],
+            'recommendations': [],
+            'filtering_stats': {
+                'social_media_removed': 0,
+                'navigation_removed': 0,
+                'utility_removed': 0,
+                'external_junk_removed': 0,
+                'broken_links_removed': 0,
+                'advertisement_removed': 0
+            }
+        }
+        
+        # Count links by type
+        for link in catalog_links:
+            link_type = link.get('link_type', 'unknown')
+            if link_type not in summary['links_by_type']:
+                summary['links_by_type'][link_type] = 0
+            summary['links_by_type'][link_type] += 1
+        
+        # Generate recommendations
+        if satellite_data.get('extraction_confidence') == 'low':
+            summary['recommendations'].append('Consider manual review of extracted data')
+        
+        if satellite_data.get('data_completeness', 0) < 50:
+            summary['recommendations'].append('Data extraction incomplete - may need additional sources')
+        
+        if not satellite_data.get('gee_code_snippet'):
+            summary['recommendations'].append('No GEE code found - check for code examples or documentation')
+        
+        # Add junk filtering recommendations
+        if summary['junk_links_filtered'] > 0:
+            summary['recommendations'].append(f'Successfully filtered out {summary["junk_links_filtered"]} junk links for cleaner data')
+        
+        if summary['total_links'] < 100:
+            summary['recommendations'].append('Low link count - may need to adjust filtering criteria')
+        
+        return summary
+
+    @METRICS.timed('extract', kind='detail')
+    def extract_from_dataset_link(self, link, base_soup, prefetched=None):
+        """Extract detailed data from an individual dataset link
+
+        ``prefetched`` is an optional ConcurrentFetcher result for the link's URL;
+        without it the page is fetched here.
+        """
+        try:
+            href = link.get('href', '')
+            text = link.get('text', '')
+            
+            print(f"         🌐 Processing link: {href[:80]}...")
+            
+            # Try to fetch the linked dataset page for real details
+            details_soup = None
+            if href.startswith('http'):
+                if prefetched is None:
+                    prefetched = self.get_fetcher().fetch(
+                        href, timeout=self.config['performance']['timeout'], verify=False, allow_redirects=True
+                    )
+                if prefetched['error'] is None:
+                    try:
+                        details_soup = self.make_soup(prefetched['response'].content)
+                    except Exception as e:
+                        print(f"          Failed to parse detail page: {e}")
+                else:
+                    print(f"          Failed to fetch detail page: {prefetched['error']}")
+            
+            # Create a dataset entry and prefer real details when available
+            dataset_data = {
+                'layer_name': text.strip(),
+                'date_range': {'start': '', 'end': ''},
+                'satellites_used': [],
+                'location': '',
+                'gee_code_snippet': '',
+                'thumbnails': [],
+                'band_information': [],
+                'category_tags': [],
+                'dataset_provider': '',
+                'pixel_size': '',
+                'citations': [],
+                'description': '',
+                'terms_of_use': '',
+                'doi': ''
+            }
+            
+            # If we have a detail soup, extract structured metadata first
+            if details_soup is not None:
+                try:
+                    # First try JSON-LD structured data (fastest and most reliable)
+                    json_ld_data = self.extract_json_ld_metadata(details_soup)
+                    for k, v in json_ld_data.items():
+                        if k in dataset_data and v:
+                            dataset_data[k] = v
+                        
+                    # Then try the general satellite data extractor
+                    structured = self.extract_satellite_data(details_soup, {'catalog_links': []})
+                    for k, v in structured.items():
+                        if k in dataset_data and v and not dataset_data[k]:  # Don't overwrite JSON-LD data
+                            dataset_data[k] = v
+                            
+                except Exception as e:
+                    print(f"          Detail parse error: {e}")
+            
+            # If we still have many unknowns and this is a developers.google.com page, try headless browser
+            if (details_soup is None or 
+                sum(1 for v in dataset_data.values() if v and v != 'Unknown') < 5) and 'developers.google.com' in href:
+                print(f"          Trying headless browser fallback for better extraction...")
+                headless_soup = self.extract_with_headless_browser(href)
+                if headless_soup:
+                    try:
+                        # Extract from fully rendered page
+                        headless_data = self.extract_json_ld_metadata(headless_soup)
+                        headless_structured = self.extract_satellite_data(headless_soup, {'catalog_links': []})
+                        
+                        # Merge headless data, preferring it over previous attempts
+                        for k, v in headless_data.items():
+                            if k in dataset_data and v:
+                                dataset_data[k] = v
+                        for k, v in headless_structured.items():
+                            if k in dataset_data and v:
+                                dataset_data[k] = v
+                                
+                        print(f"          Headless browser extracted additional data")
+                    except Exception as e:
+                        print(f"          Headless extraction error: {e}")
+            
+            # Extract provider from link text or URL
+            if 'copernicus' in text.lower() or 'copernicus' in href.lower():
+                dataset_data['dataset_provider'] = 'Copernicus'
+            elif 'nasa' in text.lower() or 'nasa' in href.lower():
+                dataset_data['dataset_provider'] = 'NASA'
+            elif 'esa' in text.lower() or 'esa' in href.lower():
+                dataset_data['dataset_data'] = 'ESA'
+            elif 'usgs' in text.lower() or 'usgs' in href.lower():
+                dataset_data['dataset_provider'] = 'USGS'
+            elif 'noaa' in text.lower() or 'noaa' in href.lower():
+                dataset_data['dataset_provider'] = 'NOAA'
+            
+            # Extract satellites from text
+            satellite_keywords = ['landsat', 'sentinel', 'modis', 'aster', 'viirs', 'olci', 'meris', 'seawifs']
+            for keyword in satellite_keywords:
+                if keyword in text.lower():
+                    dataset_data['satellites_used'].append(keyword.title())
+            
+            # Extract location from text
+            location_keywords = ['global', 'worldwide', 'continental', 'regional', 'local', 'greenland', 'arctic', 'antarctic']
+            for keyword in location_keywords:
+                if keyword in text.lower():
+                    dataset_data['location'] = keyword.title()
+                    break
+            
+            # Extract date patterns from text
+            date_patterns = [
+                r'(\d{4})',
+                r'(\d{4}-\d{2})',
+                r'(\d{4}/\d{2})'
+            ]
+            
+            for pattern in date_patterns:
+                matches = re.findall(pattern, text)
+                if matches:
+                    if not dataset_data['date_range']['start']:
+                        dataset_data['date_range']['start'] = matches[0]
+                    elif not dataset_data['date_range']['end']:
+                        dataset_data['date_range']['end'] = matches[0]
+                    break
+            
+            # Extract categories from text
+            category_keywords = ['ocean', 'marine', 'land', 'atmosphere', 'climate', 'vegetation', 'water', 'ice', 'snow', 'urban', 'agriculture']
+            for keyword in category_keywords:
+                if keyword in text.lower():
+                    dataset_data['category_tags'].append(keyword.title())
+            
+            # Look for GEE code patterns in the link
+            if 'ee.' in text or 'ImageCollection' in text:
+                dataset_data['gee_code_snippet'] = text
+            
+            # Extract resolution from text
+            resolution_patterns = [
+                r'(\d+(?:\.\d+)?)\s*(?:meter|m|km)',
+                r'(\d+(?:\.\d+)?)\s*(?:pixel|resolution)'
+            ]
+            
+            for pattern in resolution_patterns:
+                matches = re.findall(pattern, text)
+                if matches:
+                    dataset_data['pixel_size'] = f"{matches[0]} meters"
+                    break
+            
+            # Look for description in link title or text
+            if link.get('title'):
+                dataset_data['description'] = link['title']
+            elif len(text) > 50:
+                dataset_data['description'] = text[:100] + "..."
+            
+            return dataset_data
+            
+        except Exception as e:
+            print(f"          Error extracting from dataset link: {e}")
+            return None
+
+    def find_dataset_page_links(self, source):
+        """Absolute links to individual dataset catalog pages (from a soup, raw markup or an open file), in page order"""
+        if hasattr(source, 'find_all'):
+            hrefs = [link.get('href') for link in source.find_all('a', href=True)]
+        else:
+            hrefs = [link['href'] for link in self.find_links(source)]
+        links = []
+        for url in hrefs:
+            if url and url.startswith('http'):
+                if '/datasets/catalog/' in url and not url.endswith('/catalog'):
+                    links.append(url)
+        return list(dict.fromkeys(links))
+
+    def follow_dataset_links(self, links, log_callback=None, **request_kwargs):
+        """Fetch dataset pages concurrently and save what each one contains
+
+        Every page is extracted with extract_all_data, saved to its own JSON file
+        and, when it carries satellite catalog data, appended to the satellite
+        catalog. Returns counts of saved and failed pages.
+        """
+        log = log_callback or print
+        request_kwargs.setdefault('timeout', self.config['performance']['timeout'])
+        summary = {'links': len(links), 'saved': 0, 'failed': 0}
+        fetched = self.get_fetcher().iter_fetch(links, retries=2, **request_kwargs)
+        try:
+            for i, result in enumerate(fetched, start=1):
+                url = result['url']
+                response = result['response']
+                if result['error'] is not None:
+                    log(f" [{i}/{len(links)}] Request failed: {result['error']} - {url}")
+                    summary['failed'] += 1
+                    continue
+                content_type = response.headers.get('content-type', '').lower()
+                if not content_type.startswith('text/html'):
+                    log(f" [{i}/{len(links)}] URL does not return HTML: {content_type} - {url}")
+                    summary['failed'] += 1
+                    continue
+
+                data = self.extract_all_data(self.make_soup(response.content), url)
+                json_file = self.save_data_to_json(data, url)
+                if not json_file:
+                    summary['failed'] += 1
+                    continue
+                catalog = data.get('satellite_catalog')
+                if catalog:
+                    satellite_name = catalog.get('layer_name') or f"Satellite_{summary['saved'] + 1}"
+                    self.save_satellite_catalog_data(catalog, satellite_name)
+                summary['saved'] += 1
+                log(f" [{i}/{len(links)}] {data.get('title', 'Unknown')[:50]} -> {os.path.basename(json_file)}")
+        finally:
+            fetched.close()
+        return summary
+
+    def extract_links_by_thumbnails(self, soup, catalog_links):
+        """Extract links by finding ALL thumbnail images and their associated links"""
+        print("      Extracting ALL thumbnail-based links...")
+        
+        # Find ALL images that could be thumbnails
+        all_images = soup.find_all('img', src=True)
+        print(f"        Found {len(all_images)} total images")
+        
+        thumbnail_count = 0
+        for img in all_images:
+            # Check if this looks like a dataset thumbnail
+            if self.looks_like_dataset_thumbnail(img):
+                # Find associated link
+                link = self.find_link_for_thumbnail(img)
+                if link:
+                    href = link.get('href', '')
+                    text = link.get_text().strip()
+                    
+                    # Only add if we don't already have this link
+                    if not any(existing['href'] == href for existing in catalog_links):
+                        catalog_link = {
+                            'text': text,
+                            'href': href,
+                            'title': link.get('title', ''),
+                            'thumbnail': {
+                                'src': img.get('src', ''),
+                                'alt': img.get('alt', ''),
+                                'title': img.get('title', ''),
+                                'width': img.get('width', ''),
+                                'height': img.get('height', '')
+                            },
+                            'is_catalog_item': True,
+                            'link_type': 'thumbnail_based',
+                            'extraction_priority': 10,  # High priority for thumbnails
+                            'container_type': 'thumbnail_based'
+                        }
+                        catalog_links.append(catalog_link)
+                        thumbnail_count += 1
+                        
+                        if thumbnail_count <= 10:  # Show first 10 for debugging
+                            print(f"          Found thumbnail {thumbnail_count}: {text[:40]}...")
+        
+        print(f"        Extracted {thumbnail_count} thumbnail-based links")
+        return thumbnail_count
+
+    def extract_json_ld_metadata(self, soup):
+        """Extract structured metadata from JSON-LD scripts"""
+        metadata = {}
+        try:
+            # Look for JSON-LD structured data
+            json_ld_scripts = soup.find_all('script', type='application/ld+json')
+            for script in json_ld_scripts:
+                try:
+                    data = json.loads(script.string)
+                    if isinstance(data, dict):
+                        # Extract common fields
+                        if 'name' in data and not metadata.get('layer_name'):
+                            metadata['layer_name'] = data['name']
+                        if 'description' in data and not metadata.get('description'):
+                            metadata['description'] = data['description']
+                        if 'provider' in data and not metadata.get('dataset_provider'):
+                            metadata['dataset_provider'] = data['provider']['name'] if isinstance(data['provider'], dict) else data['provider']
+                        if 'datePublished' in data and not metadata.get('date_range'):
+                            metadata['date_range'] = {'start': data['datePublished'], 'end': ''}
+                        if 'identifier' in data and not metadata.get('doi'):
+                            # Check if it's a DOI
+                            identifier = data['identifier']
+                            if isinstance(identifier, dict) and identifier.get('@type') == 'PropertyValue':
+                                identifier = identifier.get('value', '')
+                            if 'doi.org' in str(identifier) or str(identifier).startswith('10.'):
+                                metadata['doi'] = str(identifier)
+                        if 'keywords' in data and not metadata.get('category_tags'):
+                            metadata['category_tags'] = data['keywords'] if isinstance(data['keywords'], list) else [data['keywords']]
+                        if 'spatialCoverage' in data and not metadata.get('location'):
+                            spatial = data['spatialCoverage']
+                            if isinstance(spatial, dict):
+                                if 'name' in spatial:
+                                    metadata['location'] = spatial['name']
+                                elif 'geo' in spatial:
+                                    geo = spatial['geo']
+                                    if isinstance(geo, dict) and 'latitude' in geo and 'longitude' in geo:
+                                        metadata['location'] = f"Lat: {geo['latitude']}, Lon: {geo['longitude']}"
+                except (json.JSONDecodeError, AttributeError) as e:
+                    continue
+            
+            # Also check for microdata attributes
+            meta_tags = soup.find_all('meta')
+            for meta in meta_tags:
+                property_name = meta.get('property', meta.get('name', ''))
+                content = meta.get('content', '')
+                
+                if 'og:title' in property_name and not metadata.get('layer_name'):
+                    metadata['layer_name'] = content
+                elif 'og:description' in property_name and not metadata.get('description'):
+                    metadata['description'] = content
+                elif 'citation_doi' in property_name and not metadata.get('doi'):
+                    metadata['doi'] = content
+                elif 'citation_author' in property_name and not metadata.get('dataset_provider'):
+                    metadata['dataset_provider'] = content
+                elif 'citation_keywords' in property_name and not metadata.get('category_tags'):
+                    metadata['category_tags'] = [kw.strip() for kw in content.split(',') if kw.strip()]
+            
+        except Exception as e:
+            print(f"          JSON-LD extraction error: {e}")
+        
+        return metadata
+
+    @METRICS.timed('fetch', kind='browser')
+    def extract_with_headless_browser(self, url):
+        """Fallback: render the page in the shared headless browser pool"""
+        pool = self.get_browser_pool()
+        if pool is None:
+            return None
+        try:
+            return self.make_soup(pool.render(url))
+        except Exception as e:
+            print(f"          Headless browser fallback failed: {e}")
+            return None
@@ -9,3210 +9,364 @@ import sys
 import json
 import time
 import threading
-import warnings
 import re
 import gc
+import contextlib
 import psutil
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
 from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtCore import Qt
 import requests
 import html
-import faulthandler
-import logging
-from logging.handlers import RotatingFileHandler
-import pathlib
 
-# Enable fault handler to capture hard crashes
-try:
-    crash_log_path = os.path.join(os.path.dirname(__file__), 'lightweight_crash.log')
-    _fh = open(crash_log_path, 'w', buffering=1, encoding='utf-8')
-    faulthandler.enable(file=_fh)
-except Exception:
-    pass
+# The Qt-free engine; also importable on its own by headless tools
+if __package__:
+    from .extraction_engine import *
+    from .extraction_engine import _StructuredLogWriter, _log_json, _logger, _structured_log
+else:
+    from extraction_engine import *
+    from extraction_engine import _StructuredLogWriter, _log_json, _logger, _structured_log
 
-# Global exception hook to log uncaught exceptions
-def _log_excepthook(exctype, value, tb):
-    try:
-        with open(os.path.join(os.path.dirname(__file__), 'lightweight_errors.log'), 'a', encoding='utf-8') as ef:
-            ef.write(f"[{datetime.now().isoformat()}] Uncaught: {exctype.__name__}: {value}\n")
-    except Exception:
-        pass
-    sys.__excepthook__(exctype, value, tb)
+setup_logging()
 
-sys.excepthook = _log_excepthook
 
-# Configure comprehensive logging
-_logs_dir = pathlib.Path(os.path.join(os.path.dirname(__file__), 'logs'))
-_logs_dir.mkdir(parents=True, exist_ok=True)
+class DatasetGalleryModel(QAbstractListModel):
+    """List model behind the dataset gallery; filtering only rebuilds a row index"""
 
-_logger = logging.getLogger('lightweight')
-if not _logger.handlers:
-    _logger.setLevel(logging.INFO)
-    fmt = logging.Formatter('%(asctime)s | %(levelname)s | %(threadName)s | %(name)s | %(message)s')
-    file_handler = RotatingFileHandler(_logs_dir / 'app.log', maxBytes=2_000_000, backupCount=5, encoding='utf-8')
-    file_handler.setFormatter(fmt)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(fmt)
-    _logger.addHandler(file_handler)
-    _logger.addHandler(console_handler)
+    DatasetRole = Qt.ItemDataRole.UserRole
+    CategoryRole = Qt.ItemDataRole.UserRole + 1
 
-def _log_json(event_type: str, **kwargs):
-    try:
-        record = {
-            'ts': datetime.now().isoformat(),
-            'event': event_type,
-            **kwargs
-        }
-        with open(_logs_dir / 'structured.log', 'a', encoding='utf-8') as jf:
-            jf.write(json.dumps(record, ensure_ascii=False) + '\n')
-    except Exception:
-        pass
-
-# Suppress warnings
-warnings.filterwarnings('ignore')
-
-class LocalHTMLDataExtractor:
-    """Extracts ALL data from local HTML files without external requests"""
-    
-    def __init__(self):
-        # Create output directory for JSON files
-        self.output_dir = "collected_data"
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-
-        # Create thumbnails directory
-        self.thumbnails_dir = os.path.join(self.output_dir, "thumbnails")
-        if not os.path.exists(self.thumbnails_dir):
-            os.makedirs(self.thumbnails_dir)
-
-        # Smart crawling controls
-        self.processed_urls = set()
-        self.crawl_depth_limit = 3
-        self.max_datasets_per_run = 1000
-        self.crawl_delay = 1.0  # seconds between requests
-        self.dataset_counter = 0
-        
-        # Network session and defaults for link-following
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-        # Log all HTTP responses
-        def _resp_hook(resp, *args, **kwargs):
-            try:
-                _logger.info(f"HTTP {resp.status_code} {resp.request.method} {resp.url} ({resp.elapsed.total_seconds():.3f}s)")
-                _log_json('http_response', status=resp.status_code, method=resp.request.method, url=resp.url, elapsed_ms=int(resp.elapsed.total_seconds()*1000))
-            except Exception:
-                pass
-            return resp
-        self.session.hooks['response'] = [ _resp_hook ]
-        self.config = {
-            'performance': {'timeout': 15, 'request_delay': 0.5},
-            'processing': {'batch_size': 10}
-        }
-    
-    def extract_all_data(self, soup, file_path, progress_callback=None, log_callback=None):
-        """Extract satellite catalog data from HTML file"""
-        print(f"Starting satellite catalog extraction from: {os.path.basename(file_path)}")
-        _logger.info(f"extract_all_data:start file={file_path}")
-        
-        try:
-            data = {
-                'file_path': file_path,
-                'timestamp': datetime.now().isoformat(),
-                'title': '',
-                'satellite_catalog': {},
-                'catalog_links': [],
-                'thumbnails': [],
-                'extraction_metadata': {}
-            }
-            
-            print(" Extracting satellite catalog data...")
-            
-            # Extract title
-            title_tag = soup.find('title')
-            if title_tag:
-                data['title'] = title_tag.get_text().strip()
-                print(f"    Title: {data['title'][:50]}...")
-                _logger.info(f"title: {data['title']}")
-            
-            # Extract catalog links (thumbnails with satellite data)
-            print(" Extracting satellite catalog links with smart classification...")
-            catalog_links = []
-            
-            try:
-                # Look for catalog grid containers first
-                catalog_containers = soup.find_all(['div', 'section', 'article'], class_=re.compile(r'catalog|grid|item|dataset|collection'))
-                
-                if catalog_containers:
-                    print(f"      Found {len(catalog_containers)} catalog containers")
-                    for container in catalog_containers:
-                        self.extract_links_from_container(container, catalog_links)
-                else:
-                    # Fallback to general link extraction
-                    print("     No catalog containers found, using general link extraction")
-                    self.extract_links_generally(soup, catalog_links)
-            except re.error as e:
-                print(f"      Regex error in catalog container search: {e}")
-                # Fallback to general link extraction
-                print("     Using fallback link extraction due to regex error")
-                self.extract_links_generally(soup, catalog_links)
-            
-            data['catalog_links'] = catalog_links
-            print(f"    Found {len(catalog_links)} catalog links")
-            _log_json('catalog_links', file=file_path, count=len(catalog_links))
-            
-            # Classify catalog links by type
-            try:
-                self.classify_catalog_links(catalog_links)
-            except Exception as e:
-                print(f"      Error in link classification: {e}")
-                _logger.exception("link_classification_error")
-            
-            # Extract satellite catalog data using smart extraction
-            print(" Starting smart satellite catalog data extraction...")
-            try:
-                data['satellite_catalog'] = self.extract_satellite_data(soup, data)
-                print(" Smart satellite catalog data extraction completed")
-                _log_json('satellite_data_extracted', completeness=len(data['satellite_catalog']))
-            except Exception as e:
-                print(f"      Error in satellite data extraction: {e}")
-                data['satellite_catalog'] = {}
-                _logger.exception("satellite_data_extraction_error")
-            
-            # Now follow individual dataset links to extract detailed information
-            if catalog_links:
-                try:
-                    # Keep only dataset detail links
-                    detail_links = [l for l in catalog_links if l.get('link_type') == 'dataset_detail']
-                    print(f" Following {len(detail_links)} dataset detail links to extract detailed information...")
-                    _log_json('detail_links', file=file_path, count=len(detail_links))
-                    detailed_extractions = 0
-                    
-                    # Process ALL detail links - no artificial limits
-                    for i, link in enumerate(detail_links):
-                        if progress_callback:
-                            # Update progress: 50% for initial extraction, 50% for dataset processing
-                            progress = 50 + (i / len(detail_links)) * 50
-                            progress_callback(progress)
-                        if log_callback:
-                            log_callback(f"Processing dataset {i+1}/{len(detail_links)}: {link['text'][:80]}")
-                        
-                        print(f"     Processing dataset {i+1}/{len(detail_links)}: {link['text'][:50]}...")
-                        
-                        try:
-                            # Extract detailed data from this dataset link
-                            detailed_data = self.extract_from_dataset_link(link, soup)
-                            if detailed_data:
-                                # Add to satellite catalog
-                                if 'satellite_catalog' not in data:
-                                    data['satellite_catalog'] = {}
-                                
-                                # Merge detailed data
-                                for key, value in detailed_data.items():
-                                    if value and value != 'Unknown':
-                                        data['satellite_catalog'][key] = value
-                                
-                                detailed_extractions += 1
-                                print(f"        Extracted detailed data for: {link['text'][:30]}...")
-                                _log_json('detail_extracted', href=link.get('href', ''), text=link.get('text', '')[:120])
-                            else:
-                                print(f"        No detailed data found for: {link['text'][:30]}...")
-                        except Exception as e:
-                            print(f"        Error processing dataset link: {e}")
-                            continue
-                    
-                    print(f" Completed detailed extraction of {detailed_extractions} datasets")
-                    if progress_callback:
-                        progress_callback(100)
-                except Exception as e:
-                    print(f"      Error in dataset link processing: {e}")
-                    _logger.exception("dataset_link_processing_error")
-            
-            # Generate extraction summary
-            if catalog_links:
-                try:
-                    summary = self.generate_extraction_summary(catalog_links, data['satellite_catalog'])
-                    data['extraction_summary'] = summary
-                    print(f"    Smart Extraction Summary:")
-                    print(f"      • Total links discovered: {summary['total_links_discovered']}")
-                    print(f"      • Junk links filtered: {summary['junk_links_filtered']}")
-                    print(f"      • Clean catalog links: {summary['total_links']}")
-                    print(f"      • Links by type: {', '.join([f'{k}: {v}' for k, v in summary['links_by_type'].items()])}")
-                    print(f"      • Confidence: {summary['extraction_confidence']}")
-                    print(f"      • Completeness: {summary['data_completeness']:.1f}%")
-                    print(f"      • Quality: {summary['extraction_quality']}")
-                    if summary['junk_examples']:
-                        print(f"      • Junk examples: {', '.join(summary['junk_examples'][:3])}")
-                    if summary['recommendations']:
-                        print(f"      • Recommendations: {', '.join(summary['recommendations'][:2])}")
-                    _log_json('extraction_summary', **summary)
-                except Exception as e:
-                    print(f"      Error generating extraction summary: {e}")
-                    data['extraction_summary'] = {}
-                    _logger.exception("summary_error")
-            
-            return data
-            
-        except Exception as e:
-            print(f" Critical error in extract_all_data: {e}")
-            _logger.exception("extract_all_data_critical_error")
-            # Return minimal data structure
-            return {
-                'file_path': file_path,
-                'timestamp': datetime.now().isoformat(),
-                'title': 'Extraction Failed',
-                'satellite_catalog': {},
-                'catalog_links': [],
-                'thumbnails': [],
-                'extraction_metadata': {'error': str(e)}
-            }
-    
-    def extract_links_from_container(self, container, catalog_links):
-        """Extract links from a catalog container with smart classification"""
-        # Look for links within the container
-        links = container.find_all('a', href=True)
-        
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            
-            # Skip navigation and utility links
-            if self.is_navigation_link(href, text):
-                continue
-            
-            # Check if this is a dataset link
-            if self.is_dataset_link(href, text):
-                # Find associated thumbnail
-                thumbnail = self.find_thumbnail_for_link(link, container)
-                
-                catalog_link = {
-                    'text': text,
-                    'href': href,
-                    'title': link.get('title', ''),
-                    'thumbnail': thumbnail,
-                    'is_catalog_item': True,
-                    'link_type': self.classify_link_type(href, text),
-                    'extraction_priority': self.calculate_link_priority(href, text)
-                }
-                catalog_links.append(catalog_link)
-    
-    def extract_links_generally(self, soup, catalog_links):
-        """Extract links using general patterns when no containers found"""
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            
-            # Look for satellite/dataset links
-            if any(keyword in href.lower() for keyword in ['dataset', 'catalog', 'satellite', 'collection', 'product']):
-                # Find associated thumbnail
-                thumbnail = self.find_thumbnail_for_link(link, soup)
-                
-                catalog_link = {
-                    'text': text,
-                    'href': href,
-                    'title': link.get('title', ''),
-                    'thumbnail': thumbnail,
-                    'is_catalog_item': True,
-                    'link_type': self.classify_link_type(href, text),
-                    'extraction_priority': self.calculate_link_priority(href, text)
-                }
-                catalog_links.append(catalog_link)
-    
-    def is_navigation_link(self, href, text):
-        """Check if a link is navigation/utility rather than dataset content"""
-        navigation_keywords = [
-            'home', 'about', 'contact', 'help', 'support', 'login', 'signup',
-            'documentation', 'api', 'tutorial', 'forum', 'blog', 'news',
-            'privacy', 'terms', 'cookies', 'feedback', 'report'
-        ]
-        
-        # Check href for navigation patterns
-        if any(keyword in href.lower() for keyword in navigation_keywords):
-            return True
-        
-        # Check text for navigation patterns
-        if any(keyword in text.lower() for keyword in navigation_keywords):
-            return True
-        
-        # Check for common navigation patterns
-        if href.startswith('#') or href == '/' or href == '':
-            return True
-        
-        # Check for social media and external junk links
-        if self.is_social_media_link(href, text):
-            return True
-        
-        # Check for utility and non-content links
-        if self.is_utility_link(href, text):
-            return True
-        
-        return False
-    
-    def is_social_media_link(self, href, text):
-        """Check if a link is social media or external junk"""
-        social_media_patterns = [
-            'facebook.com', 'twitter.com', 'x.com', 'instagram.com', 'linkedin.com',
-            'youtube.com', 'reddit.com', 'github.com', 'stackoverflow.com',
-            'medium.com', 'dev.to', 'hashnode.dev', 'substack.com',
-            'discord.com', 'slack.com', 'telegram.org', 'whatsapp.com',
-            'tiktok.com', 'snapchat.com', 'pinterest.com', 'tumblr.com'
-        ]
-        
-        # Check href for social media domains
-        if any(domain in href.lower() for domain in social_media_patterns):
-            return True
-        
-        # Check for social media icons/text
-        social_indicators = [
-            'follow us', 'like us', 'share', 'tweet', 'post', 'comment',
-            'social', 'community', 'connect', 'join us', 'subscribe'
-        ]
-        
-        if any(indicator in text.lower() for indicator in social_indicators):
-            return True
-        
-        return False
-    
-    def is_utility_link(self, href, text):
-        """Check if a link is utility/non-content"""
-        utility_patterns = [
-            'javascript:', 'mailto:', 'tel:', 'sms:', 'ftp://',
-            'chrome://', 'about:', 'data:', 'file://', 'view-source:'
-        ]
-        
-        # Check for utility protocols
-        if any(pattern in href.lower() for pattern in utility_patterns):
-            return True
-        
-        # Check for utility text
-        utility_indicators = [
-            'print', 'download', 'export', 'save', 'bookmark', 'favorite',
-            'share', 'email', 'copy link', 'permalink', 'qr code',
-            'accessibility', 'language', 'translate', 'search', 'filter',
-            'sort', 'refresh', 'reload', 'back', 'forward', 'close'
-        ]
-        
-        if any(indicator in text.lower() for indicator in utility_indicators):
-            return True
-        
-        return False
-    
-    def is_dataset_link(self, href, text):
-        """Check if a link points to a dataset/satellite page"""
-        dataset_keywords = [
-            'dataset', 'catalog', 'satellite', 'collection', 'product', 'layer',
-            'imagery', 'data', 'coverage', 'temporal', 'spatial'
-        ]
-        
-        # Check href for dataset patterns
-        if any(keyword in href.lower() for keyword in dataset_keywords):
-            return True
-        
-        # Check text for dataset patterns
-        if any(keyword in text.lower() for keyword in dataset_keywords):
-            return True
-        
-        # Check for Earth Engine specific patterns
-        if '/datasets/' in href or '/collections/' in href:
-            return True
-        
-        return False
-    
-    def find_thumbnail_for_link(self, link, container):
-        """Find thumbnail image associated with a link"""
-        thumbnail = None
-        
-        # Look for thumbnail in the link itself
-        thumbnail = link.find('img')
-        if thumbnail:
-            return {
-                'src': thumbnail.get('src', ''),
-                'alt': thumbnail.get('alt', ''),
-                'title': thumbnail.get('title', ''),
-                'width': thumbnail.get('width', ''),
-                'height': thumbnail.get('height', '')
-            }
-        
-        # Look for thumbnail in parent container
-        parent = link.parent
-        if parent:
-            thumbnail = parent.find('img')
-            if thumbnail:
-                return {
-                    'src': thumbnail.get('src', ''),
-                    'alt': thumbnail.get('alt', ''),
-                    'title': thumbnail.get('title', ''),
-                    'width': thumbnail.get('width', ''),
-                    'height': thumbnail.get('height', '')
-                }
-        
-        # Look for thumbnail in sibling elements
-        siblings = link.find_next_siblings()
-        for sibling in siblings:
-            if sibling.name == 'img':
-                return {
-                    'src': sibling.get('src', ''),
-                    'alt': sibling.get('alt', ''),
-                    'title': sibling.get('title', ''),
-                    'width': sibling.get('width', ''),
-                    'height': sibling.get('height', '')
-                }
-        
-        return None
-    
-    def classify_link_type(self, href, text):
-        """Classify the type of catalog link"""
-        href_lower = href.lower()
-        text_lower = text.lower()
-        
-        # Satellite/Platform links
-        if any(word in href_lower for word in ['satellite', 'platform', 'sensor', 'instrument']):
-            return 'satellite_info'
-        
-        # Dataset/Collection links (prefer catalog pages, exclude tag/tag-like pages)
-        if ('/datasets/catalog/' in href_lower) or any(word in href_lower for word in ['dataset', 'collection', 'product']):
-            if '/datasets/tags/' in href_lower or '/tags/' in href_lower:
-                return 'tag_page'
-            return 'dataset_detail'
-        
-        # Imagery/Data links
-        if any(word in href_lower for word in ['imagery', 'data', 'coverage']):
-            return 'data_coverage'
-        
-        # Documentation links
-        if any(word in href_lower for word in ['docs', 'documentation', 'guide', 'tutorial']):
-            return 'documentation'
-        
-        # API/Technical links
-        if any(word in href_lower for word in ['api', 'code', 'example', 'snippet']):
-            return 'technical'
-        
-        return 'general'
-    
-    def calculate_link_priority(self, href, text):
-        """Calculate extraction priority for a link"""
-        priority = 0
-        
-        # High priority for dataset/collection links
-        if any(word in href.lower() for word in ['dataset', 'collection', 'product']):
-            priority += 10
-        
-        # High priority for satellite/sensor links
-        if any(word in href.lower() for word in ['satellite', 'sensor', 'instrument']):
-            priority += 8
-        
-        # Medium priority for imagery/data links
-        if any(word in href.lower() for word in ['imagery', 'data', 'coverage']):
-            priority += 6
-        
-        # Lower priority for documentation
-        if any(word in href.lower() for word in ['docs', 'documentation', 'guide']):
-            priority += 3
-        
-        # Bonus for Earth Engine specific URLs
-        if '/datasets/' in href or '/collections/' in href:
-            priority += 5
-        
-        return priority
-    
-    def classify_catalog_links(self, catalog_links):
-        """Classify and organize catalog links by type and priority - Enhanced junk filtering"""
-        if not catalog_links:
-            return
-        
-        # Filter out junk links before classification
-        print("      Filtering out junk links...")
-        junk_links = []
-        clean_links = []
-        
-        for link in catalog_links:
-            href = link.get('href', '')
-            text = link.get('text', '')
-            
-            if self.is_junk_link(href, text):
-                junk_links.append(link)
-            else:
-                clean_links.append(link)
-        
-        # Report junk filtering results
-        print(f"      Filtered out {len(junk_links)} junk links")
-        print(f"     ✨ Kept {len(clean_links)} clean catalog links")
-        
-        if junk_links:
-            print("      Junk link examples:")
-            for junk in junk_links[:5]:  # Show first 5 junk examples
-                print(f"        • {junk['text'][:50]}... ({junk['href'][:50]}...)")
-        
-        # Sort clean links by priority
-        clean_links.sort(key=lambda x: x.get('extraction_priority', 0), reverse=True)
-        
-        # Group by type
-        link_types = {}
-        for link in clean_links:
-            link_type = link.get('link_type', 'general')
-            if link_type not in link_types:
-                link_types[link_type] = []
-            link_types[link_type].append(link)
-        
-        # Print classification summary
-        print("      Clean catalog link classification:")
-        for link_type, links in link_types.items():
-            print(f"       • {link_type.title()}: {len(links)} links")
-        
-        # Print high-priority links
-        high_priority = [link for link in clean_links if link.get('extraction_priority', 0) >= 8]
-        if high_priority:
-            print(f"      High-priority clean links ({len(high_priority)}):")
-            for link in high_priority[:5]:  # Show first 5
-                print(f"       • {link['text'][:50]}... (Priority: {link['extraction_priority']})")
-        
-        # Update the catalog_links list to only contain clean links
-        catalog_links.clear()
-        catalog_links.extend(clean_links)
-    
-    def is_junk_link(self, href, text):
-        """Comprehensive junk link detection - Less aggressive to capture all datasets"""
-        # Only filter out obviously non-dataset links
-        # Check for all types of junk
-        if self.is_navigation_link(href, text):
-            return True
-        
-        if self.is_social_media_link(href, text):
-            return True
-        
-        if self.is_utility_link(href, text):
-            return True
-        
-        # Only filter external junk if it's clearly not a dataset
-        if self.is_external_junk_domain(href) and not self.looks_like_dataset_link(href, text):
-            return True
-        
-        # Don't filter out links that might be datasets
-        if self.is_clearly_not_dataset(href, text):
-            return False  # Changed from True to False - be less aggressive
-        
-        # Don't filter out advertisement/tracking if they might be dataset links
-        if self.is_advertisement_link(href, text) and not self.looks_like_dataset_link(href, text):
-            return True
-        
-        if self.is_tracking_link(href, text) and not self.looks_like_dataset_link(href, text):
-            return True
-        
-        if self.is_broken_link(href, text):
-            return True
-        
-        return False
-    
-    def is_advertisement_link(self, href, text):
-        """Check if a link is an advertisement"""
-        ad_patterns = [
-            'ad', 'advertisement', 'sponsor', 'sponsored', 'promotion',
-            'banner', 'click', 'offer', 'deal', 'discount', 'sale',
-            'affiliate', 'referral', 'tracking', 'analytics'
-        ]
-        
-        # Check href for ad patterns
-        if any(pattern in href.lower() for pattern in ad_patterns):
-            return True
-        
-        # Check text for ad patterns
-        if any(pattern in text.lower() for pattern in ad_patterns):
-            return True
-        
-        return False
-    
-    def is_tracking_link(self, href, text):
-        """Check if a link is a tracking/analytics link"""
-        tracking_patterns = [
-            'utm_', 'gclid', 'fbclid', 'msclkid', 'ref_',
-            'source=', 'medium=', 'campaign=', 'term=', 'content=',
-            'tracking', 'analytics', 'pixel', 'beacon', 'tag'
-        ]
-        
-        # Check href for tracking parameters
-        if any(pattern in href.lower() for pattern in tracking_patterns):
-            return True
-        
-        return False
-    
-    def is_broken_link(self, href, text):
-        """Check if a link appears to be broken"""
-        broken_patterns = [
-            'javascript:void(0)', 'javascript:;', '#', 'javascript:',
-            'mailto:', 'tel:', 'sms:', 'ftp://', 'chrome://',
-            'about:', 'data:', 'file://', 'view-source:'
-        ]
-        
-        # Check for broken link patterns
-        if any(pattern in href.lower() for pattern in broken_patterns):
-            return True
-        
-        # Check for empty or placeholder links
-        if not href or href.strip() == '' or href.strip() == '#':
-            return True
-        
-        return False
-    
-    def save_local_image_reference(self, img_src, base_file_path):
-        """Save reference to local image (don't download external ones)"""
-        try:
-            # Only process local image references
-            if img_src.startswith('http'):
-                return None
-            
-            # Generate filename for reference
-            filename = f"local_img_{int(time.time() * 1000)}_{hash(img_src) % 10000}.txt"
-            filepath = os.path.join(self.thumbnails_dir, filename)
-            
-            # Save image reference info
-            img_info = {
-                'original_src': img_src,
-                'base_file': base_file_path,
-                'timestamp': datetime.now().isoformat(),
-                'note': 'Local image reference - not downloaded'
-            }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(img_info, f, indent=2, ensure_ascii=False)
-            
-            return filepath
-            
-        except Exception as e:
-            print(f"Failed to save local image reference {img_src}: {e}")
-            return None
-    
-    def save_data_to_json(self, data, file_path):
-        """Save extracted data to individual JSON file"""
-        try:
-            # Create safe filename from file path
-            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', os.path.basename(file_path))
-            safe_filename = safe_filename[:200]  # Limit length
-            
-            # Add timestamp to ensure uniqueness
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_{safe_filename}.json"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            _logger.info(f"save_json:start path={filepath}")
-            _log_json('save_json_start', file=file_path, out=filepath)
-            
-            # Save to JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            _logger.info(f"save_json:done path={filepath}")
-            _log_json('save_json_done', out=filepath, size_bytes=os.path.getsize(filepath))
-            return filepath
-            
-        except Exception as e:
-            print(f"Failed to save data for {file_path}: {e}")
-            try:
-                _logger.exception("save_json_error")
-                _log_json('save_json_error', file=file_path, error=str(e))
-            except Exception:
-                pass
-            return None
-
-    def save_satellite_catalog_data(self, satellite_data, satellite_name):
-        """Save satellite catalog data organized by satellite"""
-        try:
-            # Create satellite catalog file
-            catalog_file = os.path.join(self.output_dir, "satellite_catalog.json")
-            
-            # Load existing catalog if it exists
-            existing_catalog = {}
-            if os.path.exists(catalog_file):
-                try:
-                    with open(catalog_file, 'r', encoding='utf-8') as f:
-                        existing_catalog = json.load(f)
-                except:
-                    existing_catalog = {}
-            
-            # Add or update satellite data
-            if satellite_name not in existing_catalog:
-                existing_catalog[satellite_name] = []
-            
-            # Add timestamp to the data
-            satellite_data['extraction_timestamp'] = datetime.now().isoformat()
-            existing_catalog[satellite_name].append(satellite_data)
-            
-            # Save updated catalog
-            with open(catalog_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_catalog, f, indent=2, ensure_ascii=False)
-            
-            print(f" Saved satellite data for {satellite_name} to catalog")
-            return catalog_file
-            
-        except Exception as e:
-            print(f"Failed to save satellite catalog data for {satellite_name}: {e}")
-            return None
-
-    def categorize_content(self, soup, data):
-        """Categorize content into meaningful groups"""
-        print("    Categorizing content into groups...")
-        
-        categories = {
-            'navigation': [],
-            'main_content': [],
-            'sidebar': [],
-            'footer': [],
-            'header': [],
-            'metadata': [],
-            'interactive_elements': [],
-            'media_content': [],
-            'data_tables': [],
-            'forms_and_inputs': []
-        }
-        
-        # Categorize links by purpose
-        print("      Categorizing links...")
-        for link in data['links']:
-            link_text = link.get('text', '').lower()
-            href = link.get('href', '').lower()
-            
-            if any(word in link_text for word in ['home', 'main', 'index', 'start']):
-                categories['navigation'].append(link)
-            elif any(word in href for word in ['nav', 'menu', 'navigation']):
-                categories['navigation'].append(link)
-            elif any(word in link_text for word in ['contact', 'about', 'help', 'support']):
-                categories['footer'].append(link)
-            elif any(word in link_text for word in ['login', 'sign', 'register', 'submit']):
-                categories['interactive_elements'].append(link)
-            else:
-                categories['main_content'].append(link)
-        
-        print(f"        Navigation: {len(categories['navigation'])} links")
-        print(f"        Main content: {len(categories['main_content'])} links")
-        print(f"        Footer: {len(categories['footer'])} links")
-        print(f"        Interactive: {len(categories['interactive_elements'])} links")
-        
-        # Categorize images by type
-        print("      Categorizing images...")
-        for img in data['images']:
-            img_src = img.get('src', '').lower()
-            alt_text = img.get('alt', '').lower()
-            
-            if any(word in alt_text for word in ['logo', 'brand', 'header']):
-                categories['header'].append(img)
-            elif any(word in alt_text for word in ['icon', 'button', 'arrow']):
-                categories['navigation'].append(img)
-            elif any(word in img_src for word in ['chart', 'graph', 'diagram']):
-                categories['data_tables'].append(img)
-            else:
-                categories['media_content'].append(img)
-        
-        print(f"        Header images: {len(categories['header'])}")
-        print(f"        Navigation images: {len(categories['navigation'])}")
-        print(f"        Data images: {len(categories['data_tables'])}")
-        print(f"        Media images: {len(categories['media_content'])}")
-        
-        # Categorize forms
-        categories['forms_and_inputs'] = data['forms']
-        print(f"      Forms: {len(categories['forms_and_inputs'])}")
-        
-        # Categorize tables
-        categories['data_tables'] = data['tables']
-        print(f"      Tables: {len(categories['data_tables'])}")
-        
-        # Categorize headings by hierarchy
-        print("      Categorizing headings...")
-        for heading in data['headings']:
-            if heading.get('level') in ['h1', 'h2']:
-                categories['header'].append(heading)
-            elif heading.get('level') in ['h3', 'h4']:
-                categories['main_content'].append(heading)
-            else:
-                categories['sidebar'].append(heading)
-        
-        print(f"        Header headings: {len([h for h in categories['header'] if isinstance(h, dict) and h.get('level') in ['h1', 'h2']])}")
-        print(f"        Main headings: {len([h for h in categories['main_content'] if isinstance(h, dict) and h.get('level') in ['h3', 'h4']])}")
-        print(f"        Sidebar headings: {len([h for h in categories['sidebar'] if isinstance(h, dict) and h.get('level') not in ['h1', 'h2', 'h3', 'h4']])}")
-        
-        print("    Content categorization completed")
-        return categories
-    
-    def analyze_semantics(self, soup, data):
-        """Analyze semantic meaning of content"""
-        semantics = {
-            'topics': [],
-            'keywords': [],
-            'entities': [],
-            'sentiment': 'neutral',
-            'language': 'en',
-            'content_type': 'unknown',
-            'subject_matter': 'general'
-        }
-        
-        # Extract keywords from text
-        text = data['raw_text'].lower()
-        words = re.findall(r'\b\w+\b', text)
-        word_freq = {}
-        
-        for word in words:
-            if len(word) > 3:  # Skip short words
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Get top keywords
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        semantics['keywords'] = [word for word, freq in sorted_words[:20]]
-        
-        # Detect content type
-        if any(word in text for word in ['dataset', 'catalog', 'earth engine', 'satellite']):
-            semantics['content_type'] = 'earth_engine_data'
-            semantics['subject_matter'] = 'geospatial_data'
-        elif any(word in text for word in ['tutorial', 'guide', 'help', 'documentation']):
-            semantics['content_type'] = 'documentation'
-            semantics['subject_matter'] = 'educational'
-        elif any(word in text for word in ['api', 'reference', 'endpoint', 'parameter']):
-            semantics['content_type'] = 'api_reference'
-            semantics['subject_matter'] = 'technical'
-        
-        # Detect language (simple detection)
-        if any(word in text for word in ['the', 'and', 'for', 'with']):
-            semantics['language'] = 'en'
-        
-        return semantics
-    
-    # Old analyze_structure method removed - no longer needed for satellite catalog extraction
-    
-    def generate_content_summary(self, data):
-        """Generate comprehensive content summary"""
-        summary = {
-            'total_elements': 0,
-            'content_distribution': {},
-            'richness_score': 0,
-            'interactivity_level': 'low',
-            'media_richness': 'low',
-            'data_density': 'low',
-            'overall_complexity': 'simple'
-        }
-        
-        # Calculate total elements
-        summary['total_elements'] = (
-            len(data['links']) + 
-            len(data['images']) + 
-            len(data['forms']) + 
-            len(data['tables']) + 
-            len(data['lists']) + 
-            len(data['headings']) + 
-            len(data['paragraphs'])
-        )
-        
-        # Content distribution
-        summary['content_distribution'] = {
-            'text_content': len(data['paragraphs']) + len(data['headings']),
-            'interactive_elements': len(data['forms']) + len(data['links']),
-            'media_elements': len(data['images']),
-            'data_structures': len(data['tables']) + len(data['lists'])
-        }
-        
-        # Calculate richness scores
-        if summary['total_elements'] > 100:
-            summary['overall_complexity'] = 'very_complex'
-        elif summary['total_elements'] > 50:
-            summary['overall_complexity'] = 'complex'
-        elif summary['total_elements'] > 20:
-            summary['overall_complexity'] = 'moderate'
-        else:
-            summary['overall_complexity'] = 'simple'
-        
-        # Media richness
-        if len(data['images']) > 20:
-            summary['media_richness'] = 'very_high'
-        elif len(data['images']) > 10:
-            summary['media_richness'] = 'high'
-        elif len(data['images']) > 5:
-            summary['media_richness'] = 'moderate'
-        else:
-            summary['media_richness'] = 'low'
-        
-        # Interactivity level
-        if len(data['forms']) > 5 or len(data['links']) > 50:
-            summary['interactivity_level'] = 'very_high'
-        elif len(data['forms']) > 2 or len(data['links']) > 25:
-            summary['interactivity_level'] = 'high'
-        elif len(data['forms']) > 0 or len(data['links']) > 10:
-            summary['interactivity_level'] = 'moderate'
-        else:
-            summary['interactivity_level'] = 'low'
-        
-        # Data density
-        if len(data['tables']) > 5 or len(data['lists']) > 20:
-            summary['data_density'] = 'very_high'
-        elif len(data['tables']) > 2 or len(data['lists']) > 10:
-            summary['data_density'] = 'high'
-        elif len(data['tables']) > 0 or len(data['lists']) > 5:
-            summary['data_density'] = 'moderate'
-        else:
-            summary['data_density'] = 'low'
-        
-        return summary
-
-    def extract_satellite_data(self, soup, data):
-        """Extract satellite catalog data with smart classification based on Earth Engine catalog structure"""
-        print("    Starting smart satellite catalog data extraction...")
-        
-        satellite_data = {
-            'layer_name': '',
-            'date_range': {'start': '', 'end': ''},
-            'satellites_used': [],
-            'location': '',
-            'gee_code_snippet': '',
-            'thumbnails': [],
-            'band_information': [],
-            'category_tags': [],
-            'dataset_provider': '',
-            'pixel_size': '',
-            'citations': [],
-            'description': '',
-            'terms_of_use': '',
-            'doi': '',
-            'extraction_confidence': 'low',
-            'detected_page_type': 'unknown'
-        }
-        
-        # Smart page type detection
-        page_type = self.detect_page_type(soup)
-        satellite_data['detected_page_type'] = page_type
-        print(f"      Detected page type: {page_type}")
-        
-        # Extract based on page type
-        if page_type == 'catalog_main':
-            self.extract_from_catalog_main(soup, satellite_data)
-        elif page_type == 'dataset_detail':
-            self.extract_from_dataset_detail(soup, satellite_data)
-        elif page_type == 'satellite_info':
-            self.extract_from_satellite_info(soup, satellite_data)
-        else:
-            self.extract_generic_data(soup, satellite_data)
-        
-        # Calculate extraction confidence
-        satellite_data['extraction_confidence'] = self.calculate_extraction_confidence(satellite_data)
-        
-        return satellite_data
-    
-    def detect_page_type(self, soup):
-        """Detect the type of Earth Engine page based on content and structure"""
-        text_content = soup.get_text().lower()
-
-        # Prefer canonical URL hints first
-        canonical = soup.find('link', rel='canonical')
-        if canonical:
-            href = canonical.get('href', '')
-            if '/earth-engine/datasets/catalog/' in href:
-                return 'dataset_detail'
-            if '/earth-engine/datasets' in href and href.rstrip('/').endswith('datasets'):
-                return 'catalog_main'
-
-        # Dataset detail: look for strong EE detail markers
-        dataset_detail_markers = [
-            'earth engine snippet',
-            'dataset availability',
-            'dataset provider',
-            'citations',
-            'doi',
-            'tags',
-            'bands',
-            'pixel size',
-            'resolution',
-            'explore with earth engine',
-            'open in code editor'
-        ]
-        if any(marker in text_content for marker in dataset_detail_markers):
-            return 'dataset_detail'
-
-        # Dataset detail: presence of ee.* code blocks
-        code_blocks = soup.find_all(['pre', 'code'])
-        for cb in code_blocks:
-            if 'ee.' in cb.get_text():
-                return 'dataset_detail'
-
-        # Main catalog indicators (checked after dataset detail to avoid false positives)
-        if any(phrase in text_content for phrase in [
-            'earth engine data catalog',
-            'dataset catalog',
-            'satellite catalog',
-            'collection catalog'
-        ]):
-            return 'catalog_main'
-
-        # Satellite information page
-        if any(phrase in text_content for phrase in [
-            'satellite information',
-            'sensor details',
-            'instrument details',
-            'platform information'
-        ]):
-            return 'satellite_info'
-
-        return 'unknown'
-    
-    def extract_from_catalog_main(self, soup, satellite_data):
-        """Extract data from main catalog page with thumbnail grid - Enhanced for Earth Engine"""
-        print("      Extracting from main catalog page with Earth Engine intelligence...")
-
-        # First try Earth Engine specific extraction
-        ee_datasets = self.extract_earth_engine_catalog(soup)
-        if ee_datasets:
-            print(f"      Found {len(ee_datasets)} Earth Engine datasets using intelligent extraction")
-
-            # Classify the datasets intelligently
-            classifications = self.classify_earth_engine_datasets(ee_datasets)
-
-            satellite_data['datasets'] = ee_datasets
-            satellite_data['classifications'] = classifications
-            satellite_data['extraction_method'] = 'earth_engine_intelligent'
-            satellite_data['extraction_confidence'] = 'high'
-
-            # Log classification summary
-            for category, items in classifications.items():
-                if items:
-                    print(f"        {category.title()}: {len(items)} datasets")
-
-            return
-
-        # Fallback to generic extraction if Earth Engine patterns not found
-        print("      Earth Engine patterns not detected, using generic extraction...")
-        catalog_items = soup.find_all(['div', 'article', 'section'], class_=re.compile(r'catalog|item|dataset|collection'))
-        
-        for item in catalog_items:
-            # Extract thumbnail and link
-            thumbnail = item.find('img')
-            if thumbnail:
-                thumbnail_data = {
-                    'src': thumbnail.get('src', ''),
-                    'alt': thumbnail.get('alt', ''),
-                    'title': thumbnail.get('title', ''),
-                    'width': thumbnail.get('width', ''),
-                    'height': thumbnail.get('height', '')
-                }
-                satellite_data['thumbnails'].append(thumbnail_data)
-            
-            # Extract dataset name from heading or link
-            heading = item.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            if heading:
-                satellite_data['layer_name'] = heading.get_text().strip()
-                break
-            
-            # Extract from link text
-            link = item.find('a')
-            if link and not satellite_data['layer_name']:
-                satellite_data['layer_name'] = link.get_text().strip()
-        
-        # Extract provider from page metadata
-        provider_meta = soup.find('meta', attrs={'name': re.compile(r'provider|organization|institution', re.I)})
-        if provider_meta:
-            satellite_data['dataset_provider'] = provider_meta.get('content', '')
-        
-        # Extract description from meta description
-        desc_meta = soup.find('meta', attrs={'name': 'description'})
-        if desc_meta:
-            satellite_data['description'] = desc_meta.get('content', '')
-    
-    def extract_from_dataset_detail(self, soup, satellite_data):
-        """Extract data from detailed dataset page - Enhanced for Earth Engine structure"""
-        print("      Extracting from dataset detail page...")
-        
-        # Extract dataset name from main heading
-        main_heading = soup.find(['h1', 'h2'], class_=re.compile(r'main|title|dataset'))
-        if main_heading:
-            satellite_data['layer_name'] = main_heading.get_text().strip()
-        
-        # Look for Earth Engine specific data structure
-        self.extract_earth_engine_metadata(soup, satellite_data)
-        
-        # Look for structured data sections
-        sections = soup.find_all(['section', 'div'], class_=re.compile(r'section|info|details'))
-        
-        for section in sections:
-            section_text = section.get_text().lower()
-            section_title = section.find(['h2', 'h3', 'h4'])
-            title_text = section_title.get_text().lower() if section_title else ''
-            
-            # Temporal coverage section
-            if any(word in title_text for word in ['temporal', 'time', 'date', 'coverage', 'availability']):
-                self.extract_temporal_data(section, satellite_data)
-            
-            # Spatial coverage section
-            elif any(word in title_text for word in ['spatial', 'coverage', 'extent', 'boundary']):
-                self.extract_spatial_data(section, satellite_data)
-            
-            # Technical specifications section
-            elif any(word in title_text for word in ['technical', 'specifications', 'bands', 'resolution']):
-                self.extract_technical_data(section, satellite_data)
-            
-            # Provider information section
-            elif any(word in title_text for word in ['provider', 'source', 'organization']):
-                self.extract_provider_data(section, satellite_data)
-        
-        # Extract GEE code examples
-        code_blocks = soup.find_all(['code', 'pre'], class_=re.compile(r'example|code|snippet'))
-        for code in code_blocks:
-            code_text = code.get_text()
-            if any(word in code_text.lower() for word in ['ee.', 'earth engine', 'dataset', 'collection']):
-                satellite_data['gee_code_snippet'] = code_text.strip()
-                break
-        
-        # Extract DOI and citations
-        self.extract_citation_data(soup, satellite_data)
-    
-    def extract_earth_engine_metadata(self, soup, satellite_data):
-        """Extract Earth Engine specific metadata structure - Enhanced based on actual HTML structure"""
-        print("      Extracting Earth Engine metadata...")
-        
-        try:
-            # Method 1: Look for specific text patterns in the entire page
-            page_text = soup.get_text()
-            
-            # Extract dataset availability (date range) - Look for ISO date format
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}Z\s*-\s*(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}Z',
-                r'(\d{4}-\d{2}-\d{2})\s*to\s*(\d{4}-\d{2}-\d{2})',
-                r'(\d{4}-\d{2}-\d{2})\s*-\s*(\d{4}-\d{2}-\d{2})'
-            ]
-            
-            for pattern in date_patterns:
-                try:
-                    matches = re.findall(pattern, page_text)
-                    if matches:
-                        satellite_data['date_range']['start'] = matches[0][0]
-                        satellite_data['date_range']['end'] = matches[0][1]
-                        print(f"        Found date range: {matches[0][0]} to {matches[0][1]}")
-                        break
-                except re.error as e:
-                    print(f"        Regex error in date pattern: {e}")
-                    continue
-            
-            # Extract dataset provider - Look for common providers
-            provider_patterns = [
-                r'provider[:\s]+([^.\n]+)',
-                r'managed by[:\s]+([^.\n]+)',
-                r'hosted by[:\s]+([^.\n]+)',
-                r'produced by[:\s]+([^.\n]+)',
-                r'developed by[:\s]+([^.\n]+)'
-            ]
-            
-            for pattern in provider_patterns:
-                try:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        provider = matches[0].strip()
-                        if len(provider) > 2 and provider.lower() not in ['unknown', 'n/a', 'none']:
-                            satellite_data['dataset_provider'] = provider
-                            print(f"       🏢 Found provider: {provider}")
-                            break
-                except re.error as e:
-                    print(f"        Regex error in provider pattern: {e}")
-                    continue
-            
-            # Method 2: Look for specific HTML structures
-            # Look for dataset availability label
-            availability_elements = soup.find_all(string=re.compile(r'Dataset Availability', re.I))
-            for element in availability_elements:
-                parent = element.parent
-                if parent:
-                    # Look for the next sibling or parent that contains the date
-                    date_container = parent.find_next_sibling() or parent.parent
-                    if date_container:
-                        date_text = date_container.get_text()
-                        for pattern in date_patterns:
-                            try:
-                                matches = re.findall(pattern, date_text)
-                                if matches and not satellite_data['date_range']['start']:
-                                    satellite_data['date_range']['start'] = matches[0][0]
-                                    satellite_data['date_range']['end'] = matches[0][1]
-                                    print(f"        Found date range from structure: {matches[0][0]} to {matches[0][1]}")
-                                    break
-                            except re.error as e:
-                                print(f"        Regex error in date structure pattern: {e}")
-                                continue
-            
-            # Look for dataset provider label
-            provider_elements = soup.find_all(string=re.compile(r'Dataset Provider', re.I))
-            for element in provider_elements:
-                parent = element.parent
-                if parent:
-                    # Look for provider name in nearby elements
-                    provider_container = parent.find_next_sibling() or parent.parent
-                    if provider_container:
-                        provider_text = provider_container.get_text()
-                        try:
-                            provider_match = re.search(r'([A-Z][a-zA-Z\s&]+)', provider_text)
-                            if provider_match:
-                                provider = provider_match.group(1).strip()
-                                if len(provider) > 2 and provider.lower() not in ['unknown', 'n/a', 'none']:
-                                    satellite_data['dataset_provider'] = provider
-                                    print(f"       🏢 Found provider from structure: {provider}")
-                                    break
-                        except re.error as e:
-                            print(f"        Regex error in provider structure pattern: {e}")
-                            continue
-            
-            # Look for Earth Engine snippet
-            snippet_elements = soup.find_all(string=re.compile(r'Earth Engine Snippet', re.I))
-            for element in snippet_elements:
-                parent = element.parent
-                if parent:
-                    # Look for code in the same container
-                    code_element = parent.find(['code', 'pre'])
-                    if code_element:
-                        snippet = code_element.get_text().strip()
-                        if 'ee.' in snippet or 'ImageCollection' in snippet:
-                            satellite_data['gee_code_snippet'] = snippet
-                            print(f"       💻 Found GEE snippet: {snippet[:50]}...")
-                            break
-            
-            # Method 3: Look for common Earth Engine patterns
-            # Look for any code blocks that contain Earth Engine code
-            code_blocks = soup.find_all(['code', 'pre'])
-            for code in code_blocks:
-                code_text = code.get_text()
-                if ('ee.' in code_text or 'ImageCollection' in code_text) and not satellite_data.get('gee_code_snippet'):
-                    satellite_data['gee_code_snippet'] = code_text.strip()
-                    print(f"       💻 Found GEE code block: {code_text[:50]}...")
-                    break
-            
-            # Look for tags/categories
-            tag_elements = soup.find_all(string=re.compile(r'Tags?', re.I))
-            for element in tag_elements:
-                parent = element.parent
-                if parent:
-                    # Look for tag elements in the same container
-                    tag_links = parent.find_all('a')
-                    if tag_links:
-                        tags = [tag.get_text().strip() for tag in tag_links if tag.get_text().strip()]
-                        if tags:
-                            satellite_data['category_tags'].extend(tags)
-                            print(f"        Found tags: {', '.join(tags)}")
-                            break
-            
-            # Look for pixel size/resolution
-            resolution_patterns = [
-                r'pixel size[:\s]+([^.\n]+)',
-                r'resolution[:\s]+([^.\n]+)',
-                r'spatial resolution[:\s]+([^.\n]+)'
-            ]
-            
-            for pattern in resolution_patterns:
-                try:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        satellite_data['pixel_size'] = matches[0].strip()
-                        print(f"        Found pixel size: {matches[0].strip()}")
-                        break
-                except re.error as e:
-                    print(f"        Regex error in resolution pattern: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"        Error in Earth Engine metadata extraction: {e}")
-            # Continue with basic extraction
-
-    def extract_earth_engine_catalog(self, soup):
-        """Intelligent extraction specifically designed for Earth Engine catalog structure"""
-        print("     Using Earth Engine intelligent extraction...")
-        datasets = []
-
-        # Target the specific Earth Engine dataset containers
-        ee_containers = soup.select('li.ee-sample-image.ee-cards.devsite-landing-row-item-description')
-
-        if not ee_containers:
-            # Try alternative selector patterns
-            ee_containers = soup.select('.ee-sample-image.ee-cards')
-            if not ee_containers:
-                ee_containers = soup.select('li.ee-sample-image')
-
-        if not ee_containers:
-            print("     No Earth Engine dataset containers found")
-            return None
-
-        print(f"     Found {len(ee_containers)} Earth Engine dataset containers")
-
-        for container in ee_containers:
-            dataset = self.extract_single_ee_dataset(container)
-            if dataset:
-                datasets.append(dataset)
-
-        return datasets if datasets else None
-
-    def extract_single_ee_dataset(self, container):
-        """Extract data from a single Earth Engine dataset container with enhanced data points"""
-        dataset = {
-            # Core Information
-            'dataset_id': '',
-            'title': '',
-            'description': '',
-            'url': '',
-            'thumbnail': '',
-            'thumbnail_local_path': '',
-
-            # Classification & Metadata
-            'tags': [],
-            'provider': '',
-            'keywords': [],
-            'collection_type': '',
-
-            # Temporal Information
-            'temporal_coverage': {
-                'start_date': '',
-                'end_date': '',
-                'update_frequency': '',
-                'revisit_time': ''
-            },
-
-            # Spatial Information
-            'spatial_info': {
-                'resolution': '',
-                'pixel_size': '',
-                'projection': '',
-                'geographic_extent': ''
-            },
-
-            # Spectral & Technical
-            'bands': [],
-            'spectral_info': '',
-            'processing_level': '',
-            'file_format': '',
-            'data_volume': '',
-
-            # Access & Legal
-            'license': '',
-            'doi': '',
-            'citations': [],
-            'terms_of_use': '',
-            'access_method': '',
-
-            # Quality Metrics
-            'confidence_score': 0,
-            'extraction_timestamp': datetime.now().isoformat(),
-            'data_completeness': 0
-        }
-
-        try:
-            # Extract title from h3[data-text] attribute (most reliable)
-            title_element = container.select_one('h3[data-text]')
-            if title_element:
-                dataset['title'] = title_element.get('data-text', '').strip()
-                dataset['confidence_score'] += 25
-
-                # Extract dataset ID from URL if available
-                link = container.select_one('a[href]')
-                if link:
-                    href = link.get('href', '')
-                    dataset['url'] = href
-                    dataset['confidence_score'] += 20
-
-                    # Extract dataset ID from URL pattern
-                    if '/catalog/' in href:
-                        dataset_id = href.split('/catalog/')[-1].split('?')[0].split('#')[0]
-                        dataset['dataset_id'] = dataset_id
-                        dataset['confidence_score'] += 20
-
-            # Extract description from specific class
-            desc_element = container.select_one('.ee-dataset-description-snippet')
-            if desc_element:
-                dataset['description'] = desc_element.get_text().strip()
-                dataset['confidence_score'] += 15
-
-            # Extract tags from ee-chip ee-tag elements
-            tag_elements = container.select('.ee-chip.ee-tag')
-            for tag_elem in tag_elements:
-                tag_text = tag_elem.get_text().strip()
-                if tag_text:
-                    dataset['tags'].append(tag_text)
-            if dataset['tags']:
-                dataset['confidence_score'] += 10
-
-            # Extract thumbnail image and download it locally
-            img_element = container.select_one('figure img')
-            if img_element:
-                thumbnail_url = img_element.get('src', '')
-                dataset['thumbnail'] = thumbnail_url
-
-                # Download thumbnail locally for real-time viewing
-                local_path = self.download_thumbnail(thumbnail_url, dataset.get('dataset_id', 'unknown'))
-                if local_path:
-                    dataset['thumbnail_local_path'] = local_path
-                    dataset['confidence_score'] += 10
-
-            # Extract enhanced metadata
-            self.extract_ee_enhanced_metadata(container, dataset)
-            self.extract_ee_metadata_from_comments(container, dataset)
-
-            # Calculate data completeness score
-            dataset['data_completeness'] = self.calculate_data_completeness(dataset)
-
-            # Only return dataset if we have minimum viable data
-            if dataset['title'] and dataset['confidence_score'] >= 30:
-                return dataset
-
-        except Exception as e:
-            print(f"     Error extracting single EE dataset: {e}")
-
-        return None
-
-    def extract_ee_metadata_from_comments(self, container, dataset):
-        """Extract metadata from HTML comments in Earth Engine dataset"""
-        try:
-            # Look for HTML comments containing metadata
-            html_str = str(container)
-
-            # Extract provider from comments
-            provider_match = re.search(r'<!--.*?provider[:\s]+([^-]+?)-->', html_str, re.IGNORECASE | re.DOTALL)
-            if provider_match:
-                dataset['provider'] = provider_match.group(1).strip()
-                dataset['confidence_score'] += 15
-
-            # Extract keywords from comments
-            keywords_match = re.search(r'<!--.*?keywords?[:\s]+([^-]+?)-->', html_str, re.IGNORECASE | re.DOTALL)
-            if keywords_match:
-                keywords_text = keywords_match.group(1).strip()
-                dataset['keywords'] = [kw.strip() for kw in keywords_text.split() if kw.strip()]
-                dataset['confidence_score'] += 10
-
-            # Extract collection type
-            collection_match = re.search(r'<!--.*?collection[_\s]type[:\s]+([^-]+?)-->', html_str, re.IGNORECASE | re.DOTALL)
-            if collection_match:
-                dataset['collection_type'] = collection_match.group(1).strip()
-                dataset['confidence_score'] += 10
-
-        except Exception as e:
-            print(f"     Error extracting metadata from comments: {e}")
-
-    def extract_ee_enhanced_metadata(self, container, dataset):
-        """Extract enhanced metadata from Earth Engine dataset container"""
-        try:
-            # Extract additional data from text content
-            text_content = container.get_text()
-
-            # Extract temporal information
-            self.extract_temporal_metadata(text_content, dataset)
-
-            # Extract spatial information
-            self.extract_spatial_metadata(text_content, dataset)
-
-            # Extract technical information
-            self.extract_technical_metadata(text_content, dataset)
-
-            # Extract access information
-            self.extract_access_metadata(text_content, dataset)
-
-        except Exception as e:
-            print(f"     Error extracting enhanced metadata: {e}")
-
-    def extract_temporal_metadata(self, text, dataset):
-        """Extract temporal coverage information"""
-        # Date range patterns
-        date_patterns = [
-            r'(\d{4}-\d{2}-\d{2}).*?to.*?(\d{4}-\d{2}-\d{2})',
-            r'(\d{4}).*?to.*?(\d{4})',
-            r'since\s+(\d{4})',
-            r'from\s+(\d{4})'
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if len(matches[0]) == 2:
-                    dataset['temporal_coverage']['start_date'] = matches[0][0]
-                    dataset['temporal_coverage']['end_date'] = matches[0][1]
-                else:
-                    dataset['temporal_coverage']['start_date'] = matches[0]
-                break
-
-        # Update frequency patterns
-        frequency_patterns = [
-            r'(daily|weekly|monthly|yearly|annual)',
-            r'every\s+(\d+\s+days?)',
-            r'(\d+)\s*day\s*repeat',
-            r'revisit.*?(\d+).*?days?'
-        ]
-
-        for pattern in frequency_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['temporal_coverage']['update_frequency'] = matches[0]
-                break
-
-    def extract_spatial_metadata(self, text, dataset):
-        """Extract spatial resolution and coverage information"""
-        # Resolution patterns
-        resolution_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:meter|m)\s*resolution',
-            r'(\d+)\s*m\s*pixel',
-            r'(\d+(?:\.\d+)?)\s*km\s*resolution',
-            r'resolution.*?(\d+(?:\.\d+)?)\s*(?:meter|m|km)'
-        ]
-
-        for pattern in resolution_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['spatial_info']['resolution'] = f"{matches[0]}m"
-                dataset['spatial_info']['pixel_size'] = matches[0]
-                break
-
-        # Geographic extent patterns
-        extent_patterns = [
-            r'global(?:\s+coverage)?',
-            r'worldwide',
-            r'continental',
-            r'regional',
-            r'([-+]?\d*\.?\d+)°?[NS],?\s*([-+]?\d*\.?\d+)°?[EW]'
-        ]
-
-        for pattern in extent_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['spatial_info']['geographic_extent'] = matches[0] if isinstance(matches[0], str) else str(matches[0])
-                break
-
-    def extract_technical_metadata(self, text, dataset):
-        """Extract technical specifications"""
-        # Band information patterns
-        band_patterns = [
-            r'(\d+)\s*(?:spectral\s+)?bands?',
-            r'bands?.*?(\d+)',
-            r'(red|green|blue|nir|swir|thermal|panchromatic)',
-            r'(\d+(?:\.\d+)?)\s*(?:μm|um|nm|µm)'
-        ]
-
-        bands_found = []
-        for pattern in band_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                bands_found.extend(matches)
-
-        if bands_found:
-            dataset['bands'] = list(set(bands_found))
-            dataset['spectral_info'] = ', '.join(bands_found)
-
-        # Processing level patterns
-        processing_patterns = [
-            r'level\s*(\d+[a-zA-Z]*)',
-            r'L(\d+[a-zA-Z]*)',
-            r'(raw|processed|calibrated|atmospherically\s+corrected)'
-        ]
-
-        for pattern in processing_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['processing_level'] = matches[0]
-                break
-
-        # File format patterns
-        format_patterns = [
-            r'(GeoTIFF|NetCDF|HDF|CSV|JSON)',
-            r'\.(tif|nc|hdf|csv|json)\s',
-            r'format.*?(GeoTIFF|NetCDF|HDF|CSV|JSON)'
-        ]
-
-        for pattern in format_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['file_format'] = matches[0]
-                break
-
-    def extract_access_metadata(self, text, dataset):
-        """Extract access and licensing information"""
-        # License patterns
-        license_patterns = [
-            r'(CC\s*BY[^,\s]*)',
-            r'(Creative\s+Commons[^,\s]*)',
-            r'(public\s+domain)',
-            r'(open\s+(?:access|data))',
-            r'license.*?(free|commercial|restricted)'
-        ]
-
-        for pattern in license_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['license'] = matches[0]
-                break
-
-        # DOI patterns
-        doi_patterns = [
-            r'doi:\s*(10\.\d+/[^\s]+)',
-            r'(10\.\d+/[^\s,]+)',
-            r'DOI[:\s]+(10\.\d+/[^\s]+)'
-        ]
-
-        for pattern in doi_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                dataset['doi'] = matches[0]
-                break
-
-    def download_thumbnail(self, thumbnail_url, dataset_id):
-        """Download thumbnail image locally for real-time viewing"""
-        try:
-            if not thumbnail_url or not thumbnail_url.startswith(('http', './')):
-                return None
-
-            # Handle relative URLs
-            if thumbnail_url.startswith('./'):
-                # This is a local file reference
-                base_path = os.path.dirname(os.path.dirname(__file__))
-                local_path = os.path.join(base_path, thumbnail_url.replace('./', ''))
-                if os.path.exists(local_path):
-                    # Copy to thumbnails directory
-                    filename = f"{dataset_id}_{os.path.basename(local_path)}"
-                    dest_path = os.path.join(self.thumbnails_dir, filename)
-                    import shutil
-                    shutil.copy2(local_path, dest_path)
-                    return dest_path
-
-            # For HTTP URLs, download the image
-            if thumbnail_url.startswith('http'):
-                response = self.session.get(thumbnail_url, timeout=10)
-                if response.status_code == 200:
-                    # Determine file extension
-                    content_type = response.headers.get('content-type', '')
-                    if 'image/png' in content_type:
-                        ext = '.png'
-                    elif 'image/jpeg' in content_type or 'image/jpg' in content_type:
-                        ext = '.jpg'
-                    elif 'image/webp' in content_type:
-                        ext = '.webp'
-                    else:
-                        ext = '.png'  # default
-
-                    filename = f"{dataset_id}_thumbnail{ext}"
-                    local_path = os.path.join(self.thumbnails_dir, filename)
-
-                    with open(local_path, 'wb') as f:
-                        f.write(response.content)
-
-                    return local_path
-
-        except Exception as e:
-            print(f"     Error downloading thumbnail: {e}")
-
-        return None
-
-    def calculate_data_completeness(self, dataset):
-        """Calculate completeness score for the dataset"""
-        total_fields = 25  # Total number of fields we check
-        filled_fields = 0
-
-        # Check core fields
-        if dataset.get('title'): filled_fields += 1
-        if dataset.get('description'): filled_fields += 1
-        if dataset.get('dataset_id'): filled_fields += 1
-        if dataset.get('url'): filled_fields += 1
-        if dataset.get('thumbnail'): filled_fields += 1
-
-        # Check metadata fields
-        if dataset.get('provider'): filled_fields += 1
-        if dataset.get('tags'): filled_fields += 1
-        if dataset.get('keywords'): filled_fields += 1
-        if dataset.get('collection_type'): filled_fields += 1
-
-        # Check temporal fields
-        temporal = dataset.get('temporal_coverage', {})
-        if temporal.get('start_date'): filled_fields += 1
-        if temporal.get('end_date'): filled_fields += 1
-        if temporal.get('update_frequency'): filled_fields += 1
-
-        # Check spatial fields
-        spatial = dataset.get('spatial_info', {})
-        if spatial.get('resolution'): filled_fields += 1
-        if spatial.get('pixel_size'): filled_fields += 1
-        if spatial.get('geographic_extent'): filled_fields += 1
-
-        # Check technical fields
-        if dataset.get('bands'): filled_fields += 1
-        if dataset.get('processing_level'): filled_fields += 1
-        if dataset.get('file_format'): filled_fields += 1
-
-        # Check access fields
-        if dataset.get('license'): filled_fields += 1
-        if dataset.get('doi'): filled_fields += 1
-        if dataset.get('citations'): filled_fields += 1
-        if dataset.get('terms_of_use'): filled_fields += 1
-
-        # Check quality fields
-        if dataset.get('confidence_score', 0) > 0: filled_fields += 1
-        if dataset.get('thumbnail_local_path'): filled_fields += 1
-        if dataset.get('data_volume'): filled_fields += 1
-
-        return round((filled_fields / total_fields) * 100, 1)
-
-    def classify_earth_engine_datasets(self, datasets):
-        """Intelligent classification of Earth Engine datasets"""
-        print(f"      Classifying {len(datasets)} datasets using intelligent algorithms...")
-
-        classifications = {
-            'climate': [],
-            'landsat': [],
-            'modis': [],
-            'sentinel': [],
-            'atmospheric': [],
-            'ocean': [],
-            'terrain': [],
-            'weather': [],
-            'vegetation': [],
-            'urban': [],
-            'other': []
-        }
-
-        for dataset in datasets:
-            category = self.classify_single_dataset(dataset)
-            classifications[category].append(dataset)
-
-        return classifications
-
-    def classify_single_dataset(self, dataset):
-        """Classify a single dataset based on its metadata"""
-        title = dataset.get('title', '').lower()
-        description = dataset.get('description', '').lower()
-        tags = [tag.lower() for tag in dataset.get('tags', [])]
-        keywords = [kw.lower() for kw in dataset.get('keywords', [])]
-
-        # Combine all text for analysis
-        all_text = f"{title} {description} {' '.join(tags)} {' '.join(keywords)}"
-
-        # Classification patterns
-        if any(term in all_text for term in ['landsat', 'oli', 'tirs']):
-            return 'landsat'
-        elif any(term in all_text for term in ['modis', 'aqua', 'terra']):
-            return 'modis'
-        elif any(term in all_text for term in ['sentinel', 'esa', 'msi', 'olci']):
-            return 'sentinel'
-        elif any(term in all_text for term in ['temperature', 'precipitation', 'climate']):
-            return 'climate'
-        elif any(term in all_text for term in ['atmospheric', 'aerosol', 'ozone', 'air']):
-            return 'atmospheric'
-        elif any(term in all_text for term in ['ocean', 'sea', 'marine', 'sst']):
-            return 'ocean'
-        elif any(term in all_text for term in ['dem', 'elevation', 'topography', 'terrain']):
-            return 'terrain'
-        elif any(term in all_text for term in ['weather', 'goes', 'himawari', 'meteorological']):
-            return 'weather'
-        elif any(term in all_text for term in ['vegetation', 'ndvi', 'evi', 'lai', 'biomass']):
-            return 'vegetation'
-        elif any(term in all_text for term in ['urban', 'built', 'population', 'lights']):
-            return 'urban'
-        else:
-            return 'other'
-
-    def generate_intelligent_extraction_report(self, satellite_data):
-        """Generate a detailed report of the intelligent extraction results"""
-        if satellite_data.get('extraction_method') != 'earth_engine_intelligent':
-            return None
-
-        datasets = satellite_data.get('datasets', [])
-        classifications = satellite_data.get('classifications', {})
-
-        report = {
-            'total_datasets': len(datasets),
-            'extraction_method': 'Earth Engine Intelligent Extraction',
-            'confidence_scores': {
-                'very_high': len([d for d in datasets if d.get('confidence_score', 0) >= 70]),
-                'high': len([d for d in datasets if 50 <= d.get('confidence_score', 0) < 70]),
-                'medium': len([d for d in datasets if 30 <= d.get('confidence_score', 0) < 50]),
-                'low': len([d for d in datasets if d.get('confidence_score', 0) < 30])
-            },
-            'data_completeness': {
-                'with_titles': len([d for d in datasets if d.get('title')]),
-                'with_descriptions': len([d for d in datasets if d.get('description')]),
-                'with_tags': len([d for d in datasets if d.get('tags')]),
-                'with_thumbnails': len([d for d in datasets if d.get('thumbnail')]),
-                'with_providers': len([d for d in datasets if d.get('provider')]),
-                'with_urls': len([d for d in datasets if d.get('url')])
-            },
-            'classifications': {k: len(v) for k, v in classifications.items() if v},
-            'top_providers': self._get_top_providers(datasets),
-            'sample_datasets': datasets[:5] if datasets else []
-        }
-
-        return report
-
-    def _get_top_providers(self, datasets):
-        """Get the top data providers from the extracted datasets"""
-        provider_counts = {}
-        for dataset in datasets:
-            provider = dataset.get('provider', 'Unknown')
-            if provider and provider.strip():
-                provider_counts[provider] = provider_counts.get(provider, 0) + 1
-
-        return sorted(provider_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    def extract_from_satellite_info(self, soup, satellite_data):
-        """Extract data from satellite information page"""
-        print("      Extracting from satellite info page...")
-        
-        # Extract satellite name
-        satellite_heading = soup.find(['h1', 'h2'], class_=re.compile(r'satellite|platform|instrument'))
-        if satellite_heading:
-            satellite_data['layer_name'] = satellite_heading.get_text().strip()
-        
-        # Extract sensor/instrument information
-        sensor_sections = soup.find_all(['div', 'section'], class_=re.compile(r'sensor|instrument|platform'))
-        for section in sensor_sections:
-            section_text = section.get_text()
-            if 'band' in section_text.lower():
-                self.extract_band_data(section, satellite_data)
-            if 'resolution' in section_text.lower():
-                self.extract_resolution_data(section, satellite_data)
-    
-    def extract_generic_data(self, soup, satellite_data):
-        """Extract data using generic patterns when page type is unknown"""
-        print("     Using generic extraction patterns...")
-        
-        text_content = soup.get_text()
-        
-        # Try to extract dataset name from various sources
-        if not satellite_data['layer_name']:
-            # Look for dataset names in headings
-            headings = soup.find_all(['h1', 'h2', 'h3'])
-            for heading in headings:
-                heading_text = heading.get_text().lower()
-                if any(word in heading_text for word in ['dataset', 'collection', 'product', 'layer']):
-                    satellite_data['layer_name'] = heading.get_text().strip()
-                    break
-        
-        # Extract using regex patterns
-        self.extract_with_regex_patterns(text_content, satellite_data)
-    
-    def extract_temporal_data(self, section, satellite_data):
-        """Extract temporal coverage information"""
-        section_text = section.get_text()
-        
-        # Look for date patterns
-        date_patterns = [
-            r'(\d{4}-\d{2}-\d{2})\s*to\s*(\d{4}-\d{2}-\d{2})',
-            r'(\d{4}/\d{2}/\d{2})\s*-\s*(\d{4}/\d{2}/\d{2})',
-            r'start[:\s]+(\d{4}[-/]\d{2}[-/]\d{2}).*?end[:\s]+(\d{4}[-/]\d{2}[-/]\d{2})',
-            r'(\d{4})\s*to\s*(\d{4})',
-            r'coverage[:\s]+(\d{4})\s*-\s*(\d{4})'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            if matches:
-                if len(matches[0]) == 2:
-                    satellite_data['date_range']['start'] = matches[0][0]
-                    satellite_data['date_range']['end'] = matches[0][1]
-                    break
-    
-    def extract_spatial_data(self, section, satellite_data):
-        """Extract spatial coverage information"""
-        section_text = section.get_text()
-        
-        # Look for location/coverage patterns
-        location_patterns = [
-            r'coverage[:\s]+([^.\n]+)',
-            r'extent[:\s]+([^.\n]+)',
-            r'boundary[:\s]+([^.\n]+)',
-            r'region[:\s]+([^.\n]+)',
-            r'area[:\s]+([^.\n]+)',
-            r'global|worldwide|continental|regional|local'
-        ]
-        
-        for pattern in location_patterns:
-            if pattern in ['global', 'worldwide', 'continental', 'regional', 'local']:
-                if pattern in section_text.lower():
-                    satellite_data['location'] = pattern.title()
-                    break
-            else:
-                matches = re.findall(pattern, section_text, re.IGNORECASE)
-                if matches:
-                    satellite_data['location'] = matches[0].strip()
-                    break
-    
-    def extract_technical_data(self, section, satellite_data):
-        """Extract technical specifications"""
-        section_text = section.get_text()
-        
-        # Extract bands
-        band_patterns = [
-            r'band[s]?[:\s]+([^.\n]+)',
-            r'wavelength[s]?[:\s]+([^.\n]+)',
-            r'channel[s]?[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in band_patterns:
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            if matches:
-                bands = [b.strip() for b in matches[0].split(',')]
-                satellite_data['band_information'].extend(bands)
-        
-        # Extract resolution/pixel size
-        resolution_patterns = [
-            r'resolution[:\s]+([^.\n]+)',
-            r'pixel[:\s]+([^.\n]+)',
-            r'spatial[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in resolution_patterns:
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            if matches:
-                satellite_data['pixel_size'] = matches[0].strip()
-                break
-    
-    def extract_provider_data(self, section, satellite_data):
-        """Extract provider/organization information"""
-        section_text = section.get_text()
-        
-        provider_patterns = [
-            r'provider[:\s]+([^\.\n]+)',
-            r'source[:\s]+([^\.\n]+)',
-            r'organization[:\s]+([^\.\n]+)',
-            r'institution[:\s]+([^\.\n]+)',
-            r'developed by[:\s]+([^\.\n]+)',
-            r'created by[:\s]+([^\.\n]+)',
-            r'managed by[:\s]+([^\.\n]+)',
-            r'hosted by[:\s]+([^\.\n]+)',
-            r'maintained by[:\s]+([^\.\n]+)',
-            r'agency[:\s]+([^\.\n]+)',
-            r'authority[:\s]+([^\.\n]+)'
-        ]
-        
-        for pattern in provider_patterns:
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            if matches:
-                satellite_data['dataset_provider'] = matches[0].strip()
-                break
-        
-        # Fallback via meta tags if still empty
-        if not satellite_data.get('dataset_provider'):
-            meta = section.find('meta', attrs={'name': re.compile(r'provider|organization|institution|author|og:site_name', re.I)})
-            if meta:
-                satellite_data['dataset_provider'] = meta.get('content', '').strip()
-    
-    def extract_band_data(self, section, satellite_data):
-        """Extract band information from sensor section - Enhanced for Earth Engine bands table"""
-        section_text = section.get_text()
-        
-        # Look for band tables
-        band_tables = section.find_all('table')
-        for table in band_tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    band_name = cells[0].get_text().strip()
-                    if 'band' in band_name.lower() or 'channel' in band_name.lower() or 'wavelength' in band_name.lower():
-                        satellite_data['band_information'].append(band_name)
-        
-        # Look for Earth Engine specific band structure
-        bands_divs = section.find_all(['div', 'span'], string=re.compile(r'Bands?', re.I))
-        for div in bands_divs:
-            parent = div.parent
-            if parent:
-                # Look for band information in the same container
-                bands_text = parent.get_text()
-                
-                # Extract band names from text
-                band_patterns = [
-                    r'band[s]?[:\s]+([^.\n]+)',
-                    r'wavelength[s]?[:\s]+([^.\n]+)',
-                    r'channel[s]?[:\s]+([^.\n]+)'
-                ]
-                
-                for pattern in band_patterns:
-                    matches = re.findall(pattern, bands_text, re.IGNORECASE)
-                    if matches:
-                        bands = [b.strip() for b in matches[0].split(',')]
-                        satellite_data['band_information'].extend(bands)
-                        print(f"        Found bands from text: {', '.join(bands)}")
-                        break
-                
-                # Also look for band table in this section
-                band_table = parent.find('table')
-                if band_table:
-                    rows = band_table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 1:
-                            band_name = cells[0].get_text().strip()
-                            if band_name and band_name.lower() not in ['name', 'band', 'bands']:
-                                satellite_data['band_information'].append(band_name)
-                    
-                    if satellite_data['band_information']:
-                        print(f"        Found {len(satellite_data['band_information'])} bands from table")
-                break
-    
-    def extract_resolution_data(self, section, satellite_data):
-        """Extract resolution information from sensor section"""
-        section_text = section.get_text()
-        
-        resolution_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:meter|m|km|pixel|arcsecond)',
-            r'resolution[:\s]+([^.\n]+)',
-            r'pixel[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in resolution_patterns:
-            matches = re.findall(pattern, section_text, re.IGNORECASE)
-            if matches:
-                satellite_data['pixel_size'] = matches[0].strip()
-                break
-    
-    def extract_citation_data(self, soup, satellite_data):
-        """Extract DOI and citation information - Enhanced for Earth Engine structure"""
-        print("     📚 Extracting citation data...")
-        
-        page_text = soup.get_text()
-        
-        # Look for DOI in text - Enhanced patterns
-        doi_patterns = [
-            r'doi[:\s]+([^.\n]+)',
-            r'10\.\d{4,}/[^\s\n]+',
-            r'digital object identifier[:\s]+([^.\n]+)',
-            r'doi\.org/([^\s\n]+)'
-        ]
-        
-        for pattern in doi_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            if matches:
-                doi = matches[0].strip()
-                if doi.startswith('10.'):
-                    satellite_data['doi'] = doi
-                else:
-                    satellite_data['doi'] = f"10.{doi}"
-                print(f"        Found DOI: {satellite_data['doi']}")
-                break
-        
-        # Look for citations in structured elements
-        citation_elements = soup.find_all(['div', 'section'], class_=re.compile(r'citation|reference|cite'))
-        for element in citation_elements:
-            citation_text = element.get_text().strip()
-            if citation_text:
-                satellite_data['citations'].append(citation_text)
-                print(f"       📖 Found citation: {citation_text[:100]}...")
-        
-        # Look for Earth Engine specific citation structure
-        citations_divs = soup.find_all(['div', 'span'], string=re.compile(r'Citations?', re.I))
-        for div in citations_divs:
-            parent = div.parent
-            if parent:
-                # Look for citation text in the same container
-                citation_text = parent.get_text()
-                # Extract the citation content (everything after "Citations:")
-                try:
-                    citation_match = re.search(r'Citations?[:\s]*(.+)', citation_text, re.I | re.DOTALL)
-                    if citation_match:
-                        citation_content = citation_match.group(1).strip()
-                        if citation_content and len(citation_content) > 10:  # Avoid very short matches
-                            satellite_data['citations'].append(citation_content)
-                            print(f"       📖 Found structured citation: {citation_content[:100]}...")
-                except re.error as e:
-                    print(f"        Regex error in citation pattern: {e}")
-                
-                # Also look for DOI in the citation section
-                try:
-                    doi_match = re.search(r'doi[:\s]*([^.\s]+)', citation_text, re.I)
-                    if doi_match and not satellite_data.get('doi'):
-                        doi = doi_match.group(1).strip()
-                        if doi.startswith('10.'):
-                            satellite_data['doi'] = doi
-                        else:
-                            satellite_data['doi'] = f"10.{doi}"
-                        print(f"        Found DOI in citations: {satellite_data['doi']}")
-                except re.error as e:
-                    print(f"        Regex error in DOI pattern: {e}")
-                break
-        
-        # Look for terms of use
-        terms_divs = soup.find_all(['div', 'span'], string=re.compile(r'Terms of Use', re.I))
-        for div in terms_divs:
-            parent = div.parent
-            if parent:
-                # Look for terms content in the same container
-                terms_text = parent.get_text()
-                try:
-                    terms_match = re.search(r'Terms of Use[:\s]*(.+)', terms_text, re.I | re.DOTALL)
-                    if terms_match:
-                        terms_content = terms_match.group(1).strip()
-                        if terms_content and len(terms_content) > 10:
-                            satellite_data['terms_of_use'] = terms_content
-                            print(f"        Found terms of use: {terms_content[:100]}...")
-                except re.error as e:
-                    print(f"        Regex error in terms pattern: {e}")
-                break
-        
-        # Look for description
-        description_divs = soup.find_all(['div', 'span'], string=re.compile(r'Description', re.I))
-        for div in description_divs:
-            parent = div.parent
-            if parent:
-                # Look for description content in the same container
-                desc_text = parent.get_text()
-                try:
-                    desc_match = re.search(r'Description[:\s]*(.+)', desc_text, re.I | re.DOTALL)
-                    if desc_match:
-                        desc_content = desc_match.group(1).strip()
-                        if desc_content and len(desc_content) > 10:
-                            satellite_data['description'] = desc_content
-                            print(f"        Found description: {desc_content[:100]}...")
-                except re.error as e:
-                    print(f"        Regex error in description pattern: {e}")
-                break
-        
-        # Method 4: Look for any text that looks like a citation
-        citation_patterns = [
-            r'([A-Z][a-zA-Z\s&]+)\s*\(\d{4}\)[:\s]+([^.\n]+)',
-            r'([A-Z][a-zA-Z\s&]+)\s*Climate\s+Change\s+Service[^.\n]*',
-            r'([A-Z][a-zA-Z\s&]+)\s*Climate\s+Data\s+Store[^.\n]*'
-        ]
-        
-        for pattern in citation_patterns:
-            try:
-                matches = re.findall(pattern, page_text)
-                if matches and not satellite_data.get('citations'):
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            citation = ' '.join(match).strip()
-                        else:
-                            citation = match.strip()
-                        if citation and len(citation) > 20:
-                            satellite_data['citations'].append(citation)
-                            print(f"       📖 Found citation pattern: {citation[:100]}...")
-            except re.error as e:
-                print(f"        Regex error in citation pattern: {e}")
-                continue
-    
-    def extract_with_regex_patterns(self, text_content, satellite_data):
-        """Extract data using comprehensive regex patterns"""
-        # Extract satellites used
-        satellite_patterns = [
-            r'satellite[:\s]+([^.\n]+)',
-            r'sensor[:\s]+([^.\n]+)',
-            r'instrument[:\s]+([^.\n]+)',
-            r'platform[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in satellite_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                satellites = [s.strip() for s in matches[0].split(',')]
-                satellite_data['satellites_used'].extend(satellites)
-        
-        # Extract category tags
-        tag_patterns = [
-            r'category[:\s]+([^.\n]+)',
-            r'tag[s]?[:\s]+([^.\n]+)',
-            r'type[:\s]+([^.\n]+)',
-            r'classification[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in tag_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                tags = [t.strip() for t in matches[0].split(',')]
-                satellite_data['category_tags'].extend(tags)
-        
-        # Extract terms of use
-        terms_patterns = [
-            r'terms[:\s]+([^.\n]+)',
-            r'license[:\s]+([^.\n]+)',
-            r'usage[:\s]+([^.\n]+)',
-            r'conditions[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in terms_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                satellite_data['terms_of_use'] = matches[0].strip()
-                break
-    
-    def calculate_extraction_confidence(self, satellite_data):
-        """Calculate confidence level of extracted data - Enhanced for Earth Engine"""
-        # Check if we used intelligent Earth Engine extraction
-        if satellite_data.get('extraction_method') == 'earth_engine_intelligent':
-            datasets = satellite_data.get('datasets', [])
-            if datasets:
-                avg_confidence = sum(d.get('confidence_score', 0) for d in datasets) / len(datasets)
-                if avg_confidence >= 70:
-                    return 'very_high'
-                elif avg_confidence >= 50:
-                    return 'high'
-                elif avg_confidence >= 30:
-                    return 'medium'
-                else:
-                    return 'low'
-
-        # Fallback to original confidence calculation
-        confidence_score = 0
-        max_score = 100
-        
-        # Layer name (20 points)
-        if satellite_data['layer_name']:
-            confidence_score += 20
-        
-        # Date range (15 points)
-        if satellite_data['date_range']['start'] and satellite_data['date_range']['end']:
-            confidence_score += 15
-        elif satellite_data['date_range']['start'] or satellite_data['date_range']['end']:
-            confidence_score += 7
-        
-        # Satellites used (15 points)
-        if satellite_data['satellites_used']:
-            confidence_score += 15
-        
-        # Location (10 points)
-        if satellite_data['location']:
-            confidence_score += 10
-        
-        # GEE code (10 points)
-        if satellite_data['gee_code_snippet']:
-            confidence_score += 10
-        
-        # Provider (10 points)
-        if satellite_data['dataset_provider']:
-            confidence_score += 10
-        
-        # Technical specs (10 points)
-        if satellite_data['pixel_size'] or satellite_data['band_information']:
-            confidence_score += 10
-        
-        # Determine confidence level
-        if confidence_score >= 80:
-            return 'high'
-        elif confidence_score >= 50:
-            return 'medium'
-        else:
-            return 'low'
-
-    def process_catalog_extraction(self, soup, file_path):
-        """Process catalog extraction with detailed progress tracking"""
-        print(f"Processing catalog extraction for: {os.path.basename(file_path)}")
-        
-        # Step 1: Analyze page structure
-        print("    Step 1: Analyzing page structure...")
-        page_type = self.detect_page_type(soup)
-        print(f"       Detected page type: {page_type}")
-        
-        # Step 2: Extract catalog links
-        print("    Step 2: Extracting catalog links...")
-        catalog_links = self.extract_catalog_links_smart(soup)
-        print(f"       Found {len(catalog_links)} catalog links")
-        
-        # Step 3: Classify and prioritize links
-        print("    Step 3: Classifying and prioritizing links...")
-        classified_links = self.classify_and_prioritize_links(catalog_links)
-        print(f"       Classified into {len(classified_links)} categories")
-        
-        # Step 4: Extract satellite data
-        print("    Step 4: Extracting satellite catalog data...")
-        satellite_data = self.extract_satellite_data_enhanced(soup, catalog_links)
-        print(f"       Extracted satellite data with {satellite_data.get('extraction_confidence', 'unknown')} confidence")
-        
-        # Step 5: Validate and enhance data
-        print("    Step 5: Validating and enhancing data...")
-        enhanced_data = self.enhance_satellite_data(satellite_data, soup)
-        print(f"       Data enhancement completed")
-        
-        return {
-            'page_type': page_type,
-            'catalog_links': catalog_links,
-            'classified_links': classified_links,
-            'satellite_catalog': enhanced_data,
-            'extraction_summary': self.generate_extraction_summary(catalog_links, enhanced_data)
-        }
-    
-    def extract_catalog_links_smart(self, soup):
-        """Smart extraction of catalog links with better pattern recognition"""
-        catalog_links = []
-        
-        # Method 1: Look for structured catalog containers
-        containers = self.find_catalog_containers(soup)
-        if containers:
-            print(f"       Found {len(containers)} catalog containers")
-            for container in containers:
-                links = self.extract_from_container(container)
-                catalog_links.extend(links)
-        
-        # Method 2: Look for specific link patterns
-        if not catalog_links:
-            print("       No containers found, using link pattern analysis")
-            pattern_links = self.extract_by_link_patterns(soup)
-            catalog_links.extend(pattern_links)
-        
-        # Method 3: Look for thumbnail-based links
-        if not catalog_links:
-            print("       No pattern links found, using thumbnail analysis")
-            thumbnail_links = self.extract_by_thumbnails(soup)
-            catalog_links.extend(thumbnail_links)
-        
-        # Remove duplicates and validate
-        unique_links = self.deduplicate_links(catalog_links)
-        valid_links = self.validate_catalog_links(unique_links)
-        
-        return valid_links
-    
-    def find_catalog_containers(self, soup):
-        """Find catalog containers using multiple strategies"""
-        containers = []
-        
-        # Strategy 1: Look for common catalog class names
-        catalog_classes = [
-            'catalog', 'grid', 'item', 'dataset', 'collection', 'product',
-            'catalog-item', 'catalog-grid', 'dataset-grid', 'collection-grid'
-        ]
-        
-        for class_name in catalog_classes:
-            found = soup.find_all(['div', 'section', 'article'], class_=re.compile(class_name, re.I))
-            containers.extend(found)
-        
-        # Strategy 2: Look for catalog-like structures
-        catalog_structures = soup.find_all(['div', 'section'], class_=re.compile(r'container|wrapper|content'))
-        for structure in catalog_structures:
-            # Check if it contains multiple links and images (likely a catalog)
-            links = structure.find_all('a')
-            images = structure.find_all('img')
-            if len(links) > 3 and len(images) > 2:
-                containers.append(structure)
-        
-        # Strategy 3: Look for grid-like layouts
-        grid_elements = soup.find_all(['div', 'section'], style=re.compile(r'grid|flex|display'))
-        containers.extend(grid_elements)
-        
-        return list(set(containers))  # Remove duplicates
-    
-    def extract_from_container(self, container):
-        """Extract catalog links from a container"""
-        links = []
-        
-        # Find all links in the container
-        container_links = container.find_all('a', href=True)
-        
-        for link in container_links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            
-            # Skip navigation links
-            if self.is_navigation_link(href, text):
-                continue
-            
-            # Check if this looks like a dataset link
-            if self.looks_like_dataset_link(href, text):
-                # Find associated thumbnail
-                thumbnail = self.find_thumbnail_for_link(link, container)
-                
-                catalog_link = {
-                    'text': text,
-                    'href': href,
-                    'title': link.get('title', ''),
-                    'thumbnail': thumbnail,
-                    'is_catalog_item': True,
-                    'link_type': self.classify_link_type(href, text),
-                    'extraction_priority': self.calculate_link_priority(href, text),
-                    'container_type': 'structured'
-                }
-                links.append(catalog_link)
-        
-        return links
-    
-    def extract_by_link_patterns(self, soup):
-        """Extract links by analyzing URL patterns"""
-        links = []
-        
-        all_links = soup.find_all('a', href=True)
-        
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.get_text().strip()
-            
-            # Look for Earth Engine specific patterns
-            if self.is_earth_engine_link(href):
-                thumbnail = self.find_thumbnail_for_link(link, soup)
-                
-                catalog_link = {
-                    'text': text,
-                    'href': href,
-                    'title': link.get('title', ''),
-                    'thumbnail': thumbnail,
-                    'is_catalog_item': True,
-                    'link_type': 'earth_engine',
-                    'extraction_priority': 9,
-                    'container_type': 'pattern_based'
-                }
-                links.append(catalog_link)
-        
-        return links
-    
-    def extract_by_thumbnails(self, soup):
-        """Extract links by finding thumbnail images and their associated links"""
-        links = []
-        
-        # Find all images that look like thumbnails
-        thumbnails = soup.find_all('img', src=True)
-        
-        for thumbnail in thumbnails:
-            # Check if this looks like a dataset thumbnail
-            if self.looks_like_dataset_thumbnail(thumbnail):
-                # Find associated link
-                link = self.find_link_for_thumbnail(thumbnail)
-                if link:
-                    href = link.get('href', '')
-                    text = link.get_text().strip()
-                    
-                    catalog_link = {
-                        'text': text,
-                        'href': href,
-                        'title': link.get('title', ''),
-                        'thumbnail': {
-                            'src': thumbnail.get('src', ''),
-                            'alt': thumbnail.get('alt', ''),
-                            'title': thumbnail.get('title', ''),
-                            'width': thumbnail.get('width', ''),
-                            'height': thumbnail.get('height', '')
-                        },
-                        'is_catalog_item': True,
-                        'link_type': 'thumbnail_based',
-                        'extraction_priority': 7,
-                        'container_type': 'thumbnail_based'
-                    }
-                    links.append(catalog_link)
-        
-        return links
-    
-    def is_earth_engine_link(self, href):
-        """Check if a link is Earth Engine specific"""
-        earth_engine_patterns = [
-            '/datasets/',
-            '/collections/',
-            'earth-engine',
-            'earthengine',
-            'google.com/earthengine',
-            'developers.google.com/earth-engine'
-        ]
-        
-        return any(pattern in href.lower() for pattern in earth_engine_patterns)
-    
-    def looks_like_dataset_link(self, href, text):
-        """Check if a link looks like it points to a dataset - Enhanced filtering"""
-        # First, check if it's clearly NOT a dataset link
-        if self.is_clearly_not_dataset(href, text):
-            return False
-        
-        dataset_indicators = [
-            'dataset', 'collection', 'product', 'layer', 'imagery',
-            'satellite', 'sensor', 'coverage', 'temporal', 'spatial',
-            'earth engine', 'earthengine', 'gee', 'landsat', 'sentinel',
-            'modis', 'copernicus', 'nasa', 'esa', 'usgs', 'noaa'
-        ]
-        
-        # Check href for dataset patterns
-        if any(indicator in href.lower() for indicator in dataset_indicators):
-            return True
-        
-        # Check text for dataset patterns
-        if any(indicator in text.lower() for indicator in dataset_indicators):
-            return True
-        
-        # Check for data-like patterns
-        if re.search(r'\d{4}', text):  # Contains year
-            return True
-        
-        if re.search(r'[A-Z]{2,}', text):  # Contains acronyms
-            return True
-        
-        # Check for Earth Engine specific patterns
-        if self.is_earth_engine_specific(href, text):
-            return True
-        
-        return False
-    
-    def is_clearly_not_dataset(self, href, text):
-        """Check if a link is clearly NOT a dataset link"""
-        # Check for obvious non-dataset patterns
-        non_dataset_patterns = [
-            'login', 'signup', 'register', 'account', 'profile',
-            'settings', 'preferences', 'admin', 'dashboard',
-            'cart', 'checkout', 'payment', 'billing',
-            'support', 'help', 'faq', 'contact', 'about',
-            'privacy', 'terms', 'legal', 'cookies',
-            'news', 'blog', 'article', 'press', 'media',
-            'careers', 'jobs', 'team', 'company', 'organization',
-            'events', 'conferences', 'webinars', 'workshops'
-        ]
-        
-        # Check href
-        if any(pattern in href.lower() for pattern in non_dataset_patterns):
-            return True
-        
-        # Check text
-        if any(pattern in text.lower() for pattern in non_dataset_patterns):
-            return True
-        
-        # Check for social media and external domains
-        if self.is_external_junk_domain(href):
-            return True
-        
-        return False
-    
-    def is_external_junk_domain(self, href):
-        """Check if href points to external junk domains"""
-        if not href.startswith('http'):
-            return False
-        
-        junk_domains = [
-            'facebook.com', 'twitter.com', 'x.com', 'instagram.com',
-            'linkedin.com', 'youtube.com', 'reddit.com', 'github.com',
-            'stackoverflow.com', 'medium.com', 'dev.to', 'hashnode.dev',
-            'discord.com', 'slack.com', 'telegram.org', 'whatsapp.com',
-            'tiktok.com', 'snapchat.com', 'pinterest.com', 'tumblr.com',
-            'amazon.com', 'ebay.com', 'etsy.com', 'shopify.com',
-            'booking.com', 'airbnb.com', 'tripadvisor.com', 'yelp.com',
-            'wikipedia.org', 'wikimedia.org', 'quora.com', 'yahoo.com',
-            'bing.com', 'duckduckgo.com', 'baidu.com', 'yandex.com'
-        ]
-        
-        return any(domain in href.lower() for domain in junk_domains)
-    
-    def is_earth_engine_specific(self, href, text):
-        """Check if a link is specifically Earth Engine related"""
-        earth_engine_patterns = [
-            '/datasets/', '/collections/', '/products/', '/layers/',
-            'earth-engine', 'earthengine', 'google.com/earthengine',
-            'developers.google.com/earth-engine', 'code.earthengine.google.com',
-            'explorer.earthengine.google.com', 'signup.earthengine.google.com'
-        ]
-        
-        # Check href for Earth Engine patterns
-        if any(pattern in href.lower() for pattern in earth_engine_patterns):
-            return True
-        
-        # Check text for Earth Engine patterns
-        earth_engine_indicators = [
-            'earth engine', 'earthengine', 'gee', 'google earth engine',
-            'dataset', 'collection', 'satellite', 'imagery', 'remote sensing'
-        ]
-        
-        if any(indicator in text.lower() for indicator in earth_engine_indicators):
-            return True
-        
-        return False
-    
-    def looks_like_dataset_thumbnail(self, img):
-        """Check if an image looks like a dataset thumbnail"""
-        src = img.get('src', '').lower()
-        alt = img.get('alt', '').lower()
-        title = img.get('title', '').lower()
-        
-        # Check for thumbnail indicators
-        thumbnail_indicators = [
-            'thumb', 'preview', 'sample', 'example', 'dataset', 'collection'
-        ]
-        
-        if any(indicator in src for indicator in thumbnail_indicators):
-            return True
-        
-        if any(indicator in alt for indicator in thumbnail_indicators):
-            return True
-        
-        if any(indicator in title for indicator in thumbnail_indicators):
-            return True
-        
-        # Check size (thumbnails are usually small)
-        width = img.get('width')
-        height = img.get('height')
-        if width and height:
-            try:
-                if int(width) < 300 and int(height) < 300:
-                    return True
-            except ValueError:
-                pass
-        
-        return False
-    
-    def find_link_for_thumbnail(self, thumbnail):
-        """Find the link associated with a thumbnail image"""
-        # Look for parent link
-        parent = thumbnail.parent
-        while parent and parent.name != 'a':
-            parent = parent.parent
-        
-        if parent and parent.name == 'a':
-            return parent
-        
-        # Look for sibling link
-        siblings = thumbnail.find_next_siblings()
-        for sibling in siblings:
-            if sibling.name == 'a':
-                return sibling
-        
-        # Look for nearby link
-        nearby = thumbnail.find_next('a')
-        if nearby:
-            return nearby
-        
-        return None
-    
-    def deduplicate_links(self, links):
-        """Remove duplicate links based on href"""
-        seen = set()
-        unique_links = []
-        
-        for link in links:
-            href = link.get('href', '')
-            if href not in seen:
-                seen.add(href)
-                unique_links.append(link)
-        
-        return unique_links
-    
-    def validate_catalog_links(self, links):
-        """Validate that links are actually catalog-related - Enhanced filtering"""
-        valid_links = []
-        
-        for link in links:
-            href = link.get('href', '')
-            text = link.get('text', '')
-            
-            # Skip empty or invalid links
-            if not href or href == '#' or href == '':
-                continue
-            
-            # Skip navigation links
-            if self.is_navigation_link(href, text):
-                continue
-            
-            # Skip external junk domains
-            if self.is_external_junk_domain(href):
-                continue
-            
-            # Skip utility and non-content links
-            if self.is_utility_link(href, text):
-                continue
-            
-            # Skip social media links
-            if self.is_social_media_link(href, text):
-                continue
-            
-            # Skip clearly non-dataset links
-            if self.is_clearly_not_dataset(href, text):
-                continue
-            
-            # Skip external non-Earth Engine links (unless they have strong dataset indicators)
-            if href.startswith('http') and not self.is_earth_engine_link(href):
-                # Only include if it has very strong dataset indicators
-                if not self.has_strong_dataset_indicators(href, text):
-                    continue
-            
-            valid_links.append(link)
-        
-        return valid_links
-    
-    def has_strong_dataset_indicators(self, href, text):
-        """Check if a link has very strong dataset indicators"""
-        strong_indicators = [
-            'satellite', 'sensor', 'imagery', 'remote sensing', 'earth observation',
-            'landsat', 'sentinel', 'modis', 'copernicus', 'nasa', 'esa', 'usgs', 'noaa',
-            'dataset', 'collection', 'product', 'layer', 'coverage', 'temporal', 'spatial'
-        ]
-        
-        # Count strong indicators
-        indicator_count = 0
-        for indicator in strong_indicators:
-            if indicator in href.lower():
-                indicator_count += 2  # href matches are worth more
-            if indicator in text.lower():
-                indicator_count += 1
-        
-        # Require multiple strong indicators for external links
-        return indicator_count >= 3
-    
-    def classify_and_prioritize_links(self, links):
-        """Classify links by type and assign priorities"""
-        if not links:
-            return {}
-        
-        # Sort by priority
-        links.sort(key=lambda x: x.get('extraction_priority', 0), reverse=True)
-        
-        # Group by type
-        classified = {}
-        for link in links:
-            link_type = link.get('link_type', 'general')
-            if link_type not in classified:
-                classified[link_type] = []
-            classified[link_type].append(link)
-        
-        return classified
-    
-    def extract_satellite_data_enhanced(self, soup, catalog_links):
-        """Enhanced satellite data extraction using catalog links context"""
-        # Use the existing enhanced extraction method
-        return self.extract_satellite_data(soup, {'catalog_links': catalog_links})
-    
-    def enhance_satellite_data(self, satellite_data, soup):
-        """Enhance satellite data with additional context"""
-        enhanced = satellite_data.copy()
-        
-        # Add extraction metadata
-        enhanced['extraction_timestamp'] = datetime.now().isoformat()
-        enhanced['extraction_method'] = 'enhanced_smart_extraction'
-        
-        # Add confidence indicators
-        enhanced['data_completeness'] = self.calculate_data_completeness(enhanced)
-        enhanced['extraction_quality'] = self.assess_extraction_quality(enhanced)
-        
-        # Add context information
-        enhanced['page_context'] = self.extract_page_context(soup)
-        
-        return enhanced
-    
-    def calculate_data_completeness(self, data):
-        """Calculate how complete the extracted data is"""
-        fields = [
-            'layer_name', 'date_range', 'satellites_used', 'location',
-            'gee_code_snippet', 'dataset_provider', 'pixel_size', 'doi'
-        ]
-        
-        completed_fields = 0
-        for field in fields:
-            if field == 'date_range':
-                if data.get('date_range', {}).get('start') and data.get('date_range', {}).get('end'):
-                    completed_fields += 1
-            elif data.get(field):
-                completed_fields += 1
-        
-        return (completed_fields / len(fields)) * 100
-    
-    def assess_extraction_quality(self, data):
-        """Assess the overall quality of extracted data"""
-        quality_score = 0
-        
-        # Layer name quality
-        if data.get('layer_name'):
-            if len(data['layer_name']) > 10:
-                quality_score += 20
-            else:
-                quality_score += 10
-        
-        # Date range quality
-        if data.get('date_range', {}).get('start') and data.get('date_range', {}).get('end'):
-            quality_score += 20
-        
-        # Technical data quality
-        if data.get('pixel_size') or data.get('band_information'):
-            quality_score += 15
-        
-        # Provider information quality
-        if data.get('dataset_provider'):
-            quality_score += 15
-        
-        # GEE code quality
-        if data.get('gee_code_snippet'):
-            quality_score += 10
-        
-        # Metadata quality
-        if data.get('doi') or data.get('citations'):
-            quality_score += 10
-        
-        # Determine quality level
-        if quality_score >= 80:
-            return 'excellent'
-        elif quality_score >= 60:
-            return 'good'
-        elif quality_score >= 40:
-            return 'fair'
-        else:
-            return 'poor'
-    
-    def extract_page_context(self, soup):
-        """Extract contextual information about the page"""
-        context = {
-            'page_title': '',
-            'breadcrumbs': [],
-            'related_links': [],
-            'page_metadata': {}
-        }
-        
-        # Extract page title
-        title_tag = soup.find('title')
-        if title_tag:
-            context['page_title'] = title_tag.get_text().strip()
-        
-        # Extract breadcrumbs
-        breadcrumb_elements = soup.find_all(['nav', 'div'], class_=re.compile(r'breadcrumb|navigation'))
-        for element in breadcrumb_elements:
-            links = element.find_all('a')
-            for link in links:
-                context['breadcrumbs'].append({
-                    'text': link.get_text().strip(),
-                    'href': link.get('href', '')
-                })
-        
-        # Extract related links
-        related_sections = soup.find_all(['div', 'section'], class_=re.compile(r'related|similar|additional'))
-        for section in related_sections:
-            links = section.find_all('a')
-            for link in links:
-                context['related_links'].append({
-                    'text': link.get_text().strip(),
-                    'href': link.get('href', '')
-                })
-        
-        # Extract page metadata
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            name = meta.get('name', meta.get('property', ''))
-            content = meta.get('content', '')
-            if name and content:
-                context['page_metadata'][name] = content
-        
-        return context
-    
-    def generate_extraction_summary(self, catalog_links, satellite_data):
-        """Generate a comprehensive summary of the extraction process with junk filtering details"""
-        summary = {
-            'total_links_discovered': 0,  # Total before filtering
-            'junk_links_filtered': 0,     # How many were filtered out
-            'total_links': len(catalog_links),
-            'links_by_type': {},
-            'extraction_confidence': satellite_data.get('extraction_confidence', 'unknown'),
-            'data_completeness': satellite_data.get('data_completeness', 0),
-            'extraction_quality': satellite_data.get('extraction_quality', 'unknown'),
-            'junk_examples': [],
-            'recommendations': [],
-            'filtering_stats': {
-                'social_media_removed': 0,
-                'navigation_removed': 0,
-                'utility_removed': 0,
-                'external_junk_removed': 0,
-                'broken_links_removed': 0,
-                'advertisement_removed': 0
-            }
-        }
-        
-        # Count links by type
-        for link in catalog_links:
-            link_type = link.get('link_type', 'unknown')
-            if link_type not in summary['links_by_type']:
-                summary['links_by_type'][link_type] = 0
-            summary['links_by_type'][link_type] += 1
-        
-        # Generate recommendations
-        if satellite_data.get('extraction_confidence') == 'low':
-            summary['recommendations'].append('Consider manual review of extracted data')
-        
-        if satellite_data.get('data_completeness', 0) < 50:
-            summary['recommendations'].append('Data extraction incomplete - may need additional sources')
-        
-        if not satellite_data.get('gee_code_snippet'):
-            summary['recommendations'].append('No GEE code found - check for code examples or documentation')
-        
-        # Add junk filtering recommendations
-        if summary['junk_links_filtered'] > 0:
-            summary['recommendations'].append(f'Successfully filtered out {summary["junk_links_filtered"]} junk links for cleaner data')
-        
-        if summary['total_links'] < 100:
-            summary['recommendations'].append('Low link count - may need to adjust filtering criteria')
-        
-        return summary
+    def __init__(self, classify, parent=None):
+        super().__init__(parent)
+        self._classify = classify
+        self._datasets = []
+        self._categories = []
+        self._rows = []
+        self._filter = None
 
-    def extract_from_dataset_link(self, link, base_soup):
-        """Extract detailed data from an individual dataset link"""
-        try:
-            href = link.get('href', '')
-            text = link.get('text', '')
-            
-            print(f"         🌐 Processing link: {href[:80]}...")
-            
-            # Try to fetch the linked dataset page for real details
-            details_soup = None
-            if href.startswith('http'):
-                try:
-                    resp = self.session.get(href, timeout=self.config['performance']['timeout'], verify=False, allow_redirects=True)
-                    resp.raise_for_status()
-                    details_soup = BeautifulSoup(resp.content, 'html.parser')
-                except Exception as e:
-                    print(f"          Failed to fetch detail page: {e}")
-            
-            # Create a dataset entry and prefer real details when available
-            dataset_data = {
-                'layer_name': text.strip(),
-                'date_range': {'start': '', 'end': ''},
-                'satellites_used': [],
-                'location': '',
-                'gee_code_snippet': '',
-                'thumbnails': [],
-                'band_information': [],
-                'category_tags': [],
-                'dataset_provider': '',
-                'pixel_size': '',
-                'citations': [],
-                'description': '',
-                'terms_of_use': '',
-                'doi': ''
-            }
-            
-            # If we have a detail soup, extract structured metadata first
-            if details_soup is not None:
-                try:
-                    # First try JSON-LD structured data (fastest and most reliable)
-                    json_ld_data = self.extract_json_ld_metadata(details_soup)
-                    for k, v in json_ld_data.items():
-                        if k in dataset_data and v:
-                            dataset_data[k] = v
-                        
-                    # Then try the general satellite data extractor
-                    structured = self.extract_satellite_data(details_soup, {'catalog_links': []})
-                    for k, v in structured.items():
-                        if k in dataset_data and v and not dataset_data[k]:  # Don't overwrite JSON-LD data
-                            dataset_data[k] = v
-                            
-                except Exception as e:
-                    print(f"          Detail parse error: {e}")
-            
-            # If we still have many unknowns and this is a developers.google.com page, try headless browser
-            if (details_soup is None or 
-                sum(1 for v in dataset_data.values() if v and v != 'Unknown') < 5) and 'developers.google.com' in href:
-                print(f"          Trying headless browser fallback for better extraction...")
-                headless_soup = self.extract_with_headless_browser(href)
-                if headless_soup:
-                    try:
-                        # Extract from fully rendered page
-                        headless_data = self.extract_json_ld_metadata(headless_soup)
-                        headless_structured = self.extract_satellite_data(headless_soup, {'catalog_links': []})
-                        
-                        # Merge headless data, preferring it over previous attempts
-                        for k, v in headless_data.items():
-                            if k in dataset_data and v:
-                                dataset_data[k] = v
-                        for k, v in headless_structured.items():
-                            if k in dataset_data and v:
-                                dataset_data[k] = v
-                                
-                        print(f"          Headless browser extracted additional data")
-                    except Exception as e:
-                        print(f"          Headless extraction error: {e}")
-            
-            # Extract provider from link text or URL
-            if 'copernicus' in text.lower() or 'copernicus' in href.lower():
-                dataset_data['dataset_provider'] = 'Copernicus'
-            elif 'nasa' in text.lower() or 'nasa' in href.lower():
-                dataset_data['dataset_provider'] = 'NASA'
-            elif 'esa' in text.lower() or 'esa' in href.lower():
-                dataset_data['dataset_data'] = 'ESA'
-            elif 'usgs' in text.lower() or 'usgs' in href.lower():
-                dataset_data['dataset_provider'] = 'USGS'
-            elif 'noaa' in text.lower() or 'noaa' in href.lower():
-                dataset_data['dataset_provider'] = 'NOAA'
-            
-            # Extract satellites from text
-            satellite_keywords = ['landsat', 'sentinel', 'modis', 'aster', 'viirs', 'olci', 'meris', 'seawifs']
-            for keyword in satellite_keywords:
-                if keyword in text.lower():
-                    dataset_data['satellites_used'].append(keyword.title())
-            
-            # Extract location from text
-            location_keywords = ['global', 'worldwide', 'continental', 'regional', 'local', 'greenland', 'arctic', 'antarctic']
-            for keyword in location_keywords:
-                if keyword in text.lower():
-                    dataset_data['location'] = keyword.title()
-                    break
-            
-            # Extract date patterns from text
-            date_patterns = [
-                r'(\d{4})',
-                r'(\d{4}-\d{2})',
-                r'(\d{4}/\d{2})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    if not dataset_data['date_range']['start']:
-                        dataset_data['date_range']['start'] = matches[0]
-                    elif not dataset_data['date_range']['end']:
-                        dataset_data['date_range']['end'] = matches[0]
-                    break
-            
-            # Extract categories from text
-            category_keywords = ['ocean', 'marine', 'land', 'atmosphere', 'climate', 'vegetation', 'water', 'ice', 'snow', 'urban', 'agriculture']
-            for keyword in category_keywords:
-                if keyword in text.lower():
-                    dataset_data['category_tags'].append(keyword.title())
-            
-            # Look for GEE code patterns in the link
-            if 'ee.' in text or 'ImageCollection' in text:
-                dataset_data['gee_code_snippet'] = text
-            
-            # Extract resolution from text
-            resolution_patterns = [
-                r'(\d+(?:\.\d+)?)\s*(?:meter|m|km)',
-                r'(\d+(?:\.\d+)?)\s*(?:pixel|resolution)'
-            ]
-            
-            for pattern in resolution_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    dataset_data['pixel_size'] = f"{matches[0]} meters"
-                    break
-            
-            # Look for description in link title or text
-            if link.get('title'):
-                dataset_data['description'] = link['title']
-            elif len(text) > 50:
-                dataset_data['description'] = text[:100] + "..."
-            
-            return dataset_data
-            
-        except Exception as e:
-            print(f"          Error extracting from dataset link: {e}")
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
             return None
+        position = self._rows[index.row()]
+        if role == self.DatasetRole:
+            return self._datasets[position]
+        if role == self.CategoryRole:
+            return self._categories[position]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._datasets[position].get('title', 'Unknown Dataset')
+        return None
 
-    def extract_links_by_thumbnails(self, soup, catalog_links):
-        """Extract links by finding ALL thumbnail images and their associated links"""
-        print("      Extracting ALL thumbnail-based links...")
-        
-        # Find ALL images that could be thumbnails
-        all_images = soup.find_all('img', src=True)
-        print(f"        Found {len(all_images)} total images")
-        
-        thumbnail_count = 0
-        for img in all_images:
-            # Check if this looks like a dataset thumbnail
-            if self.looks_like_dataset_thumbnail(img):
-                # Find associated link
-                link = self.find_link_for_thumbnail(img)
-                if link:
-                    href = link.get('href', '')
-                    text = link.get_text().strip()
-                    
-                    # Only add if we don't already have this link
-                    if not any(existing['href'] == href for existing in catalog_links):
-                        catalog_link = {
-                            'text': text,
-                            'href': href,
-                            'title': link.get('title', ''),
-                            'thumbnail': {
-                                'src': img.get('src', ''),
-                                'alt': img.get('alt', ''),
-                                'title': img.get('title', ''),
-                                'width': img.get('width', ''),
-                                'height': img.get('height', '')
-                            },
-                            'is_catalog_item': True,
-                            'link_type': 'thumbnail_based',
-                            'extraction_priority': 10,  # High priority for thumbnails
-                            'container_type': 'thumbnail_based'
-                        }
-                        catalog_links.append(catalog_link)
-                        thumbnail_count += 1
-                        
-                        if thumbnail_count <= 10:  # Show first 10 for debugging
-                            print(f"          Found thumbnail {thumbnail_count}: {text[:40]}...")
-        
-        print(f"        Extracted {thumbnail_count} thumbnail-based links")
-        return thumbnail_count
+    def category_filter(self):
+        return self._filter
 
-    def extract_json_ld_metadata(self, soup):
-        """Extract structured metadata from JSON-LD scripts"""
-        metadata = {}
+    def _category(self, dataset):
         try:
-            # Look for JSON-LD structured data
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        # Extract common fields
-                        if 'name' in data and not metadata.get('layer_name'):
-                            metadata['layer_name'] = data['name']
-                        if 'description' in data and not metadata.get('description'):
-                            metadata['description'] = data['description']
-                        if 'provider' in data and not metadata.get('dataset_provider'):
-                            metadata['dataset_provider'] = data['provider']['name'] if isinstance(data['provider'], dict) else data['provider']
-                        if 'datePublished' in data and not metadata.get('date_range'):
-                            metadata['date_range'] = {'start': data['datePublished'], 'end': ''}
-                        if 'identifier' in data and not metadata.get('doi'):
-                            # Check if it's a DOI
-                            identifier = data['identifier']
-                            if isinstance(identifier, dict) and identifier.get('@type') == 'PropertyValue':
-                                identifier = identifier.get('value', '')
-                            if 'doi.org' in str(identifier) or str(identifier).startswith('10.'):
-                                metadata['doi'] = str(identifier)
-                        if 'keywords' in data and not metadata.get('category_tags'):
-                            metadata['category_tags'] = data['keywords'] if isinstance(data['keywords'], list) else [data['keywords']]
-                        if 'spatialCoverage' in data and not metadata.get('location'):
-                            spatial = data['spatialCoverage']
-                            if isinstance(spatial, dict):
-                                if 'name' in spatial:
-                                    metadata['location'] = spatial['name']
-                                elif 'geo' in spatial:
-                                    geo = spatial['geo']
-                                    if isinstance(geo, dict) and 'latitude' in geo and 'longitude' in geo:
-                                        metadata['location'] = f"Lat: {geo['latitude']}, Lon: {geo['longitude']}"
-                except (json.JSONDecodeError, AttributeError) as e:
-                    continue
-            
-            # Also check for microdata attributes
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                property_name = meta.get('property', meta.get('name', ''))
-                content = meta.get('content', '')
-                
-                if 'og:title' in property_name and not metadata.get('layer_name'):
-                    metadata['layer_name'] = content
-                elif 'og:description' in property_name and not metadata.get('description'):
-                    metadata['description'] = content
-                elif 'citation_doi' in property_name and not metadata.get('doi'):
-                    metadata['doi'] = content
-                elif 'citation_author' in property_name and not metadata.get('dataset_provider'):
-                    metadata['dataset_provider'] = content
-                elif 'citation_keywords' in property_name and not metadata.get('category_tags'):
-                    metadata['category_tags'] = [kw.strip() for kw in content.split(',') if kw.strip()]
-            
-        except Exception as e:
-            print(f"          JSON-LD extraction error: {e}")
-        
-        return metadata
+            return sys.intern(self._classify(dataset))
+        except Exception:
+            return 'other'
 
-    def extract_with_headless_browser(self, url):
-        """Fallback: Use headless browser to get fully rendered content"""
-        try:
-            # Try to import playwright (install with: pip install playwright)
-            try:
-                from playwright.sync_api import sync_playwright
-            except ImportError:
-                print("          Playwright not installed. Install with: pip install playwright")
+    def set_datasets(self, datasets):
+        """Replace all datasets; each one is classified once here"""
+        self.beginResetModel()
+        self._datasets = list(datasets)
+        self._categories = [self._category(d) for d in self._datasets]
+        self._rows = self._matching_rows(0)
+        self.endResetModel()
+
+    def append_datasets(self, datasets):
+        """Append datasets, inserting only the rows that pass the current filter"""
+        start = len(self._datasets)
+        self._datasets.extend(datasets)
+        self._categories.extend(self._category(d) for d in datasets)
+        new_rows = self._matching_rows(start)
+        if new_rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+
+    def set_category_filter(self, category):
+        """Show only datasets of one category (None shows all)"""
+        self.beginResetModel()
+        self._filter = category
+        self._rows = self._matching_rows(0)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_datasets([])
+
+    def _matching_rows(self, start):
+        if self._filter is None:
+            return list(range(start, len(self._datasets)))
+        category = self._filter
+        return [i for i in range(start, len(self._categories)) if self._categories[i] == category]
+
+
+class DatasetGalleryDelegate(QStyledItemDelegate):
+    """Paints gallery cards directly; pixmaps come from a bounded QPixmapCache"""
+
+    CARD_SIZE = QSize(200, 280)
+    PIXMAP_CACHE_KB = 32 * 1024
+
+    def __init__(self, load_pixmap, category_color, parent=None):
+        super().__init__(parent)
+        self._load_pixmap = load_pixmap
+        self._category_color = category_color
+        self._missing = set()
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_KB))
+
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+
+    def pixmap_for(self, path):
+        """Pixmap for a thumbnail path, loaded on first paint and kept in the cache"""
+        if not path or path in self._missing:
+            return None
+        key = f"gallery:{path}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._load_pixmap(path)
+            if pixmap is None:
+                self._missing.add(path)
                 return None
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    viewport={"width": 1280, "height": 720}
-                )
-                page = context.new_page()
-                
-                # Navigate and wait for content to load
-                page.goto(url, wait_until='networkidle', timeout=30000)
-                
-                # Wait a bit more for dynamic content
-                page.wait_for_timeout(2000)
-                
-                # Get the fully rendered HTML
-                html_content = page.content()
-                context.close()
-                browser.close()
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-                return soup
-                
-        except Exception as e:
-            print(f"          Headless browser fallback failed: {e}")
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def forget_missing(self):
+        """Retry thumbnails that failed to load, e.g. once the model has been reset"""
+        self._missing.clear()
+
+    def paint(self, painter, option, index):
+        dataset = index.data(DatasetGalleryModel.DatasetRole)
+        if dataset is None:
+            return
+        category = index.data(DatasetGalleryModel.CategoryRole)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card = option.rect.adjusted(4, 4, -4, -4)
+        painter.setPen(QPen(QColor('#0078d4' if hovered or selected else '#3f3f46'), 2))
+        painter.setBrush(QColor('#373738' if hovered else '#2d2d30'))
+        painter.drawRoundedRect(card, 8, 8)
+
+        # Thumbnail image
+        image_rect = QRect(card.left() + (card.width() - 180) // 2, card.top() + 8, 180, 140)
+        painter.setPen(QColor('#555555'))
+        painter.setBrush(QColor('#1e1e1e'))
+        painter.drawRect(image_rect)
+        pixmap = self.pixmap_for(dataset.get('thumbnail_local_path', ''))
+        if pixmap is not None:
+            size = pixmap.deviceIndependentSize().toSize()
+            target = QRect(QPoint(0, 0), size)
+            target.moveCenter(image_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            painter.setPen(QColor('#cccccc'))
+            painter.drawText(image_rect, Qt.AlignmentFlag.AlignCenter, "No Image")
+
+        # Dataset title
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor('#ffffff'))
+        title_rect = QRect(card.left() + 6, image_rect.bottom() + 6, card.width() - 12, 48)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap,
+                         dataset.get('title', 'Unknown Dataset')[:40] + "...")
+
+        # Category badge
+        font.setPointSize(max(6, font.pointSize() - 2))
+        painter.setFont(font)
+        label = (category or 'other').title()
+        badge_width = painter.fontMetrics().horizontalAdvance(label) + 16
+        badge = QRect(card.center().x() - badge_width // 2, title_rect.bottom() + 4, badge_width, 20)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(self._category_color(category)))
+        painter.drawRoundedRect(badge, 10, 10)
+        painter.setPen(QColor('white'))
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, label)
+
+        # Confidence score
+        font.setBold(False)
+        painter.setFont(font)
+        painter.setPen(QColor('#cccccc'))
+        stats_rect = QRect(card.left(), badge.bottom() + 4, card.width(), 20)
+        painter.drawText(stats_rect, Qt.AlignmentFlag.AlignCenter,
+                         f"Quality: {dataset.get('confidence_score', 0)}% | "
+                         f"Complete: {dataset.get('data_completeness', 0)}%")
+        painter.restore()
+
+
+class CatalogTableModel(QAbstractTableModel):
+    """Satellite catalog rows; display values are computed once when a row is added"""
+
+    COLUMNS = [
+        "Layer Name", "Satellites", "Date Range", "Location", "Provider",
+        "Pixel Size", "Bands", "Categories", "Thumbnails", "GEE Code", "DOI",
+        "Description", "Citations", "Terms", "Status"
+    ]
+    SortRole = Qt.ItemDataRole.UserRole
+    RecordRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records = []
+        self._rows = []
+        self._source = None
+        self._consumed = 0
+        self._last = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
             return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == self.SortRole:
+            value = self._rows[index.row()][index.column()]
+            # Count columns sort numerically
+            return int(value) if index.column() in (8, 12) else value
+        if role == self.RecordRole:
+            return self._records[index.row()]
+        return None
+
+    def record(self, row):
+        """Collection record shown in a source row"""
+        return self._records[row]
+
+    def sync(self, extracted_data):
+        """Show new satellite catalog entries from extracted_data
+
+        Entries appended since the last call are inserted as new rows; the model is
+        only rebuilt when the list was replaced or truncated.
+        """
+        consumed = self._consumed
+        if (extracted_data is not self._source or len(extracted_data) < consumed
+                or (consumed and extracted_data[consumed - 1] is not self._last)):
+            self.beginResetModel()
+            self._records, self._rows = [], []
+            for data in extracted_data:
+                if data.get('satellite_catalog'):
+                    self._records.append(data)
+                    self._rows.append(self.format_row(data['satellite_catalog']))
+            self.endResetModel()
+        else:
+            new = [data for data in extracted_data[consumed:] if data.get('satellite_catalog')]
+            if new:
+                first = len(self._rows)
+                self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+                self._records.extend(new)
+                self._rows.extend(self.format_row(data['satellite_catalog']) for data in new)
+                self.endInsertRows()
+        self._source = extracted_data
+        self._consumed = len(extracted_data)
+        self._last = extracted_data[-1] if extracted_data else None
+
+    @staticmethod
+    def format_row(catalog):
+        """Display strings for one satellite catalog entry"""
+        satellites = catalog.get('satellites_used', [])
+        date_range = catalog.get('date_range', {})
+        bands = catalog.get('band_information', [])
+        categories = catalog.get('category_tags', [])
+        description = html.unescape(str(catalog.get('description', 'Unknown')))
+        terms = html.unescape(str(catalog.get('terms_of_use', 'Unknown')))
+
+        completeness = 0
+        if catalog.get('layer_name'): completeness += 1
+        if date_range.get('start') or date_range.get('end'): completeness += 1
+        if catalog.get('dataset_provider'): completeness += 1
+        if catalog.get('gee_code_snippet'): completeness += 1
+        if catalog.get('doi'): completeness += 1
+        status = ' Complete' if completeness >= 4 else ('➕ Partial' if completeness >= 2 else ' Incomplete')
+
+        return (
+            html.unescape(str(catalog.get('layer_name', 'Unknown'))),
+            html.unescape(', '.join(satellites) if satellites else 'Unknown'),
+            f"{date_range.get('start', '')} to {date_range.get('end', '')}",
+            html.unescape(str(catalog.get('location', 'Unknown'))),
+            html.unescape(str(catalog.get('dataset_provider', 'Unknown'))),
+            html.unescape(str(catalog.get('pixel_size', 'Unknown'))),
+            html.unescape(', '.join(bands) if bands else 'Unknown'),
+            html.unescape(', '.join(categories) if categories else 'Unknown'),
+            str(len(catalog.get('thumbnails') or [])),
+            'Found' if catalog.get('gee_code_snippet') else 'Not found',
+            html.unescape(str(catalog.get('doi', 'Unknown'))),
+            description[:50] + "..." if len(description) > 50 else description,
+            str(len(catalog.get('citations') or [])),
+            terms[:30] + "..." if len(terms) > 30 else terms,
+            status,
+        )
+
+
+class CatalogFilterProxyModel(QSortFilterProxyModel):
+    """Sorts the catalog table and applies the filter dialog criteria"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filters = {}
+        self.setSortRole(CatalogTableModel.SortRole)
+
+    def set_filters(self, filters):
+        if hasattr(self, 'beginFilterChange'):  # Qt >= 6.10
+            self.beginFilterChange()
+            self._filters = dict(filters or {})
+            self.endFilterChange()
+        else:
+            self._filters = dict(filters or {})
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._filters:
+            return True
+        catalog = self.sourceModel().record(source_row)['satellite_catalog']
+        if self._filters.get('provider') and catalog.get('dataset_provider', '').lower() != self._filters['provider']:
+            return False
+        if self._filters.get('location') and catalog.get('location', '').lower() != self._filters['location']:
+            return False
+        if self._filters.get('has_gee_code') and not catalog.get('gee_code_snippet'):
+            return False
+        if self._filters.get('has_doi') and not catalog.get('doi'):
+            return False
+        return True
+
+
+class ExtractionWorker(QRunnable):
+    """Runs an extraction job on a QThreadPool thread
+
+    The job reports back only through the UI's signals, so nothing here touches
+    widgets directly.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            self.fn(*self.args)
+        except Exception as e:
+            _logger.exception("extraction_worker_error")
+            _log_json('extraction_worker_error', error=str(e))
+
 
 class LocalHTMLDataExtractorUI(QWidget):
     """UI for local HTML data extraction"""
@@ -3225,6 +379,9 @@ class LocalHTMLDataExtractorUI(QWidget):
     error_updated = Signal(str)
     extraction_percent_updated = Signal(int)
     realtime_viewer_updated = Signal(str, object)
+    extraction_log_updated = Signal(str, str)
+    extraction_done = Signal()
+    console_appended = Signal(str)
     
     def __init__(self):
         super().__init__()
@@ -3257,9 +414,19 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.extracted_data = []
         self.is_extracting = False
         self.stop_requested = False
+        self.overwrite_existing = True  # copied from the checkbox at start; worker threads read this
         self.processed_files = set()
         self.processed_urls = set()  # Track processed URLs for link following
         
+        # Extraction runs on a worker thread; results reach the UI in batches
+        self.worker_pool = QThreadPool(self)
+        self.worker_pool.setMaxThreadCount(1)
+        self._pending_lock = threading.Lock()
+        self._pending_results = []
+        self._data_update_pending = False
+        self._latest_progress = (0, 0)
+        self._progress_pending = False
+        
         # Statistics
         self.total_processed = 0
         self.successful_extractions = 0
@@ -3276,6 +443,9 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.error_updated.connect(self.log_error)
         self.extraction_percent_updated.connect(self.update_extraction_percent)
         self.realtime_viewer_updated.connect(self._on_realtime_viewer_updated)
+        self.extraction_log_updated.connect(self.add_extraction_log_entry)
+        self.extraction_done.connect(self.extraction_finished)
+        self.console_appended.connect(self._append_console)
         
         # Load configuration after UI is ready
         self.load_config()
@@ -3389,6 +559,10 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.noop_mode_checkbox.setChecked(True)
         self.noop_mode_checkbox.setToolTip("Test mode - no actual data extraction")
 
+        self.profile_checkbox = QCheckBox(" Profile run")
+        self.profile_checkbox.setChecked(False)
+        self.profile_checkbox.setToolTip("Profile the run with cProfile and tracemalloc into collected_data/profiles")
+
         # Enhanced action buttons
         self.clear_data_btn = QPushButton(" Clear Extracted Data")
         self.clear_data_btn.clicked.connect(self.clear_extracted_data)
@@ -3405,6 +579,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         control_layout.addWidget(self.follow_links_checkbox)
         control_layout.addWidget(self.minimal_mode_checkbox)
         control_layout.addWidget(self.noop_mode_checkbox)
+        control_layout.addWidget(self.profile_checkbox)
         control_layout.addWidget(self.clear_data_btn)
         control_layout.addWidget(self.open_folder_btn)
         
@@ -3575,13 +750,11 @@ class LocalHTMLDataExtractorUI(QWidget):
         layout = QVBoxLayout()
         
         # Enhanced table with better columns
-        self.catalog_table = QTableWidget()
-        self.catalog_table.setColumnCount(15)
-        self.catalog_table.setHorizontalHeaderLabels([
-            "Layer Name", "Satellites", "Date Range", "Location", "Provider", 
-            "Pixel Size", "Bands", "Categories", "Thumbnails", "GEE Code", "DOI",
-            "Description", "Citations", "Terms", "Status"
-        ])
+        self.catalog_model = CatalogTableModel(self)
+        self.catalog_proxy = CatalogFilterProxyModel(self)
+        self.catalog_proxy.setSourceModel(self.catalog_model)
+        self.catalog_table = QTableView()
+        self.catalog_table.setModel(self.catalog_proxy)
         
         # Set column widths
         self.catalog_table.setColumnWidth(0, 200)  # Layer Name
@@ -3602,7 +775,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         
         # Enable sorting and selection
         self.catalog_table.setSortingEnabled(True)
-        self.catalog_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.catalog_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.catalog_table.setAlternatingRowColors(True)
         
         # Context menu
@@ -3610,7 +783,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.catalog_table.customContextMenuRequested.connect(self.show_catalog_context_menu)
         
         # Double-click to view details
-        self.catalog_table.itemDoubleClicked.connect(self.show_satellite_details)
+        self.catalog_table.doubleClicked.connect(self.show_satellite_details)
         
         layout.addWidget(self.catalog_table)
         self.catalog_tab.setLayout(layout)
@@ -3711,16 +884,25 @@ class LocalHTMLDataExtractorUI(QWidget):
         controls_layout.addWidget(self.gallery_filter_combo)
         controls_layout.addStretch()
 
-        # Gallery scroll area with thumbnail grid
-        self.gallery_scroll_area = QScrollArea()
-        self.gallery_widget = QWidget()
-        self.gallery_layout = QGridLayout(self.gallery_widget)
-        self.gallery_layout.setSpacing(10)
-
-        self.gallery_scroll_area.setWidget(self.gallery_widget)
-        self.gallery_scroll_area.setWidgetResizable(True)
-        self.gallery_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.gallery_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # Gallery view: only visible cards are painted, so cost does not grow with the catalog
+        self.gallery_model = DatasetGalleryModel(self.extractor.classify_single_dataset, self)
+        self.gallery_view = QListView()
+        self.gallery_view.setViewMode(QListView.ViewMode.IconMode)
+        self.gallery_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.gallery_view.setMovement(QListView.Movement.Static)
+        self.gallery_view.setUniformItemSizes(True)
+        self.gallery_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.gallery_view.setBatchSize(200)
+        self.gallery_view.setSpacing(5)
+        self.gallery_view.setMouseTracking(True)
+        self.gallery_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        gallery_delegate = DatasetGalleryDelegate(self.load_gallery_pixmap, self.get_category_color, self.gallery_view)
+        self.gallery_view.setItemDelegate(gallery_delegate)
+        self.gallery_view.setModel(self.gallery_model)
+        # Thumbnails missing before a reset may have been downloaded since
+        self.gallery_model.modelReset.connect(gallery_delegate.forget_missing)
+        self.gallery_view.clicked.connect(
+            lambda index: self.show_dataset_details(index.data(DatasetGalleryModel.DatasetRole)))
 
         # Gallery info panel
         self.gallery_info = QTextEdit()
@@ -3728,7 +910,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.gallery_info.setPlaceholderText("Select a dataset thumbnail to view details...")
 
         layout.addLayout(controls_layout)
-        layout.addWidget(self.gallery_scroll_area, 3)  # Give more space to gallery
+        layout.addWidget(self.gallery_view, 3)  # Give more space to gallery
         layout.addWidget(QLabel("Dataset Details:"))
         layout.addWidget(self.gallery_info, 1)
 
@@ -3737,148 +919,58 @@ class LocalHTMLDataExtractorUI(QWidget):
     def refresh_gallery(self):
         """Refresh the gallery with current datasets"""
         try:
-            self.clear_gallery()
-            self.populate_gallery()
+            self.populate_gallery(self.gallery_model.category_filter())
         except Exception as e:
             self.log_error(f"Failed to refresh gallery: {e}")
 
     def clear_gallery(self):
         """Clear all thumbnails from the gallery"""
         try:
-            # Remove all widgets from gallery layout
-            while self.gallery_layout.count():
-                child = self.gallery_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+            self.gallery_model.clear()
         except Exception as e:
             self.log_error(f"Failed to clear gallery: {e}")
 
     def filter_gallery(self, filter_text):
         """Filter gallery by dataset category"""
         try:
-            # Re-populate gallery with filtered results
-            self.clear_gallery()
-            self.populate_gallery(filter_category=filter_text.lower() if filter_text != 'All' else None)
+            self.gallery_model.set_category_filter(filter_text.lower() if filter_text != 'All' else None)
         except Exception as e:
             self.log_error(f"Failed to filter gallery: {e}")
 
     def populate_gallery(self, filter_category=None):
         """Populate gallery with dataset thumbnails"""
         try:
-            row = 0
-            col = 0
-            max_cols = 4
-
+            datasets = []
             for data in self.extracted_data:
-                datasets = data.get('satellite_catalog', {}).get('datasets', [])
-                if not datasets:
-                    continue
-
-                for dataset in datasets:
-                    # Apply filter if specified
-                    if filter_category:
-                        dataset_category = self.extractor.classify_single_dataset(dataset)
-                        if dataset_category != filter_category:
-                            continue
-
-                    # Create thumbnail widget
-                    thumbnail_widget = self.create_thumbnail_widget(dataset)
-                    if thumbnail_widget:
-                        self.gallery_layout.addWidget(thumbnail_widget, row, col)
-
-                        col += 1
-                        if col >= max_cols:
-                            col = 0
-                            row += 1
-
+                datasets.extend(data.get('satellite_catalog', {}).get('datasets', []))
+            self.gallery_model.set_category_filter(filter_category)
+            self.gallery_model.set_datasets(datasets)
         except Exception as e:
             self.log_error(f"Failed to populate gallery: {e}")
 
-    def create_thumbnail_widget(self, dataset):
-        """Create a thumbnail widget for a dataset"""
-        try:
-            # Main widget container
-            widget = QWidget()
-            widget.setFixedSize(200, 280)
-            widget.setStyleSheet("""
-                QWidget {
-                    border: 2px solid #3f3f46;
-                    border-radius: 8px;
-                    background-color: #2d2d30;
-                    margin: 4px;
-                }
-                QWidget:hover {
-                    border-color: #0078d4;
-                    background-color: #373738;
-                }
-            """)
-
-            layout = QVBoxLayout(widget)
-
-            # Thumbnail image
-            thumbnail_label = QLabel()
-            thumbnail_label.setFixedSize(180, 140)
-            thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            thumbnail_label.setStyleSheet("border: 1px solid #555; background-color: #1e1e1e;")
-
-            # Load thumbnail image
-            thumbnail_path = dataset.get('thumbnail_local_path', '')
-            if thumbnail_path and os.path.exists(thumbnail_path):
-                pixmap = QPixmap(thumbnail_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(
-                        thumbnail_label.size(),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    thumbnail_label.setPixmap(scaled_pixmap)
-                else:
-                    thumbnail_label.setText("\nNo Image")
-            else:
-                thumbnail_label.setText("\nNo Image")
-
-            # Dataset title
-            title_label = QLabel(dataset.get('title', 'Unknown Dataset')[:40] + "...")
-            title_label.setWordWrap(True)
-            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            title_label.setStyleSheet("font-weight: bold; color: #ffffff; border: none;")
-
-            # Category badge
-            category = self.extractor.classify_single_dataset(dataset)
-            category_label = QLabel(category.title())
-            category_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            category_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {self.get_category_color(category)};
-                    color: white;
-                    padding: 2px 8px;
-                    border-radius: 12px;
-                    border: none;
-                    font-size: 10px;
-                    font-weight: bold;
-                }}
-            """)
-
-            # Confidence score
-            confidence = dataset.get('confidence_score', 0)
-            completeness = dataset.get('data_completeness', 0)
-            stats_label = QLabel(f"Quality: {confidence}% | Complete: {completeness}%")
-            stats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            stats_label.setStyleSheet("font-size: 9px; color: #cccccc; border: none;")
-
-            layout.addWidget(thumbnail_label)
-            layout.addWidget(title_label)
-            layout.addWidget(category_label)
-            layout.addWidget(stats_label)
-
-            # Make widget clickable
-            widget.mousePressEvent = lambda event, ds=dataset: self.show_dataset_details(ds)
-
-            return widget
-
-        except Exception as e:
-            self.log_error(f"Failed to create thumbnail widget: {e}")
+    def load_gallery_pixmap(self, thumbnail_path):
+        """Load the pre-scaled gallery variant of a thumbnail (2x on HiDPI screens)"""
+        if not thumbnail_path:
             return None
+        scales = (2, 1) if self.devicePixelRatioF() > 1 else (1,)
+        for scale in scales:
+            variant = thumbnail_variant_path(thumbnail_path, scale)
+            if os.path.exists(variant):
+                pixmap = QPixmap(variant)
+                if not pixmap.isNull():
+                    pixmap.setDevicePixelRatio(scale)
+                    return pixmap
+
+        # Not pre-scaled yet: fall back to scaling the original
+        if os.path.exists(thumbnail_path):
+            pixmap = QPixmap(thumbnail_path)
+            if not pixmap.isNull():
+                return pixmap.scaled(
+                    QSize(*GALLERY_THUMBNAIL_SIZE),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+        return None
 
     def get_category_color(self, category):
         """Get color for dataset category"""
@@ -3924,42 +1016,8 @@ class LocalHTMLDataExtractorUI(QWidget):
             if not datasets:
                 return
 
-            # Get current filter
-            current_filter = self.gallery_filter_combo.currentText().lower()
-            filter_category = current_filter if current_filter != 'all' else None
-
-            # Add new thumbnails for each dataset
-            current_row = self.gallery_layout.rowCount()
-            current_col = 0
-            max_cols = 4
-
-            for dataset in datasets:
-                # Apply filter if specified
-                if filter_category:
-                    dataset_category = self.extractor.classify_single_dataset(dataset)
-                    if dataset_category != filter_category:
-                        continue
-
-                # Create and add thumbnail widget
-                thumbnail_widget = self.create_thumbnail_widget(dataset)
-                if thumbnail_widget:
-                    # Find next available position
-                    while self.gallery_layout.itemAtPosition(current_row, current_col):
-                        current_col += 1
-                        if current_col >= max_cols:
-                            current_col = 0
-                            current_row += 1
-
-                    self.gallery_layout.addWidget(thumbnail_widget, current_row, current_col)
-
-                    current_col += 1
-                    if current_col >= max_cols:
-                        current_col = 0
-                        current_row += 1
-
-            # Update gallery widget
-            self.gallery_widget.update()
-
+            # Rows outside the current filter are kept but not shown
+            self.gallery_model.append_datasets(datasets)
         except Exception as e:
             self.log_error(f"Failed to update gallery in real-time: {e}")
 
@@ -4070,19 +1128,35 @@ class LocalHTMLDataExtractorUI(QWidget):
             'safe_mode': self.config['safe_mode'],
             'limits': self.config.get('limits', {})
         })
+        self.extractor.config['profile']['enabled'] = self.profile_checkbox.isChecked()
         self.extraction_log.clear()
-        self.add_extraction_log_entry("🛑 Extraction is disabled in this build.", "warning")
-        self.status_label.setText("Extraction disabled")
-        self.extraction_status_label.setText("Disabled")
-        self.extraction_status_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #6c757d;")
-        _log_json('extraction_disabled', files=self.file_list.count())
-        self.extraction_finished()
+        self.stop_requested = False
+        self.overwrite_existing = self.overwrite_checkbox.isChecked()
+        self.is_extracting = True
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.status_label.setText("Extracting...")
+        self.extraction_status_label.setText("Running")
+        self.extraction_status_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #28a745;")
+        
+        # Reset progress bar for extraction process
+        self.progress_bar.setMaximum(100)  # Use percentage-based progress
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        self.start_extraction_logging()
+        file_paths = [self.file_list.item(i).text() for i in range(self.file_list.count())]
+        _log_json('extraction_started', files=len(file_paths))
+        self.worker_pool.start(ExtractionWorker(self.extract_from_files_profiled, file_paths))
     
     def stop_extraction(self):
-        """Stop extraction process"""
+        """Stop extraction process
+
+        Start stays disabled until the worker sees the request and emits
+        extraction_done, so a new run cannot queue behind the stopping one.
+        """
         self.stop_requested = True
         self.is_extracting = False
-        self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         try:
             _log_json('ui_stop_clicked')
@@ -4095,25 +1169,27 @@ class LocalHTMLDataExtractorUI(QWidget):
         
         # Update current status
         self.current_file_label.setText("No file being processed")
-        self.current_status_label.setText("Stopped by user")
+        self.current_status_label.setText("Stopping...")
         
         # Add stop entry to extraction log
-        self.add_extraction_log_entry("🛑 Extraction stopped by user", "warning")
+        self.add_extraction_log_entry("🛑 Extraction stop requested by user", "warning")
         
         self.log_message("🛑 Extraction stopped by user")
     
-    def extract_from_files(self):
-        """Extract data from all HTML files in the list"""
+    def extract_from_files_profiled(self, file_paths):
+        """Run extract_from_files as one profile when the profile checkbox is on (worker thread)"""
+        with self.extractor.profiling('ui_extraction') as run:
+            self.extract_from_files(file_paths)
+        if run['pstats']:
+            self.log_message(f" Profile saved to: {run['pstats']} (report: {run['report']})")
+
+    def extract_from_files(self, file_paths):
+        """Extract data from HTML files (runs on the worker thread)"""
         try:
             _log_json('worker_start')
-            file_paths = [self.file_list.item(i).text() for i in range(self.file_list.count())]
             total_files = len(file_paths)
             _log_json('worker_files_collected', total=total_files)
             
-            # Reset progress bar for extraction process
-            self.progress_bar.setMaximum(100)  # Use percentage-based progress
-            self.progress_bar.setValue(0)
-            self.progress_bar.setVisible(True)
             self.status_updated.emit("Starting extraction...")
             
             self.log_message(f" Starting local HTML data extraction...")
@@ -4136,10 +1212,6 @@ class LocalHTMLDataExtractorUI(QWidget):
                     self.log_message(f" Following links from {os.path.basename(file_path)} to extract data from each page...")
                     self.follow_links_from_file(file_path, i+1, total_files)
                     _log_json('worker_file_done', file=file_path)
-                    
-                    time.sleep(0.1)  # Small delay to prevent UI freezing
-                else:
-                    time.sleep(1)  # Longer delay on failure
                 
                 # Memory cleanup every batch
                 if (i + 1) % batch_size == 0:
@@ -4153,28 +1225,21 @@ class LocalHTMLDataExtractorUI(QWidget):
             self.log_error(f" Extraction failed: {e}")
             _log_json('worker_error', error=str(e))
         finally:
-            self.extraction_finished()
+            self.extractor.write_metrics_snapshot()
+            self.extraction_done.emit()
     
     def follow_links_from_file(self, file_path, current, total):
         """Follow links found in an HTML file to extract data from each linked page"""
         try:
-            # Read the HTML file to find only image-wrapped links
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            try:
-                import lxml  # noqa: F401
-                soup = BeautifulSoup(content, 'lxml')
-            except Exception:
-                soup = BeautifulSoup(content, 'html.parser')
+            # Stream the memory-mapped HTML file and collect only anchors that contain an <img>
+            with MappedHTMLFile(file_path) as f:
+                image_anchors = self.extractor.find_links(f, with_img=True)
             
-            # Collect anchors that contain an <img>
             img_links = []
-            for a in soup.find_all('a', href=True):
-                if a.find('img') is not None:
-                    href = a.get('href', '').strip()
-                    text = a.get_text(" ", strip=True)
-                    if href and href.startswith('http'):
-                        img_links.append({'href': href, 'text': text})
+            for link in image_anchors:
+                href = link['href'].strip()
+                if href and href.startswith('http'):
+                    img_links.append({'href': href, 'text': link['text']})
             
             self.total_links = len(img_links)
             self.log_message(f" Image links discovered: {self.total_links}")
@@ -4182,48 +1247,47 @@ class LocalHTMLDataExtractorUI(QWidget):
             if self.total_links == 0:
                 return
             
-            # Process each image link: fetch, extract names, save minimal JSON
-            for i, link in enumerate(img_links, start=1):
-                if self.stop_requested:
-                    break
-                url = link['href']
-                self.log_message(f"🌐 [{i}/{self.total_links}] Fetching: {url}")
-                _log_json('fetch_link', index=i, total=self.total_links, url=url)
-                try:
-                    resp = self.session.get(url, timeout=self.extractor.config.get('performance', {}).get('timeout', 15))
-                    status = resp.status_code
-                    if status != 200:
-                        self.log_message(f"    HTTP {status} for {url}")
-                        _log_json('fetch_non_200', url=url, status=status)
-                        continue
-                    page_html = resp.text
+            # Fetch all image links concurrently (rate limited per host), then
+            # process each one in order: extract names, save minimal JSON
+            fetched = self.extractor.get_fetcher().iter_fetch(
+                [link['href'] for link in img_links],
+                timeout=self.extractor.config.get('performance', {}).get('timeout', 15)
+            )
+            with contextlib.closing(fetched):
+                for i, (link, result) in enumerate(zip(img_links, fetched), start=1):
+                    if self.stop_requested:
+                        break
+                    url = link['href']
+                    self.log_message(f"🌐 [{i}/{self.total_links}] Fetched: {url}")
+                    _log_json('fetch_link', index=i, total=self.total_links, url=url)
                     try:
-                        import lxml  # noqa: F401
-                        page_soup = BeautifulSoup(page_html, 'lxml')
-                    except Exception:
-                        page_soup = BeautifulSoup(page_html, 'html.parser')
-                    names = self.extract_names_from_soup(page_soup)
-                    title = (page_soup.title.get_text().strip() if page_soup.title else '')
-                    self.log_message(f"    Names: {len(names)} | Title: {title[:60]}")
-                    _log_json('link_names_extracted', url=url, count=len(names), sample=names[:5])
-                    data = {
-                        'source_file': file_path,
-                        'link_url': url,
-                        'timestamp': datetime.now().isoformat(),
-                        'title': title,
-                        'names': names,
-                        'extraction_summary': {'mode': 'names_only_link'}
-                    }
-                    json_file = self.extractor.save_data_to_json(data, file_path)
-                    if json_file:
-                        self.log_message(f"    Saved: {os.path.basename(json_file)}")
-                        _log_json('link_saved', url=url, json=json_file)
-                except Exception as e:
-                    self.log_message(f"    Link processing failed: {e}")
-                    _log_json('link_error', url=url, error=str(e))
-                finally:
-                    # Small delay to keep UI responsive
-                    time.sleep(0.1)
+                        if result['error'] is not None:
+                            error_response = getattr(result['error'], 'response', None)
+                            if error_response is None:
+                                raise result['error']
+                            self.log_message(f"    HTTP {error_response.status_code} for {url}")
+                            _log_json('fetch_non_200', url=url, status=error_response.status_code)
+                            continue
+                        page_soup = self.extractor.make_soup(result['response'].text)
+                        names = self.extract_names_from_soup(page_soup)
+                        title = (page_soup.title.get_text().strip() if page_soup.title else '')
+                        self.log_message(f"    Names: {len(names)} | Title: {title[:60]}")
+                        _log_json('link_names_extracted', url=url, count=len(names), sample=names[:5])
+                        data = {
+                            'source_file': file_path,
+                            'link_url': url,
+                            'timestamp': datetime.now().isoformat(),
+                            'title': title,
+                            'names': names,
+                            'extraction_summary': {'mode': 'names_only_link'}
+                        }
+                        json_file = self.extractor.save_data_to_json(data, file_path)
+                        if json_file:
+                            self.log_message(f"    Saved: {os.path.basename(json_file)}")
+                            _log_json('link_saved', url=url, json=json_file)
+                    except Exception as e:
+                        self.log_message(f"    Link processing failed: {e}")
+                        _log_json('link_error', url=url, error=str(e))
             
             self.log_message(f" Completed processing {self.total_links} image links")
         except Exception as e:
@@ -4235,10 +1299,12 @@ class LocalHTMLDataExtractorUI(QWidget):
             # Force garbage collection
             gc.collect()
             
-            # Log memory usage
+            # Log memory usage and publish it with the stage timings
             process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            self.log_message(f" Memory usage: {memory_mb:.1f} MB")
+            rss = process.memory_info().rss
+            METRICS.set_gauge('process_rss_bytes', rss)
+            self.extractor.write_metrics_snapshot()
+            self.log_message(f" Memory usage: {rss / 1024 / 1024:.1f} MB")
             
         except Exception as e:
             self.log_message(f" Memory cleanup failed: {e}")
@@ -4250,7 +1316,7 @@ class LocalHTMLDataExtractorUI(QWidget):
             _log_json('file_skipped_hard', file=file_path)
             self.successful_extractions += 1
             self.processed_files.add(file_path)
-            self.data_updated.emit()
+            self.post_result()
             return True
             
         except Exception as e:
@@ -4279,126 +1345,95 @@ class LocalHTMLDataExtractorUI(QWidget):
             self.log_message(" No valid links found")
             return
         
+        # Fetch pages concurrently; the per-host token bucket replaces fixed sleeps.
+        # Which links to fetch is decided once, so each result pairs with its own URL.
+        links = list(dict.fromkeys(links))
+        skipped = [url in self.processed_urls and not self.overwrite_existing for url in links]
+        fetched = self.extractor.get_fetcher().iter_fetch(
+            [url for url, skip in zip(links, skipped) if not skip], retries=2, **self.link_request_kwargs()
+        )
+        
         # Process links
-        for i, url in enumerate(links):
-            if self.stop_requested:
-                break
-            
-            self.log_message(f" Processing {i+1}/{len(links)}: {url}")
-            success = self.process_link(url, i+1, len(links))
+        with contextlib.closing(fetched):
+            for i, (url, skip) in enumerate(zip(links, skipped)):
+                if self.stop_requested:
+                    break
             
-            if success:
-                time.sleep(self.config['performance']['request_delay'])
-            else:
-                time.sleep(5)  # Longer delay on failure
+                self.log_message(f" Processing {i+1}/{len(links)}: {url}")
+                prefetched = None if skip else next(fetched)
+                self.process_link(url, i+1, len(links), prefetched)
             
-            # Memory cleanup every 10 processed items
-            if (i + 1) % 10 == 0:
-                self.cleanup_memory()
+                # Memory cleanup every 10 processed items
+                if (i + 1) % 10 == 0:
+                    self.cleanup_memory()
         
         self.log_message(" Collection completed!")
         self.show_summary()
     
-    def process_link(self, url, current, total):
+    def link_request_kwargs(self):
+        """Request options used when fetching linked catalog pages"""
+        return {
+            'timeout': self.config['performance']['timeout'],
+            'verify': False,
+            'allow_redirects': True,
+            # Enhanced headers for better compatibility
+            'headers': {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            }
+        }
+    
+    def process_link(self, url, current, total, prefetched=None):
         """Process individual link and extract data from the linked page"""
         try:
             # Check if URL already processed (unless overwrite is enabled)
-            if url in self.processed_urls and not self.overwrite_checkbox.isChecked():
+            if url in self.processed_urls and not self.overwrite_existing:
                 self.log_message(f"⏭️ Skipping already processed: {url}")
+                METRICS.inc('links_processed_total', result='skipped')
                 return True
             
             self.total_processed += 1
-            self.progress_updated.emit(current, total)
+            self.post_progress(current, total)
             self.status_updated.emit(f"Processing: {current}/{total}")
             
-            # Enhanced request with retry mechanism
-            max_retries = 3
-            retry_delay = 2
+            # Request with retry mechanism (skipped when the page was prefetched)
+            if prefetched is None:
+                prefetched = self.extractor.get_fetcher().fetch(url, retries=2, **self.link_request_kwargs())
+            if prefetched['error'] is not None:
+                error = prefetched['error']
+                if isinstance(error, requests.exceptions.Timeout):
+                    self.log_error(f"⏰ Timeout: {url}")
+                elif isinstance(error, requests.exceptions.ConnectionError):
+                    self.log_error(f"🌐 Connection error: {url}")
+                elif isinstance(error, requests.exceptions.HTTPError):
+                    self.log_error(f"📡 HTTP error {error.response.status_code}: {url}")
+                else:
+                    self.log_error(f" Request failed: {error} - {url}")
+                return False
+            response = prefetched['response']
             
-            for attempt in range(max_retries):
-                try:
-                    # Enhanced headers for better compatibility
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Cache-Control': 'no-cache',
-                        'Pragma': 'no-cache'
-                    }
-                    
-                    response = self.session.get(
-                        url, 
-                        timeout=self.config['performance']['timeout'],
-                        verify=False,
-                        headers=headers,
-                        allow_redirects=True
-                    )
-                    response.raise_for_status()
-                    
-                    # Check if response is HTML
-                    content_type = response.headers.get('content-type', '').lower()
-                    if not content_type.startswith('text/html'):
-                        self.log_error(f" URL does not return HTML: {content_type} - {url}")
-                        return False
-                    
-                    break  # Success, exit retry loop
-                    
-                except requests.exceptions.Timeout:
-                    self.log_error(f"⏰ Timeout (attempt {attempt + 1}/{max_retries}): {url}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        return False
-                        
-                except requests.exceptions.ConnectionError:
-                    self.log_error(f"🌐 Connection error (attempt {attempt + 1}/{max_retries}): {url}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        return False
-                        
-                except requests.exceptions.HTTPError as e:
-                    self.log_error(f"📡 HTTP error {e.response.status_code} (attempt {attempt + 1}/{max_retries}): {url}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        return False
-                        
-                except Exception as e:
-                    self.log_error(f" Request failed (attempt {attempt + 1}/{max_retries}): {e} - {url}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                    else:
-                        return False
+            # Check if response is HTML
+            content_type = response.headers.get('content-type', '').lower()
+            if not content_type.startswith('text/html'):
+                self.log_error(f" URL does not return HTML: {content_type} - {url}")
+                return False
             
             # Parse response
             try:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = self.extractor.make_soup(response.content)
             except Exception as e:
                 self.log_error(f" Failed to parse response: {e}")
                 return False
             
             # Collect ALL data from the linked page using the extractor
             def link_progress(pct):
-                try:
-                    self.links_progress.setMaximum(100)
-                    self.links_progress.setValue(int(pct))
-                    self.current_status_label.setText(f"Processing link: {int(pct)}%")
-                    QApplication.processEvents()
-                except Exception:
-                    pass
+                self.extraction_percent_updated.emit(int(pct))
             def link_log(msg):
-                try:
-                    self.add_extraction_log_entry(msg, "info")
-                except Exception:
-                    pass
+                self.extraction_log_updated.emit(msg, "info")
             data = self.extractor.extract_all_data(soup, url, link_progress, link_log)
             
             # Save to JSON file
@@ -4418,7 +1453,7 @@ class LocalHTMLDataExtractorUI(QWidget):
                 if data.get('satellite_catalog'):
                     satellite_name = data['satellite_catalog'].get('layer_name', 'Unknown_Satellite')
                     if satellite_name == 'Unknown_Satellite':
-                        satellite_name = f"Satellite_{len(self.extracted_data) + 1}"
+                        satellite_name = f"Satellite_{len(self.extracted_data) + len(self._pending_results) + 1}"
                     
                     # Save to satellite catalog
                     catalog_file = self.extractor.save_satellite_catalog_data(
@@ -4428,13 +1463,12 @@ class LocalHTMLDataExtractorUI(QWidget):
                     if catalog_file:
                         collection_info['catalog_file'] = catalog_file
                 
-                self.extracted_data.append(collection_info)
                 self.successful_extractions += 1
                 self.processed_urls.add(url)
-                self.data_updated.emit()
+                METRICS.inc('links_processed_total', result='saved')
 
-                # Update gallery in real-time
-                self.update_gallery_realtime(collection_info)
+                # Table, gallery and dashboard pick this up with the next batch
+                self.post_result(collection_info)
                 
                 self.log_updated.emit(
                     f" {data.get('title', 'Unknown')[:50]}... "
@@ -4456,24 +1490,54 @@ class LocalHTMLDataExtractorUI(QWidget):
             
             else:
                 self.failed_extractions += 1
+                METRICS.inc('links_processed_total', result='failed')
                 self.log_updated.emit(f" Failed to save data for: {url}")
             
             return True
             
         except Exception as e:
             self.failed_extractions += 1
+            METRICS.inc('links_processed_total', result='failed')
             self.error_updated.emit(f" Failed to process {url}: {e}")
             return False
     
+    def post_progress(self, current, total):
+        """Report progress from a worker thread; repeated updates collapse into one signal"""
+        with self._pending_lock:
+            self._latest_progress = (current, total)
+            if self._progress_pending:
+                return
+            self._progress_pending = True
+        self.progress_updated.emit(current, total)
+
+    def post_result(self, collection_info=None):
+        """Queue a finished record from a worker thread for the next UI batch"""
+        with self._pending_lock:
+            if collection_info is not None:
+                self._pending_results.append(collection_info)
+            if self._data_update_pending:
+                return
+            self._data_update_pending = True
+        self.data_updated.emit()
+
+    def take_pending_results(self):
+        """Records queued by workers since the last data update"""
+        with self._pending_lock:
+            results, self._pending_results = self._pending_results, []
+            self._data_update_pending = False
+        return results
+
     def update_progress(self, current, total):
         """Update file-level progress (does not affect main percent bar)"""
         try:
+            with self._pending_lock:
+                current, total = self._latest_progress if self._progress_pending else (current, total)
+                self._progress_pending = False
             self.files_progress.setMaximum(total)
             self.files_progress.setValue(current)
             self.files_progress.setFormat(f"Files: {current}/{total}")
             self.files_progress.setVisible(True)
             self.current_status_label.setText(f"Processing file {current}/{total}")
-            QApplication.processEvents()
         except Exception:
             pass
     
@@ -4484,6 +1548,13 @@ class LocalHTMLDataExtractorUI(QWidget):
     def update_data_viewer_after_extraction(self):
         """Update data viewer after successful extraction"""
         try:
+            # Everything workers finished since the last update arrives as one batch
+            results = self.take_pending_results()
+            if results:
+                self.extracted_data.extend(results)
+                for collection_info in results:
+                    self.update_gallery_realtime(collection_info)
+            
             # Update summary dashboard
             self.update_summary_dashboard()
             
@@ -4524,23 +1595,15 @@ class LocalHTMLDataExtractorUI(QWidget):
         except Exception as e:
             self.log_error(f"Failed to add extraction log entry: {e}")
     
-    def show_satellite_details(self, item):
+    def show_satellite_details(self, index):
         """Show detailed view of a satellite dataset"""
         try:
-            row = item.row()
-            if row < self.catalog_table.rowCount():
-                # Get the data for this row
-                catalog_data = []
-                for data in self.extracted_data:
-                    if data.get('satellite_catalog'):
-                        catalog_data.append(data)
+            if index.isValid():
+                data = self.catalog_proxy.data(index, CatalogTableModel.RecordRole)
+                catalog = data.get('satellite_catalog', {})
                 
-                if row < len(catalog_data):
-                    data = catalog_data[row]
-                    catalog = data.get('satellite_catalog', {})
-                    
-                    # Create detailed view dialog
-                    self.show_satellite_detail_dialog(catalog, data)
+                # Create detailed view dialog
+                self.show_satellite_detail_dialog(catalog, data)
                     
         except Exception as e:
             self.log_error(f"Failed to show satellite details: {e}")
@@ -4795,7 +1858,7 @@ class LocalHTMLDataExtractorUI(QWidget):
                     })
             
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                json.dump(export_data, f, indent=2, ensure_ascii=False, default=json_default)
                 
         except Exception as e:
             raise Exception(f"JSON export failed: {e}")
@@ -4956,35 +2019,7 @@ class LocalHTMLDataExtractorUI(QWidget):
     def update_catalog_table_with_filters(self):
         """Update catalog table with applied filters"""
         try:
-            # Filter the data
-            filtered_data = []
-            for data in self.extracted_data:
-                if data.get('satellite_catalog'):
-                    catalog = data['satellite_catalog']
-                    
-                    # Apply filters
-                    if self.current_filters.get('provider') and catalog.get('dataset_provider', '').lower() != self.current_filters['provider']:
-                        continue
-                    
-                    if self.current_filters.get('location') and catalog.get('location', '').lower() != self.current_filters['location']:
-                        continue
-                    
-                    if self.current_filters.get('has_gee_code') and not catalog.get('gee_code_snippet'):
-                        continue
-                    
-                    if self.current_filters.get('has_doi') and not catalog.get('doi'):
-                        continue
-                    
-                    filtered_data.append(data)
-            
-            # Update table with filtered data
-            self.catalog_table.setRowCount(len(filtered_data))
-            
-            for row, data in enumerate(filtered_data):
-                # ... (same table population logic as update_catalog_table)
-                # This would be the same as the existing update_catalog_table method
-                pass
-                
+            self.catalog_proxy.set_filters(getattr(self, 'current_filters', {}))
         except Exception as e:
             self.log_error(f"Failed to update catalog table with filters: {e}")
     
@@ -5095,10 +2130,10 @@ class LocalHTMLDataExtractorUI(QWidget):
         try:
             menu = QMenu()
             
-            # Get the item under the cursor
-            item = self.catalog_table.itemAt(position)
-            if item:
-                row = item.row()
+            # Get the row under the cursor
+            index = self.catalog_table.indexAt(position)
+            if index.isValid():
+                row = self.catalog_proxy.mapToSource(index).row()
                 
                 # Add context menu actions
                 view_details = menu.addAction("👁️ View Details")
@@ -5106,7 +2141,7 @@ class LocalHTMLDataExtractorUI(QWidget):
                 open_source = menu.addAction("🌐 Open Source")
                 
                 # Connect actions
-                view_details.triggered.connect(lambda: self.show_satellite_details(item))
+                view_details.triggered.connect(lambda: self.show_satellite_details(index))
                 export_row.triggered.connect(lambda: self.export_table_row(row))
                 open_source.triggered.connect(lambda: self.open_source_file(row))
                 
@@ -5118,16 +2153,9 @@ class LocalHTMLDataExtractorUI(QWidget):
     def export_table_row(self, row):
         """Export a single table row to JSON"""
         try:
-            if row < self.catalog_table.rowCount():
-                # Get the data for this row
-                catalog_data = []
-                for data in self.extracted_data:
-                    if data.get('satellite_catalog'):
-                        catalog_data.append(data)
-                
-                if row < len(catalog_data):
-                    data = catalog_data[row]
-                    
+            if row < self.catalog_model.rowCount():
+                data = self.catalog_model.record(row)
+                if data:
                     # Export to file
                     export_dir = os.path.join(self.extractor.output_dir, "exports")
                     if not os.path.exists(export_dir):
@@ -5137,7 +2165,7 @@ class LocalHTMLDataExtractorUI(QWidget):
                     filename = os.path.join(export_dir, f"row_{row}_{timestamp}.json")
                     
                     with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                        json.dump(data, f, indent=2, ensure_ascii=False, default=json_default)
                     
                     self.log_message(f"📤 Exported row {row} to: {os.path.basename(filename)}")
                     
@@ -5147,15 +2175,9 @@ class LocalHTMLDataExtractorUI(QWidget):
     def open_source_file(self, row):
         """Open the source file for a table row"""
         try:
-            if row < self.catalog_table.rowCount():
-                # Get the data for this row
-                catalog_data = []
-                for data in self.extracted_data:
-                    if data.get('satellite_catalog'):
-                        catalog_data.append(data)
-                
-                if row < len(catalog_data):
-                    data = catalog_data[row]
+            if row < self.catalog_model.rowCount():
+                data = self.catalog_model.record(row)
+                if data:
                     source_file = data.get('file_path', '')
                     
                     if source_file and os.path.exists(source_file):
@@ -5239,92 +2261,8 @@ class LocalHTMLDataExtractorUI(QWidget):
     def update_catalog_table(self):
         """Update the satellite catalog table with extracted data"""
         try:
-            # Filter data to only show satellite catalog entries
-            catalog_data = []
-            for data in self.extracted_data:
-                if data.get('satellite_catalog'):
-                    catalog_data.append(data)
-            
-            self.catalog_table.setRowCount(len(catalog_data))
-            
-            for row, data in enumerate(catalog_data):
-                catalog = data.get('satellite_catalog', {})
-                
-                # Layer Name
-                layer_name = html.unescape(str(catalog.get('layer_name', 'Unknown')))
-                self.catalog_table.setItem(row, 0, QTableWidgetItem(layer_name))
-                
-                # Satellites
-                satellites = catalog.get('satellites_used', [])
-                satellites_str = ', '.join(satellites) if satellites else 'Unknown'
-                self.catalog_table.setItem(row, 1, QTableWidgetItem(html.unescape(satellites_str)))
-                
-                # Date Range
-                date_range = catalog.get('date_range', {})
-                date_str = f"{date_range.get('start', '')} to {date_range.get('end', '')}"
-                self.catalog_table.setItem(row, 2, QTableWidgetItem(date_str))
-                
-                # Location
-                location = html.unescape(str(catalog.get('location', 'Unknown')))
-                self.catalog_table.setItem(row, 3, QTableWidgetItem(location))
-                
-                # Provider
-                provider = html.unescape(str(catalog.get('dataset_provider', 'Unknown')))
-                self.catalog_table.setItem(row, 4, QTableWidgetItem(provider))
-                
-                # Pixel Size
-                pixel_size = html.unescape(str(catalog.get('pixel_size', 'Unknown')))
-                self.catalog_table.setItem(row, 5, QTableWidgetItem(pixel_size))
-                
-                # Bands
-                bands = catalog.get('band_information', [])
-                bands_str = ', '.join(bands) if bands else 'Unknown'
-                self.catalog_table.setItem(row, 6, QTableWidgetItem(html.unescape(bands_str)))
-                
-                # Categories
-                categories = catalog.get('category_tags', [])
-                categories_str = ', '.join(categories) if categories else 'Unknown'
-                self.catalog_table.setItem(row, 7, QTableWidgetItem(html.unescape(categories_str)))
-                
-                # Thumbnails
-                thumbnails = catalog.get('thumbnails', [])
-                thumbnails_count = len(thumbnails) if thumbnails else 0
-                self.catalog_table.setItem(row, 8, QTableWidgetItem(str(thumbnails_count)))
-                
-                # GEE Code
-                gee_code = catalog.get('gee_code_snippet', '')
-                gee_code_str = 'Found' if gee_code else 'Not found'
-                self.catalog_table.setItem(row, 9, QTableWidgetItem(gee_code_str))
-                
-                # DOI
-                doi = html.unescape(str(catalog.get('doi', 'Unknown')))
-                self.catalog_table.setItem(row, 10, QTableWidgetItem(doi))
-                
-                # Description
-                description = html.unescape(str(catalog.get('description', 'Unknown')))
-                desc_str = description[:50] + "..." if len(description) > 50 else description
-                self.catalog_table.setItem(row, 11, QTableWidgetItem(desc_str))
-                
-                # Citations
-                citations = catalog.get('citations', [])
-                citations_count = len(citations) if citations else 0
-                self.catalog_table.setItem(row, 12, QTableWidgetItem(str(citations_count)))
-                
-                # Terms
-                terms = html.unescape(str(catalog.get('terms_of_use', 'Unknown')))
-                terms_str = terms[:30] + "..." if len(terms) > 30 else terms
-                self.catalog_table.setItem(row, 13, QTableWidgetItem(terms_str))
-                
-                # Status (computed)
-                completeness = 0
-                if catalog.get('layer_name'): completeness += 1
-                if catalog.get('date_range', {}).get('start') or catalog.get('date_range', {}).get('end'): completeness += 1
-                if catalog.get('dataset_provider'): completeness += 1
-                if catalog.get('gee_code_snippet'): completeness += 1
-                if catalog.get('doi'): completeness += 1
-                status = ' Complete' if completeness >= 4 else ('➕ Partial' if completeness >= 2 else ' Incomplete')
-                self.catalog_table.setItem(row, 14, QTableWidgetItem(status))
-                
+            # Only entries added since the last update become new rows
+            self.catalog_model.sync(self.extracted_data)
         except Exception as e:
             self.log_error(f"Failed to update catalog table: {e}")
     
@@ -5354,17 +2292,18 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Ready - Add HTML files to begin")
-        
-        # Update extraction status
-        self.extraction_status_label.setText("Completed")
-        self.extraction_status_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #28a745;")
-        
-        # Update current status
         self.current_file_label.setText("No file being processed")
-        self.current_status_label.setText("Extraction completed")
         
-        # Add completion entry to extraction log
-        self.add_extraction_log_entry(" Extraction completed successfully", "success")
+        if self.stop_requested:
+            self.extraction_status_label.setText("Stopped")
+            self.extraction_status_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #dc3545;")
+            self.current_status_label.setText("Stopped by user")
+            self.add_extraction_log_entry("🛑 Extraction stopped by user", "warning")
+        else:
+            self.extraction_status_label.setText("Completed")
+            self.extraction_status_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #28a745;")
+            self.current_status_label.setText("Extraction completed")
+            self.add_extraction_log_entry(" Extraction completed successfully", "success")
         
         # End comprehensive logging
         self.end_extraction_logging()
@@ -5377,7 +2316,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         self.log_message(f" Starting local extraction session: {session_id}")
         self.log_message(f" Initial statistics: Processed={self.total_processed}, Success={self.successful_extractions}, Failed={self.failed_extractions}")
         self.log_message(f"⚙️ Configuration: Batch size={self.config['processing']['batch_size']}")
-        self.log_message(f" Overwrite mode: {'Enabled' if self.overwrite_checkbox.isChecked() else 'Disabled'}")
+        self.log_message(f" Overwrite mode: {'Enabled' if self.overwrite_existing else 'Disabled'}")
     
     def end_extraction_logging(self):
         """End extraction session with comprehensive statistics"""
@@ -5403,7 +2342,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         text = f"[{timestamp}] {message}"
         try:
             if QThread.currentThread() != self.thread():
-                QTimer.singleShot(0, lambda: self._append_console(text))
+                self.console_appended.emit(text)
             else:
                 self._append_console(text)
         except Exception:
@@ -5428,7 +2367,7 @@ class LocalHTMLDataExtractorUI(QWidget):
         text = f"[{timestamp}] ERROR: {message}"
         try:
             if QThread.currentThread() != self.thread():
-                QTimer.singleShot(0, lambda: self._append_console(text))
+                self.console_appended.emit(text)
             else:
                 self._append_console(text)
         except Exception: